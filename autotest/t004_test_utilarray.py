@@ -73,6 +73,94 @@ def test_load_txt_fixed():
     assert fa.dtype == a.dtype
 
 
+def test_load_txt_position():
+    # the file is left at the start of the line after the array
+    a = np.arange(12, dtype=np.float32).reshape((3, 4))
+    fp = StringIO(dedent(u'''\
+        0.0 1.0 2.0 3.0 4.0
+        5.0 6.0 7.0
+        8.0 9.0 1.0E+01 11. # comment
+        next line
+    '''))
+    fa = Util2d.load_txt(a.shape, fp, a.dtype, '(FREE)')
+    np.testing.assert_equal(fa, a)
+    assert fp.readline() == 'next line\n'
+
+    # integer items split across blocks
+    a = np.arange(0, 120, 10, dtype=np.int32).reshape((3, 4))
+    fp = StringIO(u'\n'.join(' '.join(str(v) for v in row) for row in a) +
+                  u'\nnext line\n')
+    fa, lines = Util2d._load_txt_free(fp, a.size, a.dtype, itemsize=1)
+    np.testing.assert_equal(fa, a.ravel())
+    assert fp.readline() == 'next line\n'
+
+    # consecutive arrays in one file
+    fp = StringIO(u''.join(u'{0} {1}\n{2} {3} # {4}\n'.format(
+        *(a.ravel()[i:i + 4].tolist() + [i])) for i in range(0, 12, 4)))
+    for i in range(0, 12, 4):
+        fa = Util2d.load_txt((4,), fp, a.dtype, '(FREE)')
+        np.testing.assert_equal(fa, a.ravel()[i:i + 4])
+    assert fp.readline() == ''
+
+    # fixed width with a blank field and numbers that touch
+    a = np.array([[1.5, -2.0, 300.0], [4.0, 5.0, 6.0]], dtype=np.float32)
+    fp = StringIO(dedent(u'''\
+         1.5E+00-2.0E+00
+                 3.0E+02
+         4.0E+00 5.0E+00 6.0E+00
+        next line
+    '''))
+    fa = Util2d.load_txt(a.shape, fp, a.dtype, '(3E8.1)')
+    np.testing.assert_equal(fa, a)
+    assert fp.readline() == 'next line\n'
+
+    # items that are not valid for the dtype still raise an error
+    fp = StringIO(u'1 2.5 3\n')
+    try:
+        Util2d.load_txt((3,), fp, np.int32, '(FREE)')
+        raise AssertionError('ValueError not raised')
+    except ValueError:
+        pass
+
+    # so do items with an exponent or sign that is not followed by a number
+    for text in (u'1.0 3e 2.0\n', u'1.0 2.0 3E\n', u'1.0 3e- 2.0\n',
+                 u'1.0 - 2.0\n'):
+        fp = StringIO(text)
+        try:
+            Util2d.load_txt((3,), fp, np.float32, '(FREE)')
+            raise AssertionError('ValueError not raised for ' + text)
+        except ValueError:
+            pass
+
+    # signs and exponents are parsed in bulk
+    fp = StringIO(u'-5 +3,7\n')
+    fa, lines = Util2d._load_txt_free(fp, 3, np.int32)
+    np.testing.assert_equal(fa, np.array([-5, 3, 7], np.int32))
+    fp = StringIO(u'-.5 1e-2 +3.E+1\n')
+    fa, lines = Util2d._load_txt_free(fp, 3, np.float32)
+    np.testing.assert_equal(fa, np.array([-0.5, 0.01, 30.], np.float32))
+
+    # but repeat counts and items that are not valid for the dtype are
+    # left to the item by item parser
+    for text, dtype in ((u'2*1.5 3.0\n', np.float32),
+                        (u'1.0 3e 2.0\n', np.float32),
+                        (u'1.0 2.0 3E\n', np.float32),
+                        (u'1.0 2.0 3e-\n', np.float32),
+                        (u'1.0 2.0 3.0 # comment\n', np.float32),
+                        (u'1 2.5 3\n', np.int32),
+                        (u'1 2 3.5\n', np.int32)):
+        fp = StringIO(text)
+        fa, lines = Util2d._load_txt_free(fp, 3, dtype)
+        assert fa is None and fp.tell() == 0, text
+    for text in (u'1 2-3\n', u'1 - 2\n', u'1 2 3-\n'):
+        fp = StringIO(text)
+        try:
+            Util2d.load_txt((3,), fp, np.int32, '(FREE)')
+            raise AssertionError('ValueError not raised for ' + text)
+        except ValueError:
+            pass
+
+
 def test_load_block():
     a = np.ones((2, 5), dtype=np.int32) * 4
     fp = StringIO(dedent(u'''\
@@ -666,6 +754,57 @@ def test_new_get_file_entry():
     print(u2d.get_file_entry(how="external"))
 
 
+def test_chunked_write():
+    ml = flopy.modflow.Modflow(model_ws=out_dir)
+    dis = flopy.modflow.ModflowDis(ml, 1, 7, 9, nper=2)
+    a = np.arange(63, dtype=np.float32).reshape(7, 9) / 3.
+    sp_data = {0: [[0, i, i, -float(i) / 7.] for i in range(7)],
+               1: [[0, 6 - i, i, 1.e10 * i] for i in range(7)]}
+    wel = flopy.modflow.ModflowWel(ml, stress_period_data=sp_data)
+    fname = os.path.join(out_dir, 'chunked.txt')
+    for free in (True, False):
+        ml.array_free_format = free
+        u2d = Util2d(ml, (7, 9), np.float32, a, 'test', locat=99)
+        u2d_int = Util2d(ml, (7, 9), np.int32, a.astype(np.int32), 'test',
+                         locat=99)
+
+        # the same entries have to be written in a single block and
+        # in a series of small blocks
+        entries = []
+        chunksizes = (Util2d._chunksize, flopy.utils.MfList._chunksize)
+        for chunksize in (65536, 1):
+            Util2d._chunksize = chunksize
+            flopy.utils.MfList._chunksize = chunksize
+            try:
+                with open(fname, 'w') as f:
+                    u2d.write_file_entry(f)
+                    u2d_int.write_file_entry(f)
+                    wel.stress_period_data.write_transient(f)
+                with open(fname) as f:
+                    entries.append(f.read())
+            finally:
+                Util2d._chunksize, flopy.utils.MfList._chunksize = chunksizes
+        assert entries[0] == entries[1]
+        entry = u2d.get_file_entry() + u2d_int.get_file_entry()
+        assert entries[0].startswith(entry)
+
+        # list output matches numpy's savetxt
+        d = wel.stress_period_data[1].copy()
+        d['k'] += 1
+        d['i'] += 1
+        d['j'] += 1
+        f_np = StringIO()
+        np.savetxt(f_np, d, fmt=wel.stress_period_data.fmt_string,
+                   delimiter='')
+        assert entries[0].endswith(f_np.getvalue())
+
+        # array output matches reading the values back
+        f = StringIO(u2d.string)
+        fmt = '(FREE)' if free else u2d.format.fortran
+        b = Util2d.load_txt((7, 9), f, np.float32, fmt)
+        assert np.allclose(a, b, rtol=1e-5)
+
+
 def test_append_mflist():
     ml = flopy.modflow.Modflow(model_ws=out_dir)
     dis = flopy.modflow.ModflowDis(ml, 10, 10, 10, 10)
@@ -752,6 +891,171 @@ def test_mflist():
                'flux2'].values == 16.0
 
 
+def test_mflist_lazy():
+    ws = os.path.join(out_dir, 'lazy')
+    os.mkdir(ws)
+    wel_file = os.path.join(ws, 'lazy.wel')
+    with open(wel_file, 'w') as f:
+        f.write(dedent("""\
+            # lazily loaded well file
+                     3         0
+                     2         0
+                     1         1         1      -1.0
+                     1         2         2      -2.0
+                    -1         0
+                     3         0
+            SFAC 2.0
+                     1         1         1       1.0
+                     1         1         2       2.0
+                     1         1         3       3.0
+                     1         0
+            OPEN/CLOSE lazy_4.dat
+            """))
+    with open(os.path.join(ws, 'lazy_4.dat'), 'w') as f:
+        f.write('1 3 3 5.0\n')
+    rch_file = os.path.join(ws, 'lazy.rch')
+    with open(rch_file, 'w') as f:
+        f.write('1 0\n1\nOPEN/CLOSE lazy_rch.dat 0.5 (FREE) -1\n-1\n-1\n'
+                '-1\n')
+    with open(os.path.join(ws, 'lazy_rch.dat'), 'w') as f:
+        f.write('1. 2. 3.\n4. 5. 6.\n7. 8. 9.\n')
+
+    ml = flopy.modflow.Modflow(modelname='lazy', model_ws=ws)
+    dis = flopy.modflow.ModflowDis(ml, nlay=1, nrow=3, ncol=3, nper=4)
+    wel = flopy.modflow.ModflowWel.load(wel_file, ml)
+    rch = flopy.modflow.ModflowRch.load(rch_file, ml)
+    ml2 = flopy.modflow.Modflow(modelname='lazy', model_ws=ws)
+    dis2 = flopy.modflow.ModflowDis(ml2, nlay=1, nrow=3, ncol=3, nper=4)
+    wel2 = flopy.modflow.ModflowWel.load(wel_file, ml2, check=False,
+                                            lazy=True)
+    rch2 = flopy.modflow.ModflowRch.load(rch_file, ml2, check=False,
+                                            lazy=True)
+
+    # stress periods are only located
+    spd = wel2.stress_period_data
+    for kper in range(4):
+        assert spd.vtype[kper] == flopy.utils.MfListSource
+        assert spd.get_itmp(kper) == wel.stress_period_data.get_itmp(kper)
+    assert spd.mxact == 3
+    assert rch2.rech[0].vtype == str
+
+    # stress periods are read when they are used
+    assert np.array_equal(spd[2], wel.stress_period_data[2])
+    assert spd.vtype[2] == np.recarray
+    assert spd.vtype[3] == flopy.utils.MfListSource
+    for kper in range(4):
+        assert np.array_equal(spd[kper], wel.stress_period_data[kper])
+        assert np.array_equal(rch2.rech[kper].array, rch.rech[kper].array)
+
+    # unchanged stress periods are copied to the new file
+    ml3 = flopy.modflow.Modflow(modelname='lazy', model_ws=ws)
+    dis3 = flopy.modflow.ModflowDis(ml3, nlay=1, nrow=3, ncol=3, nper=4)
+    wel3 = flopy.modflow.ModflowWel.load(wel_file, ml3, check=False,
+                                            lazy=True)
+    wel3.stress_period_data[0]['flux'] *= 2.
+    fn = os.path.join(ws, 'lazy_copy.wel')
+    wel3.write_file(fn)
+    with open(fn) as f:
+        txt = f.read()
+    assert 'SFAC 2.0' in txt
+    assert '1 3 3 5.0' in txt
+    assert wel3.stress_period_data.vtype[2] == flopy.utils.MfListSource
+    wel4 = flopy.modflow.ModflowWel.load(fn, ml2)
+    for kper in range(4):
+        d = wel.stress_period_data[kper].copy()
+        if kper == 0:
+            d['flux'] *= 2.
+        assert np.array_equal(wel4.stress_period_data[kper], d)
+
+    # lists are formatted again if the settings they were read with changed
+    fn = os.path.join(ws, 'lazy_changed.wel')
+    for change in ('free_format', 'options'):
+        ml5 = flopy.modflow.Modflow(modelname='lazy', model_ws=ws)
+        dis5 = flopy.modflow.ModflowDis(ml5, nlay=1, nrow=3, ncol=3, nper=4)
+        wel5 = flopy.modflow.ModflowWel.load(wel_file, ml5, check=False,
+                                             lazy=True)
+        if change == 'free_format':
+            wel5.stress_period_data.list_free_format = False
+        else:
+            wel5.options.append('noprint')
+        wel5.write_file(fn)
+        with open(fn) as f:
+            txt = f.read()
+        msg = 'source lines were copied after the {} changed'.format(change)
+        assert 'SFAC 2.0' not in txt, msg
+        assert '1 3 3 5.0' not in txt, msg
+        assert wel5.stress_period_data.vtype[2] == flopy.utils.MfListSource
+        if change == 'free_format':
+            ml5.free_format_input = False
+        wel6 = flopy.modflow.ModflowWel.load(fn, ml5, check=False)
+        for kper in range(4):
+            assert np.array_equal(wel6.stress_period_data[kper],
+                                  wel.stress_period_data[kper]), msg
+
+    # a source that is added to a list with another dtype is read
+    with open(wel_file) as f:
+        for i in range(3):
+            f.readline()
+        source = flopy.utils.MfListSource.from_file(f, 2, ml3)
+    dtype = flopy.modflow.ModflowWel.get_default_dtype()
+    dtype = np.dtype(dtype.descr + [('iface', np.float32)])
+    spd = flopy.utils.MfList(wel3, data={0: source})
+    assert source.matches(spd)
+    spd = flopy.utils.MfList(wel3, data={0: source}, dtype=dtype)
+    assert not source.matches(spd)
+    with open(fn, 'w') as f:
+        spd.write_transient(f, single_per=0)
+    with open(fn) as f:
+        lines = f.readlines()
+    assert [len(line.split()) for line in lines[1:]] == [5, 5], lines
+    assert np.array_equal(spd[0]['flux'], wel.stress_period_data[0]['flux'])
+
+    # lists can not be read after the source file is changed
+    with open(wel_file, 'a') as f:
+        f.write('\n')
+    try:
+        wel3.stress_period_data[2]
+        raise AssertionError('changed source file was not detected')
+    except IOError:
+        pass
+
+
+def test_mflist_lazy_write_in_place():
+    # write single packages over the files they were lazily loaded from
+    ws = os.path.join(out_dir, 'lazy_in_place')
+    os.mkdir(ws)
+    pth = os.path.join('..', 'examples', 'data', 'mf2005_test')
+    for fn in os.listdir(pth):
+        if fn.startswith('bcf2ss.'):
+            shutil.copy(os.path.join(pth, fn), ws)
+    ml = flopy.modflow.Modflow.load('bcf2ss.nam', model_ws=ws, check=False)
+    ml2 = flopy.modflow.Modflow.load('bcf2ss.nam', model_ws=ws, check=False,
+                                     lazy=True)
+    assert ml2.wel.stress_period_data.vtype[1] == flopy.utils.MfListSource
+    ml2.wel.write_file()
+    ml2.riv.write_file(check=False)
+    ml2.rch.write_file()
+
+    ml3 = flopy.modflow.Modflow.load('bcf2ss.nam', model_ws=ws, check=False)
+    for name in ['wel', 'riv']:
+        spd = ml.get_package(name).stress_period_data
+        spd3 = ml3.get_package(name).stress_period_data
+        for kper in range(ml.nper):
+            assert np.array_equal(spd3[kper], spd[kper])
+    for kper in range(ml.nper):
+        assert np.array_equal(ml3.rch.rech[kper].array,
+                              ml.rch.rech[kper].array)
+
+    # a file that was already truncated is detected before it is written
+    ml4 = flopy.modflow.Modflow.load('bcf2ss.nam', model_ws=ws, check=False,
+                                     lazy=True)
+    with open(ml4.wel.fn_path, 'w') as f:
+        try:
+            ml4.wel.stress_period_data.write_transient(f)
+            raise AssertionError('truncated source file was not detected')
+        except IOError:
+            pass
+
 
 def test_how():
     import numpy as np
@@ -784,6 +1088,8 @@ def test_util3d_reset():
 if __name__ == '__main__':
     # test_util3d_reset()
     test_mflist()
+    test_mflist_lazy()
+    test_mflist_lazy_write_in_place()
     # test_new_get_file_entry()
     # test_arrayformat()
     # test_util2d_external_free_nomodelws()
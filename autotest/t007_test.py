@@ -268,6 +268,42 @@ def test_export_output():
     assert np.array_equal(ibound_mask, arr_mask)
 
 
+def test_export_output_chunks():
+    import os
+    import numpy as np
+    import flopy
+
+    # Do not fail if netCDF4 not installed
+    try:
+        import netCDF4
+        import pyproj
+    except:
+        return
+
+    model_ws = os.path.join("..", "examples", "data", "freyberg")
+    ml = flopy.modflow.Modflow.load("freyberg.nam", model_ws=model_ws)
+    hds_pth = os.path.join(model_ws, "freyberg.githds")
+    hds = flopy.utils.HeadFile(hds_pth)
+
+    out_pth = os.path.join(npth, "freyberg.chunks.nc")
+    nc = flopy.export.utils.output_helper(out_pth, ml,
+                                          {"freyberg.githds": hds},
+                                          chunks={"y": 10}, complevel=6)
+    var = nc.nc.variables.get("head")
+    assert var.chunking() == [1, 1, 10, ml.ncol]
+    assert var.filters()["complevel"] == 6
+
+    # values and the incrementally computed min and max
+    head = hds.get_alldata()
+    head[:, ml.bas6.ibound.array == 0] = np.nan
+    head[head == ml.bas6.hnoflo] = np.nan
+    head[head == ml.lpf.hdry] = np.nan
+    arr = var[:].filled(np.nan)
+    assert np.allclose(arr, head, equal_nan=True)
+    assert np.isclose(var.getncattr("min"), np.nanmin(head))
+    assert np.isclose(var.getncattr("max"), np.nanmax(head))
+
+
 def test_write_shapefile():
     from flopy.discretization import StructuredGrid
     from flopy.export.shapefile_utils import shp2recarray
@@ -4,6 +4,7 @@ These are the examples that are distributed with MODFLOW-2005.
 """
 
 import os
+import numpy as np
 import flopy
 
 tpth = os.path.join('temp', 't008')
@@ -75,6 +76,11 @@ def test_nwt_model_load():
         yield load_nwt_model, f
 
 
+def test_nwt_model_load_parallel():
+    for f in nwt_nam:
+        yield load_nwt_model_parallel, f
+
+
 def load_nwt(nwtfile):
     ml = flopy.modflow.Modflow(model_ws=tpth, version='mfnwt')
     fn = os.path.join(tpth, '{}.nwt'.format(ml.name))
@@ -131,6 +137,154 @@ def load_nwt_model(nfile):
             assert p[l] == p2[l], msg
 
 
+def load_nwt_model_parallel(nfile):
+    f = os.path.basename(nfile)
+    model_ws = os.path.dirname(nfile)
+    ml = flopy.modflow.Modflow.load(f, model_ws=model_ws, check=False)
+    ml2 = flopy.modflow.Modflow.load(f, model_ws=model_ws, check=False,
+                                     parallel=True, max_workers=4)
+    msg = 'packages loaded in parallel from {} '.format(f) + \
+          'are not the same as packages loaded serially'
+    assert ml2.get_package_list() == ml.get_package_list(), msg
+    assert ml2.load_fail == ml.load_fail, msg
+    assert ml2.output_fnames == ml.output_fnames, msg
+    assert ml2.external_fnames == ml.external_fnames, msg
+    for pn in ml.get_package_list():
+        p = ml.get_package(pn)
+        p2 = ml2.get_package(pn)
+        assert p.unit_number == p2.unit_number, msg
+        assert p.file_name == p2.file_name, msg
+
+
+def build_bcf_model(name, nlay=3, nrow=200, ncol=200):
+    model_ws = os.path.join(tpth, name)
+    ml = flopy.modflow.Modflow(name, model_ws=model_ws)
+    flopy.modflow.ModflowDis(ml, nlay=nlay, nrow=nrow, ncol=ncol)
+    flopy.modflow.ModflowBas(ml, ifrefm=True)
+    rng = np.random.RandomState(8)
+    flopy.modflow.ModflowBcf(ml, laycon=[1, 3, 0],
+                             tran=rng.rand(nlay, nrow, ncol),
+                             hy=rng.rand(nlay, nrow, ncol),
+                             vcont=rng.rand(nlay - 1, nrow, ncol))
+    flopy.modflow.ModflowPcg(ml)
+    ml.write_input()
+    return ml
+
+
+def test_load_parallel_free_format():
+    # BCF and PCG read the BAS6 free format flag while they are loaded
+    name = 'bcffree'
+    build_bcf_model(name)
+    model_ws = os.path.join(tpth, name)
+    ml = flopy.modflow.Modflow.load(name + '.nam', model_ws=model_ws,
+                                    check=False)
+    ml2 = flopy.modflow.Modflow.load(name + '.nam', model_ws=model_ws,
+                                     check=False, parallel=True)
+    msg = 'BCF package loaded in parallel is not the same as ' + \
+          'the BCF package loaded serially'
+    assert np.array_equal(ml2.bcf6.laycon.array, ml.bcf6.laycon.array), msg
+    for name in ('tran', 'hy', 'vcont'):
+        a = getattr(ml.bcf6, name).array
+        a2 = getattr(ml2.bcf6, name).array
+        assert np.array_equal(a2, a), msg
+    assert ml2.pcg.mxiter == ml.pcg.mxiter, msg
+
+
+def test_load_parallel_error():
+    # the first package that fails in name file order is reported
+    name = 'bcferror'
+    build_bcf_model(name)
+    model_ws = os.path.join(tpth, name)
+    with open(os.path.join(model_ws, name + '.pcg'), 'w') as f:
+        f.write('abc\n')
+    errors = []
+    for parallel in (False, True):
+        try:
+            flopy.modflow.Modflow.load(name + '.nam', model_ws=model_ws,
+                                       check=False, parallel=parallel)
+        except Exception as e:
+            errors.append((type(e), str(e)))
+        else:
+            raise AssertionError('malformed PCG file did not fail to load')
+    msg = 'parallel load error {} is not the same '.format(errors[1]) + \
+          'as the serial load error {}'.format(errors[0])
+    assert errors[1] == errors[0], msg
+
+
+def test_load_parallel_external():
+    # packages that read the same EXTERNAL unit read it in name file order
+    name = 'extshared'
+    model_ws = os.path.join(tpth, name)
+    ml = flopy.modflow.Modflow(name, model_ws=model_ws)
+    flopy.modflow.ModflowDis(ml, nlay=1, nrow=4, ncol=5)
+    flopy.modflow.ModflowBas(ml)
+    flopy.modflow.ModflowLpf(ml, hk=2.)
+    flopy.modflow.ModflowRch(ml, rech=0.5)
+    flopy.modflow.ModflowPcg(ml)
+    ml.write_input()
+    for ext, value in (('lpf', '2.000000E+00'), ('rch', '5.000000E-01')):
+        fname = os.path.join(model_ws, '{}.{}'.format(name, ext))
+        with open(fname) as f:
+            lines = f.readlines()
+        with open(fname, 'w') as f:
+            for line in lines:
+                if line.startswith('CONSTANT') and value in line:
+                    line = 'EXTERNAL 50 1.0 (FREE) -1\n'
+                f.write(line)
+    with open(os.path.join(model_ws, name + '.nam'), 'a') as f:
+        f.write('DATA 50 {}.dat\n'.format(name))
+    hk = np.arange(1., 21.).reshape((4, 5))
+    with open(os.path.join(model_ws, name + '.dat'), 'w') as f:
+        np.savetxt(f, hk)
+        np.savetxt(f, hk + 100.)
+
+    ml = flopy.modflow.Modflow.load(name + '.nam', model_ws=model_ws,
+                                    check=False)
+    ml2 = flopy.modflow.Modflow.load(name + '.nam', model_ws=model_ws,
+                                     check=False, parallel=True)
+    assert np.array_equal(ml.lpf.hk.array[0], hk)
+    assert np.array_equal(ml.rch.rech.array[0, 0], hk + 100.)
+    msg = 'arrays read from a shared EXTERNAL unit in parallel are ' + \
+          'not the same as the arrays read serially'
+    assert np.array_equal(ml2.lpf.hk.array, ml.lpf.hk.array), msg
+    assert np.array_equal(ml2.rch.rech.array, ml.rch.rech.array), msg
+    assert ml2.get_package_list() == ml.get_package_list(), msg
+    assert ml2.external_fnames == ml.external_fnames, msg
+    assert ml2.pop_key_list == ml.pop_key_list, msg
+
+
+def test_load_parallel_model_settings():
+    # parameter substitution is recorded on the model in name file order
+    ml = flopy.modflow.Modflow()
+    changes = []
+    with ml._defer_changes(changes):
+        ml._set_parameter_load()
+    assert not ml.parameter_load
+    ml._apply_changes(changes)
+    assert ml.parameter_load
+
+    for namfile in pnamfiles:
+        ml = flopy.modflow.Modflow.load(namfile, model_ws=ppth,
+                                        check=False)
+        ml2 = flopy.modflow.Modflow.load(namfile, model_ws=ppth,
+                                         check=False, parallel=True)
+        msg = 'model settings of {} loaded in parallel '.format(namfile) + \
+              'are not the same as the settings loaded serially'
+        assert ml.parameter_load, msg
+        assert ml2.parameter_load == ml.parameter_load, msg
+        assert ml2.version == ml.version, msg
+        assert ml2.get_package_list() == ml.get_package_list(), msg
+        assert np.array_equal(ml2.lpf.hk.array, ml.lpf.hk.array), msg
+
+    # the NWT and UPW packages are loaded on the main thread
+    for fnwt in nwt_nam:
+        f = os.path.basename(fnwt)
+        model_ws = os.path.dirname(fnwt)
+        ml = flopy.modflow.Modflow.load(f, model_ws=model_ws, check=False,
+                                        parallel=True)
+        assert ml.version == 'mfnwt'
+
+
 if __name__ == '__main__':
     for namfile in namfiles:
         load_model(namfile)
@@ -138,5 +292,11 @@ if __name__ == '__main__':
         load_only_bas6_model(namfile)
     for fnwt in nwt_nam:
         load_nwt_model(fnwt)
+    for fnwt in nwt_nam:
+        load_nwt_model_parallel(fnwt)
+    test_load_parallel_free_format()
+    test_load_parallel_error()
+    test_load_parallel_external()
+    test_load_parallel_model_settings()
     for fnwt in nwt_files:
         load_nwt(fnwt)
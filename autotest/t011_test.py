@@ -4,6 +4,8 @@ Some basic tests for mflistfile.py module (not super rigorous)
 """
 
 import os
+import re
+import shutil
 import flopy
 import numpy as np
 from nose.tools import raises
@@ -85,7 +87,59 @@ def test_mflist_reducedpumping_fail():
     
     return
 
+def test_mflist_refresh():
+    """
+    test reading budget entries appended to a list file
+    """
+    pth = os.path.join('..', 'examples', 'data', 'mt3d_test', 'mf2kmt3d',
+                       'mnw')
+    list_file = os.path.join(pth, 't5.lst')
+    mflist = flopy.utils.MfListBudget(list_file)
+    assert len(mflist.get_times()) == 99
+
+    tpth = os.path.join('temp', 't011')
+    if not os.path.isdir(tpth):
+        os.makedirs(tpth)
+    fn = os.path.join(tpth, 't5.lst')
+
+    # write the list file in pieces, the first ending part way through
+    # the budget table of the third entry
+    with open(list_file, 'rb') as f:
+        txt = f.read()
+    idx = [m.start() for m in
+           re.finditer(b'VOLUMETRIC BUDGET FOR ENTIRE MODEL', txt)]
+    with open(fn, 'wb') as f:
+        f.write(txt[:idx[2] + 500])
+    partial = flopy.utils.MfListBudget(fn)
+    assert len(partial.get_times()) == 3
+    assert np.isnan(partial.get_times()[-1])
+    assert partial.refresh() == 0
+
+    with open(fn, 'ab') as f:
+        f.write(txt[idx[2] + 500:idx[50]])
+    assert partial.refresh() == 47
+    with open(fn, 'ab') as f:
+        f.write(txt[idx[50]:])
+    assert partial.refresh() == 49
+    assert partial.refresh() == 0
+
+    inc0, cum0 = mflist.get_budget()
+    inc1, cum1 = partial.get_budget()
+    assert partial.get_kstpkper() == mflist.get_kstpkper()
+    for name in inc0.dtype.names:
+        assert np.array_equal(inc0[name], inc1[name]), name
+        assert np.array_equal(cum0[name], cum1[name]), name
+
+    # replacing the file with a shorter one starts over
+    shutil.copyfile(os.path.join('..', 'examples', 'data', 'freyberg',
+                                 'freyberg.gitlist'), fn)
+    assert partial.refresh() == -98
+    assert len(partial.get_times()) == 1
+    return
+
+
 if __name__ == '__main__':
     test_mflistfile()
     test_mflist_reducedpumping()
     test_mflist_reducedpumping_fail()
+    test_mflist_refresh()
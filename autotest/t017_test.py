@@ -99,6 +99,60 @@ def test_binaryfile_read_context():
     assert str(e.exception) == 'seek of closed file', str(e.exception)
 
 
+def test_binaryfile_read_memmap():
+    hds_path = os.path.join('..', 'examples', 'data', 'mf6', 'create_tests',
+                            'test005_advgw_tidal', 'expected_output',
+                            'AdvGW_tidal.hds')
+    h = flopy.utils.HeadFile(hds_path)
+    hm = flopy.utils.HeadFile(hds_path, memmap=True)
+
+    # index built from the record stride
+    assert np.array_equal(h.recordarray, hm.recordarray)
+    nbytes = hm.header_dtype.itemsize + \
+             hm.nrow * hm.ncol * hm.realtype(1).nbytes
+    ipos = np.arange(hm.recordarray.shape[0]) * nbytes + \
+           hm.header_dtype.itemsize
+    assert np.array_equal(hm.iposarray, ipos)
+    assert h.times == hm.times
+    assert h.kstpkper == hm.kstpkper
+
+    # data returned as views into the memory-mapped file
+    times = hm.get_times()
+    for totim in (times[0], times[-1]):
+        d = hm.get_data(totim=totim)
+        assert not d.flags.owndata
+        assert not d.flags.writeable
+        assert np.array_equal(h.get_data(totim=totim), d)
+    d = hm.get_alldata(nodata=None)
+    assert d.shape == (len(times), hm.nlay, hm.nrow, hm.ncol)
+    assert not d.flags.owndata
+    assert np.array_equal(h.get_alldata(nodata=None), d)
+    assert np.array_equal(h.get_alldata(mflay=1), hm.get_alldata(mflay=1),
+                          equal_nan=True)
+    h.close()
+    hm.close()
+
+
+def test_binaryfile_get_ts():
+    hds_path = os.path.join('..', 'examples', 'data', 'mf6', 'create_tests',
+                            'test005_advgw_tidal', 'expected_output',
+                            'AdvGW_tidal.hds')
+    kijlist = [(k, i, j) for k in range(3) for i in range(0, 15, 2)
+               for j in range(0, 10, 3)]
+    for memmap in (False, True):
+        h = flopy.utils.HeadFile(hds_path, memmap=memmap)
+        alldata = h.get_alldata(nodata=None)
+        ts = h.get_ts(kijlist)
+        assert ts.shape == (len(h.get_times()), len(kijlist) + 1)
+        assert np.array_equal(ts[:, 0], h.get_times())
+        for istat, (k, i, j) in enumerate(kijlist):
+            assert np.array_equal(ts[:, istat + 1], alldata[:, k, i, j]), \
+                'time series for cell {} is not correct'.format((k, i, j))
+        ts = h.get_ts((2, 14, 9))
+        assert np.array_equal(ts[:, 1], alldata[:, 2, 14, 9])
+        h.close()
+
+
 def test_cellbudgetfile_read_context():
     cbc_path = os.path.join(
             '..', 'examples', 'data', 'mf2005_test', 'mnw1.gitcbc')
@@ -201,6 +255,47 @@ def test_cellbudgetfile_position():
     return
 
 
+def test_cellbudgetfile_cache_index():
+    cbc_fname = os.path.join(
+            '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    fpth = os.path.join(cpth, 'test1tr.cbc')
+    shutil.copyfile(cbc_fname, fpth)
+    idxpth = fpth + '.cbcidx'
+
+    v = flopy.utils.CellBudgetFile(fpth)
+    assert not os.path.isfile(idxpth)
+
+    # create the index cache
+    v1 = flopy.utils.CellBudgetFile(fpth, cache_index=True)
+    assert os.path.isfile(idxpth), 'index cache was not created'
+
+    # read the index cache
+    v2 = flopy.utils.CellBudgetFile(fpth, cache_index=True, verbose=True)
+    for vv in (v1, v2):
+        assert np.array_equal(v.recordarray, vv.recordarray)
+        assert np.array_equal(v.iposarray, vv.iposarray)
+        assert np.array_equal(v.iposheader, vv.iposheader)
+        assert v.get_times() == vv.get_times()
+        assert v.get_kstpkper() == vv.get_kstpkper()
+        assert v.get_unique_record_names() == vv.get_unique_record_names()
+        t0 = v.get_data(text='STREAM LEAKAGE')
+        t1 = vv.get_data(text='STREAM LEAKAGE')
+        for d0, d1 in zip(t0, t1):
+            assert np.array_equal(d0, d1)
+        vv.close()
+
+    # index cache is not used if the budget file changes
+    ftime = os.path.getmtime(fpth) + 10.
+    os.utime(fpth, (ftime, ftime))
+    v3 = flopy.utils.CellBudgetFile(fpth, cache_index=True)
+    assert np.array_equal(v.recordarray, v3.recordarray)
+    v3.close()
+    with np.load(idxpth) as cache:
+        assert cache['key'][1] == os.stat(fpth).st_mtime_ns
+    v.close()
+    return
+
+
 def test_cellbudgetfile_readrecord():
 
     cbc_fname = os.path.join(
@@ -257,6 +352,40 @@ def test_cellbudgetfile_readrecord():
     return
 
 
+def test_cellbudgetfile_select_records():
+    cbc_fname = os.path.join(
+            '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    recordarray = v.recordarray
+
+    # records selected with the record index are the same as records
+    # selected with a boolean mask
+    for kstp, kper in v.get_kstpkper():
+        mask = (recordarray['kstp'] == kstp + 1) & \
+               (recordarray['kper'] == kper + 1)
+        for record in v.get_unique_record_names():
+            t0 = v.get_data(kstpkper=(kstp, kper), text=record)
+            idx = np.where(mask & (recordarray['text'] == record))[0]
+            t1 = [v.get_record(i) for i in idx]
+            assert len(t0) == len(t1)
+            for d0, d1 in zip(t0, t1):
+                assert np.array_equal(d0, d1)
+
+    times = v.get_times()
+    for totim in (times[0], float(times[-1])):
+        t0 = v.get_data(totim=totim)
+        idx = np.where(recordarray['totim'] == totim)[0]
+        assert len(t0) == len(idx)
+
+    indices = v.get_indices(text='STREAM LEAKAGE')
+    assert np.array_equal(indices,
+                          np.where(recordarray['text'] ==
+                                   b'  STREAM LEAKAGE')[0])
+    assert v.get_data(kstpkper=(1000, 1000)) == []
+    v.close()
+    return
+
+
 def test_cellbudgetfile_readrecord_waux():
 
     cbc_fname = os.path.join(
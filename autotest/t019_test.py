@@ -212,8 +212,45 @@ def test_mf6obsfile_read():
     return
 
 
+def test_obsfile_read_data():
+    pth = os.path.join('..', 'examples', 'data', 'hydmod_test',
+                       'test1tr.hyd.gitbin')
+    h = flopy.utils.HydmodObs(pth)
+    labels = h.get_obsnames()
+
+    # read a time window of two observations from the file
+    r = h.read_data(obsname=labels[1:3], start_totim=h.get_times()[10],
+                    end_totim=h.get_times()[19])
+    assert r.dtype.names == tuple(['totim'] + labels[1:3]), \
+        'read_data() did not return the selected observations'
+    assert r.shape == (10,), 'data shape is not (10,)'
+
+    data = h.get_data()
+    for name in r.dtype.names:
+        assert np.array_equal(r[name], data[name][10:20]), \
+            'read_data() {} does not match get_data()'.format(name)
+
+    r = h.read_data(obsname=labels[0])
+    assert np.array_equal(r[labels[0]], data[labels[0]]), \
+        'read_data() does not match get_data()'
+    r = h.read_data(start_totim=data['totim'][-1] + 1.)
+    assert r.shape == (0,), 'data shape is not (0,)'
+
+    # times are selected from memory for ascii mf6 observation files
+    for fn, isBinary in (('maw_obs.gitbin', True),
+                         ('maw_obs.gitcsv', False)):
+        pth = os.path.join('..', 'examples', 'data', 'mf6_obs', fn)
+        h = flopy.utils.Mf6Obs(pth, isBinary=isBinary)
+        r = h.read_data(end_totim=2.)
+        assert r.shape == (2,), 'data shape is not (2,)'
+        assert np.array_equal(r.tolist(), h.get_data()[:2].tolist()), \
+            'read_data() does not match get_data()'
+    return
+
+
 if __name__ == '__main__':
     test_mf6obsfile_read()
     test_hydmodfile_create()
     test_hydmodfile_load()
     test_hydmodfile_read()
+    test_obsfile_read_data()
@@ -216,6 +216,105 @@ def test_get_destination_data():
                            mg=mg4)
 
 
+def test_mp7_pathline_cache():
+    # write a small MODPATH 7 pathline file
+    fpth = os.path.join(path, 'mp7test.mppth')
+    pts = [(1, 1, 5, [(11, 10., 20., 5., 0., 1),
+                      (12, 15., 20., 4., 10., 1)]),
+           (2, 2, 7, [(13, 30., 40., 3., 0., 2)]),
+           (3, 2, 8, [(14, 50., 60., 2., 0., 1),
+                      (15, 55., 60., 2., 5., 1),
+                      (16, 60., 60., 1., 7.5, 2)])]
+    with open(fpth, 'w') as f:
+        f.write('MODPATH_PATHLINE_FILE         7         0\n')
+        f.write('         1         0    0.0E+00    0.0E+00    0.0E+00\n')
+        f.write('END HEADER\n')
+        for seq, group, pid, rows in pts:
+            f.write('{:10d}{:10d}{:10d}{:10d}\n'.format(seq, group, pid,
+                                                       len(rows)))
+            for node, x, y, z, t, k in rows:
+                f.write('{:10d} {:.15E} {:.15E} {:.15E} {:.15E} '.format(
+                    node, x, y, z, t) + '0.5E+00 0.5E+00 0.5E+00 ' +
+                        '{:10d}{:10d}{:10d}\n'.format(k, 1, 1))
+
+    cpth = fpth + '.npy'
+    if os.path.isfile(cpth):
+        os.remove(cpth)
+    pthobj = PathlineFile(fpth)
+    assert not os.path.isfile(cpth)
+    d = pthobj._data
+    assert d.shape[0] == 6
+    assert np.array_equal(d['particleid'], [0, 0, 1, 2, 2, 2])
+    assert np.array_equal(d['particlegroup'], [0, 0, 1, 1, 1, 1])
+    assert np.array_equal(d['particleidloc'], [4, 4, 6, 7, 7, 7])
+    assert np.array_equal(d['node'], [10, 11, 12, 13, 14, 15])
+    assert np.array_equal(d['k'], [0, 0, 1, 0, 0, 1])
+    assert np.allclose(d['time'], [0., 10., 0., 0., 5., 7.5])
+    assert np.allclose(d['x'], [10., 15., 30., 50., 55., 60.])
+    assert np.allclose(d['xloc'], 0.5)
+
+    # create and read the data cache
+    pthobj1 = PathlineFile(fpth, cache_data=True)
+    assert os.path.isfile(cpth), 'data cache was not created'
+    pthobj2 = PathlineFile(fpth, cache_data=True)
+    for p in (pthobj1, pthobj2):
+        assert np.array_equal(p._data, d)
+        assert p.get_maxid() == pthobj.get_maxid()
+
+    # data cache is not used if the pathline file changes
+    with open(fpth, 'a') as f:
+        f.write('{:10d}{:10d}{:10d}{:10d}\n'.format(4, 1, 9, 1))
+        f.write('{:10d} 1.0 2.0 3.0 4.0 0.5 0.5 0.5 '.format(17) +
+                '{:10d}{:10d}{:10d}\n'.format(3, 1, 1))
+    pthobj3 = PathlineFile(fpth, cache_data=True)
+    assert pthobj3._data.shape[0] == 7
+    assert pthobj3.get_maxid() == 3
+
+
+def test_particle_index():
+    pthld = PathlineFile(os.path.join(path, 'EXAMPLE-3.pathline'))
+    epd = EndpointFile(os.path.join(path, 'EXAMPLE-3.endpoint'))
+
+    # pathline data are sorted by particle id and time
+    d = pthld._data
+    assert np.all(np.diff(d['particleid']) >= 0)
+
+    tmax = pthld.get_maxtime() / 2.
+    plist = pthld.get_alldata()
+    plist_ge = pthld.get_alldata(totim=tmax)
+    assert len(plist) == len(pthld.nid)
+    for n, partid in enumerate(pthld.nid):
+        idx = d['particleid'] == partid
+        p = pthld.get_data(partid)
+        assert np.array_equal(p.x, d['x'][idx])
+        # particle data are views of the pathline data
+        assert p.dtype.names == pthld.outdtype.names
+        assert p.shape[0] == 0 or np.shares_memory(p, d)
+        assert p.shape[0] == 0 or np.shares_memory(plist[n], d)
+        assert np.all(np.diff(p.time) >= 0)
+        assert np.array_equal(plist[n], p)
+        idx &= d['time'] >= tmax
+        p = pthld.get_data(partid, totim=tmax)
+        assert np.array_equal(p.time, d['time'][idx])
+        assert np.array_equal(plist_ge[n], p)
+    assert pthld.get_data(pthld.get_maxid() + 1).shape[0] == 0
+
+    # destination pathlines end in the destination cell
+    dest = [(4, 12, 12)]
+    well_pthld = pthld.get_destination_pathline_data(dest, to_recarray=True)
+    well_list = pthld.get_destination_pathline_data(dest)
+    partids = np.unique(well_pthld.particleid)
+    assert len(well_list) == partids.shape[0]
+    for partid, p in zip(partids, well_list):
+        ra = well_pthld[well_pthld.particleid == partid]
+        assert np.array_equal(ra.x, p.x)
+        assert (ra.k[-1], ra.i[-1], ra.j[-1]) == dest[0]
+
+    for partid in np.unique(epd._data['particleid']):
+        e = epd.get_data(partid)
+        assert np.array_equal(e, epd._data[epd._data['particleid'] == partid])
+
+
 def test_loadtxt():
     from flopy.utils.flopy_io import loadtxt
     pthfile = os.path.join(path, 'EXAMPLE-3.pathline')
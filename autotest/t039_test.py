@@ -232,6 +232,61 @@ def test_get_model_shape():
     return
 
 
+def test_sum_flux_tuples():
+    from flopy.utils.zonbud import sum_flux_tuples
+    fz = np.array([3, 1, 1, 2, 3, 1])
+    tz = np.array([1, 2, 2, 3, 1, 3])
+    f = np.array([1., 2., 3., 4., 5., 6.], dtype=np.float32)
+    fzi, tzi, fi = sum_flux_tuples(fz, tz, f)
+    assert np.array_equal(fzi, [1, 1, 2, 3])
+    assert np.array_equal(tzi, [2, 3, 3, 1])
+    assert np.allclose(fi, [5., 6., 4., 6.])
+    assert fi.dtype == np.float32
+    fzi, tzi, fi = sum_flux_tuples([], [], [])
+    assert len(fzi) == len(tzi) == len(fi) == 0
+
+    # negative zones get their own (from zone, to zone) pairs
+    fzi, tzi, fi = sum_flux_tuples([-1, 0, -1, 1], [1, 0, 1, -1],
+                                   [1., 2., 3., 4.])
+    assert np.array_equal(fzi, [-1, 0, 1])
+    assert np.array_equal(tzi, [1, 0, -1])
+    assert np.array_equal(fi, [4., 2., 4.])
+
+    # the sums are the same as summing the fluxes of each pair in the
+    # flux dtype
+    rng = np.random.RandomState(0)
+    fz = rng.randint(-3, 4, 5000)
+    tz = rng.randint(-3, 4, 5000)
+    f = rng.rand(5000).astype(np.float32)
+    fzi, tzi, fi = sum_flux_tuples(fz, tz, f)
+    for fzj, tzj, fj in zip(fzi, tzi, fi):
+        assert fj == np.sum(f[(fz == fzj) & (tz == tzj)])
+    assert len(fzi) == len(set(zip(fz, tz)))
+    return
+
+
+def test_zonbud_parallel():
+    cbc = CellBudgetFile(os.path.join('..', 'examples', 'data',
+                                      'preserve_unitnums',
+                                      'testsfr2.lpf.cbc'),
+                         precision='double')
+    zon = np.ones(cbc.get_data(idx=0, full3D=True)[0].shape, dtype=int)
+    zon[:, :, 50:] = 2
+    zb = ZoneBudget(cbc, zon)
+    zbp = ZoneBudget(cbc, zon, max_workers=2)
+    bud = zb.get_budget()
+    budp = zbp.get_budget()
+    assert np.array_equal(bud['name'], budp['name'])
+    for name in ['ZONE_1', 'ZONE_2', 'totim', 'time_step']:
+        assert np.array_equal(bud[name], budp[name])
+    times = cbc.get_times()[1:3]
+    zbt = ZoneBudget(cbc, zon, totim=times)
+    zbtp = ZoneBudget(cbc, zon, totim=times, max_workers=2)
+    assert np.array_equal(zbt.get_budget()['ZONE_1'],
+                          zbtp.get_budget()['ZONE_1'])
+    return
+
+
 if __name__ == '__main__':
     # test_compare2mflist_mlt()
     test_compare2zonebudget()
@@ -244,3 +299,5 @@ if __name__ == '__main__':
     test_dataframes()
     test_get_budget()
     test_get_model_shape()
+    test_sum_flux_tuples()
+    test_zonbud_parallel()
@@ -203,6 +203,225 @@ def test_vtk_cbc():
     return
 
 
+def test_vtk_cell_geometry():
+    # compare the vectorized geometry with the cell vertices of the grid
+    freyberg_pth = os.path.join('..', 'examples', 'data',
+                                'freyberg_multilayer_transient')
+    m = flopy.modflow.Modflow.load('freyberg.nam', model_ws=freyberg_pth,
+                                   verbose=False, load_only=['dis', 'bas6'])
+    mg = m.modelgrid
+
+    vtkobj = vtk.Vtk(m)
+    points, connectivity, offsets, celltypes, faces, faceoffsets = \
+        vtkobj.get_3d_cell_geometry()
+    cellids = np.flatnonzero(vtkobj.ibound)
+    if celltypes.size != cellids.size or np.any(celltypes != 11):
+        raise AssertionError('unexpected number or type of cells')
+    if points.shape != (cellids.size * 8, 3) or faces is not None:
+        raise AssertionError('unexpected points')
+    if not np.array_equal(offsets, 8 * np.arange(1, cellids.size + 1)):
+        raise AssertionError('unexpected offsets')
+    if not mg._copy_cache:
+        raise AssertionError('grid cache copying was not restored')
+    for icell in range(0, cellids.size, 97):
+        k, i, j = np.unravel_index(cellids[icell], vtkobj.shape)
+        pt0, pt1, pt2, pt3, pt0 = mg._cell_vert_list(i, j)
+        xy = np.array([pt1, pt2, pt0, pt3] * 2)
+        z = np.repeat([mg.top_botm[k + 1, i, j], mg.top_botm[k, i, j]], 4)
+        cellpoints = points[icell * 8:(icell + 1) * 8]
+        if not np.allclose(cellpoints[:, :2], xy) or \
+                not np.allclose(cellpoints[:, 2], z):
+            raise AssertionError('cell {} vertices differ'.format(icell))
+
+    # the cell dictionaries are built from the same geometry
+    verts = vtkobj.verts
+    if sorted(verts) != cellids.tolist():
+        raise AssertionError('unexpected cells in vertex dictionary')
+    if not np.allclose(verts[cellids[5]], points[40:48]):
+        raise AssertionError('vertex dictionary differs from points')
+
+    # smoothed elevations are the mean of the neighbouring cells
+    vtkobj = vtk.Vtk(m, smooth=True)
+    zverts = vtkobj.extendedDataArray(mg.top_botm)
+    if not np.isclose(zverts[1, 1, 1], mg.top_botm[1, :2, :2].mean()):
+        raise AssertionError('unexpected smoothed elevation')
+    if not np.isclose(zverts[0, 0, 0], mg.top_botm[0, 0, 0]):
+        raise AssertionError('unexpected smoothed corner elevation')
+    return
+
+
+def test_vtk_vertex_grid():
+    # test vtk export of vertex (DISV) grids
+    mf6expth = os.path.join('..', 'examples', 'data', 'mf6')
+    for simnm, celltype, nvert in (('test003_gwftri_disv', 13, 3),
+                                   ('test003_gwfs_disv', 12, 4)):
+        simpth = os.path.join(mf6expth, simnm)
+        sim = flopy.mf6.MFSimulation.load(simnm, 'mf6', 'mf6', simpth)
+        m = sim.get_model(list(sim.model_names)[0])
+        mg = m.modelgrid
+
+        vtkobj = vtk.Vtk(m)
+        points, connectivity, offsets, celltypes, faces, faceoffsets = \
+            vtkobj.get_3d_cell_geometry()
+        cellids = np.flatnonzero(vtkobj.ibound)
+        ncells = cellids.size
+        if celltypes.size != ncells or np.any(celltypes != celltype):
+            raise AssertionError('unexpected number or type of cells')
+        if points.shape != (ncells * 2 * nvert, 3):
+            raise AssertionError('unexpected number of points')
+
+        # the first active cell is a prism between its top and botm
+        k, icpl = np.unravel_index(cellids[0], mg.shape)
+        cellpoints = points[:2 * nvert]
+        xv, yv = mg.xvertices[icpl], mg.yvertices[icpl]
+        if sorted(zip(cellpoints[:nvert, 0], cellpoints[:nvert, 1])) != \
+                sorted(zip(xv, yv)):
+            raise AssertionError('unexpected cell vertices')
+        z = np.repeat([mg.top_botm[k + 1, icpl], mg.top_botm[k, icpl]],
+                      nvert)
+        if not np.allclose(cellpoints[:, 2], z):
+            raise AssertionError('unexpected cell elevations')
+
+        ws = os.path.join(cpth, simnm)
+        m.export(ws, fmt='vtk')
+        m.export(ws, fmt='vtk', point_scalars=True)
+        m.export(os.path.join(binot, simnm), fmt='vtk', binary=True)
+        vtk.export_array(m, mg.top_botm[1:], ws, 'botm', smooth=True,
+                         binary=True)
+
+    # cells with more than six vertices are written as polyhedrons
+    angles = np.linspace(0., 2. * np.pi, 8)[:-1]
+    vertices = [[iv, np.cos(a), np.sin(a)] for iv, a in enumerate(angles)]
+    vertices += [[7, 2., 0.], [8, 3., 0.], [9, 3., 1.], [10, 2., 1.]]
+    cell2d = [[0, 0., 0., 7, 6, 5, 4, 3, 2, 1, 0],
+              [1, 2.5, 0.5, 4, 7, 10, 9, 8]]
+    sim = flopy.mf6.MFSimulation(sim_ws=cpth)
+    flopy.mf6.ModflowTdis(sim)
+    m = flopy.mf6.ModflowGwf(sim, modelname='polyhedron')
+    flopy.mf6.ModflowGwfdisv(m, nlay=1, ncpl=2, nvert=len(vertices),
+                             top=1., botm=0., vertices=vertices,
+                             cell2d=cell2d)
+    vtkobj = vtk.Vtk(m)
+    points, connectivity, offsets, celltypes, faces, faceoffsets = \
+        vtkobj.get_3d_cell_geometry()
+    if celltypes.tolist() != [42, 12]:
+        raise AssertionError('unexpected cell types')
+    if faceoffsets.tolist() != [52, -1] or faces[0] != 9:
+        raise AssertionError('unexpected polyhedron faces')
+    vtkobj.add_array('a', np.ones((1, 2)))
+    vtkobj.write_binary(os.path.join(binot, 'polyhedron.vtu'))
+    return
+
+
+def read_appended_vtu(fname):
+    # read the data arrays of an appended binary .vtu file
+    import re
+    import zlib
+    with open(fname, 'rb') as f:
+        raw = f.read()
+    i = raw.index(b'<AppendedData')
+    header = raw[:i].decode()
+    data = raw[raw.index(b'_', i) + 1:]
+    dtypes = {'Float64': np.float64, 'Int64': np.int64, 'UInt8': np.uint8}
+    arrays = {}
+    for attrs in re.findall(r'<DataArray([^>]*)>', header):
+        attrs = dict(re.findall(r'(\w+)="([^"]*)"', attrs))
+        offset = int(attrs['offset'])
+        if 'vtkZLibDataCompressor' in header:
+            nblocks = int(np.frombuffer(data, np.uint64, 1, offset)[0])
+            sizes = np.frombuffer(data, np.uint64, nblocks, offset + 24)
+            pos = offset + 24 + 8 * nblocks
+            block = b''
+            for size in sizes.astype(int):
+                block += zlib.decompress(data[pos:pos + size])
+                pos += size
+        else:
+            size = int(np.frombuffer(data, np.uint64, 1, offset)[0])
+            block = data[offset + 8:offset + 8 + size]
+        arrays[attrs['Name']] = np.frombuffer(block, dtypes[attrs['type']])
+    return arrays
+
+
+def test_vtk_binary_time_series():
+    # write a head file with a time series for the mf6 freyberg model
+    ws = os.path.join('..', 'examples', 'data', 'mf6-freyberg')
+    sim = flopy.mf6.MFSimulation.load('mfsim.nam', 'mf6', 'mf6', ws)
+    m = sim.get_model('gwf_1')
+    nlay, nrow, ncol = m.modelgrid.shape
+    head = flopy.utils.HeadFile(os.path.join(ws, 'freyberg.hds')).get_data()
+    hdsfile = os.path.join(cpth, 'freyberg_series.hds')
+    with open(hdsfile, 'wb') as f:
+        for kper in range(5):
+            # cells without data change the active cells of the third step
+            a = head[0] + kper
+            if kper == 2:
+                a[:, :3] = -1e20
+            header = flopy.utils.BinaryHeader.create(
+                bintype='head', precision='double', text='head', nrow=nrow,
+                ncol=ncol, ilay=1, pertim=1., totim=kper + 1., kstp=1,
+                kper=kper + 1)
+            flopy.utils.Util2d.write_bin((nrow, ncol), f, a,
+                                         header_data=header)
+
+    otfolder = os.path.join(cpth, 'heads_series')
+    vtk.export_heads(m, hdsfile, otfolder, binary=True)
+    otfolder = os.path.join(cpth, 'heads_series_zlib')
+    vtk.export_heads(m, hdsfile, otfolder, binary=True, compressor='zlib',
+                     max_workers=2)
+
+    active = m.modelgrid.idomain[0] != 0
+    for kper in range(5):
+        fname = 'gwf_1_Heads_KPER{}_KSTP1.vtu'.format(kper + 1)
+        raw = read_appended_vtu(os.path.join(cpth, 'heads_series', fname))
+        compressed = read_appended_vtu(
+            os.path.join(cpth, 'heads_series_zlib', fname))
+        for name in raw:
+            if not np.array_equal(raw[name], compressed[name]):
+                raise AssertionError('{} arrays differ'.format(name))
+        if kper == 2:
+            ncells = np.count_nonzero(active[:, 3:])
+        else:
+            ncells = np.count_nonzero(active)
+            if not np.allclose(raw['head'], head[0][active] + kper):
+                raise AssertionError('unexpected heads')
+        if raw['types'].size != ncells or raw['points'].size != ncells * 24:
+            raise AssertionError('unexpected number of cells')
+    return
+
+
+def test_vtk_cbc_records():
+    # only 3d budget records are exported, also for a single layer model
+    ws = os.path.join(cpth, 'cbc_records')
+    nlay, nrow, ncol = 1, 3, 4
+    m = flopy.modflow.Modflow('cbcrec', model_ws=ws)
+    flopy.modflow.ModflowDis(m, nlay=nlay, nrow=nrow, ncol=ncol)
+    flopy.modflow.ModflowBas(m)
+    cbcfile = os.path.join(cpth, 'cbc_records.cbc')
+    h1dt = np.dtype([('kstp', '<i4'), ('kper', '<i4'), ('text', 'S16'),
+                     ('ncol', '<i4'), ('nrow', '<i4'), ('nlay', '<i4')])
+    h2dt = np.dtype([('imeth', '<i4'), ('delt', '<f4'), ('pertim', '<f4'),
+                     ('totim', '<f4')])
+    frf = np.arange(nlay * nrow * ncol, dtype=np.float32)
+    rch = np.full((nrow, ncol), 2., dtype=np.float32)
+    with open(cbcfile, 'wb') as f:
+        for text, imeth, a in (('FLOW RIGHT FACE', 1, frf),
+                               ('RECHARGE', 4, rch)):
+            np.array([(1, 1, '{:>16}'.format(text), ncol, nrow, -nlay)],
+                     dtype=h1dt).tofile(f)
+            np.array([(imeth, 1., 1., 1.)], dtype=h2dt).tofile(f)
+            a.tofile(f)
+
+    otfolder = os.path.join(cpth, 'cbc_records_bin')
+    vtk.export_cbc(m, cbcfile, otfolder, binary=True)
+    arrays = read_appended_vtu(
+        os.path.join(otfolder, 'cbcrec_CBC_KPER1_KSTP1.vtu'))
+    if not np.array_equal(arrays['FLOW RIGHT FACE'], frf):
+        raise AssertionError('unexpected FLOW RIGHT FACE values')
+    if 'RECHARGE' in arrays:
+        raise AssertionError('2d RECHARGE record was exported')
+    return
+
+
 if __name__ == '__main__':
     test_vtk_export_array2d()
     test_vtk_export_array3d()
@@ -212,3 +431,7 @@ if __name__ == '__main__':
     test_vtk_mf6()
     test_vtk_binary_head_export()
     test_vtk_cbc()
+    test_vtk_cbc_records()
+    test_vtk_cell_geometry()
+    test_vtk_vertex_grid()
+    test_vtk_binary_time_series()
@@ -142,5 +142,101 @@ def test_intersection():
             assert all(np.isnan([row, col, cell2d_disv]))
 
 
+def test_intersection_arrays():
+    ml_dis = dis_model()
+    ml_disv = disv_model()
+
+    # points inside cells and on cell edges, in local coordinates
+    x = np.array([4001., 4000., 250., 9999., 500., 7250.])
+    y = np.array([4001., 4000., 250., 10499., 3000., 1100.])
+    cell2d_disv = ml_disv.modelgrid.intersect(x, y, local=True)
+    assert cell2d_disv.shape == x.shape
+    for xp, yp, cell2d in zip(x, y, cell2d_disv):
+        row, col = ml_dis.modelgrid.intersect(xp, yp, local=True)
+        assert cell2d == row * ml_dis.modelgrid.ncol + col
+        assert cell2d == ml_disv.modelgrid.intersect(xp, yp, local=True)
+
+    # real-world coordinates give the same cells for points inside cells
+    inside = [0, 2, 3, 5]
+    xw, yw = ml_disv.modelgrid.get_coords(x[inside], y[inside])
+    assert np.array_equal(ml_disv.modelgrid.intersect(xw, yw),
+                          cell2d_disv[inside])
+
+    # points outside of the grid
+    cell2d_disv = ml_disv.modelgrid.intersect(np.array([4001., 999.]),
+                                              np.array([4001., -1.]),
+                                              local=True, forgive=True)
+    assert cell2d_disv[0] == ml_disv.modelgrid.intersect(4001., 4001.,
+                                                         local=True)
+    assert np.isnan(cell2d_disv[1])
+    try:
+        ml_disv.modelgrid.intersect(np.array([4001., 999.]),
+                                    np.array([4001., -1.]), local=True)
+        assert False, 'point outside of the grid should raise an exception'
+    except Exception as e:
+        assert 'outside of the model area' in e.args[0]
+
+    # the cell index is rebuilt when the grid is moved
+    ml_disv.modelgrid.set_coord_info(xoff=0., yoff=0., angrot=0.)
+    assert ml_disv.modelgrid.intersect(4001., 4001.) == \
+        ml_disv.modelgrid.intersect(4001., 4001., local=True)
+
+
+def test_intersection_unstructured():
+    # two unit squares side by side
+    vertices = [[0, 0., 0.], [1, 1., 0.], [2, 2., 0.],
+                [3, 0., 1.], [4, 1., 1.], [5, 2., 1.]]
+    iverts = [[0, 1, 4, 3], [1, 2, 5, 4]]
+    ugrid = flopy.discretization.UnstructuredGrid(
+        vertices=vertices, iverts=iverts, xcenters=[0.5, 1.5],
+        ycenters=[0.5, 0.5], ncpl=[2], top=np.ones(2),
+        botm=np.zeros((1, 2)))
+    assert ugrid.intersect(0.5, 0.5) == 0
+    # the shared edge belongs to the cell with the lowest number
+    assert ugrid.intersect(1., 0.5) == 0
+    assert ugrid.intersect(1.5, 0.2) == 1
+    assert np.isnan(ugrid.intersect(3., 3., forgive=True))
+    cells = ugrid.intersect([0.5, 1., 1.5], [0.5, 0.5, 0.2])
+    assert list(cells) == [0, 0, 1]
+
+
+def test_intersection_rotated_vertices():
+    # the vertices of a small rotated grid, given in real-world coordinates,
+    # are in the cell with the lowest number that shares the vertex
+    nrow, ncol, d = 4, 15, 0.1
+    vertices = [[i * (ncol + 1) + j, j * d, (nrow - i) * d]
+                for i in range(nrow + 1) for j in range(ncol + 1)]
+    cell2d = []
+    expected = np.full((nrow + 1) * (ncol + 1), nrow * ncol)
+    for i in range(nrow):
+        for j in range(ncol):
+            iv = i * (ncol + 1) + j
+            iverts = [iv, iv + 1, iv + ncol + 2, iv + ncol + 1]
+            icell2d = i * ncol + j
+            cell2d.append([icell2d, (j + 0.5) * d, (nrow - i - 0.5) * d,
+                           4] + iverts)
+            expected[iverts] = np.minimum(expected[iverts], icell2d)
+    ncpl = nrow * ncol
+    mg = flopy.discretization.VertexGrid(vertices=vertices, cell2d=cell2d,
+                                         top=np.ones(ncpl),
+                                         botm=np.zeros((1, ncpl)),
+                                         nlay=1, ncpl=ncpl, xoff=1234.567,
+                                         yoff=7654.321, angrot=33.3)
+    xv = np.array([v[1] for v in vertices])
+    yv = np.array([v[2] for v in vertices])
+    xw, yw = mg.get_coords(xv, yv)
+    assert np.array_equal(mg.intersect(xw, yw), expected)
+    for xp, yp, icell2d in zip(xw, yw, expected):
+        assert mg.intersect(xp, yp) == icell2d
+
+    # points just outside of the grid are still outside
+    xw, yw = mg.get_coords(np.array([-1e-6, ncol * d + 1e-6]),
+                           np.array([0.05, 0.05]))
+    assert np.all(np.isnan(mg.intersect(xw, yw, forgive=True)))
+
+
 if __name__ == '__main__':
-    test_intersection()
\ No newline at end of file
+    test_intersection()
+    test_intersection_arrays()
+    test_intersection_unstructured()
+    test_intersection_rotated_vertices()
\ No newline at end of file
@@ -6,6 +6,7 @@ import shutil
 import time
 import numpy as np
 import flopy.modflow as fm
+from flopy.utils.util_array import Util2d
 
 
 class TestModflowPerformance():
@@ -92,3 +93,41 @@ class TestModflowPerformance():
     def teardown_class(cls):
         # cleanup
         shutil.rmtree(cls.model_ws)
+
+
+def test_load_txt_free_bulk():
+    """test that large free format arrays are parsed in bulk and give the
+    same values as the item by item parser."""
+    model_ws = 'temp/t064_load_txt'
+    if not os.path.isdir(model_ws):
+        os.makedirs(model_ws)
+    rng = np.random.RandomState(64)
+    cases = [('small', 300, (20, 20), np.float32, '%.6e'),
+             ('int', 2, (1000, 1000), np.int32, '%d'),
+             ('float32', 2, (1000, 1000), np.float32, '%.6e'),
+             ('float64', 2, (1000, 1000), np.float64, '%.15e')]
+    for name, narrays, shape, dtype, fmt in cases:
+        fname = os.path.join(model_ws, '{}.txt'.format(name))
+        with open(fname, 'w') as f:
+            for i in range(narrays):
+                a = (rng.rand(*shape) * 1000).astype(dtype)
+                np.savetxt(f, a, fmt=fmt)
+        num_items = a.size
+        with open(fname) as f:
+            expected = [Util2d._load_txt_items(f, [], num_items, dtype,
+                                               'free', None)
+                        for i in range(narrays)]
+        with open(fname) as f:
+            for a in expected:
+                a2 = Util2d.load_txt(shape, f, dtype, '(FREE)')
+                assert a2.dtype == a.dtype
+                assert np.array_equal(a2.ravel(), a), \
+                    "{} arrays do not match".format(name)
+            assert f.readline() == ''
+        with open(fname) as f:
+            for a in expected:
+                a2, lines = Util2d._load_txt_free(f, num_items, dtype)
+                assert a2 is not None, \
+                    "{} arrays were not parsed in bulk".format(name)
+                assert np.array_equal(a2, a)
+    shutil.rmtree(model_ws)
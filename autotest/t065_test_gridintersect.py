@@ -303,6 +303,48 @@ def test_tri_grid_multipoint_in_multiple_cells():
     return result
 
 
+# %% test bulk point intersection
+
+
+def test_rect_grid_intersect_points():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    for method in ("structured", "strtree"):
+        gr = get_rect_grid(angrot=30., xyoffset=10.)
+        ix = GridIntersect(gr, method=method)
+        x, y = gr.get_coords(np.array([1., 10., 20., 12., 25., 5.]),
+                             np.array([1., 10., 10., 12., 25., 20.]))
+        i, j = ix.intersect_points(x, y)
+        assert list(zip(i, j)) == [(1, 0), (0, 0), (0, 1), (0, 1),
+                                   (-1, -1), (0, 0)]
+    return
+
+
+def test_tri_grid_intersect_points():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    gr = get_tri_grid(triangle_exe=triangle_exe)
+    if gr == -1:
+        return
+    ix = GridIntersect(gr)
+    x = np.array([25., 20., 10., 1., 12.])
+    y = np.array([25., 10., 10., 1., 12.])
+    cellids = ix.intersect_points(x, y)
+    for xp, yp, cellid in zip(x, y, cellids):
+        result = ix.intersect_point(Point(xp, yp))
+        if len(result) == 0:
+            assert cellid == -1
+        else:
+            assert cellid == result.cellids[0]
+    return
+
+
 # %% test linestring structured
 
 
@@ -1092,5 +1134,244 @@ def test_rasters():
     del rio
 
 
+def test_rasters_windowed():
+    from flopy.utils import Raster
+    import os
+    import warnings
+    import flopy as fp
+
+    ws = os.path.join("..", "examples", "data", "options")
+    raster_name = os.path.join(ws, "dem", "dem.img")
+
+    try:
+        rio = Raster.load(raster_name)
+        rio_win = Raster.load(raster_name, windowed=True, max_memory=0.1)
+    except ImportError:
+        return
+
+    ml = fp.modflow.Modflow.load("sagehen.nam", version="mfnwt",
+                                 model_ws=os.path.join(ws, 'sagehen'))
+    xoff = 214110
+    yoff = 4366620
+    ml.modelgrid.set_coord_info(xoff, yoff)
+
+    # windowed results should match results from the full raster
+    val = rio_win.sample_point(xoff + 2000, yoff + 2000, band=1)
+    if val != rio.sample_point(xoff + 2000, yoff + 2000, band=1):
+        raise AssertionError
+
+    x0, x1, y0, y1 = rio.bounds
+    shape = np.array([(x0 + 1000, y0 + 1000), (x0 + 1000, y1 - 1000),
+                      (x1 - 1000, y1 - 1000), (x1 - 1000, y0 + 1000)])
+
+    data = rio_win.sample_polygon(shape, band=1)
+    if not np.array_equal(data, rio.sample_polygon(shape, band=1)):
+        raise AssertionError
+
+    for angrot in (0., 15.):
+        ml.modelgrid.set_coord_info(xoff, yoff, angrot=angrot)
+        for method in ("nearest", "bilinear", "bicubic"):
+            data = rio_win.resample_to_grid(ml.modelgrid.xcellcenters,
+                                            ml.modelgrid.ycellcenters,
+                                            band=1, method=method)
+            data0 = rio.resample_to_grid(ml.modelgrid.xcellcenters,
+                                         ml.modelgrid.ycellcenters,
+                                         band=1, method=method)
+            if not np.array_equal(data, data0):
+                raise AssertionError(
+                    "windowed {} resampling with angrot={} does not match "
+                    "the full raster".format(method, angrot))
+    ml.modelgrid.set_coord_info(xoff, yoff, angrot=0.)
+
+    # "linear" and "cubic" triangulate every raster cell center, so they
+    # are compared on a small raster cut from the dem
+    out_dir = os.path.join("temp", "t065")
+    if not os.path.exists(out_dir):
+        os.makedirs(out_dir)
+    small_name = os.path.join(out_dir, "dem_small.tif")
+    rio_small = Raster.load(raster_name)
+    rio_small.crop([(x0 + 2000, y0 + 2000), (x0 + 2000, y0 + 3000),
+                    (x0 + 3000, y0 + 3000), (x0 + 3000, y0 + 2000)])
+    rio_small.write(small_name)
+    rio_small = Raster.load(small_name)
+    rio_small_win = Raster.load(small_name, windowed=True)
+    rio_small_blocks = Raster.load(small_name, windowed=True,
+                                   max_memory=0.1)
+    arr = rio_small.get_array(1, masked=False).astype(float)
+    zrange = arr.max() - arr.min()
+    # half of the twist of the raster values around each raster cell
+    twist = np.abs(arr[:-1, :-1] - arr[:-1, 1:] - arr[1:, :-1] +
+                   arr[1:, 1:]) / 2.
+    xg, yg = np.meshgrid(np.linspace(-400., 400., 20),
+                         np.linspace(-400., 400., 20))
+    for angrot in (0., 15.):
+        a = np.radians(angrot)
+        xc = x0 + 2500. + xg * np.cos(a) - yg * np.sin(a)
+        yc = y0 + 2500. + xg * np.sin(a) + yg * np.cos(a)
+        for method in ("linear", "cubic"):
+            data0 = rio_small.resample_to_grid(xc, yc, band=1,
+                                               method=method)
+            # the full band fits in max_memory and is read at once
+            data = rio_small_win.resample_to_grid(xc, yc, band=1,
+                                                  method=method)
+            if not np.array_equal(data, data0):
+                raise AssertionError(
+                    "windowed {} resampling with angrot={} does not match "
+                    "the full raster".format(method, angrot))
+
+            # larger bands are resampled block by block with a warning
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                data = rio_small_blocks.resample_to_grid(xc, yc, band=1,
+                                                         method=method)
+            if not any("max_memory" in str(wi.message) for wi in w):
+                raise AssertionError("block by block {} resampling did "
+                                     "not warn".format(method))
+            diff = np.abs(data - data0)
+            if method == "linear":
+                fx = (xc - rio_small.xcenters[0, 0]) / 10.
+                fy = (rio_small.ycenters[0, 0] - yc) / 10.
+                tol = twist[np.floor(fy).astype(int),
+                            np.floor(fx).astype(int)] + 1e-6
+            else:
+                tol = 0.01 * zrange
+            if np.any(diff > tol):
+                raise AssertionError(
+                    "block by block {} resampling with angrot={} differs "
+                    "from the full raster".format(method, angrot))
+
+    # raster no data values are not interpolated
+    ml.modelgrid.set_coord_info(xoff, yoff, angrot=15.)
+    arr = rio.get_array(1)
+    data = rio.resample_to_grid(ml.modelgrid.xcellcenters,
+                                ml.modelgrid.ycellcenters,
+                                band=1, method="bicubic")
+    data = data[data != rio.nodatavals[0]]
+    if np.any(data < np.nanmin(arr) - 100.) or \
+            np.any(data > np.nanmax(arr) + 100.):
+        raise AssertionError("bicubic resampling interpolated no data values")
+    ml.modelgrid.set_coord_info(xoff, yoff, angrot=0.)
+
+    # interpolation reproduces the raster values at the cell centers
+    xc, yc = rio.xcenters[10:20, 10:20], rio.ycenters[10:20, 10:20]
+    for method in ("bilinear", "bicubic"):
+        data = rio.resample_to_grid(xc, yc, band=1, method=method)
+        if not np.allclose(data, rio.get_array(1)[10:20, 10:20]):
+            raise AssertionError
+
+    data = rio_win.zonal_statistics(ml.modelgrid, band=1, method="mean")
+    data0 = rio.zonal_statistics(ml.modelgrid, band=1, method="mean")
+    if not np.allclose(data, data0):
+        raise AssertionError
+
+    rio.crop(shape)
+    rio_win.crop(shape)
+    if rio_win.bounds != rio.bounds:
+        raise AssertionError
+    if not np.array_equal(rio_win.get_array(band=1, masked=False),
+                          rio.get_array(band=1, masked=False)):
+        raise AssertionError
+
+    del rio, rio_win
+
+
+def test_raster_zonal_statistics():
+    from flopy.utils import Raster
+    from flopy.utils.rasters import RasterCellIndex
+    import os
+    import flopy as fp
+
+    ws = os.path.join("..", "examples", "data", "options")
+    raster_name = os.path.join(ws, "dem", "dem.img")
+
+    try:
+        rio = Raster.load(raster_name)
+    except ImportError:
+        return
+
+    ml = fp.modflow.Modflow.load("sagehen.nam", version="mfnwt",
+                                 model_ws=os.path.join(ws, 'sagehen'))
+    xoff = 214110
+    yoff = 4366620
+    mg = ml.modelgrid
+    mg.set_coord_info(xoff, yoff)
+
+    out_dir = os.path.join("temp", "t065")
+    if not os.path.exists(out_dir):
+        os.makedirs(out_dir)
+    fname = os.path.join(out_dir, "sagehen_index.npz")
+    if os.path.exists(fname):
+        os.remove(fname)
+
+    index = rio.get_cell_index(mg, fname=fname)
+    if not os.path.isfile(fname):
+        raise AssertionError("cell index cache file was not written")
+
+    # brute force: the pixels with centers in each cell, with cell edges
+    # assigned as in StructuredGrid.intersect
+    arr = rio.get_array(1, masked=False)
+    nodata = rio.nodatavals[0]
+    x = rio.xcenters[0] - xoff
+    y = rio.ycenters[:, 0] - yoff
+    xe, ye = mg.xyedges
+    stats = {m: np.full(mg.shape[1:], nodata, dtype=np.float64)
+             for m in RasterCellIndex.methods}
+    stats["count"][:] = 0
+    for i in range(mg.nrow):
+        rows = (y < ye[i]) & (y >= ye[i + 1])
+        for j in range(mg.ncol):
+            cols = (x > xe[j]) & (x <= xe[j + 1])
+            vals = arr[rows][:, cols].ravel().astype(np.float64)
+            vals = vals[(vals != nodata) & ~np.isnan(vals)]
+            stats["count"][i, j] = vals.size
+            if vals.size == 0:
+                continue
+            stats["mean"][i, j] = np.mean(vals)
+            stats["median"][i, j] = np.median(vals)
+            stats["min"][i, j] = np.min(vals)
+            stats["max"][i, j] = np.max(vals)
+            values, counts = np.unique(vals, return_counts=True)
+            stats["mode"][i, j] = values[np.argmax(counts)]
+
+    if np.sum(stats["count"] > 0) == 0:
+        raise AssertionError
+    for method in RasterCellIndex.methods:
+        data = rio.zonal_statistics(mg, band=1, method=method)
+        if data.shape != mg.shape[1:]:
+            raise AssertionError
+        if method == "mean":
+            same = np.allclose(data, stats[method])
+        else:
+            same = np.array_equal(data, stats[method])
+        if not same:
+            raise AssertionError(
+                "zonal statistic {} does not match".format(method))
+
+    # the index is loaded from the cache file by another raster instance,
+    # a truncated index with the same key shows that it was not rebuilt
+    RasterCellIndex(index.cells[:10], index.pixels[:10], index.shape,
+                    key=index.key).save(fname)
+    rio2 = Raster.load(raster_name)
+    index2 = rio2.get_cell_index(mg, fname=fname)
+    if index2.key != index.key or index2.shape != index.shape or \
+            not np.array_equal(index2.cells, index.cells[:10]) or \
+            not np.array_equal(index2.pixels, index.pixels[:10]):
+        raise AssertionError("cell index was not loaded from the cache file")
+
+    # moving the grid changes the key, so the cache file is rebuilt
+    mg.set_coord_info(xoff + 100., yoff)
+    index3 = rio2.get_cell_index(mg, fname=fname)
+    if index3.key == index.key:
+        raise AssertionError("cell index key did not change")
+    if index3.cells.size == 10:
+        raise AssertionError("stale cell index was used")
+    if RasterCellIndex.load(fname).key != index3.key:
+        raise AssertionError("cell index cache file was not updated")
+
+    del rio, rio2
+
+
 if __name__ == "__main__":
     test_rasters()
+    test_rasters_windowed()
+    test_raster_zonal_statistics()
@@ -0,0 +1,165 @@
+# BAS6 package for  MODFLOW-NWT, generated by Flopy.
+FREE
+INTERNAL               1     (FREE) -1 #ibound_layer_0                
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1        -1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1        -1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1        -1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1         1
+    -999.0
+INTERNAL               1     (FREE) -1 #strt_layer_0                  
+   5.490000E+01   5.550000E+01   5.610000E+01   5.660000E+01   5.720000E+01   5.780000E+01   5.830000E+01   5.890000E+01   5.950000E+01   6.010000E+01   6.060000E+01   6.120000E+01   6.180000E+01   6.240000E+01   6.300000E+01   6.350000E+01   6.410000E+01   6.470000E+01   6.530000E+01   6.590000E+01   6.650000E+01   6.710000E+01   6.770000E+01   6.820000E+01   6.880000E+01   6.940000E+01   7.000000E+01   7.060000E+01   7.120000E+01   7.180000E+01   7.240000E+01   7.290000E+01   7.350000E+01   7.410000E+01   7.470000E+01   7.530000E+01   7.590000E+01   7.650000E+01   7.700000E+01   7.760000E+01   7.820000E+01   7.880000E+01   7.940000E+01   7.990000E+01   8.050000E+01   8.110000E+01   8.170000E+01   8.220000E+01   8.280000E+01   8.340000E+01   8.400000E+01   8.450000E+01   8.510000E+01   8.570000E+01   8.620000E+01   8.680000E+01   8.730000E+01   8.790000E+01   8.840000E+01   8.900000E+01   8.950000E+01   9.010000E+01   9.060000E+01   9.120000E+01   9.170000E+01   9.220000E+01   9.280000E+01   9.330000E+01   9.380000E+01   9.440000E+01   9.490000E+01   9.540000E+01   9.590000E+01   9.640000E+01   9.690000E+01   9.740000E+01   9.790000E+01   9.840000E+01   9.890000E+01   9.940000E+01
+   5.590000E+01   5.650000E+01   5.700000E+01   5.750000E+01   5.800000E+01   5.850000E+01   5.890000E+01   5.940000E+01   5.990000E+01   6.040000E+01   6.080000E+01   6.130000E+01   6.180000E+01   6.230000E+01   6.290000E+01   6.340000E+01   6.400000E+01   6.450000E+01   6.510000E+01   6.570000E+01   6.640000E+01   6.700000E+01   6.760000E+01   6.830000E+01   6.890000E+01   6.960000E+01   7.020000E+01   7.080000E+01   7.150000E+01   7.210000E+01   7.260000E+01   7.320000E+01   7.380000E+01   7.430000E+01   7.490000E+01   7.540000E+01   7.590000E+01   7.640000E+01   7.680000E+01   7.730000E+01   7.780000E+01   7.830000E+01   7.880000E+01   7.930000E+01   7.980000E+01   8.030000E+01   8.080000E+01   8.140000E+01   8.190000E+01   8.250000E+01   8.310000E+01   8.370000E+01   8.430000E+01   8.490000E+01   8.550000E+01   8.610000E+01   8.670000E+01   8.730000E+01   8.790000E+01   8.850000E+01   8.910000E+01   8.960000E+01   9.020000E+01   9.070000E+01   9.120000E+01   9.170000E+01   9.220000E+01   9.260000E+01   9.310000E+01   9.350000E+01   9.390000E+01   9.430000E+01   9.470000E+01   9.520000E+01   9.560000E+01   9.600000E+01   9.640000E+01   9.690000E+01   9.740000E+01   9.780000E+01
+   5.700000E+01   5.750000E+01   5.790000E+01   5.840000E+01   5.880000E+01   5.920000E+01   5.960000E+01   6.000000E+01   6.030000E+01   6.070000E+01   6.110000E+01   6.150000E+01   6.190000E+01   6.230000E+01   6.280000E+01   6.330000E+01   6.380000E+01   6.440000E+01   6.500000E+01   6.560000E+01   6.630000E+01   6.690000E+01   6.760000E+01   6.830000E+01   6.900000E+01   6.970000E+01   7.040000E+01   7.110000E+01   7.170000E+01   7.230000E+01   7.290000E+01   7.350000E+01   7.400000E+01   7.450000E+01   7.500000E+01   7.540000E+01   7.590000E+01   7.620000E+01   7.660000E+01   7.700000E+01   7.740000E+01   7.780000E+01   7.810000E+01   7.860000E+01   7.900000E+01   7.940000E+01   7.990000E+01   8.040000E+01   8.100000E+01   8.150000E+01   8.210000E+01   8.280000E+01   8.340000E+01   8.410000E+01   8.470000E+01   8.540000E+01   8.610000E+01   8.670000E+01   8.740000E+01   8.800000E+01   8.860000E+01   8.920000E+01   8.970000E+01   9.020000E+01   9.070000E+01   9.110000E+01   9.150000E+01   9.190000E+01   9.220000E+01   9.260000E+01   9.290000E+01   9.320000E+01   9.350000E+01   9.380000E+01   9.420000E+01   9.450000E+01   9.490000E+01   9.530000E+01   9.570000E+01   9.620000E+01
+   5.810000E+01   5.850000E+01   5.890000E+01   5.930000E+01   5.970000E+01   6.000000E+01   6.020000E+01   6.050000E+01   6.080000E+01   6.100000E+01   6.130000E+01   6.160000E+01   6.200000E+01   6.230000E+01   6.270000E+01   6.320000E+01   6.370000E+01   6.430000E+01   6.490000E+01   6.550000E+01   6.620000E+01   6.690000E+01   6.760000E+01   6.840000E+01   6.910000E+01   6.990000E+01   7.060000E+01   7.130000E+01   7.200000E+01   7.260000E+01   7.320000E+01   7.380000E+01   7.430000E+01   7.470000E+01   7.510000E+01   7.550000E+01   7.580000E+01   7.610000E+01   7.640000E+01   7.670000E+01   7.690000E+01   7.720000E+01   7.750000E+01   7.780000E+01   7.820000E+01   7.860000E+01   7.900000E+01   7.950000E+01   8.000000E+01   8.060000E+01   8.120000E+01   8.180000E+01   8.250000E+01   8.320000E+01   8.390000E+01   8.460000E+01   8.540000E+01   8.610000E+01   8.680000E+01   8.740000E+01   8.800000E+01   8.860000E+01   8.910000E+01   8.960000E+01   9.010000E+01   9.040000E+01   9.080000E+01   9.110000E+01   9.130000E+01   9.160000E+01   9.180000E+01   9.200000E+01   9.220000E+01   9.240000E+01   9.270000E+01   9.290000E+01   9.330000E+01   9.360000E+01   9.400000E+01   9.440000E+01
+   5.920000E+01   5.960000E+01   6.000000E+01   6.030000E+01   6.050000E+01   6.080000E+01   6.090000E+01   6.110000E+01   6.130000E+01   6.140000E+01   6.160000E+01   6.180000E+01   6.210000E+01   6.230000E+01   6.270000E+01   6.310000E+01   6.360000E+01   6.410000E+01   6.470000E+01   6.540000E+01   6.610000E+01   6.680000E+01   6.760000E+01   6.840000E+01   6.920000E+01   7.000000E+01   7.080000E+01   7.150000E+01   7.220000E+01   7.290000E+01   7.350000E+01   7.400000E+01   7.450000E+01   7.490000E+01   7.520000E+01   7.550000E+01   7.580000E+01   7.600000E+01   7.610000E+01   7.630000E+01   7.650000E+01   7.660000E+01   7.680000E+01   7.710000E+01   7.730000E+01   7.770000E+01   7.800000E+01   7.850000E+01   7.900000E+01   7.950000E+01   8.020000E+01   8.080000E+01   8.160000E+01   8.230000E+01   8.310000E+01   8.380000E+01   8.460000E+01   8.540000E+01   8.610000E+01   8.680000E+01   8.740000E+01   8.800000E+01   8.850000E+01   8.900000E+01   8.940000E+01   8.970000E+01   9.000000E+01   9.020000E+01   9.040000E+01   9.050000E+01   9.060000E+01   9.070000E+01   9.080000E+01   9.100000E+01   9.110000E+01   9.130000E+01   9.160000E+01   9.180000E+01   9.220000E+01   9.260000E+01
+   6.030000E+01   6.070000E+01   6.100000E+01   6.130000E+01   6.150000E+01   6.160000E+01   6.170000E+01   6.170000E+01   6.180000E+01   6.180000E+01   6.190000E+01   6.200000E+01   6.220000E+01   6.240000E+01   6.270000E+01   6.300000E+01   6.350000E+01   6.400000E+01   6.460000E+01   6.530000E+01   6.600000E+01   6.680000E+01   6.760000E+01   6.850000E+01   6.930000E+01   7.020000E+01   7.100000E+01   7.180000E+01   7.250000E+01   7.320000E+01   7.370000E+01   7.430000E+01   7.470000E+01   7.510000E+01   7.530000E+01   7.550000E+01   7.570000E+01   7.580000E+01   7.590000E+01   7.590000E+01   7.600000E+01   7.610000E+01   7.620000E+01   7.630000E+01   7.650000E+01   7.670000E+01   7.710000E+01   7.750000E+01   7.800000E+01   7.850000E+01   7.910000E+01   7.980000E+01   8.060000E+01   8.140000E+01   8.220000E+01   8.300000E+01   8.380000E+01   8.460000E+01   8.540000E+01   8.610000E+01   8.680000E+01   8.740000E+01   8.790000E+01   8.830000E+01   8.870000E+01   8.890000E+01   8.910000E+01   8.930000E+01   8.940000E+01   8.940000E+01   8.940000E+01   8.940000E+01   8.940000E+01   8.950000E+01   8.950000E+01   8.960000E+01   8.980000E+01   9.000000E+01   9.030000E+01   9.070000E+01
+   6.150000E+01   6.190000E+01   6.210000E+01   6.230000E+01   6.240000E+01   6.240000E+01   6.240000E+01   6.240000E+01   6.230000E+01   6.220000E+01   6.220000E+01   6.220000E+01   6.230000E+01   6.240000E+01   6.270000E+01   6.300000E+01   6.340000E+01   6.390000E+01   6.450000E+01   6.520000E+01   6.600000E+01   6.680000E+01   6.760000E+01   6.850000E+01   6.940000E+01   7.030000E+01   7.120000E+01   7.200000E+01   7.270000E+01   7.340000E+01   7.400000E+01   7.450000E+01   7.490000E+01   7.520000E+01   7.540000E+01   7.560000E+01   7.560000E+01   7.560000E+01   7.560000E+01   7.550000E+01   7.550000E+01   7.550000E+01   7.540000E+01   7.550000E+01   7.560000E+01   7.580000E+01   7.610000E+01   7.640000E+01   7.690000E+01   7.740000E+01   7.810000E+01   7.880000E+01   7.960000E+01   8.040000E+01   8.130000E+01   8.210000E+01   8.300000E+01   8.390000E+01   8.470000E+01   8.540000E+01   8.610000E+01   8.670000E+01   8.720000E+01   8.760000E+01   8.790000E+01   8.810000E+01   8.830000E+01   8.830000E+01   8.830000E+01   8.820000E+01   8.820000E+01   8.800000E+01   8.800000E+01   8.790000E+01   8.790000E+01   8.790000E+01   8.800000E+01   8.820000E+01   8.840000E+01   8.880000E+01
+   6.270000E+01   6.300000E+01   6.320000E+01   6.330000E+01   6.340000E+01   6.330000E+01   6.320000E+01   6.300000E+01   6.280000E+01   6.270000E+01   6.260000E+01   6.250000E+01   6.250000E+01   6.250000E+01   6.270000E+01   6.300000E+01   6.330000E+01   6.380000E+01   6.440000E+01   6.510000E+01   6.590000E+01   6.680000E+01   6.770000E+01   6.860000E+01   6.950000E+01   7.050000E+01   7.140000E+01   7.220000E+01   7.300000E+01   7.370000E+01   7.420000E+01   7.470000E+01   7.510000E+01   7.530000E+01   7.550000E+01   7.550000E+01   7.550000E+01   7.540000E+01   7.530000E+01   7.510000E+01   7.500000E+01   7.480000E+01   7.470000E+01   7.470000E+01   7.470000E+01   7.480000E+01   7.510000E+01   7.540000E+01   7.580000E+01   7.640000E+01   7.700000E+01   7.770000E+01   7.860000E+01   7.940000E+01   8.030000E+01   8.120000E+01   8.220000E+01   8.310000E+01   8.390000E+01   8.470000E+01   8.540000E+01   8.600000E+01   8.650000E+01   8.680000E+01   8.710000E+01   8.730000E+01   8.730000E+01   8.730000E+01   8.720000E+01   8.700000E+01   8.680000E+01   8.660000E+01   8.640000E+01   8.630000E+01   8.610000E+01   8.610000E+01   8.610000E+01   8.620000E+01   8.650000E+01   8.680000E+01
+   6.400000E+01   6.420000E+01   6.440000E+01   6.440000E+01   6.430000E+01   6.420000E+01   6.400000E+01   6.370000E+01   6.340000E+01   6.320000E+01   6.290000E+01   6.270000E+01   6.260000E+01   6.260000E+01   6.270000E+01   6.300000E+01   6.330000E+01   6.380000E+01   6.440000E+01   6.510000E+01   6.590000E+01   6.680000E+01   6.770000E+01   6.870000E+01   6.970000E+01   7.060000E+01   7.160000E+01   7.240000E+01   7.320000E+01   7.390000E+01   7.450000E+01   7.490000E+01   7.530000E+01   7.550000E+01   7.560000E+01   7.550000E+01   7.540000E+01   7.520000E+01   7.500000E+01   7.470000E+01   7.440000E+01   7.420000E+01   7.400000E+01   7.390000E+01   7.380000E+01   7.390000E+01   7.400000E+01   7.430000E+01   7.470000E+01   7.530000E+01   7.590000E+01   7.670000E+01   7.750000E+01   7.840000E+01   7.930000E+01   8.030000E+01   8.130000E+01   8.220000E+01   8.310000E+01   8.390000E+01   8.460000E+01   8.520000E+01   8.570000E+01   8.600000E+01   8.620000E+01   8.630000E+01   8.630000E+01   8.620000E+01   8.600000E+01   8.580000E+01   8.550000E+01   8.520000E+01   8.490000E+01   8.460000E+01   8.440000E+01   8.420000E+01   8.420000E+01   8.430000E+01   8.450000E+01   8.480000E+01
+   6.520000E+01   6.540000E+01   6.550000E+01   6.550000E+01   6.530000E+01   6.510000E+01   6.480000E+01   6.440000E+01   6.400000E+01   6.360000E+01   6.330000E+01   6.300000E+01   6.280000E+01   6.270000E+01   6.280000E+01   6.300000E+01   6.330000E+01   6.370000E+01   6.430000E+01   6.500000E+01   6.580000E+01   6.670000E+01   6.770000E+01   6.870000E+01   6.980000E+01   7.080000E+01   7.170000E+01   7.260000E+01   7.340000E+01   7.410000E+01   7.470000E+01   7.510000E+01   7.540000E+01   7.560000E+01   7.560000E+01   7.550000E+01   7.530000E+01   7.500000E+01   7.470000E+01   7.430000E+01   7.390000E+01   7.350000E+01   7.320000E+01   7.300000E+01   7.290000E+01   7.290000E+01   7.300000E+01   7.320000E+01   7.360000E+01   7.410000E+01   7.480000E+01   7.560000E+01   7.640000E+01   7.740000E+01   7.830000E+01   7.940000E+01   8.040000E+01   8.130000E+01   8.220000E+01   8.310000E+01   8.380000E+01   8.440000E+01   8.480000E+01   8.520000E+01   8.540000E+01   8.540000E+01   8.530000E+01   8.510000E+01   8.480000E+01   8.450000E+01   8.410000E+01   8.370000E+01   8.320000E+01   8.290000E+01   8.260000E+01   8.240000E+01   8.230000E+01   8.230000E+01   8.240000E+01   8.270000E+01
+   6.650000E+01   6.670000E+01   6.670000E+01   6.660000E+01   6.630000E+01   6.600000E+01   6.560000E+01   6.510000E+01   6.460000E+01   6.410000E+01   6.370000E+01   6.330000E+01   6.300000E+01   6.290000E+01   6.280000E+01   6.300000E+01   6.320000E+01   6.370000E+01   6.430000E+01   6.500000E+01   6.580000E+01   6.680000E+01   6.780000E+01   6.880000E+01   6.990000E+01   7.090000E+01   7.190000E+01   7.290000E+01   7.370000E+01   7.440000E+01   7.490000E+01   7.530000E+01   7.560000E+01   7.570000E+01   7.560000E+01   7.550000E+01   7.520000E+01   7.480000E+01   7.430000E+01   7.380000E+01   7.340000E+01   7.290000E+01   7.250000E+01   7.220000E+01   7.190000E+01   7.190000E+01   7.190000E+01   7.210000E+01   7.250000E+01   7.300000E+01   7.360000E+01   7.440000E+01   7.530000E+01   7.630000E+01   7.730000E+01   7.840000E+01   7.940000E+01   8.040000E+01   8.140000E+01   8.220000E+01   8.290000E+01   8.350000E+01   8.400000E+01   8.430000E+01   8.440000E+01   8.440000E+01   8.420000E+01   8.400000E+01   8.360000E+01   8.310000E+01   8.260000E+01   8.210000E+01   8.160000E+01   8.110000E+01   8.070000E+01   8.040000E+01   8.030000E+01   8.020000E+01   8.030000E+01   8.060000E+01
+   6.780000E+01   6.790000E+01   6.790000E+01   6.770000E+01   6.740000E+01   6.690000E+01   6.640000E+01   6.580000E+01   6.520000E+01   6.460000E+01   6.410000E+01   6.360000E+01   6.330000E+01   6.300000E+01   6.290000E+01   6.300000E+01   6.320000E+01   6.360000E+01   6.420000E+01   6.490000E+01   6.580000E+01   6.680000E+01   6.780000E+01   6.890000E+01   7.000000E+01   7.110000E+01   7.210000E+01   7.310000E+01   7.390000E+01   7.460000E+01   7.510000E+01   7.550000E+01   7.570000E+01   7.580000E+01   7.570000E+01   7.540000E+01   7.500000E+01   7.450000E+01   7.400000E+01   7.340000E+01   7.280000E+01   7.220000E+01   7.170000E+01   7.130000E+01   7.100000E+01   7.080000E+01   7.080000E+01   7.100000E+01   7.130000E+01   7.180000E+01   7.250000E+01   7.330000E+01   7.420000E+01   7.520000E+01   7.630000E+01   7.740000E+01   7.840000E+01   7.950000E+01   8.050000E+01   8.130000E+01   8.210000E+01   8.270000E+01   8.310000E+01   8.340000E+01   8.340000E+01   8.340000E+01   8.310000E+01   8.280000E+01   8.230000E+01   8.180000E+01   8.120000E+01   8.050000E+01   7.990000E+01   7.930000E+01   7.890000E+01   7.850000E+01   7.820000E+01   7.810000E+01   7.820000E+01   7.840000E+01
+   6.910000E+01   6.920000E+01   6.910000E+01   6.880000E+01   6.840000E+01   6.790000E+01   6.730000E+01   6.660000E+01   6.590000E+01   6.520000E+01   6.450000E+01   6.390000E+01   6.350000E+01   6.320000E+01   6.300000E+01   6.300000E+01   6.320000E+01   6.360000E+01   6.420000E+01   6.490000E+01   6.580000E+01   6.680000E+01   6.780000E+01   6.900000E+01   7.010000E+01   7.120000E+01   7.230000E+01   7.330000E+01   7.410000E+01   7.480000E+01   7.530000E+01   7.570000E+01   7.590000E+01   7.590000E+01   7.570000E+01   7.530000E+01   7.490000E+01   7.430000E+01   7.360000E+01   7.290000E+01   7.220000E+01   7.150000E+01   7.090000E+01   7.040000E+01   7.010000E+01   6.980000E+01   6.980000E+01   6.990000E+01   7.020000E+01   7.070000E+01   7.130000E+01   7.210000E+01   7.310000E+01   7.410000E+01   7.520000E+01   7.630000E+01   7.740000E+01   7.850000E+01   7.950000E+01   8.040000E+01   8.120000E+01   8.170000E+01   8.220000E+01   8.240000E+01   8.240000E+01   8.230000E+01   8.200000E+01   8.160000E+01   8.100000E+01   8.040000E+01   7.960000E+01   7.890000E+01   7.820000E+01   7.750000E+01   7.700000E+01   7.650000E+01   7.620000E+01   7.600000E+01   7.600000E+01   7.620000E+01
+   7.040000E+01   7.040000E+01   7.030000E+01   6.990000E+01   6.950000E+01   6.880000E+01   6.810000E+01   6.730000E+01   6.650000E+01   6.570000E+01   6.500000E+01   6.430000E+01   6.370000E+01   6.340000E+01   6.310000E+01   6.310000E+01   6.330000E+01   6.360000E+01   6.420000E+01   6.490000E+01   6.580000E+01   6.680000E+01   6.790000E+01   6.910000E+01   7.020000E+01   7.140000E+01   7.250000E+01   7.340000E+01   7.430000E+01   7.500000E+01   7.550000E+01   7.590000E+01   7.600000E+01   7.590000E+01   7.570000E+01   7.530000E+01   7.470000E+01   7.400000E+01   7.330000E+01   7.240000E+01   7.160000E+01   7.090000E+01   7.020000E+01   6.960000E+01   6.910000E+01   6.880000E+01   6.870000E+01   6.880000E+01   6.900000E+01   6.950000E+01   7.020000E+01   7.100000E+01   7.190000E+01   7.300000E+01   7.410000E+01   7.530000E+01   7.640000E+01   7.750000E+01   7.860000E+01   7.950000E+01   8.020000E+01   8.080000E+01   8.120000E+01   8.140000E+01   8.140000E+01   8.120000E+01   8.090000E+01   8.030000E+01   7.970000E+01   7.890000E+01   7.810000E+01   7.730000E+01   7.650000E+01   7.570000E+01   7.500000E+01   7.450000E+01   7.410000E+01   7.390000E+01   7.390000E+01   7.400000E+01
+   7.170000E+01   7.170000E+01   7.150000E+01   7.110000E+01   7.050000E+01   6.980000E+01   6.900000E+01   6.810000E+01   6.720000E+01   6.630000E+01   6.540000E+01   6.460000E+01   6.400000E+01   6.350000E+01   6.330000E+01   6.320000E+01   6.330000E+01   6.360000E+01   6.420000E+01   6.490000E+01   6.580000E+01   6.680000E+01   6.800000E+01   6.910000E+01   7.030000E+01   7.150000E+01   7.260000E+01   7.360000E+01   7.450000E+01   7.520000E+01   7.570000E+01   7.600000E+01   7.610000E+01   7.600000E+01   7.570000E+01   7.520000E+01   7.450000E+01   7.370000E+01   7.290000E+01   7.200000E+01   7.110000E+01   7.020000E+01   6.940000E+01   6.870000E+01   6.810000E+01   6.780000E+01   6.760000E+01   6.760000E+01   6.790000E+01   6.830000E+01   6.900000E+01   6.980000E+01   7.080000E+01   7.190000E+01   7.300000E+01   7.420000E+01   7.540000E+01   7.650000E+01   7.760000E+01   7.850000E+01   7.930000E+01   7.980000E+01   8.020000E+01   8.040000E+01   8.040000E+01   8.010000E+01   7.970000E+01   7.910000E+01   7.830000E+01   7.750000E+01   7.660000E+01   7.560000E+01   7.470000E+01   7.380000E+01   7.310000E+01   7.250000E+01   7.200000E+01   7.170000E+01   7.170000E+01   7.180000E+01
+   7.300000E+01   7.290000E+01   7.270000E+01   7.220000E+01   7.160000E+01   7.080000E+01   6.980000E+01   6.890000E+01   6.780000E+01   6.680000E+01   6.590000E+01   6.500000E+01   6.430000E+01   6.370000E+01   6.340000E+01   6.330000E+01   6.330000E+01   6.370000E+01   6.420000E+01   6.490000E+01   6.580000E+01   6.690000E+01   6.800000E+01   6.920000E+01   7.050000E+01   7.170000E+01   7.280000E+01   7.380000E+01   7.470000E+01   7.540000E+01   7.590000E+01   7.620000E+01   7.620000E+01   7.600000E+01   7.570000E+01   7.510000E+01   7.430000E+01   7.350000E+01   7.250000E+01   7.150000E+01   7.050000E+01   6.950000E+01   6.860000E+01   6.780000E+01   6.720000E+01   6.670000E+01   6.650000E+01   6.650000E+01   6.670000E+01   6.720000E+01   6.780000E+01   6.860000E+01   6.960000E+01   7.070000E+01   7.190000E+01   7.310000E+01   7.440000E+01   7.550000E+01   7.660000E+01   7.750000E+01   7.830000E+01   7.890000E+01   7.920000E+01   7.940000E+01   7.930000E+01   7.900000E+01   7.850000E+01   7.780000E+01   7.690000E+01   7.600000E+01   7.500000E+01   7.400000E+01   7.290000E+01   7.200000E+01   7.110000E+01   7.040000E+01   6.990000E+01   6.960000E+01   6.950000E+01   6.960000E+01
+   7.430000E+01   7.420000E+01   7.390000E+01   7.340000E+01   7.260000E+01   7.170000E+01   7.070000E+01   6.960000E+01   6.850000E+01   6.740000E+01   6.630000E+01   6.540000E+01   6.460000E+01   6.400000E+01   6.350000E+01   6.340000E+01   6.340000E+01   6.370000E+01   6.420000E+01   6.490000E+01   6.580000E+01   6.690000E+01   6.810000E+01   6.930000E+01   7.060000E+01   7.180000E+01   7.300000E+01   7.400000E+01   7.490000E+01   7.560000E+01   7.600000E+01   7.630000E+01   7.630000E+01   7.610000E+01   7.560000E+01   7.500000E+01   7.410000E+01   7.320000E+01   7.210000E+01   7.100000E+01   6.990000E+01   6.880000E+01   6.780000E+01   6.690000E+01   6.620000E+01   6.570000E+01   6.540000E+01   6.540000E+01   6.560000E+01   6.600000E+01   6.660000E+01   6.750000E+01   6.850000E+01   6.960000E+01   7.080000E+01   7.210000E+01   7.330000E+01   7.450000E+01   7.560000E+01   7.650000E+01   7.730000E+01   7.790000E+01   7.820000E+01   7.830000E+01   7.820000E+01   7.780000E+01   7.720000E+01   7.650000E+01   7.550000E+01   7.450000E+01   7.340000E+01   7.230000E+01   7.120000E+01   7.010000E+01   6.920000E+01   6.840000E+01   6.780000E+01   6.740000E+01   6.730000E+01   6.730000E+01
+   7.560000E+01   7.550000E+01   7.510000E+01   7.450000E+01   7.370000E+01   7.270000E+01   7.160000E+01   7.040000E+01   6.920000E+01   6.790000E+01   6.680000E+01   6.580000E+01   6.490000E+01   6.420000E+01   6.370000E+01   6.350000E+01   6.350000E+01   6.370000E+01   6.420000E+01   6.500000E+01   6.590000E+01   6.700000E+01   6.810000E+01   6.940000E+01   7.070000E+01   7.190000E+01   7.310000E+01   7.420000E+01   7.500000E+01   7.570000E+01   7.620000E+01   7.640000E+01   7.640000E+01   7.610000E+01   7.560000E+01   7.490000E+01   7.390000E+01   7.290000E+01   7.170000E+01   7.050000E+01   6.930000E+01   6.810000E+01   6.700000E+01   6.610000E+01   6.530000E+01   6.470000E+01   6.440000E+01   6.430000E+01   6.440000E+01   6.480000E+01   6.550000E+01   6.630000E+01   6.730000E+01   6.850000E+01   6.970000E+01   7.100000E+01   7.220000E+01   7.350000E+01   7.460000E+01   7.550000E+01   7.630000E+01   7.680000E+01   7.720000E+01   7.720000E+01   7.710000E+01   7.660000E+01   7.600000E+01   7.510000E+01   7.410000E+01   7.300000E+01   7.180000E+01   7.060000E+01   6.940000E+01   6.820000E+01   6.720000E+01   6.640000E+01   6.570000E+01   6.520000E+01   6.500000E+01   6.510000E+01
+   7.690000E+01   7.670000E+01   7.630000E+01   7.560000E+01   7.470000E+01   7.370000E+01   7.250000E+01   7.120000E+01   6.980000E+01   6.850000E+01   6.730000E+01   6.610000E+01   6.520000E+01   6.440000E+01   6.390000E+01   6.360000E+01   6.360000E+01   6.380000E+01   6.430000E+01   6.500000E+01   6.590000E+01   6.700000E+01   6.820000E+01   6.950000E+01   7.080000E+01   7.210000E+01   7.330000E+01   7.430000E+01   7.520000E+01   7.590000E+01   7.630000E+01   7.650000E+01   7.650000E+01   7.610000E+01   7.550000E+01   7.470000E+01   7.370000E+01   7.260000E+01   7.130000E+01   7.000000E+01   6.870000E+01   6.740000E+01   6.620000E+01   6.520000E+01   6.430000E+01   6.370000E+01   6.330000E+01   6.320000E+01   6.330000E+01   6.370000E+01   6.430000E+01   6.510000E+01   6.620000E+01   6.730000E+01   6.860000E+01   6.990000E+01   7.120000E+01   7.240000E+01   7.350000E+01   7.450000E+01   7.530000E+01   7.580000E+01   7.610000E+01   7.620000E+01   7.590000E+01   7.550000E+01   7.470000E+01   7.380000E+01   7.270000E+01   7.150000E+01   7.020000E+01   6.890000E+01   6.760000E+01   6.640000E+01   6.530000E+01   6.430000E+01   6.360000E+01   6.310000E+01   6.280000E+01   6.290000E+01
+   7.820000E+01   7.800000E+01   7.750000E+01   7.670000E+01   7.580000E+01   7.460000E+01   7.330000E+01   7.190000E+01   7.050000E+01   6.910000E+01   6.780000E+01   6.650000E+01   6.550000E+01   6.470000E+01   6.410000E+01   6.370000E+01   6.360000E+01   6.390000E+01   6.430000E+01   6.500000E+01   6.600000E+01   6.710000E+01   6.830000E+01   6.960000E+01   7.090000E+01   7.220000E+01   7.340000E+01   7.450000E+01   7.540000E+01   7.600000E+01   7.650000E+01   7.660000E+01   7.650000E+01   7.610000E+01   7.550000E+01   7.460000E+01   7.350000E+01   7.230000E+01   7.090000E+01   6.950000E+01   6.810000E+01   6.670000E+01   6.550000E+01   6.430000E+01   6.340000E+01   6.270000E+01   6.220000E+01   6.210000E+01   6.220000E+01   6.250000E+01   6.310000E+01   6.400000E+01   6.500000E+01   6.620000E+01   6.750000E+01   6.880000E+01   7.010000E+01   7.140000E+01   7.250000E+01   7.350000E+01   7.420000E+01   7.480000E+01   7.510000E+01   7.510000E+01   7.480000E+01   7.430000E+01   7.350000E+01   7.250000E+01   7.130000E+01   7.000000E+01   6.860000E+01   6.720000E+01   6.580000E+01   6.450000E+01   6.330000E+01   6.230000E+01   6.150000E+01   6.090000E+01   6.070000E+01   6.060000E+01
+   7.950000E+01   7.920000E+01   7.860000E+01   7.780000E+01   7.680000E+01   7.560000E+01   7.420000E+01   7.270000E+01   7.120000E+01   6.970000E+01   6.820000E+01   6.690000E+01   6.580000E+01   6.490000E+01   6.420000E+01   6.390000E+01   6.370000E+01   6.390000E+01   6.440000E+01   6.510000E+01   6.600000E+01   6.710000E+01   6.840000E+01   6.970000E+01   7.100000E+01   7.230000E+01   7.350000E+01   7.460000E+01   7.550000E+01   7.620000E+01   7.660000E+01   7.670000E+01   7.660000E+01   7.610000E+01   7.540000E+01   7.450000E+01   7.330000E+01   7.200000E+01   7.050000E+01   6.900000E+01   6.750000E+01   6.600000E+01   6.470000E+01   6.350000E+01   6.250000E+01   6.170000E+01   6.120000E+01   6.100000E+01   6.100000E+01   6.140000E+01   6.200000E+01   6.280000E+01   6.390000E+01   6.510000E+01   6.640000E+01   6.770000E+01   6.900000E+01   7.030000E+01   7.150000E+01   7.240000E+01   7.320000E+01   7.370000E+01   7.400000E+01   7.400000E+01   7.370000E+01   7.310000E+01   7.220000E+01   7.110000E+01   6.990000E+01   6.850000E+01   6.700000E+01   6.550000E+01   6.400000E+01   6.260000E+01   6.140000E+01   6.030000E+01   5.940000E+01   5.880000E+01   5.850000E+01   5.840000E+01
+   8.070000E+01   8.040000E+01   7.980000E+01   7.890000E+01   7.780000E+01   7.650000E+01   7.500000E+01   7.350000E+01   7.180000E+01   7.020000E+01   6.870000E+01   6.730000E+01   6.610000E+01   6.520000E+01   6.440000E+01   6.400000E+01   6.390000E+01   6.400000E+01   6.440000E+01   6.510000E+01   6.610000E+01   6.720000E+01   6.840000E+01   6.980000E+01   7.110000E+01   7.250000E+01   7.370000E+01   7.480000E+01   7.570000E+01   7.630000E+01   7.670000E+01   7.680000E+01   7.660000E+01   7.610000E+01   7.540000E+01   7.430000E+01   7.310000E+01   7.170000E+01   7.010000E+01   6.850000E+01   6.690000E+01   6.540000E+01   6.390000E+01   6.260000E+01   6.160000E+01   6.070000E+01   6.020000E+01   5.990000E+01   5.990000E+01   6.030000E+01   6.090000E+01   6.170000E+01   6.280000E+01   6.400000E+01   6.530000E+01   6.660000E+01   6.800000E+01   6.930000E+01   7.040000E+01   7.140000E+01   7.220000E+01   7.270000E+01   7.290000E+01   7.290000E+01   7.250000E+01   7.190000E+01   7.100000E+01   6.980000E+01   6.850000E+01   6.700000E+01   6.540000E+01   6.380000E+01   6.230000E+01   6.080000E+01   5.940000E+01   5.830000E+01   5.740000E+01   5.670000E+01   5.630000E+01   5.630000E+01
+   8.190000E+01   8.160000E+01   8.090000E+01   8.000000E+01   7.880000E+01   7.740000E+01   7.590000E+01   7.420000E+01   7.250000E+01   7.080000E+01   6.920000E+01   6.780000E+01   6.650000E+01   6.540000E+01   6.460000E+01   6.420000E+01   6.400000E+01   6.410000E+01   6.450000E+01   6.520000E+01   6.610000E+01   6.720000E+01   6.850000E+01   6.990000E+01   7.120000E+01   7.260000E+01   7.380000E+01   7.490000E+01   7.580000E+01   7.640000E+01   7.680000E+01   7.690000E+01   7.660000E+01   7.610000E+01   7.530000E+01   7.420000E+01   7.290000E+01   7.140000E+01   6.970000E+01   6.810000E+01   6.640000E+01   6.470000E+01   6.320000E+01   6.180000E+01   6.070000E+01   5.980000E+01   5.920000E+01   5.890000E+01   5.890000E+01   5.920000E+01   5.980000E+01   6.060000E+01   6.160000E+01   6.290000E+01   6.420000E+01   6.560000E+01   6.690000E+01   6.820000E+01   6.940000E+01   7.040000E+01   7.120000E+01   7.170000E+01   7.190000E+01   7.180000E+01   7.140000E+01   7.070000E+01   6.970000E+01   6.850000E+01   6.710000E+01   6.550000E+01   6.390000E+01   6.220000E+01   6.050000E+01   5.900000E+01   5.750000E+01   5.630000E+01   5.530000E+01   5.460000E+01   5.420000E+01   5.410000E+01
+   8.310000E+01   8.270000E+01   8.200000E+01   8.100000E+01   7.980000E+01   7.830000E+01   7.670000E+01   7.490000E+01   7.320000E+01   7.140000E+01   6.970000E+01   6.820000E+01   6.680000E+01   6.570000E+01   6.490000E+01   6.430000E+01   6.410000E+01   6.420000E+01   6.460000E+01   6.530000E+01   6.620000E+01   6.730000E+01   6.860000E+01   7.000000E+01   7.130000E+01   7.270000E+01   7.390000E+01   7.500000E+01   7.590000E+01   7.650000E+01   7.690000E+01   7.690000E+01   7.670000E+01   7.610000E+01   7.520000E+01   7.400000E+01   7.260000E+01   7.110000E+01   6.940000E+01   6.760000E+01   6.580000E+01   6.410000E+01   6.250000E+01   6.100000E+01   5.980000E+01   5.880000E+01   5.820000E+01   5.780000E+01   5.780000E+01   5.810000E+01   5.870000E+01   5.950000E+01   6.050000E+01   6.180000E+01   6.310000E+01   6.450000E+01   6.590000E+01   6.720000E+01   6.840000E+01   6.940000E+01   7.010000E+01   7.060000E+01   7.080000E+01   7.070000E+01   7.020000E+01   6.950000E+01   6.840000E+01   6.720000E+01   6.570000E+01   6.400000E+01   6.230000E+01   6.050000E+01   5.880000E+01   5.720000E+01   5.570000E+01   5.440000E+01   5.330000E+01   5.260000E+01   5.210000E+01   5.200000E+01
+   8.430000E+01   8.390000E+01   8.310000E+01   8.210000E+01   8.070000E+01   7.920000E+01   7.750000E+01   7.570000E+01   7.380000E+01   7.200000E+01   7.020000E+01   6.860000E+01   6.710000E+01   6.600000E+01   6.510000E+01   6.450000E+01   6.420000E+01   6.430000E+01   6.470000E+01   6.530000E+01   6.630000E+01   6.740000E+01   6.870000E+01   7.000000E+01   7.140000E+01   7.280000E+01   7.410000E+01   7.510000E+01   7.600000E+01   7.670000E+01   7.700000E+01   7.700000E+01   7.670000E+01   7.600000E+01   7.510000E+01   7.390000E+01   7.240000E+01   7.080000E+01   6.900000E+01   6.710000E+01   6.520000E+01   6.340000E+01   6.170000E+01   6.020000E+01   5.890000E+01   5.790000E+01   5.720000E+01   5.680000E+01   5.680000E+01   5.700000E+01   5.760000E+01   5.840000E+01   5.950000E+01   6.070000E+01   6.210000E+01   6.350000E+01   6.490000E+01   6.620000E+01   6.740000E+01   6.840000E+01   6.910000E+01   6.960000E+01   6.970000E+01   6.960000E+01   6.910000E+01   6.830000E+01   6.720000E+01   6.590000E+01   6.430000E+01   6.260000E+01   6.080000E+01   5.890000E+01   5.710000E+01   5.540000E+01   5.380000E+01   5.250000E+01   5.140000E+01   5.060000E+01   5.010000E+01   4.990000E+01
+   8.550000E+01   8.500000E+01   8.420000E+01   8.310000E+01   8.170000E+01   8.010000E+01   7.830000E+01   7.640000E+01   7.440000E+01   7.250000E+01   7.070000E+01   6.900000E+01   6.750000E+01   6.620000E+01   6.530000E+01   6.470000E+01   6.440000E+01   6.440000E+01   6.480000E+01   6.540000E+01   6.630000E+01   6.750000E+01   6.880000E+01   7.010000E+01   7.150000E+01   7.290000E+01   7.420000E+01   7.530000E+01   7.610000E+01   7.670000E+01   7.700000E+01   7.700000E+01   7.670000E+01   7.600000E+01   7.500000E+01   7.370000E+01   7.220000E+01   7.050000E+01   6.860000E+01   6.660000E+01   6.470000E+01   6.280000E+01   6.100000E+01   5.950000E+01   5.810000E+01   5.700000E+01   5.630000E+01   5.590000E+01   5.580000E+01   5.600000E+01   5.660000E+01   5.740000E+01   5.840000E+01   5.970000E+01   6.100000E+01   6.240000E+01   6.380000E+01   6.520000E+01   6.640000E+01   6.740000E+01   6.810000E+01   6.860000E+01   6.870000E+01   6.850000E+01   6.800000E+01   6.710000E+01   6.600000E+01   6.460000E+01   6.300000E+01   6.120000E+01   5.930000E+01   5.740000E+01   5.550000E+01   5.370000E+01   5.200000E+01   5.060000E+01   4.950000E+01   4.860000E+01   4.810000E+01   4.790000E+01
+   8.660000E+01   8.610000E+01   8.520000E+01   8.400000E+01   8.260000E+01   8.090000E+01   7.910000E+01   7.710000E+01   7.510000E+01   7.310000E+01   7.110000E+01   6.940000E+01   6.780000E+01   6.650000E+01   6.550000E+01   6.480000E+01   6.450000E+01   6.450000E+01   6.490000E+01   6.550000E+01   6.640000E+01   6.760000E+01   6.880000E+01   7.020000E+01   7.160000E+01   7.300000E+01   7.430000E+01   7.540000E+01   7.620000E+01   7.680000E+01   7.710000E+01   7.710000E+01   7.670000E+01   7.590000E+01   7.490000E+01   7.350000E+01   7.190000E+01   7.020000E+01   6.820000E+01   6.620000E+01   6.420000E+01   6.220000E+01   6.040000E+01   5.870000E+01   5.730000E+01   5.620000E+01   5.540000E+01   5.490000E+01   5.480000E+01   5.500000E+01   5.550000E+01   5.640000E+01   5.740000E+01   5.870000E+01   6.000000E+01   6.140000E+01   6.290000E+01   6.420000E+01   6.540000E+01   6.640000E+01   6.710000E+01   6.750000E+01   6.770000E+01   6.740000E+01   6.690000E+01   6.600000E+01   6.480000E+01   6.330000E+01   6.160000E+01   5.980000E+01   5.780000E+01   5.580000E+01   5.380000E+01   5.200000E+01   5.030000E+01   4.880000E+01   4.760000E+01   4.670000E+01   4.610000E+01   4.590000E+01
+   8.770000E+01   8.710000E+01   8.620000E+01   8.500000E+01   8.350000E+01   8.170000E+01   7.980000E+01   7.780000E+01   7.570000E+01   7.360000E+01   7.160000E+01   6.980000E+01   6.810000E+01   6.680000E+01   6.570000E+01   6.500000E+01   6.470000E+01   6.460000E+01   6.500000E+01   6.560000E+01   6.650000E+01   6.760000E+01   6.890000E+01   7.030000E+01   7.170000E+01   7.310000E+01   7.440000E+01   7.550000E+01   7.630000E+01   7.690000E+01   7.720000E+01   7.710000E+01   7.670000E+01   7.590000E+01   7.480000E+01   7.340000E+01   7.170000E+01   6.990000E+01   6.780000E+01   6.580000E+01   6.370000E+01   6.160000E+01   5.970000E+01   5.800000E+01   5.650000E+01   5.540000E+01   5.450000E+01   5.400000E+01   5.390000E+01   5.400000E+01   5.460000E+01   5.540000E+01   5.640000E+01   5.770000E+01   5.900000E+01   6.050000E+01   6.190000E+01   6.320000E+01   6.440000E+01   6.540000E+01   6.610000E+01   6.660000E+01   6.660000E+01   6.640000E+01   6.580000E+01   6.490000E+01   6.360000E+01   6.210000E+01   6.030000E+01   5.840000E+01   5.640000E+01   5.430000E+01   5.230000E+01   5.030000E+01   4.860000E+01   4.710000E+01   4.580000E+01   4.490000E+01   4.420000E+01   4.400000E+01
+   8.870000E+01   8.810000E+01   8.720000E+01   8.590000E+01   8.430000E+01   8.250000E+01   8.050000E+01   7.840000E+01   7.630000E+01   7.410000E+01   7.200000E+01   7.020000E+01   6.850000E+01   6.710000E+01   6.600000E+01   6.520000E+01   6.480000E+01   6.480000E+01   6.510000E+01   6.570000E+01   6.660000E+01   6.770000E+01   6.900000E+01   7.040000E+01   7.180000E+01   7.320000E+01   7.450000E+01   7.550000E+01   7.640000E+01   7.700000E+01   7.720000E+01   7.710000E+01   7.660000E+01   7.580000E+01   7.470000E+01   7.320000E+01   7.150000E+01   6.960000E+01   6.750000E+01   6.530000E+01   6.320000E+01   6.110000E+01   5.910000E+01   5.730000E+01   5.580000E+01   5.460000E+01   5.370000E+01   5.310000E+01   5.290000E+01   5.310000E+01   5.360000E+01   5.440000E+01   5.550000E+01   5.670000E+01   5.810000E+01   5.950000E+01   6.090000E+01   6.230000E+01   6.350000E+01   6.450000E+01   6.520000E+01   6.560000E+01   6.560000E+01   6.540000E+01   6.470000E+01   6.370000E+01   6.240000E+01   6.090000E+01   5.900000E+01   5.710000E+01   5.500000E+01   5.280000E+01   5.070000E+01   4.880000E+01   4.690000E+01   4.530000E+01   4.400000E+01   4.310000E+01   4.240000E+01   4.210000E+01
+   8.970000E+01   8.910000E+01   8.810000E+01   8.680000E+01   8.520000E+01   8.330000E+01   8.120000E+01   7.910000E+01   7.680000E+01   7.460000E+01   7.250000E+01   7.050000E+01   6.880000E+01   6.730000E+01   6.620000E+01   6.540000E+01   6.500000E+01   6.490000E+01   6.520000E+01   6.580000E+01   6.670000E+01   6.780000E+01   6.910000E+01   7.050000E+01   7.190000E+01   7.330000E+01   7.450000E+01   7.560000E+01   7.650000E+01   7.700000E+01   7.720000E+01   7.710000E+01   7.660000E+01   7.580000E+01   7.460000E+01   7.300000E+01   7.130000E+01   6.930000E+01   6.710000E+01   6.490000E+01   6.270000E+01   6.050000E+01   5.850000E+01   5.660000E+01   5.510000E+01   5.380000E+01   5.290000E+01   5.230000E+01   5.210000E+01   5.220000E+01   5.270000E+01   5.350000E+01   5.450000E+01   5.580000E+01   5.720000E+01   5.860000E+01   6.000000E+01   6.140000E+01   6.260000E+01   6.350000E+01   6.420000E+01   6.460000E+01   6.470000E+01   6.440000E+01   6.370000E+01   6.270000E+01   6.130000E+01   5.970000E+01   5.780000E+01   5.580000E+01   5.360000E+01   5.140000E+01   4.930000E+01   4.720000E+01   4.530000E+01   4.370000E+01   4.230000E+01   4.130000E+01   4.070000E+01   4.030000E+01
+   9.070000E+01   9.000000E+01   8.900000E+01   8.760000E+01   8.590000E+01   8.400000E+01   8.190000E+01   7.970000E+01   7.740000E+01   7.510000E+01   7.290000E+01   7.090000E+01   6.910000E+01   6.760000E+01   6.640000E+01   6.560000E+01   6.510000E+01   6.500000E+01   6.530000E+01   6.590000E+01   6.680000E+01   6.790000E+01   6.920000E+01   7.060000E+01   7.200000E+01   7.340000E+01   7.460000E+01   7.570000E+01   7.650000E+01   7.710000E+01   7.730000E+01   7.710000E+01   7.660000E+01   7.570000E+01   7.440000E+01   7.290000E+01   7.100000E+01   6.900000E+01   6.680000E+01   6.450000E+01   6.220000E+01   6.000000E+01   5.790000E+01   5.600000E+01   5.440000E+01   5.310000E+01   5.210000E+01   5.150000E+01   5.120000E+01   5.140000E+01   5.180000E+01   5.260000E+01   5.370000E+01   5.490000E+01   5.630000E+01   5.770000E+01   5.910000E+01   6.050000E+01   6.170000E+01   6.260000E+01   6.330000E+01   6.370000E+01   6.370000E+01   6.340000E+01   6.270000E+01   6.160000E+01   6.020000E+01   5.850000E+01   5.660000E+01   5.450000E+01   5.230000E+01   5.010000E+01   4.780000E+01   4.570000E+01   4.380000E+01   4.210000E+01   4.070000E+01   3.970000E+01   3.900000E+01   3.860000E+01
+   9.160000E+01   9.090000E+01   8.980000E+01   8.840000E+01   8.670000E+01   8.470000E+01   8.250000E+01   8.030000E+01   7.790000E+01   7.560000E+01   7.330000E+01   7.130000E+01   6.940000E+01   6.790000E+01   6.670000E+01   6.580000E+01   6.530000E+01   6.520000E+01   6.540000E+01   6.600000E+01   6.690000E+01   6.800000E+01   6.930000E+01   7.060000E+01   7.210000E+01   7.340000E+01   7.470000E+01   7.570000E+01   7.660000E+01   7.710000E+01   7.730000E+01   7.710000E+01   7.650000E+01   7.560000E+01   7.430000E+01   7.270000E+01   7.080000E+01   6.870000E+01   6.650000E+01   6.410000E+01   6.180000E+01   5.950000E+01   5.730000E+01   5.540000E+01   5.370000E+01   5.240000E+01   5.140000E+01   5.070000E+01   5.040000E+01   5.060000E+01   5.100000E+01   5.180000E+01   5.280000E+01   5.400000E+01   5.540000E+01   5.690000E+01   5.830000E+01   5.960000E+01   6.080000E+01   6.180000E+01   6.240000E+01   6.280000E+01   6.280000E+01   6.240000E+01   6.170000E+01   6.060000E+01   5.920000E+01   5.740000E+01   5.550000E+01   5.330000E+01   5.100000E+01   4.870000E+01   4.650000E+01   4.430000E+01   4.230000E+01   4.060000E+01   3.920000E+01   3.810000E+01   3.730000E+01   3.700000E+01
+   9.240000E+01   9.170000E+01   9.060000E+01   8.920000E+01   8.740000E+01   8.540000E+01   8.320000E+01   8.080000E+01   7.840000E+01   7.600000E+01   7.370000E+01   7.160000E+01   6.970000E+01   6.820000E+01   6.690000E+01   6.600000E+01   6.550000E+01   6.530000E+01   6.550000E+01   6.610000E+01   6.700000E+01   6.810000E+01   6.930000E+01   7.070000E+01   7.210000E+01   7.350000E+01   7.470000E+01   7.580000E+01   7.660000E+01   7.710000E+01   7.730000E+01   7.710000E+01   7.650000E+01   7.550000E+01   7.420000E+01   7.250000E+01   7.060000E+01   6.840000E+01   6.610000E+01   6.370000E+01   6.130000E+01   5.900000E+01   5.680000E+01   5.480000E+01   5.310000E+01   5.170000E+01   5.070000E+01   5.000000E+01   4.970000E+01   4.980000E+01   5.020000E+01   5.100000E+01   5.200000E+01   5.320000E+01   5.460000E+01   5.600000E+01   5.750000E+01   5.880000E+01   6.000000E+01   6.090000E+01   6.160000E+01   6.190000E+01   6.190000E+01   6.150000E+01   6.080000E+01   5.960000E+01   5.810000E+01   5.640000E+01   5.440000E+01   5.220000E+01   4.980000E+01   4.750000E+01   4.520000E+01   4.300000E+01   4.090000E+01   3.920000E+01   3.770000E+01   3.660000E+01   3.580000E+01   3.540000E+01
+   9.330000E+01   9.250000E+01   9.140000E+01   8.990000E+01   8.810000E+01   8.600000E+01   8.370000E+01   8.130000E+01   7.890000E+01   7.650000E+01   7.410000E+01   7.200000E+01   7.000000E+01   6.840000E+01   6.710000E+01   6.620000E+01   6.560000E+01   6.550000E+01   6.570000E+01   6.620000E+01   6.710000E+01   6.810000E+01   6.940000E+01   7.080000E+01   7.220000E+01   7.360000E+01   7.480000E+01   7.580000E+01   7.660000E+01   7.710000E+01   7.730000E+01   7.700000E+01   7.640000E+01   7.540000E+01   7.410000E+01   7.240000E+01   7.040000E+01   6.820000E+01   6.580000E+01   6.340000E+01   6.090000E+01   5.860000E+01   5.630000E+01   5.430000E+01   5.250000E+01   5.110000E+01   5.000000E+01   4.930000E+01   4.900000E+01   4.910000E+01   4.950000E+01   5.020000E+01   5.120000E+01   5.250000E+01   5.380000E+01   5.530000E+01   5.670000E+01   5.800000E+01   5.920000E+01   6.010000E+01   6.080000E+01   6.110000E+01   6.110000E+01   6.060000E+01   5.980000E+01   5.870000E+01   5.720000E+01   5.540000E+01   5.330000E+01   5.100000E+01   4.870000E+01   4.630000E+01   4.390000E+01   4.170000E+01   3.960000E+01   3.780000E+01   3.630000E+01   3.510000E+01   3.430000E+01   3.390000E+01
+   9.400000E+01   9.320000E+01   9.210000E+01   9.050000E+01   8.870000E+01   8.660000E+01   8.430000E+01   8.190000E+01   7.940000E+01   7.690000E+01   7.450000E+01   7.230000E+01   7.030000E+01   6.870000E+01   6.730000E+01   6.640000E+01   6.580000E+01   6.560000E+01   6.580000E+01   6.630000E+01   6.720000E+01   6.820000E+01   6.950000E+01   7.090000E+01   7.230000E+01   7.360000E+01   7.480000E+01   7.590000E+01   7.670000E+01   7.710000E+01   7.730000E+01   7.700000E+01   7.640000E+01   7.530000E+01   7.390000E+01   7.220000E+01   7.020000E+01   6.790000E+01   6.550000E+01   6.310000E+01   6.060000E+01   5.810000E+01   5.590000E+01   5.380000E+01   5.200000E+01   5.050000E+01   4.940000E+01   4.870000E+01   4.830000E+01   4.840000E+01   4.880000E+01   4.950000E+01   5.050000E+01   5.170000E+01   5.310000E+01   5.450000E+01   5.590000E+01   5.720000E+01   5.840000E+01   5.930000E+01   6.000000E+01   6.030000E+01   6.020000E+01   5.980000E+01   5.900000E+01   5.780000E+01   5.620000E+01   5.440000E+01   5.230000E+01   5.000000E+01   4.760000E+01   4.520000E+01   4.280000E+01   4.050000E+01   3.840000E+01   3.650000E+01   3.500000E+01   3.380000E+01   3.300000E+01   3.260000E+01
+   9.470000E+01   9.390000E+01   9.270000E+01   9.120000E+01   8.930000E+01   8.710000E+01   8.480000E+01   8.230000E+01   7.980000E+01   7.730000E+01   7.490000E+01   7.260000E+01   7.060000E+01   6.890000E+01   6.760000E+01   6.660000E+01   6.600000E+01   6.580000E+01   6.590000E+01   6.640000E+01   6.730000E+01   6.830000E+01   6.960000E+01   7.090000E+01   7.230000E+01   7.370000E+01   7.490000E+01   7.590000E+01   7.670000E+01   7.710000E+01   7.720000E+01   7.690000E+01   7.630000E+01   7.520000E+01   7.380000E+01   7.200000E+01   7.000000E+01   6.770000E+01   6.530000E+01   6.270000E+01   6.020000E+01   5.770000E+01   5.540000E+01   5.330000E+01   5.150000E+01   5.000000E+01   4.880000E+01   4.810000E+01   4.770000E+01   4.780000E+01   4.820000E+01   4.890000E+01   4.990000E+01   5.110000E+01   5.240000E+01   5.380000E+01   5.520000E+01   5.650000E+01   5.770000E+01   5.860000E+01   5.920000E+01   5.950000E+01   5.950000E+01   5.900000E+01   5.820000E+01   5.690000E+01   5.540000E+01   5.350000E+01   5.130000E+01   4.900000E+01   4.660000E+01   4.410000E+01   4.170000E+01   3.930000E+01   3.720000E+01   3.530000E+01   3.380000E+01   3.250000E+01   3.170000E+01   3.130000E+01
+   9.540000E+01   9.450000E+01   9.330000E+01   9.170000E+01   8.980000E+01   8.760000E+01   8.530000E+01   8.280000E+01   8.020000E+01   7.760000E+01   7.520000E+01   7.290000E+01   7.090000E+01   6.920000E+01   6.780000E+01   6.680000E+01   6.610000E+01   6.590000E+01   6.610000E+01   6.660000E+01   6.740000E+01   6.840000E+01   6.960000E+01   7.100000E+01   7.240000E+01   7.370000E+01   7.490000E+01   7.590000E+01   7.670000E+01   7.710000E+01   7.720000E+01   7.690000E+01   7.620000E+01   7.510000E+01   7.370000E+01   7.190000E+01   6.980000E+01   6.750000E+01   6.500000E+01   6.240000E+01   5.990000E+01   5.740000E+01   5.500000E+01   5.290000E+01   5.100000E+01   4.950000E+01   4.830000E+01   4.760000E+01   4.720000E+01   4.720000E+01   4.760000E+01   4.830000E+01   4.920000E+01   5.040000E+01   5.180000E+01   5.320000E+01   5.460000E+01   5.590000E+01   5.700000E+01   5.790000E+01   5.850000E+01   5.880000E+01   5.870000E+01   5.820000E+01   5.740000E+01   5.610000E+01   5.450000E+01   5.260000E+01   5.040000E+01   4.810000E+01   4.560000E+01   4.310000E+01   4.060000E+01   3.830000E+01   3.610000E+01   3.420000E+01   3.260000E+01   3.140000E+01   3.050000E+01   3.010000E+01
+   9.590000E+01   9.510000E+01   9.380000E+01   9.220000E+01   9.030000E+01   8.810000E+01   8.570000E+01   8.320000E+01   8.060000E+01   7.800000E+01   7.550000E+01   7.320000E+01   7.120000E+01   6.940000E+01   6.800000E+01   6.690000E+01   6.630000E+01   6.610000E+01   6.620000E+01   6.670000E+01   6.750000E+01   6.850000E+01   6.970000E+01   7.100000E+01   7.240000E+01   7.370000E+01   7.490000E+01   7.590000E+01   7.670000E+01   7.710000E+01   7.720000E+01   7.680000E+01   7.610000E+01   7.500000E+01   7.350000E+01   7.170000E+01   6.960000E+01   6.730000E+01   6.480000E+01   6.220000E+01   5.960000E+01   5.700000E+01   5.470000E+01   5.250000E+01   5.060000E+01   4.910000E+01   4.790000E+01   4.710000E+01   4.670000E+01   4.670000E+01   4.700000E+01   4.770000E+01   4.870000E+01   4.990000E+01   5.120000E+01   5.260000E+01   5.400000E+01   5.520000E+01   5.640000E+01   5.730000E+01   5.790000E+01   5.810000E+01   5.800000E+01   5.750000E+01   5.660000E+01   5.540000E+01   5.370000E+01   5.180000E+01   4.960000E+01   4.720000E+01   4.470000E+01   4.220000E+01   3.970000E+01   3.730000E+01   3.510000E+01   3.320000E+01   3.160000E+01   3.030000E+01   2.940000E+01   2.900000E+01
+   9.650000E+01   9.560000E+01   9.430000E+01   9.270000E+01   9.080000E+01   8.850000E+01   8.610000E+01   8.350000E+01   8.090000E+01   7.830000E+01   7.580000E+01   7.350000E+01   7.140000E+01   6.960000E+01   6.820000E+01   6.710000E+01   6.650000E+01   6.620000E+01   6.630000E+01   6.680000E+01   6.760000E+01   6.860000E+01   6.980000E+01   7.110000E+01   7.250000E+01   7.380000E+01   7.490000E+01   7.590000E+01   7.660000E+01   7.710000E+01   7.710000E+01   7.680000E+01   7.600000E+01   7.490000E+01   7.340000E+01   7.160000E+01   6.940000E+01   6.710000E+01   6.450000E+01   6.190000E+01   5.930000E+01   5.670000E+01   5.430000E+01   5.220000E+01   5.020000E+01   4.870000E+01   4.750000E+01   4.660000E+01   4.620000E+01   4.620000E+01   4.650000E+01   4.720000E+01   4.820000E+01   4.930000E+01   5.060000E+01   5.200000E+01   5.340000E+01   5.470000E+01   5.580000E+01   5.670000E+01   5.720000E+01   5.750000E+01   5.740000E+01   5.680000E+01   5.590000E+01   5.460000E+01   5.300000E+01   5.100000E+01   4.880000E+01   4.640000E+01   4.390000E+01   4.130000E+01   3.880000E+01   3.640000E+01   3.420000E+01   3.230000E+01   3.060000E+01   2.930000E+01   2.840000E+01   2.800000E+01
+   9.690000E+01   9.600000E+01   9.480000E+01   9.310000E+01   9.110000E+01   8.890000E+01   8.650000E+01   8.390000E+01   8.120000E+01   7.860000E+01   7.610000E+01   7.370000E+01   7.160000E+01   6.980000E+01   6.840000E+01   6.730000E+01   6.660000E+01   6.640000E+01   6.640000E+01   6.690000E+01   6.770000E+01   6.870000E+01   6.990000E+01   7.120000E+01   7.250000E+01   7.380000E+01   7.490000E+01   7.590000E+01   7.660000E+01   7.700000E+01   7.700000E+01   7.670000E+01   7.590000E+01   7.480000E+01   7.330000E+01   7.140000E+01   6.930000E+01   6.690000E+01   6.430000E+01   6.170000E+01   5.910000E+01   5.650000E+01   5.410000E+01   5.180000E+01   4.990000E+01   4.830000E+01   4.710000E+01   4.630000E+01   4.580000E+01   4.580000E+01   4.610000E+01   4.680000E+01   4.770000E+01   4.890000E+01   5.010000E+01   5.150000E+01   5.290000E+01   5.410000E+01   5.520000E+01   5.610000E+01   5.670000E+01   5.690000E+01   5.680000E+01   5.620000E+01   5.530000E+01   5.400000E+01   5.230000E+01   5.040000E+01   4.810000E+01   4.570000E+01   4.320000E+01   4.060000E+01   3.800000E+01   3.560000E+01   3.340000E+01   3.140000E+01   2.980000E+01   2.850000E+01   2.760000E+01   2.710000E+01
+   9.730000E+01   9.640000E+01   9.510000E+01   9.350000E+01   9.150000E+01   8.920000E+01   8.680000E+01   8.420000E+01   8.150000E+01   7.890000E+01   7.630000E+01   7.400000E+01   7.190000E+01   7.010000E+01   6.860000E+01   6.750000E+01   6.680000E+01   6.650000E+01   6.660000E+01   6.700000E+01   6.780000E+01   6.870000E+01   6.990000E+01   7.120000E+01   7.250000E+01   7.380000E+01   7.490000E+01   7.590000E+01   7.660000E+01   7.700000E+01   7.700000E+01   7.660000E+01   7.580000E+01   7.470000E+01   7.310000E+01   7.130000E+01   6.910000E+01   6.670000E+01   6.410000E+01   6.150000E+01   5.880000E+01   5.620000E+01   5.380000E+01   5.160000E+01   4.960000E+01   4.800000E+01   4.680000E+01   4.590000E+01   4.550000E+01   4.540000E+01   4.570000E+01   4.640000E+01   4.730000E+01   4.840000E+01   4.970000E+01   5.110000E+01   5.240000E+01   5.360000E+01   5.470000E+01   5.560000E+01   5.610000E+01   5.640000E+01   5.620000E+01   5.570000E+01   5.470000E+01   5.340000E+01   5.170000E+01   4.970000E+01   4.750000E+01   4.500000E+01   4.250000E+01   3.990000E+01   3.730000E+01   3.490000E+01   3.270000E+01   3.070000E+01   2.900000E+01   2.770000E+01   2.680000E+01   2.630000E+01
+   9.770000E+01   9.680000E+01   9.540000E+01   9.380000E+01   9.180000E+01   8.950000E+01   8.700000E+01   8.440000E+01   8.180000E+01   7.910000E+01   7.660000E+01   7.420000E+01   7.210000E+01   7.030000E+01   6.880000E+01   6.770000E+01   6.700000E+01   6.660000E+01   6.670000E+01   6.710000E+01   6.780000E+01   6.880000E+01   7.000000E+01   7.120000E+01   7.250000E+01   7.380000E+01   7.490000E+01   7.590000E+01   7.650000E+01   7.690000E+01   7.690000E+01   7.650000E+01   7.570000E+01   7.460000E+01   7.300000E+01   7.110000E+01   6.900000E+01   6.650000E+01   6.400000E+01   6.130000E+01   5.860000E+01   5.600000E+01   5.360000E+01   5.140000E+01   4.940000E+01   4.780000E+01   4.650000E+01   4.570000E+01   4.520000E+01   4.510000E+01   4.540000E+01   4.600000E+01   4.700000E+01   4.810000E+01   4.930000E+01   5.070000E+01   5.200000E+01   5.320000E+01   5.430000E+01   5.510000E+01   5.570000E+01   5.590000E+01   5.570000E+01   5.510000E+01   5.420000E+01   5.280000E+01   5.120000E+01   4.920000E+01   4.690000E+01   4.450000E+01   4.190000E+01   3.930000E+01   3.670000E+01   3.430000E+01   3.200000E+01   3.010000E+01   2.840000E+01   2.710000E+01   2.610000E+01   2.560000E+01
+   9.800000E+01   9.700000E+01   9.570000E+01   9.400000E+01   9.200000E+01   8.970000E+01   8.730000E+01   8.470000E+01   8.200000E+01   7.930000E+01   7.680000E+01   7.440000E+01   7.230000E+01   7.040000E+01   6.890000E+01   6.780000E+01   6.710000E+01   6.680000E+01   6.680000E+01   6.720000E+01   6.790000E+01   6.890000E+01   7.000000E+01   7.130000E+01   7.260000E+01   7.380000E+01   7.490000E+01   7.580000E+01   7.650000E+01   7.680000E+01   7.680000E+01   7.640000E+01   7.560000E+01   7.440000E+01   7.290000E+01   7.100000E+01   6.880000E+01   6.640000E+01   6.380000E+01   6.120000E+01   5.850000E+01   5.590000E+01   5.340000E+01   5.120000E+01   4.920000E+01   4.760000E+01   4.630000E+01   4.540000E+01   4.500000E+01   4.490000E+01   4.520000E+01   4.580000E+01   4.670000E+01   4.780000E+01   4.900000E+01   5.030000E+01   5.160000E+01   5.280000E+01   5.390000E+01   5.470000E+01   5.520000E+01   5.540000E+01   5.520000E+01   5.470000E+01   5.370000E+01   5.240000E+01   5.070000E+01   4.870000E+01   4.640000E+01   4.390000E+01   4.140000E+01   3.880000E+01   3.620000E+01   3.380000E+01   3.150000E+01   2.950000E+01   2.780000E+01   2.650000E+01   2.560000E+01   2.500000E+01
+   9.820000E+01   9.720000E+01   9.590000E+01   9.420000E+01   9.220000E+01   8.990000E+01   8.750000E+01   8.480000E+01   8.220000E+01   7.950000E+01   7.700000E+01   7.460000E+01   7.250000E+01   7.060000E+01   6.910000E+01   6.800000E+01   6.730000E+01   6.690000E+01   6.700000E+01   6.730000E+01   6.800000E+01   6.900000E+01   7.010000E+01   7.130000E+01   7.260000E+01   7.380000E+01   7.490000E+01   7.580000E+01   7.640000E+01   7.680000E+01   7.670000E+01   7.630000E+01   7.550000E+01   7.430000E+01   7.280000E+01   7.090000E+01   6.870000E+01   6.630000E+01   6.370000E+01   6.100000E+01   5.830000E+01   5.570000E+01   5.330000E+01   5.100000E+01   4.910000E+01   4.740000E+01   4.620000E+01   4.530000E+01   4.480000E+01   4.470000E+01   4.500000E+01   4.560000E+01   4.640000E+01   4.750000E+01   4.870000E+01   5.000000E+01   5.130000E+01   5.250000E+01   5.350000E+01   5.430000E+01   5.480000E+01   5.500000E+01   5.480000E+01   5.420000E+01   5.330000E+01   5.190000E+01   5.020000E+01   4.820000E+01   4.600000E+01   4.350000E+01   4.100000E+01   3.840000E+01   3.580000E+01   3.330000E+01   3.110000E+01   2.910000E+01   2.740000E+01   2.610000E+01   2.510000E+01   2.460000E+01
+   9.830000E+01   9.740000E+01   9.600000E+01   9.430000E+01   9.230000E+01   9.010000E+01   8.760000E+01   8.500000E+01   8.230000E+01   7.970000E+01   7.710000E+01   7.480000E+01   7.260000E+01   7.080000E+01   6.930000E+01   6.820000E+01   6.740000E+01   6.710000E+01   6.710000E+01   6.750000E+01   6.810000E+01   6.900000E+01   7.010000E+01   7.140000E+01   7.260000E+01   7.380000E+01   7.490000E+01   7.570000E+01   7.640000E+01   7.670000E+01   7.660000E+01   7.620000E+01   7.540000E+01   7.420000E+01   7.260000E+01   7.070000E+01   6.860000E+01   6.610000E+01   6.360000E+01   6.090000E+01   5.820000E+01   5.560000E+01   5.320000E+01   5.100000E+01   4.900000E+01   4.740000E+01   4.610000E+01   4.520000E+01   4.470000E+01   4.460000E+01   4.480000E+01   4.540000E+01   4.630000E+01   4.730000E+01   4.850000E+01   4.980000E+01   5.110000E+01   5.220000E+01   5.320000E+01   5.400000E+01   5.450000E+01   5.470000E+01   5.450000E+01   5.390000E+01   5.290000E+01   5.160000E+01   4.990000E+01   4.790000E+01   4.560000E+01   4.320000E+01   4.060000E+01   3.800000E+01   3.550000E+01   3.300000E+01   3.080000E+01   2.880000E+01   2.710000E+01   2.570000E+01   2.480000E+01   2.420000E+01
+   9.840000E+01   9.740000E+01   9.610000E+01   9.440000E+01   9.240000E+01   9.020000E+01   8.770000E+01   8.510000E+01   8.240000E+01   7.980000E+01   7.730000E+01   7.490000E+01   7.280000E+01   7.090000E+01   6.940000E+01   6.830000E+01   6.760000E+01   6.720000E+01   6.720000E+01   6.760000E+01   6.820000E+01   6.910000E+01   7.020000E+01   7.140000E+01   7.260000E+01   7.380000E+01   7.480000E+01   7.570000E+01   7.630000E+01   7.660000E+01   7.650000E+01   7.610000E+01   7.530000E+01   7.410000E+01   7.250000E+01   7.060000E+01   6.840000E+01   6.600000E+01   6.350000E+01   6.080000E+01   5.820000E+01   5.560000E+01   5.310000E+01   5.090000E+01   4.890000E+01   4.730000E+01   4.600000E+01   4.510000E+01   4.460000E+01   4.450000E+01   4.480000E+01   4.530000E+01   4.610000E+01   4.720000E+01   4.840000E+01   4.960000E+01   5.090000E+01   5.200000E+01   5.300000E+01   5.380000E+01   5.420000E+01   5.440000E+01   5.420000E+01   5.360000E+01   5.260000E+01   5.130000E+01   4.960000E+01   4.760000E+01   4.530000E+01   4.290000E+01   4.030000E+01   3.770000E+01   3.520000E+01   3.280000E+01   3.050000E+01   2.850000E+01   2.690000E+01   2.550000E+01   2.460000E+01   2.400000E+01
+   9.840000E+01   9.740000E+01   9.610000E+01   9.440000E+01   9.240000E+01   9.020000E+01   8.770000E+01   8.520000E+01   8.250000E+01   7.990000E+01   7.740000E+01   7.500000E+01   7.290000E+01   7.110000E+01   6.960000E+01   6.840000E+01   6.770000E+01   6.730000E+01   6.730000E+01   6.770000E+01   6.830000E+01   6.920000E+01   7.020000E+01   7.140000E+01   7.260000E+01   7.370000E+01   7.480000E+01   7.560000E+01   7.620000E+01   7.650000E+01   7.640000E+01   7.600000E+01   7.520000E+01   7.400000E+01   7.240000E+01   7.050000E+01   6.830000E+01   6.600000E+01   6.340000E+01   6.080000E+01   5.810000E+01   5.560000E+01   5.310000E+01   5.090000E+01   4.900000E+01   4.730000E+01   4.610000E+01   4.520000E+01   4.460000E+01   4.450000E+01   4.470000E+01   4.530000E+01   4.610000E+01   4.710000E+01   4.830000E+01   4.950000E+01   5.070000E+01   5.180000E+01   5.280000E+01   5.360000E+01   5.400000E+01   5.420000E+01   5.390000E+01   5.330000E+01   5.240000E+01   5.100000E+01   4.930000E+01   4.730000E+01   4.510000E+01   4.270000E+01   4.010000E+01   3.760000E+01   3.510000E+01   3.260000E+01   3.040000E+01   2.840000E+01   2.680000E+01   2.540000E+01   2.450000E+01   2.400000E+01
+   9.830000E+01   9.740000E+01   9.610000E+01   9.440000E+01   9.240000E+01   9.020000E+01   8.770000E+01   8.520000E+01   8.260000E+01   8.000000E+01   7.750000E+01   7.510000E+01   7.300000E+01   7.120000E+01   6.970000E+01   6.860000E+01   6.780000E+01   6.750000E+01   6.740000E+01   6.780000E+01   6.840000E+01   6.920000E+01   7.030000E+01   7.140000E+01   7.260000E+01   7.370000E+01   7.470000E+01   7.550000E+01   7.610000E+01   7.640000E+01   7.630000E+01   7.590000E+01   7.500000E+01   7.380000E+01   7.230000E+01   7.040000E+01   6.830000E+01   6.590000E+01   6.340000E+01   6.070000E+01   5.810000E+01   5.560000E+01   5.320000E+01   5.100000E+01   4.900000E+01   4.740000E+01   4.610000E+01   4.520000E+01   4.470000E+01   4.460000E+01   4.480000E+01   4.530000E+01   4.610000E+01   4.710000E+01   4.820000E+01   4.940000E+01   5.060000E+01   5.170000E+01   5.270000E+01   5.340000E+01   5.390000E+01   5.400000E+01   5.370000E+01   5.310000E+01   5.220000E+01   5.080000E+01   4.910000E+01   4.720000E+01   4.500000E+01   4.260000E+01   4.000000E+01   3.750000E+01   3.500000E+01   3.260000E+01   3.040000E+01   2.840000E+01   2.680000E+01   2.540000E+01   2.450000E+01   2.400000E+01
+   9.820000E+01   9.720000E+01   9.590000E+01   9.430000E+01   9.230000E+01   9.010000E+01   8.770000E+01   8.520000E+01   8.260000E+01   8.000000E+01   7.750000E+01   7.520000E+01   7.310000E+01   7.130000E+01   6.980000E+01   6.870000E+01   6.800000E+01   6.760000E+01   6.760000E+01   6.790000E+01   6.850000E+01   6.930000E+01   7.030000E+01   7.140000E+01   7.260000E+01   7.370000E+01   7.460000E+01   7.540000E+01   7.600000E+01   7.630000E+01   7.620000E+01   7.570000E+01   7.490000E+01   7.370000E+01   7.220000E+01   7.030000E+01   6.820000E+01   6.580000E+01   6.330000E+01   6.070000E+01   5.810000E+01   5.560000E+01   5.320000E+01   5.100000E+01   4.910000E+01   4.750000E+01   4.620000E+01   4.540000E+01   4.480000E+01   4.470000E+01   4.490000E+01   4.540000E+01   4.620000E+01   4.710000E+01   4.830000E+01   4.940000E+01   5.060000E+01   5.170000E+01   5.260000E+01   5.330000E+01   5.370000E+01   5.390000E+01   5.360000E+01   5.300000E+01   5.200000E+01   5.070000E+01   4.900000E+01   4.710000E+01   4.490000E+01   4.250000E+01   4.000000E+01   3.750000E+01   3.500000E+01   3.270000E+01   3.050000E+01   2.850000E+01   2.690000E+01   2.560000E+01   2.460000E+01   2.420000E+01
+   9.800000E+01   9.710000E+01   9.580000E+01   9.410000E+01   9.220000E+01   9.000000E+01   8.760000E+01   8.510000E+01   8.250000E+01   8.000000E+01   7.750000E+01   7.530000E+01   7.320000E+01   7.140000E+01   6.990000E+01   6.880000E+01   6.810000E+01   6.770000E+01   6.770000E+01   6.800000E+01   6.850000E+01   6.940000E+01   7.030000E+01   7.140000E+01   7.250000E+01   7.360000E+01   7.460000E+01   7.540000E+01   7.590000E+01   7.610000E+01   7.600000E+01   7.560000E+01   7.480000E+01   7.360000E+01   7.210000E+01   7.020000E+01   6.810000E+01   6.580000E+01   6.330000E+01   6.080000E+01   5.820000E+01   5.570000E+01   5.330000E+01   5.120000E+01   4.930000E+01   4.770000E+01   4.640000E+01   4.550000E+01   4.500000E+01   4.490000E+01   4.510000E+01   4.550000E+01   4.630000E+01   4.720000E+01   4.830000E+01   4.950000E+01   5.060000E+01   5.170000E+01   5.260000E+01   5.330000E+01   5.370000E+01   5.380000E+01   5.350000E+01   5.290000E+01   5.200000E+01   5.070000E+01   4.900000E+01   4.710000E+01   4.490000E+01   4.260000E+01   4.010000E+01   3.760000E+01   3.520000E+01   3.280000E+01   3.060000E+01   2.870000E+01   2.710000E+01   2.580000E+01   2.480000E+01   2.430000E+01
+   9.770000E+01   9.680000E+01   9.550000E+01   9.390000E+01   9.200000E+01   8.980000E+01   8.750000E+01   8.500000E+01   8.250000E+01   8.000000E+01   7.760000E+01   7.530000E+01   7.330000E+01   7.150000E+01   7.010000E+01   6.890000E+01   6.820000E+01   6.780000E+01   6.780000E+01   6.810000E+01   6.860000E+01   6.940000E+01   7.040000E+01   7.140000E+01   7.250000E+01   7.360000E+01   7.450000E+01   7.530000E+01   7.580000E+01   7.600000E+01   7.590000E+01   7.550000E+01   7.460000E+01   7.350000E+01   7.200000E+01   7.010000E+01   6.810000E+01   6.580000E+01   6.330000E+01   6.080000E+01   5.830000E+01   5.580000E+01   5.350000E+01   5.140000E+01   4.950000E+01   4.790000E+01   4.670000E+01   4.580000E+01   4.530000E+01   4.510000E+01   4.530000E+01   4.580000E+01   4.650000E+01   4.740000E+01   4.850000E+01   4.960000E+01   5.070000E+01   5.170000E+01   5.260000E+01   5.330000E+01   5.370000E+01   5.380000E+01   5.350000E+01   5.290000E+01   5.200000E+01   5.070000E+01   4.900000E+01   4.710000E+01   4.500000E+01   4.270000E+01   4.020000E+01   3.780000E+01   3.540000E+01   3.310000E+01   3.090000E+01   2.900000E+01   2.740000E+01   2.610000E+01   2.520000E+01   2.460000E+01
+   9.740000E+01   9.650000E+01   9.520000E+01   9.360000E+01   9.170000E+01   8.960000E+01   8.730000E+01   8.490000E+01   8.240000E+01   7.990000E+01   7.750000E+01   7.530000E+01   7.330000E+01   7.160000E+01   7.010000E+01   6.910000E+01   6.830000E+01   6.790000E+01   6.790000E+01   6.820000E+01   6.870000E+01   6.950000E+01   7.040000E+01   7.140000E+01   7.250000E+01   7.350000E+01   7.440000E+01   7.510000E+01   7.560000E+01   7.590000E+01   7.580000E+01   7.530000E+01   7.450000E+01   7.340000E+01   7.190000E+01   7.010000E+01   6.800000E+01   6.580000E+01   6.340000E+01   6.090000E+01   5.840000E+01   5.600000E+01   5.370000E+01   5.160000E+01   4.970000E+01   4.820000E+01   4.700000E+01   4.610000E+01   4.560000E+01   4.540000E+01   4.560000E+01   4.600000E+01   4.670000E+01   4.760000E+01   4.870000E+01   4.980000E+01   5.080000E+01   5.180000E+01   5.270000E+01   5.330000E+01   5.370000E+01   5.380000E+01   5.360000E+01   5.300000E+01   5.200000E+01   5.070000E+01   4.910000E+01   4.720000E+01   4.510000E+01   4.290000E+01   4.050000E+01   3.810000E+01   3.570000E+01   3.340000E+01   3.130000E+01   2.940000E+01   2.790000E+01   2.660000E+01   2.570000E+01   2.510000E+01
+   9.700000E+01   9.610000E+01   9.490000E+01   9.330000E+01   9.140000E+01   8.930000E+01   8.710000E+01   8.470000E+01   8.220000E+01   7.980000E+01   7.750000E+01   7.530000E+01   7.330000E+01   7.160000E+01   7.020000E+01   6.920000E+01   6.840000E+01   6.800000E+01   6.800000E+01   6.820000E+01   6.880000E+01   6.950000E+01   7.040000E+01   7.140000E+01   7.240000E+01   7.340000E+01   7.430000E+01   7.500000E+01   7.550000E+01   7.570000E+01   7.560000E+01   7.520000E+01   7.440000E+01   7.320000E+01   7.180000E+01   7.000000E+01   6.800000E+01   6.580000E+01   6.340000E+01   6.100000E+01   5.850000E+01   5.620000E+01   5.390000E+01   5.180000E+01   5.000000E+01   4.850000E+01   4.730000E+01   4.640000E+01   4.590000E+01   4.580000E+01   4.590000E+01   4.630000E+01   4.700000E+01   4.790000E+01   4.890000E+01   5.000000E+01   5.100000E+01   5.200000E+01   5.280000E+01   5.350000E+01   5.380000E+01   5.390000E+01   5.370000E+01   5.310000E+01   5.210000E+01   5.090000E+01   4.930000E+01   4.740000E+01   4.540000E+01   4.310000E+01   4.080000E+01   3.840000E+01   3.610000E+01   3.390000E+01   3.180000E+01   3.000000E+01   2.840000E+01   2.720000E+01   2.620000E+01   2.570000E+01
+   9.660000E+01   9.570000E+01   9.440000E+01   9.290000E+01   9.110000E+01   8.900000E+01   8.680000E+01   8.450000E+01   8.210000E+01   7.970000E+01   7.740000E+01   7.530000E+01   7.340000E+01   7.170000E+01   7.030000E+01   6.920000E+01   6.850000E+01   6.810000E+01   6.810000E+01   6.830000E+01   6.880000E+01   6.960000E+01   7.040000E+01   7.140000E+01   7.240000E+01   7.340000E+01   7.420000E+01   7.490000E+01   7.540000E+01   7.560000E+01   7.540000E+01   7.500000E+01   7.420000E+01   7.310000E+01   7.170000E+01   7.000000E+01   6.800000E+01   6.580000E+01   6.350000E+01   6.110000E+01   5.870000E+01   5.640000E+01   5.420000E+01   5.220000E+01   5.040000E+01   4.890000E+01   4.770000E+01   4.680000E+01   4.630000E+01   4.620000E+01   4.630000E+01   4.670000E+01   4.740000E+01   4.820000E+01   4.920000E+01   5.020000E+01   5.130000E+01   5.220000E+01   5.300000E+01   5.360000E+01   5.400000E+01   5.410000E+01   5.380000E+01   5.320000E+01   5.230000E+01   5.110000E+01   4.950000E+01   4.770000E+01   4.570000E+01   4.350000E+01   4.120000E+01   3.890000E+01   3.660000E+01   3.440000E+01   3.240000E+01   3.060000E+01   2.910000E+01   2.780000E+01   2.690000E+01   2.640000E+01
+   9.600000E+01   9.520000E+01   9.400000E+01   9.250000E+01   9.070000E+01   8.870000E+01   8.650000E+01   8.420000E+01   8.190000E+01   7.960000E+01   7.730000E+01   7.520000E+01   7.340000E+01   7.170000E+01   7.040000E+01   6.930000E+01   6.860000E+01   6.820000E+01   6.820000E+01   6.840000E+01   6.890000E+01   6.960000E+01   7.040000E+01   7.140000E+01   7.240000E+01   7.330000E+01   7.410000E+01   7.480000E+01   7.520000E+01   7.540000E+01   7.530000E+01   7.490000E+01   7.410000E+01   7.300000E+01   7.160000E+01   6.990000E+01   6.800000E+01   6.580000E+01   6.360000E+01   6.130000E+01   5.890000E+01   5.660000E+01   5.450000E+01   5.250000E+01   5.080000E+01   4.930000E+01   4.810000E+01   4.730000E+01   4.680000E+01   4.660000E+01   4.680000E+01   4.720000E+01   4.780000E+01   4.860000E+01   4.960000E+01   5.060000E+01   5.160000E+01   5.250000E+01   5.330000E+01   5.390000E+01   5.420000E+01   5.430000E+01   5.400000E+01   5.340000E+01   5.250000E+01   5.130000E+01   4.980000E+01   4.800000E+01   4.610000E+01   4.390000E+01   4.170000E+01   3.940000E+01   3.720000E+01   3.500000E+01   3.310000E+01   3.130000E+01   2.980000E+01   2.860000E+01   2.770000E+01   2.720000E+01
+   9.550000E+01   9.460000E+01   9.340000E+01   9.200000E+01   9.020000E+01   8.830000E+01   8.620000E+01   8.390000E+01   8.160000E+01   7.940000E+01   7.720000E+01   7.520000E+01   7.330000E+01   7.170000E+01   7.040000E+01   6.940000E+01   6.870000E+01   6.830000E+01   6.830000E+01   6.850000E+01   6.900000E+01   6.960000E+01   7.050000E+01   7.140000E+01   7.230000E+01   7.320000E+01   7.400000E+01   7.460000E+01   7.510000E+01   7.520000E+01   7.510000E+01   7.470000E+01   7.390000E+01   7.290000E+01   7.150000E+01   6.990000E+01   6.800000E+01   6.590000E+01   6.370000E+01   6.140000E+01   5.910000E+01   5.690000E+01   5.480000E+01   5.290000E+01   5.120000E+01   4.980000E+01   4.860000E+01   4.780000E+01   4.730000E+01   4.720000E+01   4.730000E+01   4.770000E+01   4.830000E+01   4.910000E+01   5.000000E+01   5.100000E+01   5.190000E+01   5.280000E+01   5.360000E+01   5.410000E+01   5.450000E+01   5.450000E+01   5.430000E+01   5.370000E+01   5.280000E+01   5.160000E+01   5.020000E+01   4.840000E+01   4.650000E+01   4.440000E+01   4.220000E+01   4.000000E+01   3.790000E+01   3.580000E+01   3.380000E+01   3.210000E+01   3.070000E+01   2.950000E+01   2.860000E+01   2.810000E+01
+   9.480000E+01   9.400000E+01   9.280000E+01   9.140000E+01   8.970000E+01   8.780000E+01   8.580000E+01   8.360000E+01   8.140000E+01   7.920000E+01   7.710000E+01   7.510000E+01   7.330000E+01   7.170000E+01   7.050000E+01   6.950000E+01   6.880000E+01   6.840000E+01   6.840000E+01   6.860000E+01   6.900000E+01   6.970000E+01   7.050000E+01   7.130000E+01   7.220000E+01   7.310000E+01   7.390000E+01   7.450000E+01   7.490000E+01   7.510000E+01   7.500000E+01   7.450000E+01   7.380000E+01   7.280000E+01   7.140000E+01   6.980000E+01   6.800000E+01   6.600000E+01   6.380000E+01   6.160000E+01   5.940000E+01   5.730000E+01   5.520000E+01   5.330000E+01   5.170000E+01   5.030000E+01   4.920000E+01   4.840000E+01   4.790000E+01   4.770000E+01   4.790000E+01   4.820000E+01   4.880000E+01   4.960000E+01   5.050000E+01   5.140000E+01   5.230000E+01   5.320000E+01   5.390000E+01   5.450000E+01   5.480000E+01   5.480000E+01   5.460000E+01   5.400000E+01   5.320000E+01   5.200000E+01   5.060000E+01   4.890000E+01   4.700000E+01   4.500000E+01   4.290000E+01   4.070000E+01   3.860000E+01   3.660000E+01   3.470000E+01   3.310000E+01   3.160000E+01   3.050000E+01   2.970000E+01   2.910000E+01
+   9.410000E+01   9.330000E+01   9.220000E+01   9.080000E+01   8.920000E+01   8.730000E+01   8.530000E+01   8.320000E+01   8.110000E+01   7.900000E+01   7.690000E+01   7.500000E+01   7.320000E+01   7.170000E+01   7.050000E+01   6.950000E+01   6.890000E+01   6.850000E+01   6.840000E+01   6.860000E+01   6.910000E+01   6.970000E+01   7.050000E+01   7.130000E+01   7.220000E+01   7.300000E+01   7.380000E+01   7.430000E+01   7.470000E+01   7.490000E+01   7.480000E+01   7.440000E+01   7.370000E+01   7.260000E+01   7.130000E+01   6.980000E+01   6.800000E+01   6.610000E+01   6.400000E+01   6.180000E+01   5.970000E+01   5.760000E+01   5.560000E+01   5.380000E+01   5.220000E+01   5.090000E+01   4.980000E+01   4.900000E+01   4.850000E+01   4.840000E+01   4.850000E+01   4.880000E+01   4.940000E+01   5.020000E+01   5.100000E+01   5.190000E+01   5.280000E+01   5.360000E+01   5.430000E+01   5.480000E+01   5.510000E+01   5.520000E+01   5.490000E+01   5.440000E+01   5.360000E+01   5.240000E+01   5.110000E+01   4.940000E+01   4.760000E+01   4.560000E+01   4.360000E+01   4.150000E+01   3.950000E+01   3.750000E+01   3.570000E+01   3.410000E+01   3.270000E+01   3.160000E+01   3.080000E+01   3.030000E+01
+   9.330000E+01   9.260000E+01   9.150000E+01   9.010000E+01   8.860000E+01   8.680000E+01   8.490000E+01   8.280000E+01   8.080000E+01   7.870000E+01   7.670000E+01   7.490000E+01   7.320000E+01   7.170000E+01   7.050000E+01   6.960000E+01   6.890000E+01   6.860000E+01   6.850000E+01   6.870000E+01   6.910000E+01   6.970000E+01   7.050000E+01   7.130000E+01   7.210000E+01   7.290000E+01   7.360000E+01   7.420000E+01   7.460000E+01   7.470000E+01   7.460000E+01   7.420000E+01   7.350000E+01   7.250000E+01   7.130000E+01   6.980000E+01   6.810000E+01   6.620000E+01   6.420000E+01   6.210000E+01   6.000000E+01   5.800000E+01   5.610000E+01   5.430000E+01   5.280000E+01   5.150000E+01   5.040000E+01   4.970000E+01   4.920000E+01   4.910000E+01   4.920000E+01   4.950000E+01   5.010000E+01   5.080000E+01   5.160000E+01   5.240000E+01   5.330000E+01   5.410000E+01   5.480000E+01   5.530000E+01   5.560000E+01   5.560000E+01   5.540000E+01   5.480000E+01   5.400000E+01   5.290000E+01   5.160000E+01   5.000000E+01   4.830000E+01   4.640000E+01   4.440000E+01   4.240000E+01   4.040000E+01   3.850000E+01   3.670000E+01   3.520000E+01   3.380000E+01   3.280000E+01   3.200000E+01   3.150000E+01
+   9.250000E+01   9.180000E+01   9.070000E+01   8.940000E+01   8.790000E+01   8.620000E+01   8.430000E+01   8.240000E+01   8.040000E+01   7.840000E+01   7.650000E+01   7.470000E+01   7.310000E+01   7.170000E+01   7.050000E+01   6.960000E+01   6.900000E+01   6.870000E+01   6.860000E+01   6.880000E+01   6.920000E+01   6.970000E+01   7.050000E+01   7.120000E+01   7.200000E+01   7.280000E+01   7.350000E+01   7.400000E+01   7.440000E+01   7.450000E+01   7.440000E+01   7.400000E+01   7.340000E+01   7.240000E+01   7.120000E+01   6.980000E+01   6.810000E+01   6.630000E+01   6.440000E+01   6.240000E+01   6.040000E+01   5.840000E+01   5.660000E+01   5.490000E+01   5.340000E+01   5.210000E+01   5.110000E+01   5.040000E+01   5.000000E+01   4.980000E+01   4.990000E+01   5.020000E+01   5.070000E+01   5.140000E+01   5.220000E+01   5.300000E+01   5.390000E+01   5.460000E+01   5.530000E+01   5.570000E+01   5.600000E+01   5.600000E+01   5.580000E+01   5.530000E+01   5.450000E+01   5.350000E+01   5.220000E+01   5.070000E+01   4.900000E+01   4.720000E+01   4.520000E+01   4.330000E+01   4.140000E+01   3.960000E+01   3.790000E+01   3.640000E+01   3.510000E+01   3.410000E+01   3.330000E+01   3.280000E+01
+   9.170000E+01   9.090000E+01   8.990000E+01   8.870000E+01   8.720000E+01   8.560000E+01   8.380000E+01   8.190000E+01   8.000000E+01   7.810000E+01   7.630000E+01   7.450000E+01   7.300000E+01   7.160000E+01   7.050000E+01   6.970000E+01   6.910000E+01   6.870000E+01   6.870000E+01   6.880000E+01   6.920000E+01   6.980000E+01   7.040000E+01   7.120000E+01   7.200000E+01   7.270000E+01   7.330000E+01   7.390000E+01   7.420000E+01   7.430000E+01   7.420000E+01   7.380000E+01   7.320000E+01   7.230000E+01   7.110000E+01   6.970000E+01   6.820000E+01   6.640000E+01   6.460000E+01   6.260000E+01   6.070000E+01   5.890000E+01   5.710000E+01   5.550000E+01   5.400000E+01   5.280000E+01   5.190000E+01   5.120000E+01   5.070000E+01   5.060000E+01   5.070000E+01   5.100000E+01   5.150000E+01   5.210000E+01   5.290000E+01   5.370000E+01   5.450000E+01   5.520000E+01   5.580000E+01   5.630000E+01   5.650000E+01   5.650000E+01   5.630000E+01   5.580000E+01   5.510000E+01   5.410000E+01   5.280000E+01   5.140000E+01   4.980000E+01   4.800000E+01   4.620000E+01   4.430000E+01   4.250000E+01   4.070000E+01   3.910000E+01   3.770000E+01   3.640000E+01   3.540000E+01   3.470000E+01   3.430000E+01
+   9.070000E+01   9.000000E+01   8.910000E+01   8.790000E+01   8.650000E+01   8.490000E+01   8.320000E+01   8.140000E+01   7.960000E+01   7.780000E+01   7.600000E+01   7.440000E+01   7.290000E+01   7.160000E+01   7.050000E+01   6.970000E+01   6.910000E+01   6.880000E+01   6.880000E+01   6.890000E+01   6.930000E+01   6.980000E+01   7.040000E+01   7.110000E+01   7.190000E+01   7.260000E+01   7.320000E+01   7.370000E+01   7.400000E+01   7.410000E+01   7.400000E+01   7.370000E+01   7.310000E+01   7.220000E+01   7.110000E+01   6.970000E+01   6.820000E+01   6.660000E+01   6.480000E+01   6.300000E+01   6.110000E+01   5.930000E+01   5.760000E+01   5.610000E+01   5.470000E+01   5.350000E+01   5.260000E+01   5.200000E+01   5.160000E+01   5.140000E+01   5.150000E+01   5.180000E+01   5.230000E+01   5.290000E+01   5.360000E+01   5.440000E+01   5.510000E+01   5.580000E+01   5.640000E+01   5.680000E+01   5.710000E+01   5.710000E+01   5.690000E+01   5.640000E+01   5.570000E+01   5.470000E+01   5.350000E+01   5.220000E+01   5.060000E+01   4.890000E+01   4.720000E+01   4.540000E+01   4.360000E+01   4.200000E+01   4.040000E+01   3.900000E+01   3.780000E+01   3.690000E+01   3.620000E+01   3.580000E+01
+   8.980000E+01   8.910000E+01   8.820000E+01   8.710000E+01   8.570000E+01   8.420000E+01   8.260000E+01   8.090000E+01   7.910000E+01   7.740000E+01   7.570000E+01   7.420000E+01   7.280000E+01   7.150000E+01   7.050000E+01   6.970000E+01   6.920000E+01   6.890000E+01   6.880000E+01   6.900000E+01   6.930000E+01   6.980000E+01   7.040000E+01   7.110000E+01   7.180000E+01   7.240000E+01   7.300000E+01   7.350000E+01   7.380000E+01   7.390000E+01   7.380000E+01   7.350000E+01   7.290000E+01   7.210000E+01   7.100000E+01   6.970000E+01   6.830000E+01   6.670000E+01   6.500000E+01   6.330000E+01   6.150000E+01   5.980000E+01   5.820000E+01   5.670000E+01   5.540000E+01   5.430000E+01   5.340000E+01   5.280000E+01   5.240000E+01   5.230000E+01   5.240000E+01   5.260000E+01   5.310000E+01   5.370000E+01   5.440000E+01   5.510000E+01   5.580000E+01   5.650000E+01   5.700000E+01   5.740000E+01   5.770000E+01   5.770000E+01   5.750000E+01   5.700000E+01   5.640000E+01   5.540000E+01   5.430000E+01   5.300000E+01   5.150000E+01   4.990000E+01   4.820000E+01   4.650000E+01   4.490000E+01   4.330000E+01   4.180000E+01   4.050000E+01   3.940000E+01   3.840000E+01   3.780000E+01   3.740000E+01
+   8.870000E+01   8.810000E+01   8.720000E+01   8.620000E+01   8.490000E+01   8.350000E+01   8.190000E+01   8.030000E+01   7.870000E+01   7.700000E+01   7.540000E+01   7.400000E+01   7.260000E+01   7.150000E+01   7.050000E+01   6.970000E+01   6.920000E+01   6.890000E+01   6.890000E+01   6.900000E+01   6.930000E+01   6.980000E+01   7.040000E+01   7.100000E+01   7.170000E+01   7.230000E+01   7.290000E+01   7.330000E+01   7.360000E+01   7.370000E+01   7.360000E+01   7.330000E+01   7.270000E+01   7.200000E+01   7.100000E+01   6.980000E+01   6.840000E+01   6.690000E+01   6.530000E+01   6.360000E+01   6.200000E+01   6.040000E+01   5.880000E+01   5.740000E+01   5.620000E+01   5.510000E+01   5.430000E+01   5.370000E+01   5.330000E+01   5.320000E+01   5.330000E+01   5.350000E+01   5.400000E+01   5.450000E+01   5.520000E+01   5.580000E+01   5.650000E+01   5.710000E+01   5.770000E+01   5.810000E+01   5.830000E+01   5.830000E+01   5.810000E+01   5.770000E+01   5.710000E+01   5.620000E+01   5.510000E+01   5.390000E+01   5.240000E+01   5.090000E+01   4.930000E+01   4.770000E+01   4.620000E+01   4.460000E+01   4.320000E+01   4.200000E+01   4.090000E+01   4.010000E+01   3.940000E+01   3.910000E+01
+   8.770000E+01   8.710000E+01   8.630000E+01   8.520000E+01   8.410000E+01   8.270000E+01   8.130000E+01   7.970000E+01   7.820000E+01   7.660000E+01   7.510000E+01   7.370000E+01   7.250000E+01   7.140000E+01   7.050000E+01   6.980000E+01   6.930000E+01   6.900000E+01   6.890000E+01   6.910000E+01   6.940000E+01   6.980000E+01   7.040000E+01   7.100000E+01   7.160000E+01   7.220000E+01   7.270000E+01   7.310000E+01   7.340000E+01   7.350000E+01   7.340000E+01   7.310000E+01   7.260000E+01   7.190000E+01   7.090000E+01   6.980000E+01   6.850000E+01   6.710000E+01   6.550000E+01   6.400000E+01   6.240000E+01   6.090000E+01   5.950000E+01   5.810000E+01   5.700000E+01   5.600000E+01   5.520000E+01   5.460000E+01   5.430000E+01   5.420000E+01   5.420000E+01   5.450000E+01   5.490000E+01   5.540000E+01   5.600000E+01   5.670000E+01   5.730000E+01   5.790000E+01   5.840000E+01   5.880000E+01   5.900000E+01   5.900000E+01   5.880000E+01   5.840000E+01   5.780000E+01   5.700000E+01   5.600000E+01   5.480000E+01   5.350000E+01   5.200000E+01   5.050000E+01   4.900000E+01   4.750000E+01   4.610000E+01   4.480000E+01   4.360000E+01   4.260000E+01   4.180000E+01   4.120000E+01   4.080000E+01
+   8.660000E+01   8.600000E+01   8.520000E+01   8.430000E+01   8.320000E+01   8.190000E+01   8.060000E+01   7.910000E+01   7.770000E+01   7.620000E+01   7.480000E+01   7.350000E+01   7.230000E+01   7.130000E+01   7.040000E+01   6.980000E+01   6.930000E+01   6.910000E+01   6.900000E+01   6.910000E+01   6.940000E+01   6.980000E+01   7.030000E+01   7.090000E+01   7.150000E+01   7.210000E+01   7.260000E+01   7.290000E+01   7.320000E+01   7.330000E+01   7.320000E+01   7.290000E+01   7.240000E+01   7.170000E+01   7.090000E+01   6.980000E+01   6.860000E+01   6.720000E+01   6.580000E+01   6.440000E+01   6.290000E+01   6.150000E+01   6.010000E+01   5.890000E+01   5.780000E+01   5.690000E+01   5.610000E+01   5.560000E+01   5.530000E+01   5.510000E+01   5.520000E+01   5.550000E+01   5.580000E+01   5.630000E+01   5.690000E+01   5.750000E+01   5.810000E+01   5.870000E+01   5.910000E+01   5.950000E+01   5.970000E+01   5.970000E+01   5.950000E+01   5.920000E+01   5.860000E+01   5.780000E+01   5.690000E+01   5.570000E+01   5.450000E+01   5.320000E+01   5.180000E+01   5.030000E+01   4.890000E+01   4.760000E+01   4.640000E+01   4.530000E+01   4.430000E+01   4.360000E+01   4.300000E+01   4.270000E+01
+   8.540000E+01   8.490000E+01   8.420000E+01   8.330000E+01   8.230000E+01   8.110000E+01   7.980000E+01   7.850000E+01   7.710000E+01   7.580000E+01   7.450000E+01   7.320000E+01   7.210000E+01   7.120000E+01   7.040000E+01   6.980000E+01   6.930000E+01   6.910000E+01   6.910000E+01   6.920000E+01   6.940000E+01   6.980000E+01   7.030000E+01   7.080000E+01   7.140000E+01   7.190000E+01   7.240000E+01   7.280000E+01   7.300000E+01   7.310000E+01   7.300000E+01   7.270000E+01   7.230000E+01   7.160000E+01   7.080000E+01   6.980000E+01   6.870000E+01   6.740000E+01   6.610000E+01   6.480000E+01   6.340000E+01   6.210000E+01   6.080000E+01   5.970000E+01   5.860000E+01   5.780000E+01   5.710000E+01   5.660000E+01   5.630000E+01   5.620000E+01   5.620000E+01   5.650000E+01   5.680000E+01   5.730000E+01   5.780000E+01   5.840000E+01   5.890000E+01   5.950000E+01   5.990000E+01   6.020000E+01   6.040000E+01   6.040000E+01   6.030000E+01   5.990000E+01   5.940000E+01   5.870000E+01   5.780000E+01   5.680000E+01   5.560000E+01   5.440000E+01   5.300000E+01   5.170000E+01   5.040000E+01   4.920000E+01   4.800000E+01   4.700000E+01   4.610000E+01   4.540000E+01   4.490000E+01   4.460000E+01
+   8.420000E+01   8.370000E+01   8.310000E+01   8.230000E+01   8.130000E+01   8.020000E+01   7.910000E+01   7.780000E+01   7.660000E+01   7.530000E+01   7.410000E+01   7.300000E+01   7.190000E+01   7.110000E+01   7.030000E+01   6.980000E+01   6.940000E+01   6.920000E+01   6.910000E+01   6.920000E+01   6.950000E+01   6.980000E+01   7.030000E+01   7.080000E+01   7.130000E+01   7.180000E+01   7.220000E+01   7.260000E+01   7.280000E+01   7.290000E+01   7.280000E+01   7.250000E+01   7.210000E+01   7.150000E+01   7.080000E+01   6.990000E+01   6.880000E+01   6.770000E+01   6.640000E+01   6.520000E+01   6.390000E+01   6.270000E+01   6.150000E+01   6.040000E+01   5.950000E+01   5.870000E+01   5.810000E+01   5.760000E+01   5.730000E+01   5.720000E+01   5.730000E+01   5.750000E+01   5.780000E+01   5.830000E+01   5.880000E+01   5.930000E+01   5.980000E+01   6.030000E+01   6.070000E+01   6.100000E+01   6.120000E+01   6.120000E+01   6.110000E+01   6.070000E+01   6.030000E+01   5.960000E+01   5.880000E+01   5.780000E+01   5.670000E+01   5.560000E+01   5.440000E+01   5.320000E+01   5.190000E+01   5.080000E+01   4.970000E+01   4.880000E+01   4.800000E+01   4.730000E+01   4.680000E+01   4.650000E+01
+   8.300000E+01   8.260000E+01   8.200000E+01   8.120000E+01   8.030000E+01   7.930000E+01   7.830000E+01   7.710000E+01   7.600000E+01   7.480000E+01   7.370000E+01   7.270000E+01   7.180000E+01   7.090000E+01   7.030000E+01   6.980000E+01   6.940000E+01   6.920000E+01   6.920000E+01   6.930000E+01   6.950000E+01   6.980000E+01   7.030000E+01   7.070000E+01   7.120000E+01   7.160000E+01   7.200000E+01   7.230000E+01   7.260000E+01   7.260000E+01   7.260000E+01   7.240000E+01   7.200000E+01   7.140000E+01   7.070000E+01   6.990000E+01   6.890000E+01   6.790000E+01   6.680000E+01   6.560000E+01   6.440000E+01   6.330000E+01   6.220000E+01   6.130000E+01   6.040000E+01   5.970000E+01   5.910000E+01   5.870000E+01   5.840000E+01   5.830000E+01   5.840000E+01   5.860000E+01   5.890000E+01   5.930000E+01   5.980000E+01   6.020000E+01   6.070000E+01   6.120000E+01   6.150000E+01   6.180000E+01   6.200000E+01   6.200000E+01   6.190000E+01   6.160000E+01   6.110000E+01   6.050000E+01   5.980000E+01   5.890000E+01   5.790000E+01   5.690000E+01   5.580000E+01   5.460000E+01   5.350000E+01   5.250000E+01   5.150000E+01   5.060000E+01   4.990000E+01   4.930000E+01   4.880000E+01   4.860000E+01
+   8.180000E+01   8.140000E+01   8.080000E+01   8.010000E+01   7.930000E+01   7.840000E+01   7.750000E+01   7.640000E+01   7.540000E+01   7.430000E+01   7.330000E+01   7.240000E+01   7.160000E+01   7.080000E+01   7.020000E+01   6.970000E+01   6.940000E+01   6.920000E+01   6.920000E+01   6.930000E+01   6.950000E+01   6.980000E+01   7.020000E+01   7.060000E+01   7.110000E+01   7.150000E+01   7.180000E+01   7.210000E+01   7.230000E+01   7.240000E+01   7.240000E+01   7.220000E+01   7.180000E+01   7.130000E+01   7.070000E+01   6.990000E+01   6.910000E+01   6.810000E+01   6.710000E+01   6.600000E+01   6.500000E+01   6.400000E+01   6.300000E+01   6.210000E+01   6.130000E+01   6.070000E+01   6.010000E+01   5.980000E+01   5.950000E+01   5.950000E+01   5.950000E+01   5.970000E+01   6.000000E+01   6.030000E+01   6.080000E+01   6.120000E+01   6.160000E+01   6.210000E+01   6.240000E+01   6.270000E+01   6.280000E+01   6.280000E+01   6.270000E+01   6.250000E+01   6.210000E+01   6.150000E+01   6.080000E+01   6.000000E+01   5.910000E+01   5.820000E+01   5.720000E+01   5.620000E+01   5.520000E+01   5.420000E+01   5.330000E+01   5.250000E+01   5.180000E+01   5.130000E+01   5.090000E+01   5.070000E+01
+   8.050000E+01   8.010000E+01   7.960000E+01   7.900000E+01   7.830000E+01   7.750000E+01   7.660000E+01   7.570000E+01   7.480000E+01   7.380000E+01   7.290000E+01   7.210000E+01   7.130000E+01   7.070000E+01   7.010000E+01   6.970000E+01   6.940000E+01   6.930000E+01   6.930000E+01   6.940000E+01   6.960000E+01   6.980000E+01   7.020000E+01   7.060000E+01   7.100000E+01   7.130000E+01   7.170000E+01   7.190000E+01   7.210000E+01   7.220000E+01   7.210000E+01   7.200000E+01   7.170000E+01   7.120000E+01   7.060000E+01   7.000000E+01   6.920000E+01   6.830000E+01   6.740000E+01   6.650000E+01   6.550000E+01   6.460000E+01   6.380000E+01   6.300000E+01   6.230000E+01   6.170000E+01   6.120000E+01   6.090000E+01   6.070000E+01   6.060000E+01   6.070000E+01   6.080000E+01   6.110000E+01   6.140000E+01   6.180000E+01   6.220000E+01   6.260000E+01   6.300000E+01   6.330000E+01   6.350000E+01   6.370000E+01   6.370000E+01   6.360000E+01   6.340000E+01   6.300000E+01   6.250000E+01   6.190000E+01   6.120000E+01   6.040000E+01   5.950000E+01   5.860000E+01   5.770000E+01   5.680000E+01   5.600000E+01   5.520000E+01   5.450000E+01   5.380000E+01   5.340000E+01   5.300000E+01   5.280000E+01
+   7.920000E+01   7.890000E+01   7.840000E+01   7.790000E+01   7.730000E+01   7.660000E+01   7.580000E+01   7.500000E+01   7.420000E+01   7.330000E+01   7.250000E+01   7.180000E+01   7.110000E+01   7.050000E+01   7.010000E+01   6.970000E+01   6.950000E+01   6.930000E+01   6.930000E+01   6.940000E+01   6.960000E+01   6.980000E+01   7.010000E+01   7.050000E+01   7.080000E+01   7.120000E+01   7.150000E+01   7.170000E+01   7.190000E+01   7.190000E+01   7.190000E+01   7.180000E+01   7.150000E+01   7.110000E+01   7.060000E+01   7.000000E+01   6.930000E+01   6.860000E+01   6.780000E+01   6.690000E+01   6.610000E+01   6.530000E+01   6.450000E+01   6.380000E+01   6.320000E+01   6.270000E+01   6.230000E+01   6.200000E+01   6.180000E+01   6.180000E+01   6.180000E+01   6.200000E+01   6.220000E+01   6.250000E+01   6.290000E+01   6.320000E+01   6.360000E+01   6.390000E+01   6.420000E+01   6.440000E+01   6.450000E+01   6.460000E+01   6.450000E+01   6.430000E+01   6.400000E+01   6.350000E+01   6.300000E+01   6.240000E+01   6.170000E+01   6.090000E+01   6.010000E+01   5.930000E+01   5.850000E+01   5.780000E+01   5.710000E+01   5.640000E+01   5.590000E+01   5.550000E+01   5.520000E+01   5.500000E+01
+   7.780000E+01   7.760000E+01   7.720000E+01   7.680000E+01   7.620000E+01   7.560000E+01   7.490000E+01   7.420000E+01   7.350000E+01   7.280000E+01   7.210000E+01   7.150000E+01   7.090000E+01   7.040000E+01   7.000000E+01   6.970000E+01   6.950000E+01   6.940000E+01   6.940000E+01   6.940000E+01   6.960000E+01   6.980000E+01   7.010000E+01   7.040000E+01   7.070000E+01   7.100000E+01   7.130000E+01   7.150000E+01   7.160000E+01   7.170000E+01   7.170000E+01   7.160000E+01   7.130000E+01   7.100000E+01   7.060000E+01   7.010000E+01   6.950000E+01   6.880000E+01   6.810000E+01   6.740000E+01   6.670000E+01   6.600000E+01   6.530000E+01   6.470000E+01   6.420000E+01   6.380000E+01   6.340000E+01   6.320000E+01   6.300000E+01   6.300000E+01   6.300000E+01   6.320000E+01   6.340000E+01   6.360000E+01   6.390000E+01   6.430000E+01   6.460000E+01   6.490000E+01   6.510000E+01   6.530000E+01   6.540000E+01   6.550000E+01   6.540000E+01   6.520000E+01   6.490000E+01   6.460000E+01   6.410000E+01   6.360000E+01   6.300000E+01   6.230000E+01   6.160000E+01   6.090000E+01   6.020000E+01   5.960000E+01   5.900000E+01   5.840000E+01   5.800000E+01   5.760000E+01   5.740000E+01   5.720000E+01
+   7.650000E+01   7.630000E+01   7.600000E+01   7.560000E+01   7.510000E+01   7.460000E+01   7.410000E+01   7.350000E+01   7.290000E+01   7.230000E+01   7.170000E+01   7.120000E+01   7.070000E+01   7.030000E+01   6.990000E+01   6.970000E+01   6.950000E+01   6.940000E+01   6.940000E+01   6.950000E+01   6.960000E+01   6.980000E+01   7.010000E+01   7.030000E+01   7.060000E+01   7.090000E+01   7.110000E+01   7.130000E+01   7.140000E+01   7.150000E+01   7.150000E+01   7.140000E+01   7.120000E+01   7.090000E+01   7.050000E+01   7.010000E+01   6.960000E+01   6.910000E+01   6.850000E+01   6.790000E+01   6.730000E+01   6.670000E+01   6.610000E+01   6.560000E+01   6.520000E+01   6.480000E+01   6.450000E+01   6.430000E+01   6.420000E+01   6.420000E+01   6.420000E+01   6.430000E+01   6.450000E+01   6.480000E+01   6.500000E+01   6.530000E+01   6.560000E+01   6.580000E+01   6.610000E+01   6.620000E+01   6.630000E+01   6.640000E+01   6.630000E+01   6.620000E+01   6.590000E+01   6.560000E+01   6.530000E+01   6.480000E+01   6.430000E+01   6.370000E+01   6.320000E+01   6.260000E+01   6.200000E+01   6.140000E+01   6.090000E+01   6.050000E+01   6.010000E+01   5.980000E+01   5.960000E+01   5.940000E+01
+   7.510000E+01   7.500000E+01   7.470000E+01   7.440000E+01   7.410000E+01   7.360000E+01   7.320000E+01   7.270000E+01   7.220000E+01   7.170000E+01   7.130000E+01   7.080000E+01   7.040000E+01   7.010000E+01   6.980000E+01   6.960000E+01   6.950000E+01   6.940000E+01   6.940000E+01   6.950000E+01   6.960000E+01   6.980000E+01   7.000000E+01   7.020000E+01   7.050000E+01   7.070000E+01   7.090000E+01   7.110000E+01   7.120000E+01   7.120000E+01   7.120000E+01   7.120000E+01   7.100000E+01   7.080000E+01   7.050000E+01   7.020000E+01   6.980000E+01   6.930000E+01   6.890000E+01   6.840000E+01   6.790000E+01   6.740000E+01   6.700000E+01   6.650000E+01   6.620000E+01   6.590000E+01   6.570000E+01   6.550000E+01   6.540000E+01   6.540000E+01   6.540000E+01   6.550000E+01   6.570000E+01   6.590000E+01   6.610000E+01   6.640000E+01   6.660000E+01   6.680000E+01   6.700000E+01   6.720000E+01   6.720000E+01   6.730000E+01   6.720000E+01   6.710000E+01   6.700000E+01   6.670000E+01   6.640000E+01   6.600000E+01   6.560000E+01   6.520000E+01   6.470000E+01   6.420000E+01   6.380000E+01   6.330000E+01   6.290000E+01   6.250000E+01   6.220000E+01   6.200000E+01   6.180000E+01   6.170000E+01
+   7.380000E+01   7.360000E+01   7.350000E+01   7.320000E+01   7.300000E+01   7.260000E+01   7.230000E+01   7.190000E+01   7.160000E+01   7.120000E+01   7.080000E+01   7.050000E+01   7.020000E+01   7.000000E+01   6.980000E+01   6.960000E+01   6.950000E+01   6.950000E+01   6.950000E+01   6.960000E+01   6.970000E+01   6.980000E+01   7.000000E+01   7.020000E+01   7.040000E+01   7.050000E+01   7.070000E+01   7.080000E+01   7.090000E+01   7.100000E+01   7.100000E+01   7.100000E+01   7.090000E+01   7.070000E+01   7.050000E+01   7.020000E+01   6.990000E+01   6.960000E+01   6.920000E+01   6.890000E+01   6.850000E+01   6.810000E+01   6.780000E+01   6.750000E+01   6.720000E+01   6.700000E+01   6.680000E+01   6.670000E+01   6.660000E+01   6.660000E+01   6.670000E+01   6.680000E+01   6.690000E+01   6.710000E+01   6.720000E+01   6.740000E+01   6.760000E+01   6.780000E+01   6.800000E+01   6.810000E+01   6.820000E+01   6.820000E+01   6.820000E+01   6.810000E+01   6.800000E+01   6.780000E+01   6.760000E+01   6.730000E+01   6.700000E+01   6.660000E+01   6.630000E+01   6.590000E+01   6.560000E+01   6.520000E+01   6.490000E+01   6.460000E+01   6.440000E+01   6.420000E+01   6.410000E+01   6.400000E+01
+   7.240000E+01   7.230000E+01   7.220000E+01   7.200000E+01   7.180000E+01   7.160000E+01   7.140000E+01   7.120000E+01   7.090000E+01   7.060000E+01   7.040000E+01   7.020000E+01   7.000000E+01   6.980000E+01   6.970000E+01   6.960000E+01   6.950000E+01   6.950000E+01   6.950000E+01   6.960000E+01   6.970000E+01   6.980000E+01   6.990000E+01   7.010000E+01   7.020000E+01   7.040000E+01   7.050000E+01   7.060000E+01   7.070000E+01   7.080000E+01   7.080000E+01   7.080000E+01   7.070000E+01   7.060000E+01   7.040000E+01   7.030000E+01   7.010000E+01   6.980000E+01   6.960000E+01   6.930000E+01   6.910000E+01   6.880000E+01   6.860000E+01   6.840000E+01   6.820000E+01   6.810000E+01   6.800000E+01   6.790000E+01   6.790000E+01   6.790000E+01   6.790000E+01   6.800000E+01   6.810000E+01   6.820000E+01   6.840000E+01   6.850000E+01   6.870000E+01   6.880000E+01   6.890000E+01   6.900000E+01   6.910000E+01   6.910000E+01   6.910000E+01   6.910000E+01   6.900000E+01   6.890000E+01   6.870000E+01   6.860000E+01   6.830000E+01   6.810000E+01   6.790000E+01   6.760000E+01   6.740000E+01   6.710000E+01   6.690000E+01   6.670000E+01   6.660000E+01   6.650000E+01   6.640000E+01   6.630000E+01
+   7.100000E+01   7.100000E+01   7.090000E+01   7.080000E+01   7.070000E+01   7.060000E+01   7.050000E+01   7.040000E+01   7.020000E+01   7.010000E+01   7.000000E+01   6.980000E+01   6.970000E+01   6.970000E+01   6.960000E+01   6.960000E+01   6.950000E+01   6.950000E+01   6.960000E+01   6.960000E+01   6.970000E+01   6.980000E+01   6.990000E+01   7.000000E+01   7.010000E+01   7.020000E+01   7.030000E+01   7.040000E+01   7.050000E+01   7.050000E+01   7.050000E+01   7.050000E+01   7.050000E+01   7.050000E+01   7.040000E+01   7.030000E+01   7.020000E+01   7.010000E+01   7.000000E+01   6.980000E+01   6.970000E+01   6.960000E+01   6.940000E+01   6.930000E+01   6.920000E+01   6.920000E+01   6.910000E+01   6.910000E+01   6.910000E+01   6.910000E+01   6.920000E+01   6.920000E+01   6.930000E+01   6.940000E+01   6.950000E+01   6.960000E+01   6.970000E+01   6.980000E+01   6.990000E+01   7.000000E+01   7.000000E+01   7.010000E+01   7.010000E+01   7.010000E+01   7.010000E+01   7.000000E+01   6.990000E+01   6.980000E+01   6.970000E+01   6.960000E+01   6.950000E+01   6.930000E+01   6.920000E+01   6.910000E+01   6.890000E+01   6.880000E+01   6.880000E+01   6.870000E+01   6.870000E+01   6.870000E+01
+   6.960000E+01   6.960000E+01   6.960000E+01   6.960000E+01   6.960000E+01   6.960000E+01   6.960000E+01   6.960000E+01   6.960000E+01   6.950000E+01   6.950000E+01   6.950000E+01   6.950000E+01   6.950000E+01   6.950000E+01   6.950000E+01   6.960000E+01   6.960000E+01   6.960000E+01   6.970000E+01   6.970000E+01   6.980000E+01   6.980000E+01   6.990000E+01   7.000000E+01   7.000000E+01   7.010000E+01   7.020000E+01   7.020000E+01   7.030000E+01   7.030000E+01   7.030000E+01   7.040000E+01   7.040000E+01   7.040000E+01   7.040000E+01   7.040000E+01   7.040000E+01   7.030000E+01   7.030000E+01   7.030000E+01   7.030000E+01   7.030000E+01   7.030000E+01   7.030000E+01   7.030000E+01   7.030000E+01   7.030000E+01   7.030000E+01   7.040000E+01   7.040000E+01   7.040000E+01   7.050000E+01   7.060000E+01   7.060000E+01   7.070000E+01   7.080000E+01   7.080000E+01   7.090000E+01   7.090000E+01   7.100000E+01   7.100000E+01   7.110000E+01   7.110000E+01   7.110000E+01   7.110000E+01   7.110000E+01   7.110000E+01   7.110000E+01   7.110000E+01   7.100000E+01   7.100000E+01   7.100000E+01   7.100000E+01   7.100000E+01   7.100000E+01   7.090000E+01   7.100000E+01   7.100000E+01   7.100000E+01
+   6.820000E+01   6.830000E+01   6.840000E+01   6.840000E+01   6.850000E+01   6.860000E+01   6.870000E+01   6.880000E+01   6.890000E+01   6.900000E+01   6.910000E+01   6.920000E+01   6.930000E+01   6.940000E+01   6.940000E+01   6.950000E+01   6.960000E+01   6.960000E+01   6.970000E+01   6.970000E+01   6.970000E+01   6.980000E+01   6.980000E+01   6.980000E+01   6.990000E+01   6.990000E+01   6.990000E+01   6.990000E+01   7.000000E+01   7.000000E+01   7.010000E+01   7.010000E+01   7.020000E+01   7.030000E+01   7.030000E+01   7.040000E+01   7.050000E+01   7.060000E+01   7.070000E+01   7.080000E+01   7.090000E+01   7.100000E+01   7.110000E+01   7.120000E+01   7.130000E+01   7.140000E+01   7.140000E+01   7.150000E+01   7.150000E+01   7.160000E+01   7.160000E+01   7.170000E+01   7.170000E+01   7.170000E+01   7.180000E+01   7.180000E+01   7.180000E+01   7.180000E+01   7.190000E+01   7.190000E+01   7.190000E+01   7.200000E+01   7.200000E+01   7.210000E+01   7.210000E+01   7.220000E+01   7.230000E+01   7.240000E+01   7.240000E+01   7.250000E+01   7.260000E+01   7.270000E+01   7.280000E+01   7.290000E+01   7.300000E+01   7.310000E+01   7.310000E+01   7.320000E+01   7.330000E+01   7.330000E+01
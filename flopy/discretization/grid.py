@@ -369,6 +369,48 @@ class Grid(object):
         else:
             return x, y
 
+    def _get_polygon_index(self):
+        """
+        Get the packed bounding box index of the cell polygons in local
+        coordinates, which is built the first time it is needed and rebuilt
+        after the grid geometry changes.  Used by grids that store the local
+        vertices of each cell as 'localxyvertices' when building their
+        geometry.
+        """
+        cache_index = 'polygonindex'
+        if cache_index not in self._cache_dict or \
+                self._cache_dict[cache_index].out_of_date:
+            cache_index_local = 'localxyvertices'
+            if cache_index_local not in self._cache_dict or \
+                    self._cache_dict[cache_index_local].out_of_date:
+                self._build_grid_geometry_info()
+            xvertices, yvertices = \
+                self._cache_dict[cache_index_local].data_nocopy
+            self._cache_dict[cache_index] = CachedData(
+                geometry.PolygonIndex(xvertices, yvertices))
+        return self._cache_dict[cache_index].data_nocopy
+
+    def _intersect_polygons(self, x, y, local=False, forgive=False):
+        """
+        Get the number of the cell polygon that contains each point, the
+        lowest cell number for a point on an edge shared by several cells.
+        x and y can be scalars or arrays.
+        """
+        # transform x and y to local coordinates
+        x, y = Grid.intersect(self, x, y, local, forgive)
+        cells = self._get_polygon_index().query(x, y)
+        outside = cells < 0
+        if np.any(outside) and not forgive:
+            raise Exception('x, y point given is outside of the model area')
+        if np.ndim(x) == 0:
+            if outside[0]:
+                return np.nan
+            return int(cells[0])
+        if np.any(outside):
+            cells = cells.astype(float)
+            cells[outside] = np.nan
+        return cells.reshape(np.shape(x))
+
     def set_coord_info(self, xoff=0.0, yoff=0.0, angrot=0.0, epsg=None,
                        proj4=None, merge_coord_info=True):
         if merge_coord_info:
@@ -170,8 +170,37 @@ class UnstructuredGrid(Grid):
             return self._cache_dict[cache_index].data_nocopy
 
     def intersect(self, x, y, local=False, forgive=False):
-        x, y = super(UnstructuredGrid, self).intersect(x, y, local, forgive)
-        raise Exception('Not implemented yet')
+        """
+        Get the cell number of a point with coordinates x and y, the index
+        of the cell in iverts
+
+        When the point is on the edge of two cells, the cell with the lowest
+        cell number is returned.
+
+        The cells are found with a bounding box index of the cells that is
+        built on the first call and kept until the grid geometry changes.
+
+        Parameters
+        ----------
+        x : float or array-like
+            The x-coordinate of the requested point(s)
+        y : float or array-like
+            The y-coordinate of the requested point(s)
+        local: bool (optional)
+            If True, x and y are in local coordinates (defaults to False)
+        forgive: bool (optional)
+            Forgive x,y arguments that fall outside the model grid and
+            return NaNs instead (defaults to False - will throw exception)
+
+        Returns
+        -------
+        icell : int or numpy.ndarray
+            The cell number, or an array of cell numbers with the shape of
+            x when x and y are arrays (a float array when forgive is True
+            and points are outside of the model grid)
+
+        """
+        return self._intersect_polygons(x, y, local, forgive)
 
     def get_cell_vertices(self, cellid):
         """
@@ -189,6 +218,7 @@ class UnstructuredGrid(Grid):
     def _build_grid_geometry_info(self):
         cache_index_cc = 'cellcenters'
         cache_index_vert = 'xyzgrid'
+        cache_index_local = 'localxyvertices'
 
         vertexdict = {ix: list(v[-2:])
                       for ix, v in enumerate(self._vertices)}
@@ -211,6 +241,8 @@ class UnstructuredGrid(Grid):
             yvertices.append(ycellvert)
 
         zvertices, zcenters = self._zcoords()
+        self._cache_dict[cache_index_local] = CachedData([xvertices,
+                                                          yvertices])
 
         if self._has_ref_coordinates:
             # transform x and y
@@ -1,11 +1,6 @@
 import numpy as np
-try:
-    from matplotlib.path import Path
-except ImportError:
-    Path = None
 
 from .grid import Grid, CachedData
-from ..utils.geometry import is_clockwise
 
 
 class VertexGrid(Grid):
@@ -150,13 +145,16 @@ class VertexGrid(Grid):
         
         When the point is on the edge of two cells, the cell with the lowest
         CELL2D number is returned.
+
+        The cells are found with a bounding box index of the cells that is
+        built on the first call and kept until the grid geometry changes.
         
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
+        x : float or array-like
+            The x-coordinate of the requested point(s)
+        y : float or array-like
+            The y-coordinate of the requested point(s)
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
         forgive: bool (optional)
@@ -165,37 +163,13 @@ class VertexGrid(Grid):
     
         Returns
         -------
-        icell2d : int
-            The CELL2D number
+        icell2d : int or numpy.ndarray
+            The CELL2D number, or an array of CELL2D numbers with the shape
+            of x when x and y are arrays (a float array when forgive is
+            True and points are outside of the model grid)
         
         """
-        if Path is None:
-            s = 'Could not import matplotlib.  Must install matplotlib ' + \
-                ' in order to use VertexGrid.intersect() method'
-            raise ImportError(s)
-
-        if local:
-            # transform x and y to real-world coordinates
-            x, y = super(VertexGrid, self).get_coords(x,y)
-        xv, yv, zv = self.xyzvertices
-        for icell2d in range(self.ncpl):
-            xa = np.array(xv[icell2d])
-            ya = np.array(yv[icell2d])
-            # x and y at least have to be within the bounding box of the cell
-            if np.any(x <= xa) and np.any(x >= xa) and \
-                    np.any(y <= ya) and np.any(y >= ya):
-                path = Path(np.stack((xa, ya)).transpose())
-                # use a small radius, so that the edge of the cell is included
-                if is_clockwise(xa, ya):
-                    radius = -1e-9
-                else:
-                    radius = 1e-9
-                if path.contains_point((x, y), radius=radius):
-                    return icell2d
-        if forgive:
-            icell2d = np.nan
-            return icell2d
-        raise Exception('x, y point given is outside of the model area')
+        return self._intersect_polygons(x, y, local, forgive)
 
     def get_cell_vertices(self, cellid):
         """
@@ -232,6 +206,7 @@ class VertexGrid(Grid):
     def _build_grid_geometry_info(self):
         cache_index_cc = 'cellcenters'
         cache_index_vert = 'xyzgrid'
+        cache_index_local = 'localxyvertices'
 
         vertexdict = {v[0]: [v[1], v[2]]
                       for v in self._vertices}
@@ -261,6 +236,8 @@ class VertexGrid(Grid):
 
         # build z cell centers
         zvertices, zcenters = self._zcoords()
+        self._cache_dict[cache_index_local] = CachedData([xvertices,
+                                                          yvertices])
 
         if self._has_ref_coordinates:
             # transform x and y
@@ -125,6 +125,14 @@ class NetCdf(object):
     forgive : what to do if a duplicate variable name is being created.  If
         True, then the newly requested var is skipped.  If False, then
         an exception is raised.
+    chunks : dict
+        chunk size for each dimension name (e.g. {"time": 1, "layer": 1}).
+        Dimensions that are not listed are stored in a single chunk.  The
+        default of one time step and one layer per chunk lets time series
+        output be written (and read back) one time step at a time.
+    complevel : int
+        zlib compression level (0-9) for the variables.  0 disables
+        compression (default 4)
     **kwargs : keyword arguments
         modelgrid : flopy.discretization.Grid instance
             user supplied model grid which will be used in lieu of the model
@@ -140,7 +148,7 @@ class NetCdf(object):
 
     def __init__(self, output_filename, model, time_values=None,
                  z_positive='up', verbose=None, prj=None, logger=None,
-                 forgive=False, **kwargs):
+                 forgive=False, chunks=None, complevel=4, **kwargs):
 
         assert output_filename.lower().endswith(".nc")
         if verbose is None:
@@ -158,6 +166,11 @@ class NetCdf(object):
 
         self.forgive = bool(forgive)
 
+        self.chunks = {"time": 1, "layer": 1}
+        if chunks is not None:
+            self.chunks.update(chunks)
+        self.complevel = int(complevel)
+
         self.model = model
         self.model_grid = model.modelgrid
         if "modelgrid" in kwargs:
@@ -392,7 +405,8 @@ class NetCdf(object):
 
         new_net = cls(output_filename, other.model,
                       time_values=other.time_values_arg, verbose=verbose,
-                      logger=logger)
+                      logger=logger, chunks=other.chunks,
+                      complevel=other.complevel)
         return new_net
 
     def difference(self, other, minuend="self", mask_zero_diff=True,
@@ -889,7 +903,8 @@ class NetCdf(object):
         return name.replace('.', '_').replace(' ', '_').replace('-', '_')
 
     def create_variable(self, name, attributes, precision_str='f4',
-                        dimensions=("time", "layer")):
+                        dimensions=("time", "layer"), chunks=None,
+                        complevel=None):
         """
         Create a new variable in the netcdf object
 
@@ -904,6 +919,12 @@ class NetCdf(object):
         dimensions : tuple
             which dimensions the variable applies to
             default : ("time","layer","x","y")
+        chunks : dict
+            chunk sizes by dimension name that override self.chunks for
+            this variable
+        complevel : int
+            zlib compression level for this variable.  If None,
+            self.complevel is used
 
         Returns
         -------
@@ -941,23 +962,17 @@ class NetCdf(object):
         if self.nc is None:
             self.initialize_file()
 
-        # check that the requested dimension exists and
-        # build up the chuck sizes
-        # chunks = []
-        # for dimension in dimensions:
-        #    assert self.nc.dimensions.get(dimension) is not None, \
-        #        "netcdf.create_variable() dimension not found:" + dimension
-        #    chunk = self.chunks[dimension]
-        #    assert chunk is not None, \
-        #        "netcdf.create_variable() chunk size of {0} is None in self.chunks". \
-        #            format(dimension)
-        #    chunks.append(chunk)
+        chunksizes = self._get_chunksizes(dimensions, chunks)
+        if complevel is None:
+            complevel = self.complevel
 
         self.var_attr_dict[name] = attributes
 
         var = self.nc.createVariable(name, precision_str, dimensions,
-                                     fill_value=self.fillvalue, zlib=True)  # ,
-        # chunksizes=tuple(chunks))
+                                     fill_value=self.fillvalue,
+                                     zlib=complevel > 0,
+                                     complevel=max(complevel, 1),
+                                     chunksizes=chunksizes)
         for k, v in attributes.items():
             try:
                 var.setncattr(k, v)
@@ -967,6 +982,26 @@ class NetCdf(object):
         self.log("creating variable: " + str(name))
         return var
 
+    def _get_chunksizes(self, dimensions, chunks=None):
+        """build up the chunk sizes for a variable from self.chunks,
+        limited to the length of each dimension"""
+        if len(dimensions) == 0:
+            return None
+        all_chunks = dict(self.chunks)
+        if chunks is not None:
+            all_chunks.update(chunks)
+        chunksizes = []
+        for dimension in dimensions:
+            dim = self.nc.dimensions.get(dimension)
+            assert dim is not None, \
+                "netcdf.create_variable() dimension not found:" + dimension
+            length = max(len(dim), 1)
+            chunk = all_chunks.get(dimension)
+            if chunk is None:
+                chunk = length
+            chunksizes.append(min(max(int(chunk), 1), length))
+        return tuple(chunksizes)
+
     def add_global_attributes(self, attr_dict):
         """ add global attribute to an initialized file
 
@@ -1,6 +1,8 @@
 from __future__ import print_function
 import json
 import os
+import threading
+import queue as Queue
 import numpy as np
 from ..utils import HeadFile, CellBudgetFile, UcnFile, FormattedHeadFile
 from ..mbase import BaseModel, ModelInterface
@@ -114,96 +116,176 @@ def ensemble_helper(inputs_filename, outputs_filename, models, add_reals=True,
     return f_in, f_out
 
 
+def _iter_output_steps(out_obj, times, text=''):
+    """
+    Generator that reads the output for each time in times one step ahead
+    on a background thread, so that reading the next step overlaps with
+    processing (e.g. compressing) the current one.
+
+    Yields
+    ------
+    (i, a, error) : tuple
+        index of the time, the array (None if the time is not in out_obj)
+        and the exception raised while reading (or None)
+
+    """
+    q = Queue.Queue(maxsize=1)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except Queue.Full:
+                pass
+        return False
+
+    def read_steps():
+        for i, t in enumerate(times):
+            a, err = None, None
+            if t in out_obj.recordarray["totim"]:
+                try:
+                    if text:
+                        a = out_obj.get_data(totim=t, full3D=True, text=text)
+                        if isinstance(a, list):
+                            a = a[0]
+                    else:
+                        a = out_obj.get_data(totim=t)
+                except Exception as e:
+                    err = e
+            if not put((i, a, err)):
+                return
+        put(None)
+
+    thread = threading.Thread(target=read_steps)
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            item = q.get()
+            if item is None:
+                break
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
 def _add_output_nc_variable(f, times, shape3d, out_obj, var_name, logger=None,
                             text='', mask_vals=(), mask_array3d=None):
+    """
+    Add the output in out_obj as a (time, layer, row, column) variable,
+    writing one time step at a time so that only a couple of time steps
+    are held in memory.  Unless f is a dict, in which case the whole array
+    is returned in it.
+
+    """
+    label = var_name
+    if text:
+        label += text.decode().strip().lower()
+
+    units = None
+    if var_name in NC_UNITS_FORMAT and not isinstance(f, dict):
+        units = NC_UNITS_FORMAT[var_name].format(
+            f.grid_units, f.time_units)
+    precision_str = "f4"
+
+    if text:
+        var_name = text.decode().strip().lower()
+
     if logger:
-        logger.log("creating array for {0}".format(
-            var_name))
-
-    array = np.zeros((len(times), shape3d[0], shape3d[1], shape3d[2]),
-                     dtype=np.float32)
-    array[:] = np.NaN
-    for i, t in enumerate(times):
-        if t in out_obj.recordarray["totim"]:
-            try:
-                if text:
-                    a = out_obj.get_data(totim=t, full3D=True, text=text)
-                    if isinstance(a, list):
-                        a = a[0]
-                else:
-                    a = out_obj.get_data(totim=t)
-            except Exception as e:
-                estr = "error getting data for {0} at time {1}:{2}".format(
-                    var_name + text.decode().strip().lower(), t, str(e))
-                if logger:
-                    logger.warn(estr)
-                else:
-                    print(estr)
-                continue
-            if mask_array3d is not None and a.shape == mask_array3d.shape:
-                a[mask_array3d] = np.NaN
+        logger.log("writing array for {0}".format(var_name))
+
+    attribs = {}
+    if isinstance(f, dict):
+        var = np.zeros((len(times), shape3d[0], shape3d[1], shape3d[2]),
+                       dtype=np.float32)
+        var[:] = netcdf.FILLVALUE
+    else:
+        attribs["long_name"] = var_name
+        attribs["coordinates"] = "time layer latitude longitude"
+        if units is not None:
+            attribs["units"] = units
+        try:
+            dim_tuple = ("time",) + f.dimension_names
+            var = f.create_variable(var_name, attribs,
+                                    precision_str=precision_str,
+                                    dimensions=dim_tuple)
+        except Exception as e:
+            estr = "error creating variable {0}:\n{1}".format(
+                var_name, str(e))
+            if logger:
+                logger.lraise(estr)
+            else:
+                raise Exception(estr)
+
+    # min and max are accumulated over the time steps
+    mn, mx = None, None
+    array = np.zeros(shape3d, dtype=np.float32)
+    for i, a, err in _iter_output_steps(out_obj, times, text):
+        if err is not None:
+            estr = "error getting data for {0} at time {1}:{2}".format(
+                label, times[i], str(err))
+            if logger:
+                logger.warn(estr)
+            else:
+                print(estr)
+            continue
+        if a is None:
+            array[:] = netcdf.FILLVALUE
+        else:
             try:
-                array[i, :, :, :] = a.astype(np.float32)
+                array[:] = a
             except Exception as e:
-                estr = "error assigning {0} data to array for time {1}:{2}".format(
-                    var_name + text.decode().strip().lower(), t, str(e))
+                estr = "error assigning {0} data to array for time " \
+                       "{1}:{2}".format(label, times[i], str(e))
                 if logger:
                     logger.warn(estr)
                 else:
                     print(estr)
-                continue
+                array[:] = netcdf.FILLVALUE
+            else:
+                if mask_array3d is not None and \
+                        a.shape == mask_array3d.shape:
+                    array[mask_array3d] = np.NaN
+                for mask_val in mask_vals:
+                    array[array == mask_val] = np.NaN
+                isnan = np.isnan(array)
+                if not isnan.all():
+                    values = array[~isnan]
+                    amn, amx = values.min(), values.max()
+                    mn = amn if mn is None else min(mn, amn)
+                    mx = amx if mx is None else max(mx, amx)
+                array[isnan] = netcdf.FILLVALUE
+        try:
+            var[i] = array
+        except Exception as e:
+            estr = "error setting array to variable {0}:\n{1}".format(
+                var_name, str(e))
+            if logger:
+                logger.lraise(estr)
+            else:
+                raise Exception(estr)
 
     if logger:
-        logger.log("creating array for {0}".format(
-            var_name))
-
-    for mask_val in mask_vals:
-        array[np.where(array == mask_val)] = np.NaN
-    mx, mn = np.nanmax(array), np.nanmin(array)
-    array[np.isnan(array)] = netcdf.FILLVALUE
+        logger.log("writing array for {0}".format(var_name))
 
     if isinstance(f, dict):
-        if text:
-            var_name = text.decode().strip().lower()
-        f[var_name] = array
+        f[var_name] = var
         return f
 
-    units = None
-    if var_name in NC_UNITS_FORMAT:
-        units = NC_UNITS_FORMAT[var_name].format(
-            f.grid_units, f.time_units)
-    precision_str = "f4"
-
-    if text:
-        var_name = text.decode().strip().lower()
-    attribs = {"long_name": var_name}
-    attribs["coordinates"] = "time layer latitude longitude"
+    if mn is None:
+        mn, mx = np.float32(np.NaN), np.float32(np.NaN)
+    # var_attr_dict holds attribs, so copies of f get min and max as well
     attribs["min"] = mn
     attribs["max"] = mx
-    if units is not None:
-        attribs["units"] = units
-    try:
-        dim_tuple = ("time",) + f.dimension_names
-        var = f.create_variable(var_name, attribs,
-                                precision_str=precision_str,
-                                dimensions=dim_tuple)
-    except Exception as e:
-        estr = "error creating variable {0}:\n{1}".format(
-            var_name, str(e))
-        if logger:
-            logger.lraise(estr)
-        else:
-            raise Exception(estr)
-
-    try:
-        var[:] = array
-    except Exception as e:
-        estr = "error setting array to variable {0}:\n{1}".format(
-            var_name, str(e))
-        if logger:
-            logger.lraise(estr)
-        else:
-            raise Exception(estr)
+    for k in ("min", "max"):
+        try:
+            var.setncattr(k, attribs[k])
+        except Exception:
+            f.logger.warn("error setting attribute {0} for variable "
+                          "{1}".format(k, var_name))
 
 
 def output_helper(f, ml, oudic, **kwargs):
@@ -221,6 +303,10 @@ def output_helper(f, ml, oudic, **kwargs):
         modelgrid : flopy.discretizaiton.Grid
             user supplied model grid instance that will be used for export
             in lieu of the models model grid instance
+        chunks : dict
+            netCDF chunk size for each dimension name (see NetCdf)
+        complevel : int
+            netCDF zlib compression level, 0-9 (default 4)
 
     Returns
     -------
@@ -235,6 +321,8 @@ def output_helper(f, ml, oudic, **kwargs):
     logger = kwargs.pop("logger", None)
     stride = kwargs.pop("stride", 1)
     forgive = kwargs.pop("forgive", False)
+    chunks = kwargs.pop("chunks", None)
+    complevel = kwargs.pop("complevel", 4)
     kwargs.pop("suffix", None)
     mask_vals = []
     if "masked_vals" in kwargs:
@@ -284,7 +372,8 @@ def output_helper(f, ml, oudic, **kwargs):
     times = [t for t in common_times[::stride]]
     if isinstance(f, str) and f.lower().endswith(".nc"):
         f = NetCdf(f, ml, time_values=times, logger=logger,
-                   forgive=forgive, **kwargs)
+                   forgive=forgive, chunks=chunks, complevel=complevel,
+                   **kwargs)
     elif isinstance(f, NetCdf):
         otimes = list(f.nc.variables["time"][:])
         assert otimes == times
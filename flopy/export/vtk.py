@@ -1,13 +1,15 @@
 from __future__ import print_function, division
 import os
 import numpy as np
-from ..discretization import StructuredGrid
+from ..discretization import StructuredGrid, VertexGrid
 from ..datbase import DataType, DataInterface
 import flopy.utils.binaryfile as bf
 from flopy.utils import HeadFile
 import numpy.ma as ma
 import struct
 import sys
+import zlib
+from collections import deque
 
 # Module for exporting vtk from flopy
 
@@ -23,6 +25,17 @@ np_to_struct = {'int8': 'b',
                 'float32': 'f',
                 'float64': 'd'}
 
+np_to_vtk = {'int8': 'Int8',
+             'uint8': 'UInt8',
+             'int16': 'Int16',
+             'uint16': 'UInt16',
+             'int32': 'Int32',
+             'uint32': 'UInt32',
+             'int64': 'Int64',
+             'uint64': 'UInt64',
+             'float32': 'Float32',
+             'float64': 'Float64'}
+
 
 class BinaryXml:
     """
@@ -57,10 +70,9 @@ class BinaryXml:
         # ravel in fortran order
         dd = np.ravel(data, order='F')
 
-        data_format = self.byte_order + str(data.size) + np_to_struct[
-            data.dtype.name]
-        binary_data = struct.pack(data_format, *dd)
-        self.stream.write(binary_data)
+        dtype = np.dtype(np_to_struct[data.dtype.name]).newbyteorder(
+            self.byte_order)
+        self.stream.write(dd.astype(dtype, copy=False).tobytes())
 
     def write_coord_arrays(self, x, y, z):
         # check that arrays are the same shape and data type
@@ -72,20 +84,15 @@ class BinaryXml:
         assert (y.flags['C_CONTIGUOUS'] or y.flags['F_CONTIGUOUS'])
         assert (z.flags['C_CONTIGUOUS'] or z.flags['F_CONTIGUOUS'])
 
-        data_format = self.byte_order + str(1) + \
-            np_to_struct[x.dtype.name]
-
-        xrav = np.ravel(x, order='F')
-        yrav = np.ravel(y, order='F')
-        zrav = np.ravel(z, order='F')
+        dtype = np.dtype(np_to_struct[x.dtype.name]).newbyteorder(
+            self.byte_order)
 
-        for idx in range(x.size):
-            bx = struct.pack(data_format, xrav[idx])
-            by = struct.pack(data_format, yrav[idx])
-            bz = struct.pack(data_format, zrav[idx])
-            self.stream.write(bx)
-            self.stream.write(by)
-            self.stream.write(bz)
+        # interleave the coordinates as x, y, z triplets
+        xyz = np.empty((x.size, 3), dtype=dtype)
+        xyz[:, 0] = np.ravel(x, order='F')
+        xyz[:, 1] = np.ravel(y, order='F')
+        xyz[:, 2] = np.ravel(z, order='F')
+        self.stream.write(xyz.tobytes())
 
     def close(self):
         assert (not self.open_tag)
@@ -128,6 +135,196 @@ class BinaryXml:
             self.stream.write(str.encode(st))
         return self
 
+
+def _encode_block(data, compressor=None, blocksize=2 ** 20):
+    """
+    Encodes an array as a block of vtk appended data, with a UInt64
+    header.  When compressor is 'zlib' the array is split into blocks of
+    blocksize bytes that are compressed separately, as in files written
+    by vtkZLibDataCompressor.
+    """
+    data = np.ascontiguousarray(data).tobytes()
+    if compressor is None:
+        return np.array([len(data)], dtype=np.uint64).tobytes() + data
+    elif compressor != 'zlib':
+        raise ValueError('compressor must be None or zlib, '
+                         'not {}'.format(compressor))
+    blocks = [zlib.compress(data[i0:i0 + blocksize])
+              for i0 in range(0, len(data), blocksize)]
+    lastsize = len(data) - (len(blocks) - 1) * blocksize if blocks else 0
+    header = [len(blocks), blocksize, lastsize] + [len(b) for b in blocks]
+    return np.array(header, dtype=np.uint64).tobytes() + b''.join(blocks)
+
+
+def _write_appended_vtu(output_file, npoints, ncells, blocks,
+                        compressor=None):
+    """
+    Writes an unstructured grid .vtu file with appended data
+
+    Parameters
+    ----------
+    output_file : str
+        vtk output file
+    npoints : int
+        number of points
+    ncells : int
+        number of cells
+    blocks : list
+        (section, name, vtk type, number of components, encoded data)
+        of each data array, section is 'Points', 'Cells', 'CellData' or
+        'PointData'
+    compressor : str
+        None or 'zlib', the compressor of the encoded data
+
+    """
+    attributes = {'type': 'UnstructuredGrid', 'version': '1.0',
+                  'byte_order': Vtk._get_byte_order(),
+                  'header_type': 'UInt64'}
+    if compressor is not None:
+        attributes['compressor'] = 'vtkZLibDataCompressor'
+
+    xml = BinaryXml(output_file)
+    xml.open_element('VTKFile').add_attributes(**attributes)
+    xml.open_element('UnstructuredGrid')
+    xml.open_element('Piece')
+    xml.add_attributes(NumberOfPoints=npoints, NumberOfCells=ncells)
+
+    # the offset of each array is calculated from the beginning of the
+    # data section
+    offset = 0
+    data = []
+    for section in ('Points', 'Cells', 'CellData', 'PointData'):
+        section_blocks = [block for block in blocks if block[0] == section]
+        if section == 'PointData' and not section_blocks:
+            continue
+        xml.open_element(section)
+        if section in ('CellData', 'PointData'):
+            xml.add_attributes(Scalars='scalars')
+        for _, name, vtk_type, ncomp, encoded in section_blocks:
+            xml.open_element('DataArray')
+            xml.add_attributes(Name=name, NumberOfComponents=ncomp,
+                               type=vtk_type, format='appended',
+                               offset=offset)
+            xml.close_element('DataArray')
+            offset += len(encoded)
+            data.append(encoded)
+        xml.close_element(section)
+
+    xml.close_element('Piece')
+    xml.close_element('UnstructuredGrid')
+
+    # build data section
+    xml.open_element('AppendedData').add_attributes(
+        encoding='raw').add_text('_')
+    for encoded in data:
+        xml.stream.write(encoded)
+    xml.close_element('AppendedData')
+    xml.close_element('VTKFile')
+    xml.close()
+
+
+# geometry of the worker processes of a _BinaryStepWriter
+_worker_geometry = None
+
+
+def _init_step_worker(geometry):
+    global _worker_geometry
+    _worker_geometry = geometry
+
+
+def _write_binary_step(output_file, geometry, arrays, compressor=None):
+    """
+    Writes the geometry and the data arrays of a time step to an appended
+    binary .vtu file.  When geometry is None the geometry that the worker
+    process was started with is used.
+    """
+    if geometry is None:
+        geometry = _worker_geometry
+    npoints, ncells, blocks = geometry
+    blocks = list(blocks)
+    for section, name, a in arrays:
+        blocks.append((section, name, 'Float64', 1,
+                       _encode_block(np.asarray(a, np.float64),
+                                     compressor)))
+    _write_appended_vtu(output_file, npoints, ncells, blocks, compressor)
+
+
+class _BinaryStepWriter(object):
+    """
+    Writes the time steps of a time series to appended binary .vtu files,
+    either one at a time, or concurrently on a process pool.
+
+    The geometry is sent to each worker process once, when the pool is
+    started, and is only sent with a time step when the active cells of
+    the time step differ.  On Python < 3.7, where the pool has no
+    initializer, the geometry is sent with every time step.  At most two
+    time steps per worker are queued, so that the data of the time steps
+    that are waiting to be written is not all held in memory.
+
+    Parameters
+    ----------
+    compressor : str
+        None or 'zlib'
+    max_workers : int
+        number of worker processes.  when None each time step is written
+        as soon as it is added
+
+    """
+
+    def __init__(self, compressor=None, max_workers=None):
+        self.compressor = compressor
+        self.max_workers = max_workers
+        self._pool = None
+        self._geometry = None
+        self._futures = deque()
+
+    def write(self, output_file, geometry, arrays):
+        if self.max_workers is None:
+            _write_binary_step(output_file, geometry, arrays,
+                               self.compressor)
+            return
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            if sys.version_info >= (3, 7):
+                # send the geometry to each worker process once
+                self._geometry = geometry
+                pool_kwargs = {'initializer': _init_step_worker,
+                               'initargs': (geometry,)}
+            else:
+                pool_kwargs = {}
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             **pool_kwargs)
+        if geometry is self._geometry:
+            geometry = None
+        while len(self._futures) >= 2 * self.max_workers:
+            self._futures.popleft().result()
+        self._futures.append(self._pool.submit(
+            _write_binary_step, output_file, geometry, arrays,
+            self.compressor))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._pool is not None:
+            for future in self._futures:
+                future.cancel()
+            self._futures.clear()
+            self._pool.shutdown()
+            self._pool = None
+
+    def close(self):
+        if self._pool is None:
+            return
+        try:
+            while self._futures:
+                self._futures.popleft().result()
+        finally:
+            self._pool.shutdown()
+            self._pool = None
+
 # END BINARY *********************************************
 
 
@@ -147,6 +344,27 @@ def end_tag(f, tag, indent_level, indent_char='  '):
     return indent_level
 
 
+def _write_ascii_array(f, values, indent_level, fmt='%r', ncol=1,
+                       indent_char='  ', chunksize=100000):
+    # writes the values of an array as lines of ncol ascii values, the
+    # lines are formatted a chunk at a time instead of value by value
+    values = np.ravel(values)
+    if values.size == 0:
+        return
+    indent = indent_level * indent_char
+    line = indent + ' '.join([fmt] * ncol) + ' \n'
+    nlines = values.size // ncol
+    nchunk = max(1, chunksize // ncol)
+    for i0 in range(0, nlines, nchunk):
+        i1 = min(i0 + nchunk, nlines)
+        chunk = values[i0 * ncol:i1 * ncol].tolist()
+        f.write((line * (i1 - i0)) % tuple(chunk))
+    remainder = values[nlines * ncol:].tolist()
+    if remainder:
+        f.write(indent + ' '.join([fmt] * len(remainder)) %
+                tuple(remainder) + ' \n')
+
+
 class _Array(object):
     # class to store array and tell if array is 2d
     def __init__(self, array, array2d):
@@ -187,8 +405,20 @@ class Vtk(object):
     arrays : dict
         Stores data arrays added to VTK object
 
+    Notes
+    -----
+    Structured grids are exported as voxel cells.  The cells of vertex
+    (DISV) grids are exported as wedge, hexahedron, pentagonal prism or
+    hexagonal prism cells, or as polyhedron cells when the cell has more
+    than six vertices.
+
     """
 
+    # vtk cell types of the prisms built from the cell polygons of a
+    # vertex grid, keyed by the number of polygon vertices
+    prism_types = {3: 13, 4: 12, 5: 15, 6: 16}
+    polyhedron_type = 42
+
     def __init__(self, model, verbose=None, nanval=-1e+20, smooth=False,
                  point_scalars=False):
 
@@ -203,13 +433,21 @@ class Vtk(object):
         self.model = model
         self.modelgrid = model.modelgrid
         self.arrays = {}
-        self.shape = (self.modelgrid.nlay, self.modelgrid.nrow,
-                      self.modelgrid.ncol)
-        self.shape2d = (self.shape[1], self.shape[2])
+
+        # check the grid type, vtk supports structured and vertex grids
+        assert (isinstance(self.modelgrid, (StructuredGrid, VertexGrid)))
+
+        self.shape = tuple(self.modelgrid.shape)
+        self.shape2d = self.shape[1:]
         self.nlay = self.modelgrid.nlay
-        self.nrow = self.modelgrid.nrow
-        self.ncol = self.modelgrid.ncol
-        self.ncol = self.modelgrid.ncol
+        if isinstance(self.modelgrid, StructuredGrid):
+            self.nrow = self.modelgrid.nrow
+            self.ncol = self.modelgrid.ncol
+            self.ncpl = self.nrow * self.ncol
+        else:
+            self.nrow = None
+            self.ncol = None
+            self.ncpl = self.modelgrid.ncpl
         self.nanval = nanval
 
         self.cell_type = 11
@@ -218,9 +456,6 @@ class Vtk(object):
         self.smooth = smooth
         self.point_scalars = point_scalars
 
-        # check if structured grid, vtk only supports structured grid
-        assert (isinstance(self.modelgrid, StructuredGrid))
-
         # cbd
         self.cbd_on = False
 
@@ -235,19 +470,51 @@ class Vtk(object):
                     hasattr(self.model.dis, 'laycbd'):
 
                 self.cbd = np.where(self.model.dis.laycbd.array > 0)
-                ibound = np.insert(ibound, self.cbd[0] + 1, ibound[self.cbd[
-                                                                    0], :, :],
-                                   axis=0)
+                ibound = np.insert(ibound, self.cbd[0] + 1,
+                                   ibound[self.cbd[0]], axis=0)
                 self.cbd_on = True
 
         self.ibound = ibound
 
-        # build the model vertices
-        self.verts, self.iverts, self.zverts = \
-            self.get_3d_vertex_connectivity()
+        # cell polygons of a vertex grid and the vertex dictionaries,
+        # these are built on first use
+        self._cell_polygons = None
+        self._vertex_connectivity = None
+
+        # encoded geometry of the last binary file
+        self._binary_geometry = None
 
         return
 
+    @property
+    def verts(self):
+        """
+        Dictionary of the x, y, z vertices of the cells in ibound
+
+        """
+        return self._get_vertex_connectivity()[0]
+
+    @property
+    def iverts(self):
+        """
+        Dictionary of the point numbers of the cells in ibound
+
+        """
+        return self._get_vertex_connectivity()[1]
+
+    @property
+    def zverts(self):
+        """
+        Dictionary of the z vertices of the cells in ibound
+
+        """
+        return self._get_vertex_connectivity()[2]
+
+    def _get_vertex_connectivity(self):
+        if self._vertex_connectivity is None:
+            self._vertex_connectivity = self.get_3d_vertex_connectivity()
+        return self._vertex_connectivity
+
     def add_array(self, name, a, array2d=False):
 
         """
@@ -273,7 +540,7 @@ class Vtk(object):
         if array2d:
             assert a.shape == self.shape2d
             array = np.full(self.shape, self.nanval)
-            array[0, :, :] = a
+            array[0] = a
             a = array
 
         try:
@@ -311,18 +578,14 @@ class Vtk(object):
 
         # get the active data cells based on the data arrays and ibound
         actwcells3d = self._configure_data_arrays()
-        actwcells = actwcells3d.ravel()
-
-        # get the indexes of the active cells
-        idxs = np.argwhere(actwcells != 0).ravel()
 
-        # get the verts and iverts to be output
-        verts = [self.verts[idx] for idx in idxs]
-        iverts = self._build_iverts(verts)
+        # get the geometry of the active cells
+        points, connectivity, offsets, celltypes, faces, faceoffsets = \
+            self.get_3d_cell_geometry(actwcells=actwcells3d)
 
         # get the total number of cells and vertices
-        ncells = len(iverts)
-        npoints = ncells * 8
+        ncells = celltypes.size
+        npoints = points.shape[0]
 
         if self.verbose:
             print('Writing vtk file: ' + output_file)
@@ -368,11 +631,7 @@ class Vtk(object):
 
         s = '<DataArray type="Float64" NumberOfComponents="3">'
         indent_level = start_tag(f, s, indent_level)
-        assert (isinstance(self.modelgrid, StructuredGrid))
-        for cell in verts:
-            for row in cell:
-                s = indent_level * '  ' + '{} {} {} \n'.format(*row)
-                f.write(s)
+        _write_ascii_array(f, points, indent_level, ncol=3)
         s = '</DataArray>'
         indent_level = end_tag(f, s, indent_level)
 
@@ -383,32 +642,46 @@ class Vtk(object):
         s = '<Cells>'
         indent_level = start_tag(f, s, indent_level)
 
+        # write a cell per line when all of the cells have the same size
+        cellsize = np.diff(offsets, prepend=0)
+        if ncells > 0 and np.all(cellsize == cellsize[0]):
+            ncol = cellsize[0]
+        else:
+            ncol = 1
+
         s = '<DataArray type="Int32" Name="connectivity">'
         indent_level = start_tag(f, s, indent_level)
-        for row in iverts:
-            s = indent_level * '  ' + ' '.join([str(i) for i in row]) + '\n'
-            f.write(s)
+        _write_ascii_array(f, connectivity, indent_level, fmt='%d',
+                           ncol=ncol)
         s = '</DataArray>'
         indent_level = end_tag(f, s, indent_level)
 
         s = '<DataArray type="Int32" Name="offsets">'
         indent_level = start_tag(f, s, indent_level)
-        icount = 0
-        for row in iverts:
-            icount += len(row)
-            s = indent_level * '  ' + '{} \n'.format(icount)
-            f.write(s)
+        _write_ascii_array(f, offsets, indent_level, fmt='%d')
         s = '</DataArray>'
         indent_level = end_tag(f, s, indent_level)
 
         s = '<DataArray type="UInt8" Name="types">'
         indent_level = start_tag(f, s, indent_level)
-        for row in iverts:
-            s = indent_level * '  ' + '{} \n'.format(self.cell_type)
-            f.write(s)
+        _write_ascii_array(f, celltypes, indent_level, fmt='%d')
         s = '</DataArray>'
         indent_level = end_tag(f, s, indent_level)
 
+        # polyhedron faces
+        if faces is not None:
+            s = '<DataArray type="Int32" Name="faces">'
+            indent_level = start_tag(f, s, indent_level)
+            _write_ascii_array(f, faces, indent_level, fmt='%d')
+            s = '</DataArray>'
+            indent_level = end_tag(f, s, indent_level)
+
+            s = '<DataArray type="Int32" Name="faceoffsets">'
+            indent_level = start_tag(f, s, indent_level)
+            _write_ascii_array(f, faceoffsets, indent_level, fmt='%d')
+            s = '</DataArray>'
+            indent_level = end_tag(f, s, indent_level)
+
         s = '</Cells>'
         indent_level = end_tag(f, s, indent_level)
 
@@ -452,7 +725,7 @@ class Vtk(object):
         self.arrays.clear()
         return
 
-    def write_binary(self, output_file):
+    def write_binary(self, output_file, compressor=None):
 
         """
 
@@ -463,6 +736,9 @@ class Vtk(object):
 
         output_file : str
             vtk output file
+        compressor : str
+            None to write the data arrays raw, or 'zlib' to compress
+            them.  Default is None.
 
         """
 
@@ -472,199 +748,93 @@ class Vtk(object):
         if self.verbose:
             print('writing binary vtk file')
 
-        xml = BinaryXml(output_file)
-        offset = 0
-        grid_type = 'UnstructuredGrid'
-
-        # get the active data cells based on the data arrays and ibound
-        actwcells3d = self._configure_data_arrays()
-        actwcells = actwcells3d.ravel()
-
-        # get the indexes of the active cells
-        idxs = np.argwhere(actwcells != 0).ravel()
-
-        # get the verts and iverts to be output
-        verts = [self.verts[idx] for idx in idxs]
-        iverts = self._build_iverts(verts)
+        geometry, arrays = self._get_binary_data(compressor)
 
         # check if there is data to be written out
-        if len(verts) == 0:
+        if geometry is None:
             # if not cannot write binary .vtu file
             return
 
-        # get the total number of cells and vertices
-        ncells = len(iverts)
-        npoints = ncells * 8
-
         if self.verbose:
             print('Writing vtk file: ' + output_file)
             print('Number of point is {}, Number of cells is {}\n'.format(
-                npoints, ncells))
-
-        # format verts and iverts
-        verts = np.array(verts)
-        verts.reshape(npoints, 3)
-        iverts = np.ascontiguousarray(iverts, np.float64)
-
-        # write xml file info
-        xml.open_element("VTKFile"). \
-            add_attributes(type=grid_type, version="1.0",
-                           byte_order=self._get_byte_order(),
-                           header_type="UInt64")
-        # unstructured grid
-        xml.open_element(grid_type)
-
-        # piece
-        xml.open_element('Piece')
-        xml.add_attributes(NumberOfPoints=npoints, NumberOfCells=ncells)
-
-        # points
-        xml.open_element('Points')
+                geometry[0], geometry[1]))
 
-        xml.open_element('DataArray')
-        xml.add_attributes(Name='points', NumberOfComponents='3',
-                           type='Float64',
-                           format='appended', offset=offset)
+        _write_binary_step(output_file, geometry, arrays, compressor)
 
-        # calculate the offset of the start of the next piece of data
-        # offset is calculated from beginning of data section
-        points_size = verts.size * verts[0].dtype.itemsize
-        offset += points_size + 8
-
-        xml.close_element('DataArray')
-
-        xml.close_element('Points')
-
-        # cells
-        xml.open_element('Cells')
-
-        # connectivity
-        xml.open_element('DataArray')
-        xml.add_attributes(Name='connectivity', NumberOfComponents='1',
-                           type='Float64',
-                           format='appended', offset=offset)
-        conn_size = iverts.size * iverts[0].dtype.itemsize
-        offset += conn_size + 8
-
-        xml.close_element('DataArray')
-
-        xml.open_element('DataArray')
-        xml.add_attributes(Name='offsets', NumberOfComponents='1',
-                           type='Float64',
-                           format='appended', offset=offset)
-        offsets_size = iverts.shape[0] * iverts[0].dtype.itemsize
-        offset += offsets_size + 8
-
-        xml.close_element('DataArray')
+    def _get_binary_data(self, compressor=None):
+        """
+        Gets the geometry and the data arrays of the active cells for an
+        appended binary .vtu file and clears the stored arrays
 
-        xml.open_element('DataArray')
-        xml.add_attributes(Name='types', NumberOfComponents='1',
-                           type='Float64',
-                           format='appended', offset=offset)
-        types_size = iverts.shape[0] * iverts[0].dtype.itemsize
-        offset += types_size + 8
+        Returns
+        -------
+        geometry : tuple
+            number of points, number of cells and the encoded blocks of
+            the points and cells, None if there are no active cells
+        arrays : list
+            (section, name, values) of the cell and point data arrays
 
-        xml.close_element('DataArray')
+        """
+        # get the active data cells based on the data arrays and ibound
+        actwcells3d = self._configure_data_arrays()
 
-        xml.close_element('Cells')
+        # get the indexes of the active cells
+        idxs = np.flatnonzero(actwcells3d)
+        if idxs.size == 0:
+            self.arrays.clear()
+            return None, []
 
-        xml.open_element('CellData')
-        xml.add_attributes(Scalars='scalars')
+        geometry = self._get_binary_geometry(actwcells3d, compressor)
 
-        # format data arrays and store for later output
-        processed_arrays = []
+        arrays = []
         for name, a in self.arrays.items():
-            a = a.ravel()[idxs]
-            xml.open_element('DataArray')
-            xml.add_attributes(Name=name, NumberOfComponents='1',
-                               type='Float64',
-                               format='appended', offset=offset)
-            a = np.ascontiguousarray(a, np.float64)
-            processed_arrays.append([a, a.size * a[0].dtype.itemsize])
-            offset += processed_arrays[-1][-1] + 8
-            xml.close_element('DataArray')
-
-        xml.close_element('CellData')
+            arrays.append(('CellData', name, a.ravel()[idxs]))
 
         # for data array point scalars
         if self.point_scalars:
-
-            xml.open_element('PointData')
-            xml.add_attributes(Scalars='scalars')
-
-            # get output point arrays
-            # loop through stored arrays
             for name, a in self.arrays.items():
                 # get the array values onto vertices
-                verts_info = self.get_3d_vertex_connectivity(
-                    actwcells=actwcells3d, zvalues=a)
-                # get values
-                point_values_dict = verts_info[2]
-                a = np.array([point_values_dict[cellid] for cellid in
-                              sorted(point_values_dict.keys())]).ravel()
-
-                xml.open_element('DataArray')
-                xml.add_attributes(Name=name, NumberOfComponents='1',
-                                   type='Float64',
-                                   format='appended', offset=offset)
-                a = np.ascontiguousarray(a, np.float64)
-                processed_arrays.append([a, a.size * a[0].dtype.itemsize])
-                offset += processed_arrays[-1][-1] + 8
-
-                xml.close_element('DataArray')
-            xml.close_element('PointData')
-
-        # end piece
-        xml.close_element('Piece')
+                a = self.get_3d_cell_geometry(actwcells=actwcells3d,
+                                              zvalues=a)[0][:, 2]
+                arrays.append(('PointData', name, a))
 
-        # end unstructured grid
-        xml.close_element('UnstructuredGrid')
-
-        # build data section
-        xml.open_element("AppendedData").add_attributes(
-            encoding="raw").add_text("_")
-
-        xml.write_size(points_size)
-        # format verts for output
-        verts_x = np.ascontiguousarray(np.ravel(verts[:, :, 0]),
-                                       np.float64)
-        verts_y = np.ascontiguousarray(np.ravel(verts[:, :, 1]),
-                                       np.float64)
-        verts_z = np.ascontiguousarray(np.ravel(verts[:, :, 2]),
-                                       np.float64)
-        # write coordinates
-        xml.write_coord_arrays(verts_x, verts_y, verts_z)
-
-        # write iverts
-        xml.write_size(conn_size)
-        rav_iverts = np.ascontiguousarray(np.ravel(iverts), np.float64)
-        xml.write_array(rav_iverts)
-
-        xml.write_size(offsets_size)
-        data = np.empty((iverts.shape[0]), np.float64)
-        icount = 0
-        for index, row in enumerate(iverts):
-            icount += len(row)
-            data[index] = icount
-        xml.write_array(data)
-
-        # write cell types (11)
-        xml.write_size(types_size)
-        data = np.empty((iverts.shape[0]), np.float64)
-        data.fill(self.cell_type)
-        xml.write_array(data)
-
-        # write out the array scalars and array point scalars
-        for a, block_size in processed_arrays:
-            xml.write_size(block_size)
-            xml.write_array(a)
-
-        # end xml
-        xml.close_element("AppendedData")
-        xml.close_element('VTKFile')
-        xml.close()
         # clear arrays
         self.arrays.clear()
+        return geometry, arrays
+
+    def _get_binary_geometry(self, actwcells3d, compressor=None):
+        """
+        Builds and encodes the points and cells of the active cells.  The
+        geometry of the last active cells is kept, so that the geometry of
+        a time series is only built and encoded again when the active
+        cells change.
+        """
+        if self._binary_geometry is not None:
+            actwcells, last_compressor, geometry = self._binary_geometry
+            if last_compressor == compressor and \
+                    np.array_equal(actwcells, actwcells3d):
+                return geometry
+
+        points, connectivity, offsets, celltypes, faces, faceoffsets = \
+            self.get_3d_cell_geometry(actwcells=actwcells3d)
+
+        blocks = [('Points', 'points', 'Float64', 3,
+                   _encode_block(np.asarray(points, np.float64),
+                                 compressor))]
+        cell_arrays = [('connectivity', connectivity, np.int64),
+                       ('offsets', offsets, np.int64),
+                       ('types', celltypes, np.uint8)]
+        if faces is not None:
+            cell_arrays += [('faces', faces, np.int64),
+                            ('faceoffsets', faceoffsets, np.int64)]
+        for name, a, dtype in cell_arrays:
+            blocks.append(('Cells', name, np_to_vtk[np.dtype(dtype).name], 1,
+                           _encode_block(np.asarray(a, dtype), compressor)))
+
+        geometry = (points.shape[0], celltypes.size, blocks)
+        self._binary_geometry = (actwcells3d.copy(), compressor, geometry)
+        return geometry
 
     def _configure_data_arrays(self):
         """
@@ -673,7 +843,7 @@ class Vtk(object):
         """
 
         # get 1d shape
-        shape1d = self.shape[0] * self.shape[1] * self.shape[2]
+        shape1d = int(np.prod(self.shape))
 
         # build index array
         ot_idx_array = np.zeros(shape1d, dtype=np.int)
@@ -698,6 +868,227 @@ class Vtk(object):
 
         return ot_idx_array
 
+    def _get_active_cellids(self, actwcells):
+        # model cellids, based on the 1d array, of the active cells
+        actwcells = np.asarray(actwcells)[:self.nlay]
+        return np.flatnonzero(actwcells.reshape(self.nlay, -1))
+
+    def get_3d_cell_geometry(self, actwcells=None, zvalues=None):
+        """
+
+        Builds the points, connectivity, offsets and cell types of all of
+        the active cells at once
+
+        Parameters
+        ----------
+        actwcells : array
+            array of where data exists
+        zvalues: array
+            array of values to be used instead of the zvalues of
+            the vertices.  This allows point scalars to be interpolated.
+
+        Returns
+        -------
+        points : np.ndarray
+            (npoints, 3) array of the x, y, z points of the cells, the
+            points are not shared between cells
+        connectivity : np.ndarray
+            point numbers of the cells
+        offsets : np.ndarray
+            end position of each cell in connectivity
+        celltypes : np.ndarray
+            vtk cell type of each cell
+        faces : np.ndarray or None
+            face stream of the polyhedron cells, None if there are no
+            polyhedron cells
+        faceoffsets : np.ndarray or None
+            end position of each cell in faces, -1 for cells that are
+            not polyhedrons, None if there are no polyhedron cells
+
+        """
+        # set up active cells
+        if actwcells is None:
+            actwcells = self.ibound
+        cellids = self._get_active_cellids(actwcells)
+
+        # if smoothing interpolate the z values
+        if self.smooth:
+            if zvalues is not None:
+                # use the given data array values
+                zvertices = self.extendedDataArray(zvalues)
+            else:
+                zvertices = self.extendedDataArray(self.modelgrid.top_botm)
+        else:
+            zvertices = None
+
+        if isinstance(self.modelgrid, StructuredGrid):
+            return self._get_structured_geometry(cellids, zvertices)
+        else:
+            return self._get_vertex_geometry(cellids, zvertices)
+
+    def _get_structured_geometry(self, cellids, zvertices):
+        """
+        Builds the voxel cells of a structured grid
+        """
+        ncells = cellids.size
+        npoints = ncells * 8
+        k, i, j = np.unravel_index(cellids, self.shape)
+
+        # corners of the cells in the bottom and top layers of points
+        # are ordered pt1, pt2, pt0, pt3
+        ivert = i[:, None] + np.array([1, 1, 0, 0])
+        jvert = j[:, None] + np.array([0, 1, 0, 1])
+
+        copy_cache = self.modelgrid._copy_cache
+        self.modelgrid._copy_cache = False
+        try:
+            xgrid = self.modelgrid.xvertices
+            ygrid = self.modelgrid.yvertices
+        finally:
+            self.modelgrid._copy_cache = copy_cache
+
+        points = np.empty((ncells, 2, 4, 3))
+        points[:, :, :, 0] = xgrid[ivert, jvert][:, None, :]
+        points[:, :, :, 1] = ygrid[ivert, jvert][:, None, :]
+        if zvertices is None:
+            top_botm = self.modelgrid.top_botm
+            points[:, 0, :, 2] = top_botm[k + 1, i, j][:, None]
+            points[:, 1, :, 2] = top_botm[k, i, j][:, None]
+        else:
+            points[:, 0, :, 2] = zvertices[k[:, None] + 1, ivert, jvert]
+            points[:, 1, :, 2] = zvertices[k[:, None], ivert, jvert]
+
+        connectivity = np.arange(npoints)
+        offsets = np.arange(8, npoints + 1, 8)
+        celltypes = np.full(ncells, self.cell_type, dtype=np.uint8)
+        return points.reshape(npoints, 3), connectivity, offsets, \
+            celltypes, None, None
+
+    def _get_cell_polygons(self):
+        """
+        Builds the x, y vertices of a vertex grid and the vertex numbers
+        of the cell polygons, ordered counter-clockwise
+
+        Returns
+        -------
+        xv, yv : np.ndarray
+            x and y vertices
+        ivert : np.ndarray
+            (ncpl, max number of cell vertices) array of the positions of
+            the cell vertices in xv and yv
+        nverts : np.ndarray
+            number of vertices of each cell
+
+        """
+        if self._cell_polygons is not None:
+            return self._cell_polygons
+
+        mg = self.modelgrid
+        vertexid = np.array([v[0] for v in mg._vertices])
+        xv = np.array([v[1] for v in mg._vertices], dtype=float)
+        yv = np.array([v[2] for v in mg._vertices], dtype=float)
+        if mg._has_ref_coordinates:
+            xv, yv = mg.get_coords(xv, yv)
+
+        cellverts = []
+        for cell2d in mg._cell2d:
+            iv = [int(i) for i in tuple(cell2d)[4:] if i is not None]
+            # drop the closing vertex of a closed polygon
+            if len(iv) > 1 and iv[0] == iv[-1]:
+                iv = iv[:-1]
+            cellverts.append(iv)
+        nverts = np.array([len(iv) for iv in cellverts])
+
+        ivert = np.full((nverts.size, nverts.max()), vertexid[0])
+        for n in np.unique(nverts):
+            sel = np.flatnonzero(nverts == n)
+            ivert[sel, :n] = [cellverts[icell] for icell in sel]
+
+        # map the vertex numbers to positions in xv and yv
+        order = np.argsort(vertexid)
+        ivert = order[np.searchsorted(vertexid, ivert, sorter=order)]
+
+        # make the cell polygons counter-clockwise
+        for n in np.unique(nverts):
+            sel = np.flatnonzero(nverts == n)
+            x, y = xv[ivert[sel, :n]], yv[ivert[sel, :n]]
+            area = np.sum(x * np.roll(y, -1, axis=1) -
+                          np.roll(x, -1, axis=1) * y, axis=1)
+            cw = sel[area < 0]
+            ivert[cw, :n] = ivert[cw, n - 1::-1]
+
+        self._cell_polygons = xv, yv, ivert, nverts
+        return self._cell_polygons
+
+    def _get_vertex_geometry(self, cellids, zvertices):
+        """
+        Builds the prism and polyhedron cells of a vertex grid
+        """
+        xv, yv, ivert, nverts = self._get_cell_polygons()
+        lay, icpl = np.divmod(cellids, self.ncpl)
+        ncells = cellids.size
+
+        # each cell has a bottom and a top ring of points
+        nv = nverts[icpl]
+        offsets = np.cumsum(2 * nv)
+        start = offsets - 2 * nv
+        npoints = offsets[-1] if ncells > 0 else 0
+        points = np.empty((npoints, 3))
+        celltypes = np.empty(ncells, dtype=np.uint8)
+
+        # face streams of the cells without a vtk prism type: the number
+        # of faces, the bottom face, the top face and the side faces
+        ispoly = nv > max(self.prism_types)
+        facesize = np.where(ispoly, 3 + 7 * nv, 0)
+        faceoffsets = np.where(ispoly, np.cumsum(facesize), -1)
+        faces = np.empty(facesize.sum(), dtype=int)
+
+        if zvertices is None:
+            top_botm = self.modelgrid.top_botm
+
+        for n in np.unique(nv):
+            sel = np.flatnonzero(nv == n)
+            iv = ivert[icpl[sel], :n]
+            if n == 3:
+                # the normal of the base of a wedge points away from the
+                # top face, for other prisms it points towards the top face
+                iv = iv[:, ::-1]
+            ipoint = start[sel, None] + np.arange(2 * n)
+
+            if zvertices is None:
+                zbot = np.repeat(top_botm[lay[sel] + 1, icpl[sel]][:, None],
+                                 n, axis=1)
+                ztop = np.repeat(top_botm[lay[sel], icpl[sel]][:, None],
+                                 n, axis=1)
+            else:
+                zbot = zvertices[lay[sel, None] + 1, iv]
+                ztop = zvertices[lay[sel, None], iv]
+            points[ipoint, 0] = np.tile(xv[iv], 2)
+            points[ipoint, 1] = np.tile(yv[iv], 2)
+            points[ipoint, 2] = np.hstack((zbot, ztop))
+
+            celltypes[sel] = self.prism_types.get(n, self.polyhedron_type)
+
+            if ispoly[sel[0]]:
+                m = sel.size
+                bot = ipoint[:, :n]
+                top = ipoint[:, n:]
+                sides = np.stack((np.full((m, n), 4), bot,
+                                  np.roll(bot, -1, axis=1),
+                                  np.roll(top, -1, axis=1), top), axis=2)
+                cellfaces = np.hstack((np.full((m, 1), n + 2),
+                                       np.full((m, 1), n), bot[:, ::-1],
+                                       np.full((m, 1), n), top,
+                                       sides.reshape(m, 5 * n)))
+                iface = (faceoffsets[sel] - facesize[sel])[:, None] + \
+                    np.arange(3 + 7 * n)
+                faces[iface] = cellfaces
+
+        connectivity = np.arange(npoints)
+        if not np.any(ispoly):
+            faces = faceoffsets = None
+        return points, connectivity, offsets, celltypes, faces, faceoffsets
+
     def get_3d_vertex_connectivity(self, actwcells=None, zvalues=None):
 
         """
@@ -725,112 +1116,71 @@ class Vtk(object):
         # set up active cells
         if actwcells is None:
             actwcells = self.ibound
+        cellids = self._get_active_cellids(actwcells)
+
+        points, connectivity, offsets = self.get_3d_cell_geometry(
+            actwcells=actwcells, zvalues=zvalues)[:3]
 
-        ipoint = 0
+        verts = points.tolist()
+        zverts = points[:, 2].tolist()
+        ivert = connectivity.tolist()
 
         vertsdict = {}
         ivertsdict = {}
         zvertsdict = {}
-
-        # if smoothing interpolate the z values
-        if self.smooth:
-            if zvalues is not None:
-                # use the given data array values
-                zVertices = self.extendedDataArray(zvalues)
-            else:
-                zVertices = self.extendedDataArray(self.modelgrid.top_botm)
-        else:
-            zVertices = None
-
-        # model cellid based on 1darray
-        # build the vertices
-        cellid = -1
-        for k in range(self.nlay):
-            for i in range(self.nrow):
-                for j in range(self.ncol):
-                    cellid += 1
-                    if actwcells[k, i, j] == 0:
-                        continue
-                    verts = []
-                    ivert = []
-                    zverts = []
-                    pts = self.modelgrid._cell_vert_list(i, j)
-                    pt0, pt1, pt2, pt3, pt0 = pts
-
-                    if not self.smooth:
-                        cellBot = self.modelgrid.top_botm[k + 1, i, j]
-                        cellTop = self.modelgrid.top_botm[k, i, j]
-                        celElev = [cellBot, cellTop]
-                        for elev in celElev:
-                            # verts[ipoint, :] = np.append(pt1,elev)
-                            verts.append([pt1[0], pt1[1], elev])
-                            # verts[ipoint+1, :] = np.append(pt2,elev)
-                            verts.append([pt2[0], pt2[1], elev])
-                            # verts[ipoint+2, :] = np.append(pt0,elev)
-                            verts.append([pt0[0], pt0[1], elev])
-                            # verts[ipoint+3, :] = np.append(pt3,elev)
-                            verts.append([pt3[0], pt3[1], elev])
-                            ivert.extend([ipoint, ipoint+1, ipoint+2,
-                                          ipoint+3])
-                            zverts.extend([elev, elev, elev, elev])
-                            ipoint += 4
-                        vertsdict[cellid] = verts
-                        ivertsdict[cellid] = ivert
-                        zvertsdict[cellid] = zverts
-                    else:
-                        layers = [k+1, k]
-                        for lay in layers:
-                            verts.append([pt1[0], pt1[1], zVertices[lay, i+1,
-                                                                    j]])
-                            verts.append([pt2[0], pt2[1], zVertices[lay, i+1,
-                                                                    j+1]])
-
-                            verts.append([pt0[0], pt0[1], zVertices[lay, i,
-                                                                    j]])
-
-                            verts.append([pt3[0], pt3[1], zVertices[lay, i,
-                                                                    j+1]])
-                            ivert.extend([ipoint, ipoint+1, ipoint+2,
-                                          ipoint+3])
-                            zverts.extend([zVertices[lay, i+1, j], zVertices[
-                                lay, i+1, j+1],
-                                        zVertices[lay, i, j], zVertices[lay, i,
-                                                                        j+1]])
-                            ipoint += 4
-                        vertsdict[cellid] = verts
-                        ivertsdict[cellid] = ivert
-                        zvertsdict[cellid] = zverts
+        i0 = 0
+        for cellid, i1 in zip(cellids.tolist(), offsets.tolist()):
+            vertsdict[cellid] = verts[i0:i1]
+            ivertsdict[cellid] = ivert[i0:i1]
+            zvertsdict[cellid] = zverts[i0:i1]
+            i0 = i1
         return vertsdict, ivertsdict, zvertsdict
 
     def extendedDataArray(self, dataArray):
+        """
+        Interpolates cell values to the vertices of the grid as the mean
+        of the values, other than nanval, of the cells that share the
+        vertex.  A data array with nlay layers is extended to nlay + 1
+        layers by repeating the first layer.
+        """
+        if dataArray.shape[0] != self.nlay + 1:
+            dataArray = np.concatenate((dataArray[:1], dataArray), axis=0)
+        nlay = dataArray.shape[0]
 
-        if dataArray.shape[0] == self.nlay+1:
-            dataArray = dataArray
+        # the means have the precision of floating point data arrays
+        if np.issubdtype(dataArray.dtype, np.floating):
+            dtype = dataArray.dtype
         else:
-            listArray = [dataArray[0]]
-            for lay in range(dataArray.shape[0]):
-                listArray.append(dataArray[lay])
-            dataArray = np.stack(listArray)
-
-        matrix = np.zeros([self.nlay+1, self.nrow+1, self.ncol+1])
-        for lay in range(self.nlay+1):
-            for row in range(self.nrow+1):
-                for col in range(self.ncol+1):
-
-                    indexList = [[row-1, col-1], [row-1, col], [row, col-1],
-                                 [row, col]]
-                    neighList = []
-                    for index in indexList:
-                        if index[0] in range(self.nrow) and index[1] in \
-                                range(self.ncol):
-                            neighList.append(dataArray[lay, index[0],
-                                                       index[1]])
-                    neighList = np.array(neighList)
-                    if neighList[neighList != self.nanval].shape[0] > 0:
-                        headMean = neighList[neighList != self.nanval].mean()
-                    else:
-                        headMean = self.nanval
-                    matrix[lay, row, col] = headMean
+            dtype = np.float64
+
+        if isinstance(self.modelgrid, VertexGrid):
+            xv, yv, ivert, nverts = self._get_cell_polygons()
+            icell = np.repeat(np.arange(nverts.size), nverts)
+            iv = ivert[np.arange(ivert.shape[1]) < nverts[:, None]]
+            matrix = np.full((nlay, xv.size), self.nanval)
+            for lay in range(nlay):
+                values = dataArray[lay].ravel()[icell]
+                valid = values != self.nanval
+                total = np.bincount(iv, weights=np.where(valid, values, 0.),
+                                    minlength=xv.size).astype(dtype)
+                count = np.bincount(iv, weights=valid,
+                                    minlength=xv.size).astype(dtype)
+                matrix[lay] = np.where(count > 0, total / count, self.nanval)
+            return matrix
+
+        # sum the up to four cells around each vertex, the grid is padded
+        # with nanval so that cells outside the grid are skipped
+        padded = np.full((nlay, self.nrow + 2, self.ncol + 2), self.nanval)
+        padded[:, 1:-1, 1:-1] = dataArray
+        total = np.zeros((nlay, self.nrow + 1, self.ncol + 1), dtype=dtype)
+        count = np.zeros((nlay, self.nrow + 1, self.ncol + 1), dtype=dtype)
+        for i0, j0 in ((0, 0), (0, 1), (1, 0), (1, 1)):
+            values = padded[:, i0:i0 + self.nrow + 1, j0:j0 + self.ncol + 1]
+            valid = values != self.nanval
+            total += np.where(valid, values, 0)
+            count += valid
+        matrix = np.full(total.shape, self.nanval)
+        np.divide(total, count, out=matrix, where=count > 0)
         return matrix
 
     @staticmethod
@@ -867,17 +1217,8 @@ class Vtk(object):
         indent_level = start_tag(f, s, indent_level)
 
         # data
-        nlay = arrayValues.shape[0]
-
-        for lay in range(nlay):
-            s = indent_level * '  '
-            f.write(s)
-            idx = (actWCells[lay] != 0)
-            arrayValuesLay = arrayValues[lay][idx].flatten()
-            for layValues in arrayValuesLay:
-                s = ' {}'.format(layValues)
-                f.write(s)
-            f.write('\n')
+        _write_ascii_array(f, arrayValues[actWCells != 0], indent_level,
+                           ncol=10)
 
         s = '</DataArray>'
         indent_level = end_tag(f, s, indent_level)
@@ -894,18 +1235,9 @@ class Vtk(object):
         indent_level = start_tag(f, s, indent_level)
 
         # data
-        verts_info = self.get_3d_vertex_connectivity(
-            actwcells=actwcells, zvalues=data_array)
-
-        zverts = verts_info[2]
-
-        for cellid in sorted(zverts):
-            for z in zverts[cellid]:
-                s = indent_level * '  '
-                f.write(s)
-                s = ' {}'.format(z)
-                f.write(s)
-                f.write('\n')
+        points = self.get_3d_cell_geometry(actwcells=actwcells,
+                                           zvalues=data_array)[0]
+        _write_ascii_array(f, points[:, 2], indent_level, ncol=10)
 
         # ending tag
         s = '</DataArray>'
@@ -931,18 +1263,7 @@ class Vtk(object):
 
         """
         ncells = len(verts)
-        npoints = ncells * 8
-        iverts = []
-        ivert = []
-        count = 1
-        for i in range(npoints):
-            ivert.append(i)
-            if count == 8:
-                iverts.append(ivert)
-                ivert = []
-                count = 0
-            count += 1
-        iverts = np.array(iverts)
+        iverts = np.arange(ncells * 8).reshape(ncells, 8)
 
         return iverts
 
@@ -959,7 +1280,8 @@ def _get_names(in_list):
 
 def export_cbc(model, cbcfile, otfolder, precision='single', nanval=-1e+20,
                kstpkper=None, text=None, smooth=False,
-               point_scalars=False, binary=False):
+               point_scalars=False, binary=False, compressor=None,
+               max_workers=None):
     """
 
     Exports cell by cell file to vtk
@@ -990,11 +1312,19 @@ def export_cbc(model, cbcfile, otfolder, precision='single', nanval=-1e+20,
     binary : bool
         if True the output .vtu file will be binary, default is
         False.
+    compressor : str
+        None to write the data arrays of binary files raw, or 'zlib' to
+        compress them, default is None.
+    max_workers : int
+        number of worker processes that write the binary time steps
+        concurrently, default is None, which writes the time steps one
+        at a time.  The geometry is built and encoded once and reused
+        for the time steps that have the same active cells.
 
     """
 
     mg = model.modelgrid
-    shape = (mg.nlay, mg.nrow, mg.ncol)
+    shape = mg.shape
 
     if not os.path.exists(otfolder):
         os.mkdir(otfolder)
@@ -1056,61 +1386,70 @@ def export_cbc(model, cbcfile, otfolder, precision='single', nanval=-1e+20,
 
     vtk = Vtk(model, nanval=nanval, smooth=smooth, point_scalars=point_scalars)
 
-    # export data
-    addarray = False
-    count = 1
-    for kper in kperlist:
-        for kstp in kstplist:
-
-            ot_base = '{}_CBC_KPER{}_KSTP{}.vtu'.format(
-                model_name, kper + 1, kstp + 1)
-            otfile = os.path.join(otfolder, ot_base)
-            pvdfile.write("""<DataSet timestep="{}" group="" part="0"
-                         file="{}"/>\n""".format(count, ot_base))
-            for name in keylist:
-
-                try:
-                    rec = cbb.get_data(kstpkper=(kstp, kper), text=name,
-                                       full3D=True)
-
-                    if len(rec) > 0:
-                        array = rec[0]  # need to fix for multiple pak
-                        addarray = True
-
-                except ValueError:
-
-                    rec = cbb.get_data(kstpkper=(kstp, kper), text=name)[0]
-
-                    if imeth_dict[name] == 6:
-                        array = np.full(shape, nanval)
-                        # rec array
-                        for [node, q] in zip(rec['node'], rec['q']):
-                            lyr, row, col = np.unravel_index(node - 1, shape)
-
-                            array[lyr, row, col] = q
-
-                        addarray = True
-                    else:
-                        raise Exception('Data type not currently supported '
-                                        'for cbc output')
-                        # print('Data type not currently supported '
-                        #       'for cbc output')
-
-                if addarray:
-
-                    # set the data to no data value
-                    if ma.is_masked(array):
-                        array = np.where(array.mask, nanval, array)
-
-                    # add array to vtk
-                    vtk.add_array(name.strip(), array)  # need to adjust for
-
-            # write the vtk data to the output file
-            if binary:
-                vtk.write_binary(otfile)
-            else:
-                vtk.write(otfile)
-            count += 1
+    # export data, binary time steps are written by a step writer
+    with _BinaryStepWriter(compressor, max_workers) as writer:
+        addarray = False
+        count = 1
+        for kper in kperlist:
+            for kstp in kstplist:
+
+                ot_base = '{}_CBC_KPER{}_KSTP{}.vtu'.format(
+                    model_name, kper + 1, kstp + 1)
+                otfile = os.path.join(otfolder, ot_base)
+                pvdfile.write("""<DataSet timestep="{}" group="" part="0"
+                             file="{}"/>\n""".format(count, ot_base))
+                for name in keylist:
+
+                    try:
+                        rec = cbb.get_data(kstpkper=(kstp, kper), text=name,
+                                           full3D=True)
+
+                        if len(rec) > 0:
+                            array = rec[0]  # need to fix for multiple pak
+                            # 3d records of vertex grids have a row
+                            # dimension, 2d records are not exported
+                            if array.ndim == 3 and \
+                                    array.size == np.prod(shape):
+                                array = array.reshape(shape)
+                            addarray = True
+
+                    except ValueError:
+
+                        rec = cbb.get_data(kstpkper=(kstp, kper), text=name)[0]
+
+                        if imeth_dict[name] == 6:
+                            array = np.full(shape, nanval)
+                            # rec array
+                            for [node, q] in zip(rec['node'], rec['q']):
+                                idx = np.unravel_index(node - 1, shape)
+
+                                array[idx] = q
+
+                            addarray = True
+                        else:
+                            raise Exception('Data type not currently '
+                                            'supported for cbc output')
+                            # print('Data type not currently supported '
+                            #       'for cbc output')
+
+                    if addarray:
+
+                        # set the data to no data value
+                        if ma.is_masked(array):
+                            array = np.where(array.mask, nanval, array)
+
+                        # add array to vtk
+                        # need to adjust for
+                        vtk.add_array(name.strip(), array)
+
+                # write the vtk data to the output file
+                if binary:
+                    geometry, arrays = vtk._get_binary_data(compressor)
+                    if geometry is not None:
+                        writer.write(otfile, geometry, arrays)
+                else:
+                    vtk.write(otfile)
+                count += 1
     # finish writing the pvd file
     pvdfile.write("""  </Collection>
 </VTKFile>""")
@@ -1121,7 +1460,7 @@ def export_cbc(model, cbcfile, otfolder, precision='single', nanval=-1e+20,
 
 def export_heads(model, hdsfile, otfolder, nanval=-1e+20, kstpkper=None,
                  smooth=False, point_scalars=False,
-                 binary=False):
+                 binary=False, compressor=None, max_workers=None):
     """
 
     Exports binary head file to vtk
@@ -1147,6 +1486,14 @@ def export_heads(model, hdsfile, otfolder, nanval=-1e+20, kstpkper=None,
     binary : bool
         if True the output .vtu file will be binary, default is
         False.
+    compressor : str
+        None to write the data arrays of binary files raw, or 'zlib' to
+        compress them, default is None.
+    max_workers : int
+        number of worker processes that write the binary time steps
+        concurrently, default is None, which writes the time steps one
+        at a time.  The geometry is built and encoded once and reused
+        for the time steps that have the same active cells.
 
     """
 
@@ -1187,23 +1534,27 @@ def export_heads(model, hdsfile, otfolder, nanval=-1e+20, kstpkper=None,
     # set upt the vtk
     vtk = Vtk(model, smooth=smooth, point_scalars=point_scalars, nanval=nanval)
 
-    # output data
-    count = 0
-    for kper in kperlist:
-        for kstp in kstplist:
-            hdarr = hds.get_data((kstp, kper))
-            vtk.add_array('head', hdarr)
-            ot_base = '{}_Heads_KPER{}_KSTP{}.vtu'.format(
-                model.name, kper + 1, kstp + 1)
-            otfile = os.path.join(otfolder, ot_base)
-            # vtk.write(otfile, timeval=totim_dict[(kstp, kper)])
-            if binary:
-                vtk.write_binary(otfile)
-            else:
-                vtk.write(otfile)
-            pvdfile.write("""<DataSet timestep="{}" group="" part="0"
-             file="{}"/>\n""".format(count, ot_base))
-            count += 1
+    # output data, binary time steps are written by a step writer
+    with _BinaryStepWriter(compressor, max_workers) as writer:
+        count = 0
+        for kper in kperlist:
+            for kstp in kstplist:
+                # vertex grid heads are stored as (nlay, 1, ncpl)
+                hdarr = hds.get_data((kstp, kper)).reshape(vtk.shape)
+                vtk.add_array('head', hdarr)
+                ot_base = '{}_Heads_KPER{}_KSTP{}.vtu'.format(
+                    model.name, kper + 1, kstp + 1)
+                otfile = os.path.join(otfolder, ot_base)
+                # vtk.write(otfile, timeval=totim_dict[(kstp, kper)])
+                if binary:
+                    geometry, arrays = vtk._get_binary_data(compressor)
+                    if geometry is not None:
+                        writer.write(otfile, geometry, arrays)
+                else:
+                    vtk.write(otfile)
+                pvdfile.write("""<DataSet timestep="{}" group="" part="0"
+                 file="{}"/>\n""".format(count, ot_base))
+                count += 1
 
     pvdfile.write("""  </Collection>
 </VTKFile>""")
@@ -1302,9 +1653,7 @@ def export_transient(model, array, output_folder, name, nanval=-1e+20,
         for kper in range(array.shape[0]):
 
             t2d_array_kper = array[kper]
-            t2d_array_kper_shape = t2d_array_kper.shape
-            t2d_array_input = t2d_array_kper.reshape(t2d_array_kper_shape[1],
-                                                     t2d_array_kper_shape[2])
+            t2d_array_input = t2d_array_kper.reshape(vtk.shape2d)
 
             vtk.add_array(name, t2d_array_input, array2d=True)
 
@@ -1394,9 +1743,8 @@ def export_package(pak_model, pak_name, ot_folder, vtkobj=None,
 
     pak = pak_model.get_package(pak_name)
 
-    shape_check_3d = (pak_model.modelgrid.nlay, pak_model.modelgrid.nrow,
-                      pak_model.modelgrid.ncol)
-    shape_check_2d = (shape_check_3d[1], shape_check_3d[2])
+    shape_check_3d = tuple(pak_model.modelgrid.shape)
+    shape_check_2d = shape_check_3d[1:]
 
     # loop through the items in the package
     for item, value in pak.__dict__.items():
@@ -1501,8 +1849,7 @@ def export_package(pak_model, pak_name, ot_folder, vtkobj=None,
                     pak_name, kper + 1))
                 for name, array in sorted(array_dict.items()):
                     if array.array2d:
-                        array_shape = array.array.shape
-                        a = array.array.reshape(array_shape[1], array_shape[2])
+                        a = array.array.reshape(vtk.shape2d)
                     else:
                         a = array.array
                     vtk.add_array(name, a, array.array2d)
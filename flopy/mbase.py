@@ -18,6 +18,8 @@ from datetime import datetime
 from shutil import which
 from subprocess import Popen, PIPE, STDOUT
 import copy
+import functools
+from contextlib import contextmanager
 import numpy as np
 from flopy import utils, discretization
 from .version import __version__
@@ -29,6 +31,29 @@ from .discretization.grid import Grid
 iconst = 1  # Multiplier for individual array elements in integer and real arrays read by MODFLOW's U2DREL, U1DREL and U2DINT.
 iprn = -1  # Printout flag. If >= 0 then array values read are printed in listing file.
 
+# model and list of changes to the model that are deferred on each thread,
+# see BaseModel._defer_changes()
+_deferred_changes = threading.local()
+
+
+def _deferrable(method):
+    """
+    Decorator for the BaseModel methods that change the model. The call
+    is recorded instead of made when changes to the model are deferred
+    on the current thread.
+
+    """
+
+    @functools.wraps(method)
+    def deferrable_method(self, *args, **kwargs):
+        deferred = getattr(_deferred_changes, 'changes', None)
+        if deferred is not None and deferred[0] is self:
+            deferred[1].append((method.__name__, args, kwargs))
+            return None
+        return method(self, *args, **kwargs)
+
+    return deferrable_method
+
 
 class FileDataEntry(object):
     def __init__(self, fname, unit, binflag=False, output=False, package=None):
@@ -420,6 +445,42 @@ class BaseModel(ModelInterface):
         from .export import utils
         return utils.model_export(f, self, **kwargs)
 
+    @contextmanager
+    def _defer_changes(self, changes):
+        """
+        Context manager that records the calls to the methods that change
+        the model (add_package, add_output_file, add_external,
+        add_pop_key_list, _set_parameter_load, ...) that are made on the
+        current thread in the list changes, instead of changing the model.
+        The recorded changes are made with _apply_changes().
+
+        Parameters
+        ----------
+        changes : list
+            list the changes are appended to
+
+        """
+        previous = getattr(_deferred_changes, 'changes', None)
+        _deferred_changes.changes = (self, changes)
+        try:
+            yield changes
+        finally:
+            _deferred_changes.changes = previous
+
+    def _apply_changes(self, changes):
+        """
+        Make the changes to the model recorded by _defer_changes().
+
+        Parameters
+        ----------
+        changes : list
+            changes recorded by _defer_changes()
+
+        """
+        for name, args, kwargs in changes:
+            getattr(self, name)(*args, **kwargs)
+
+    @_deferrable
     def add_package(self, p):
         """
         Add a package.
@@ -453,6 +514,7 @@ class BaseModel(ModelInterface):
             print('adding Package: ', p.name[0])
         self.packagelist.append(p)
 
+    @_deferrable
     def remove_package(self, pname):
         """
         Remove a package from this model
@@ -562,6 +624,7 @@ class BaseModel(ModelInterface):
               '{} the output list.'.format(txt2)
         print(msg)
 
+    @_deferrable
     def add_output_file(self, unit, fname=None, extension='cbc',
                         binflag=True, package=None):
         """
@@ -629,6 +692,7 @@ class BaseModel(ModelInterface):
             self.add_output(fname, unit, binflag=binflag, package=package)
         return
 
+    @_deferrable
     def add_output(self, fname, unit, binflag=False, package=None):
         """
         Assign an external array so that it will be listed as a DATA or
@@ -669,6 +733,7 @@ class BaseModel(ModelInterface):
 
         return
 
+    @_deferrable
     def remove_output(self, fname=None, unit=None):
         """
         Remove an output file from the model by specifying either the
@@ -733,6 +798,7 @@ class BaseModel(ModelInterface):
                 ' either fname or unit must be passed to get_output()')
         return
 
+    @_deferrable
     def set_output_attribute(self, fname=None, unit=None, attr=None):
         """
         Set a variable in an output file from the model by specifying either
@@ -814,6 +880,7 @@ class BaseModel(ModelInterface):
                     v = self.output_units[idx]
         return v
 
+    @_deferrable
     def add_external(self, fname, unit, binflag=False, output=False):
         """
         Assign an external array so that it will be listed as a DATA or
@@ -853,6 +920,7 @@ class BaseModel(ModelInterface):
         self.external_output.append(output)
         return
 
+    @_deferrable
     def remove_external(self, fname=None, unit=None):
         """
         Remove an external file from the model by specifying either the
@@ -1254,6 +1322,10 @@ class BaseModel(ModelInterface):
         if self.verbose:
             print('\nWriting packages:')
 
+        # stress period data that are loaded lazily from the files that are
+        # about to be written have to be read first
+        self._load_lazy_data(SelPackList)
+
         if SelPackList == False:
             for p in self.packagelist:
                 if self.verbose:
@@ -1286,6 +1358,21 @@ class BaseModel(ModelInterface):
         # os.chdir(org_dir)
         return
 
+    def _load_lazy_data(self, SelPackList=False):
+        """
+        Read the lazily loaded stress period data of the packages that are
+        stored in the package files that are written by write_input.
+
+        """
+        fnames = []
+        for p in self.packagelist:
+            if SelPackList == False or \
+                    any(pon in p.name for pon in SelPackList):
+                fnames += [os.path.join(self.model_ws, fn)
+                           for fn in p.file_name]
+        for p in self.packagelist:
+            p._load_lazy_data(fnames)
+
     def write_name_file(self):
         """
         Every Package needs its own writenamefile function
@@ -1315,6 +1402,7 @@ class BaseModel(ModelInterface):
         """
         return copy.deepcopy(self.__name)
 
+    @_deferrable
     def add_pop_key_list(self, key):
         """
         Add a external file unit number to a list that will be used to remove
@@ -1335,6 +1423,16 @@ class BaseModel(ModelInterface):
         if key not in self.pop_key_list:
             self.pop_key_list.append(key)
 
+    @_deferrable
+    def _set_parameter_load(self):
+        """
+        Record that parameter values were substituted in the data of a
+        loaded package, so that the model is written in free format (see
+        write_input()).
+
+        """
+        self.parameter_load = True
+
     def check(self, f=None, verbose=True, level=1):
         """
         Check model data for common errors.
@@ -4,6 +4,7 @@ modeldimensions module.  Contains the model dimension information
 
 """
 
+import threading
 from .simulationtime import SimulationTime
 from .modelgrid import UnstructuredModelGrid, ModelGrid
 from ..mfbase import StructException, FlopyException
@@ -258,6 +259,10 @@ class ModelDimensions(object):
     ----------
     simulation_time : SimulationTime
         object containing simulation time information
+    locked : bool
+        whether data shapes are stored and reused.  locked and the stored
+        shapes are kept separately for each thread, so that files can be
+        written concurrently
 
     Methods
     ----------
@@ -294,15 +299,26 @@ class ModelDimensions(object):
         self.simulation_data = simulation_data
         self._model_grid = None
         self.simulation_time = SimulationTime(simulation_data)
-        self.locked = False
-        self.stored_shapes = {}
+        self._lock_state = threading.local()
+
+    @property
+    def locked(self):
+        return getattr(self._lock_state, 'locked', False)
+
+    @property
+    def stored_shapes(self):
+        try:
+            return self._lock_state.stored_shapes
+        except AttributeError:
+            self._lock_state.stored_shapes = {}
+            return self._lock_state.stored_shapes
 
     def lock(self):
-        self.locked = True
+        self._lock_state.locked = True
 
     def unlock(self):
-        self.locked = False
-        self.stored_shapes = {}
+        self._lock_state.locked = False
+        self._lock_state.stored_shapes = {}
 
     # returns model grid
     def get_model_grid(self):
@@ -1178,6 +1178,8 @@ class DataStorage(object):
                 self._simulation_data.debug)
 
         # copy file to new location
+        self._simulation_data.external_file_cache.invalidate(
+            new_external_file)
         copyfile(self.layer_storage[layer].fname, new_external_file)
 
         # update
@@ -1198,21 +1200,16 @@ class DataStorage(object):
             self.layer_storage[layer].fname, model_name)
         # currently support files containing ndarrays or recarrays
         if self.data_structure_type == DataStructureType.ndarray:
-            file_access = MFFileAccessArray(
-                self.data_dimensions.structure, self.data_dimensions,
-                self._simulation_data, self._data_path,
-                self._stress_period)
             if self.layer_storage[layer].binary:
-                data_out = file_access.read_binary_data_from_file(
-                    read_file, self.get_data_dimensions(layer),
-                    self.get_data_size(layer), self._data_type,
-                    self._model_or_sim.modeldiscrit)[0]
+                data_type = self._data_type
             else:
-                data_out = file_access.read_text_data_from_file(
-                    self.get_data_size(layer), self._data_type,
-                    self.get_data_dimensions(layer), layer, read_file)[0]
+                data_type = self.data_dimensions.structure.get_datum_type()
+            data_out = self._read_external_array(layer, read_file, data_type)
             if self.layer_storage[layer].factor is not None:
                 data_out = data_out * self.layer_storage[layer].factor
+            else:
+                # cached data can not be changed in place
+                data_out = np.array(data_out)
 
             if store_internal:
                 self.store_internal(data_out, layer)
@@ -1249,6 +1246,40 @@ class DataStorage(object):
                 type_, value_, traceback_, message,
                 self._simulation_data.debug)
 
+    def _read_external_array(self, layer, read_file, data_type,
+                             read_multi_layer=False):
+        # read the array in external file "read_file" for layer "layer".
+        # arrays are cached by the simulation until the file changes and
+        # binary files are mapped to memory instead of being read.  the
+        # returned array is read-only.
+        layer_storage = self.layer_storage[layer]
+        data_shape = self.get_data_dimensions(layer)
+        data_size = self.get_data_size(layer)
+        file_access = MFFileAccessArray(
+            self.data_dimensions.structure, self.data_dimensions,
+            self._simulation_data, self._data_path,
+            self._stress_period)
+        binary = layer_storage.binary
+
+        def read_function():
+            if binary:
+                data = file_access.map_binary_data_from_file(
+                    read_file, data_shape, data_size, data_type,
+                    self._model_or_sim.modeldiscrit, read_multi_layer)
+                if data is not None:
+                    return data
+                return file_access.read_binary_data_from_file(
+                    read_file, data_shape, data_size, data_type,
+                    self._model_or_sim.modeldiscrit, read_multi_layer)[0]
+            return file_access.read_text_data_from_file(
+                data_size, data_type, data_shape, layer, read_file)[0]
+
+        key = (binary, read_multi_layer and binary, data_size,
+               tuple(data_shape), str(data_type),
+               file_access._is_cellid_or_numeric_index())
+        return self._simulation_data.external_file_cache.get(
+            read_file, key, read_function)
+
     def internal_to_external(self, new_external_file, multiplier=None,
                              layer=None, print_format=None, binary=False):
         if layer is None:
@@ -1513,25 +1544,34 @@ class DataStorage(object):
         if data is not None:
             model_grid = None
             cellid_size = None
-            for data_line in data:
-                data_line_len = len(data_line)
-                for index in range(0, min(data_line_len,
-                                          len(self._recarray_type_list))):
-                    if self._recarray_type_list[index][0] == 'cellid' and \
-                            self.data_dimensions.get_model_dim(None).model_name\
-                            is not None and data_line[index] is not None:
+            # check the cellid fields column by column
+            names = data.dtype.names
+            cellid_indexes = [index for index in
+                              range(0, min(len(names),
+                                           len(self._recarray_type_list)))
+                              if self._recarray_type_list[index][0] ==
+                              'cellid']
+            if not cellid_indexes or len(data) == 0 or \
+                    self.data_dimensions.get_model_dim(None).model_name \
+                    is None:
+                return
+            columns = [data[names[index]].tolist() for index in
+                       cellid_indexes]
+            for data_line in zip(*columns):
+                for cellid in data_line:
+                    if cellid is not None:
                         # this is a cell id.  verify that it contains the
                         # correct number of integers
                         if cellid_size is None:
                             model_grid = self.data_dimensions.get_model_grid()
                             cellid_size = model_grid.\
                                 get_num_spatial_coordinates()
-                        if len(data_line[index]) != cellid_size:
+                        if len(cellid) != cellid_size:
                             message = 'Cellid "{}" contains {} integer(s). ' \
                                       'Expected a cellid containing {} ' \
                                       'integer(s) for grid type' \
-                                      ' {}.'.format(data_line[index],
-                                                    len(data_line[index]),
+                                      ' {}.'.format(cellid,
+                                                    len(cellid),
                                                     cellid_size,
                                                     str(
                                                         model_grid.grid_type()))
@@ -1624,26 +1664,18 @@ class DataStorage(object):
                 else:
                     full_data[layer] = self._fill_const_layer(layer) * mult
             else:
-                file_access = MFFileAccessArray(
-                    self.data_dimensions.structure, self.data_dimensions,
-                    self._simulation_data, self._data_path,
-                    self._stress_period)
                 model_name = self.data_dimensions.package_dim.model_dim[0]. \
                     model_name
                 read_file = self._simulation_data.mfpath.resolve_path(
                     self.layer_storage[layer].fname, model_name)
 
                 if self.layer_storage[layer].binary:
-                    data_out = file_access.read_binary_data_from_file(
-                        read_file, self.get_data_dimensions(layer),
-                        self.get_data_size(layer), self._data_type,
-                        self._model_or_sim.modeldiscrit,
-                        not self.layered)[0] * mult
+                    data_out = self._read_external_array(
+                        layer, read_file, self._data_type,
+                        not self.layered) * mult
                 else:
-                    data_out = file_access.read_text_data_from_file(
-                        self.get_data_size(layer), np_data_type,
-                        self.get_data_dimensions(layer), layer,
-                        read_file)[0] * mult
+                    data_out = self._read_external_array(
+                        layer, read_file, np_data_type) * mult
                 if self.layer_storage.get_total_size() == 1 or \
                         not self.layered:
                     full_data = data_out
@@ -1,5 +1,7 @@
-import sys, inspect
+import os, sys, inspect, io
+import threading
 from copy import deepcopy
+from collections import OrderedDict
 import numpy as np
 from ..mfbase import MFDataException, VerbosityLevel
 from ...utils.datautil import PyListUtil, find_keyword, DatumUtil, MultiListIter
@@ -9,6 +11,96 @@ from ...utils import datautil
 from ..data.mfstructure import DatumType, MFDataStructure, DataType
 
 
+# ascii characters that str.split separates items with
+_ascii_space = np.zeros(256, bool)
+_ascii_space[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+# ascii characters of integer items
+_int_chars = np.zeros(256, bool)
+_int_chars[[ord(char) for char in '+-0123456789']] = True
+
+
+class MFExternalFileCache(object):
+    """
+    Least recently used cache of arrays read from external files.  Cached
+    arrays are keyed by the path of the file and a description of how the
+    file was read.  A cached array is only used while the size and
+    modification time of its file are unchanged.
+
+    Parameters
+    ----------
+    max_bytes : int
+        memory budget of the cache in bytes.  the least recently used
+        arrays are removed when the arrays in the cache use more memory.
+        a value of 0 disables the cache.
+
+    Methods
+    -------
+    get(fname, key, read_function) : ndarray
+        returns the cached array for file "fname" and key "key", calling
+        "read_function" to read the array if it is not cached or the file
+        has changed
+    invalidate(fname)
+        removes all arrays read from file "fname" from the cache
+    clear()
+        removes all arrays from the cache
+
+    """
+    def __init__(self, max_bytes=256 * 1024 ** 2):
+        self.max_bytes = max_bytes
+        self._arrays = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_file_stamp(fname):
+        try:
+            stat = os.stat(fname)
+        except OSError:
+            return None
+        return stat.st_size, getattr(stat, 'st_mtime_ns', stat.st_mtime)
+
+    def get(self, fname, key, read_function):
+        fname = os.path.abspath(fname)
+        cache_key = (fname,) + tuple(key)
+        stamp = self._get_file_stamp(fname)
+        with self._lock:
+            if cache_key in self._arrays:
+                item_stamp, data = self._arrays.pop(cache_key)
+                self._nbytes -= data.nbytes
+                if item_stamp == stamp:
+                    self._arrays[cache_key] = (item_stamp, data)
+                    self._nbytes += data.nbytes
+                    return data
+
+        data = read_function()
+        if stamp is None or not isinstance(data, np.ndarray) or \
+                data.nbytes > self.max_bytes or \
+                stamp != self._get_file_stamp(fname):
+            return data
+        # cached arrays are shared, so they can not be changed in place
+        data.setflags(write=False)
+        with self._lock:
+            if cache_key in self._arrays:
+                self._nbytes -= self._arrays.pop(cache_key)[1].nbytes
+            self._arrays[cache_key] = (stamp, data)
+            self._nbytes += data.nbytes
+            while self._nbytes > self.max_bytes:
+                self._nbytes -= self._arrays.popitem(last=False)[1][1].nbytes
+        return data
+
+    def invalidate(self, fname):
+        fname = os.path.abspath(fname)
+        with self._lock:
+            for cache_key in list(self._arrays.keys()):
+                if cache_key[0] == fname:
+                    self._nbytes -= self._arrays.pop(cache_key)[1].nbytes
+
+    def clear(self):
+        with self._lock:
+            self._arrays.clear()
+            self._nbytes = 0
+
+
 class MFFileAccess(object):
     def __init__(self, structure, data_dimensions, simulation_data, path,
                  current_key):
@@ -124,6 +216,7 @@ class MFFileAccess(object):
             fname, model_dim.model_name)
         if write:
             options = 'w'
+            self._simulation_data.external_file_cache.invalidate(read_file)
         else:
             options = 'r'
         if binary:
@@ -240,6 +333,7 @@ class MFFileAccessArray(MFFileAccess):
         return header
 
     def write_text_file(self, data, fp, data_type, data_size):
+        self._simulation_data.external_file_cache.invalidate(fp)
         try:
             fd = open(fp, 'w')
         except:
@@ -285,6 +379,45 @@ class MFFileAccessArray(MFFileAccess):
             fd.close()
             return bin_data
 
+    def map_binary_data_from_file(self, fname, data_shape, data_size,
+                                  data_type, modelgrid,
+                                  read_multi_layer=False):
+        # map the data of a binary file to a read-only memmap. returns None
+        # when the data can not be mapped directly and must be read with
+        # read_binary_data_from_file
+        import flopy.utils.binaryfile as bf
+        if self._is_cellid_or_numeric_index():
+            return None
+        read_file = self._simulation_data.mfpath.resolve_path(
+            fname, self._data_dimensions.package_dim.model_dim[0].model_name)
+        numpy_type, name = self.datum_to_numpy_type(data_type)
+        header_dtype = bf.BinaryHeader.set_dtype(
+            bintype=self._get_bintype(modelgrid),
+            precision='double')
+        data_shape = tuple(data_shape)
+        if read_multi_layer and len(data_shape) > 1:
+            nlay = data_shape[0]
+            layer_size = int(data_size / nlay)
+        else:
+            nlay = 1
+            layer_size = data_size
+        if layer_size < 1:
+            return None
+        record_dtype = np.dtype([('header', header_dtype),
+                                 ('data', numpy_type, (layer_size,))])
+        try:
+            if os.path.getsize(read_file) < record_dtype.itemsize * nlay:
+                return None
+            if nlay == 1:
+                return np.memmap(read_file, dtype=numpy_type, mode='r',
+                                 offset=header_dtype.itemsize,
+                                 shape=data_shape)
+            records = np.memmap(read_file, dtype=record_dtype, mode='r',
+                                shape=(nlay,))
+        except (OSError, ValueError):
+            return None
+        return records['data'].reshape(data_shape)
+
     def get_data_string(self, data, data_type, data_indent=''):
         layer_data_string = ['{}'.format(data_indent)]
         line_data_count = 0
@@ -676,6 +809,9 @@ class MFFileAccessArray(MFFileAccess):
 
 
 class MFFileAccessList(MFFileAccess):
+    # maximum number of simple data lines that are loaded at once
+    _bulk_load_lines = 10000
+
     def __init__(self, structure, data_dimensions, simulation_data, path,
                  current_key):
         super(MFFileAccessList, self).__init__(
@@ -910,8 +1046,20 @@ class MFFileAccessList(MFFileAccess):
         optional_line_info = []
         line_info_processed = False
         data_structs = struct.data_item_structures
+        # lines read by the bulk loader that still need to be processed
+        pending_lines = []
         while line != '':
-            line = file_handle.readline()
+            if pending_lines:
+                line = pending_lines.pop()
+            elif self.simple_line and recarray_len == 1 and \
+                    (line_info_processed or struct.num_optional == 0):
+                # load consecutive simple data lines in bulk
+                bulk_count, pending_lines = self._load_simple_lines(
+                    file_handle, data_loaded)
+                line_num += bulk_count
+                line = pending_lines.pop()
+            else:
+                line = file_handle.readline()
             arr_line = PyListUtil.split_data_line(line)
             if not line or (arr_line and len(arr_line[0]) >= 2 and
                     arr_line[0][:3].upper() == 'END'):
@@ -1056,6 +1204,223 @@ class MFFileAccessList(MFFileAccess):
         else:
             return [False, None, data_line]
 
+    def _get_simple_line_plan(self, line_len):
+        # build a plan for loading simple data lines with "line_len" items
+        # in bulk, based on the layout of the last line loaded.  the plan
+        # lists the items of a data line as ('cellid', indexes),
+        # ('value', index, data_type, data_item) or ('none',).  returns None
+        # if lines of this length can not be loaded in bulk.
+        struct = self.structure
+        data_structs = struct.data_item_structures
+        plan = []
+        cellid_indexes = []
+        data_index = 0
+        for index, entry in enumerate(self._last_line_info):
+            for sub_entry in entry:
+                if sub_entry[1] is None:
+                    plan.append(('none',))
+                elif sub_entry[2] > 0:
+                    cellid_indexes.append(sub_entry[0])
+                    if len(cellid_indexes) == sub_entry[2]:
+                        plan.append(('cellid', cellid_indexes))
+                        cellid_indexes = []
+                else:
+                    plan.append(('value', sub_entry[0], sub_entry[1],
+                                 data_structs[index]))
+                data_index = sub_entry[0]
+        if cellid_indexes or data_index >= line_len:
+            return None
+        if line_len > data_index + 1:
+            # optional aux and boundname data on the end of the line
+            data_index += 1
+            for data_item in data_structs[len(self._last_line_info):]:
+                if line_len <= data_index:
+                    break
+                elif data_item.name == 'aux':
+                    aux_var_names = self._data_dimensions.package_dim.\
+                        get_aux_variables()
+                    if aux_var_names is not None:
+                        for var_name in aux_var_names[0]:
+                            if var_name.lower() != 'auxiliary':
+                                if data_index >= line_len:
+                                    plan.append(('none',))
+                                else:
+                                    plan.append(('value', data_index,
+                                                 data_item.type, data_item))
+                                data_index += 1
+                elif data_item.name == 'boundname' and \
+                        self._data_dimensions.package_dim.boundnames():
+                    plan.append(('value', data_index, data_item.type,
+                                 data_item))
+            if line_len > data_index + 1:
+                # lines with comments are not loaded in bulk
+                return None
+        for item in plan:
+            if item[0] == 'value':
+                data_type, data_item = item[2:]
+                if not (data_type == DatumType.string or
+                        (data_type == DatumType.double_precision and
+                         not data_item.support_negative_index) or
+                        (data_type == DatumType.integer and
+                         not data_item.numeric_index)):
+                    return None
+        return plan
+
+    @staticmethod
+    def _count_simple_lines(text, line_count, line_len, int_columns):
+        # count the leading lines of "text" that can be loaded in bulk, which
+        # are lines with "line_len" whitespace separated items and only
+        # digits and signs in the items in "int_columns".  the text is
+        # checked in one numpy pass.
+        try:
+            buffer = np.frombuffer(text.encode('ascii'), np.uint8)
+        except UnicodeEncodeError:
+            return 0
+        is_space = _ascii_space[buffer]
+        starts = ~is_space
+        starts[1:] &= is_space[:-1]
+        newline = buffer == 10
+        line_index = np.cumsum(newline) - newline
+        item_counts = np.bincount(line_index[starts], minlength=line_count)
+        different = np.flatnonzero(item_counts != line_len)
+        count = different[0] if different.size > 0 else line_count
+        # check the characters of the integer items of these lines
+        column = (np.cumsum(starts) - 1) % line_len
+        is_int = np.zeros(line_len, bool)
+        is_int[int_columns] = True
+        invalid = is_int[column] & ~is_space & ~_int_chars[buffer] & \
+            (line_index < count)
+        invalid = np.flatnonzero(invalid)
+        if invalid.size > 0:
+            count = line_index[invalid[0]]
+        return count
+
+    @staticmethod
+    def _read_simple_items(text, line_len, plan):
+        # read the items of simple data lines into a structured array in one
+        # numpy pass, with one field for each item of a line
+        dtype = [object] * line_len
+        for item in plan:
+            if item[0] == 'cellid':
+                for index in item[1]:
+                    dtype[index] = np.int64
+            elif item[0] == 'value':
+                if item[2] == DatumType.double_precision:
+                    dtype[item[1]] = np.float64
+                elif item[2] == DatumType.integer:
+                    dtype[item[1]] = np.int64
+        dtype = [('f{}'.format(index), item_type)
+                 for index, item_type in enumerate(dtype)]
+        try:
+            return np.loadtxt(io.StringIO(text), dtype=dtype,
+                              comments=None, ndmin=1)
+        except ValueError:
+            if any(item_type == object for name, item_type in dtype):
+                raise
+            # fortran double precision exponents
+            return np.loadtxt(io.StringIO(text.replace('d', 'e')),
+                              dtype=dtype, comments=None, ndmin=1)
+
+    def _load_simple_lines(self, file_handle, data_loaded):
+        # load consecutive simple data lines from "file_handle" in bulk and
+        # append them to "data_loaded".  the lines are checked and read into
+        # a structured array by numpy at once, and cellids are resolved on
+        # whole columns before the data lines are built.  returns the
+        # number of lines loaded and a list, in reverse order, of lines read
+        # that still need to be processed line by line.  the list always
+        # contains at least one line.
+        if PyListUtil.delimiter_used is not None:
+            return 0, [file_handle.readline()]
+        readline = file_handle.readline
+        # the first line sets the layout of the lines loaded in bulk
+        line = readline()
+        arr_line = line.split()
+        plan = None
+        if arr_line and arr_line[0][0] != '!' and \
+                arr_line[0][:3].upper() != 'END':
+            line_len = len(arr_line)
+            plan = self._get_simple_line_plan(line_len)
+        if plan is None:
+            return 0, [line]
+        lines = [line]
+        other_lines = []
+        while len(lines) < self._bulk_load_lines:
+            line = readline()
+            start = line.lstrip()[:3]
+            if not start or start[0] == '!' or start.upper() == 'END':
+                # end of file, end of block, empty line or comment
+                other_lines.append(line)
+                break
+            lines.append(line)
+        # lines with comments, delimiters, quotes or a different number of
+        # items are loaded one at a time
+        text = ''.join(lines)
+        count = len(lines)
+        if '#' in text or ',' in text or "'" in text or '"' in text:
+            for count, line in enumerate(lines):
+                if '#' in line or ',' in line or "'" in line or '"' in line:
+                    break
+        int_columns = [index for item in plan if item[0] == 'cellid'
+                       for index in item[1]]
+        int_columns.extend(item[1] for item in plan if item[0] == 'value' and
+                           item[2] == DatumType.integer)
+        count = min(count, self._count_simple_lines(text, len(lines),
+                                                    line_len, int_columns))
+        if count < len(lines):
+            other_lines[0:0] = lines[count:]
+            text = ''.join(lines[:count])
+            lines = lines[:count]
+
+        loaded = 0
+        if lines:
+            try:
+                items = self._read_simple_items(text, line_len, plan)
+                dtype = []
+                columns = []
+                for index, item in enumerate(plan):
+                    name = 'f{}'.format(index)
+                    if item[0] == 'cellid':
+                        # resolve zero-based cellids
+                        dtype.append((name, [('c{}'.format(i), np.int64)
+                                             for i in range(len(item[1]))]))
+                        columns.append([items['f{}'.format(i)] - 1
+                                        for i in item[1]])
+                    elif item[0] == 'value':
+                        column = items['f{}'.format(item[1])]
+                        if item[2] == DatumType.string and \
+                                (item[3] is None or
+                                 not item[3].preserve_case):
+                            column = np.char.lower(
+                                column.astype(str)).astype(object)
+                        dtype.append((name, column.dtype))
+                        columns.append(column)
+                    else:
+                        dtype.append((name, object))
+                        columns.append(None)
+                data = np.empty(len(lines), dtype=dtype)
+                for (name, field_type), column in zip(dtype, columns):
+                    if isinstance(field_type, list):
+                        for (sub_name, sub_type), sub_column in \
+                                zip(field_type, column):
+                            data[name][sub_name] = sub_column
+                    else:
+                        data[name] = column
+                data_lines = data.tolist()
+            except (ValueError, TypeError, OverflowError):
+                # load the lines one at a time
+                other_lines[0:0] = lines
+            else:
+                data_loaded.extend(data_lines)
+                self._data_line = data_lines[-1]
+                loaded = len(lines)
+                # keep the state of the delimiter detection the same as if
+                # each line had been split with split_data_line
+                PyListUtil.line_num += loaded
+        if not other_lines:
+            other_lines.append(readline())
+        other_lines.reverse()
+        return loaded, other_lines
+
     def _load_list_line(self, storage, arr_line, line_num, data_loaded,
                         build_type_list, current_key, data_index_start=0,
                         data_set=None, ignore_optional_vars=False,
@@ -4,6 +4,11 @@ mfstructure module.  Contains classes related to package structure
 
 """
 import os
+import sys
+import gc
+import hashlib
+import pickle
+import tempfile
 import traceback
 import ast
 import keyword
@@ -2123,8 +2128,20 @@ class MFStructure(object):
     dimension_dict : dict
         Dictionary mapping paths to dimension information to the dataitem whose
         dimension information is being described
+    use_structure_cache : bool
+        Class attribute.  When True the structure built from the package
+        classes is saved to, and reloaded from, a cache file stamped with the
+        flopy and python versions, a hash of the modules that build the
+        structure, and the state of the package class files.  The cache is
+        not used by default
+    structure_cache_dir : str
+        Class attribute.  Folder of the structure cache file.  When None
+        ~/.cache/flopy is used.  Each flopy installation uses its own cache
+        file in the folder
     """
     _instance = None
+    use_structure_cache = False
+    structure_cache_dir = None
 
     def __new__(cls, internal_request=False, load_from_dfn_files=False):
         if cls._instance is None:
@@ -2168,14 +2185,107 @@ class MFStructure(object):
             for file in dfn_files:
                 self.sim_struct.process_dfn(DfnFile(file))
             self.sim_struct.tag_read_as_arrays()
-        else:
+        elif not self.__load_structure_cache():
             package_list = PackageContainer.package_factory(None, None)
             for package in package_list:
                 self.sim_struct.process_dfn(DfnPackage(package))
             self.sim_struct.tag_read_as_arrays()
+            self.__save_structure_cache()
+
+        return True
+
+    def get_structure_cache_file(self):
+        """
+        Returns the path of the structure cache file, or None if the
+        structure cache is not used.
+        """
+        if not self.use_structure_cache:
+            return None
+        cache_dir = self.structure_cache_dir
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser('~'), '.cache',
+                                     'flopy')
+        # separate cache files for each flopy installation
+        mf6_path = os.path.dirname(os.path.dirname(os.path.realpath(
+            __file__)))
+        install_hash = hashlib.md5(mf6_path.encode()).hexdigest()[:12]
+        return os.path.join(cache_dir,
+                            'mf6_structure_{}.pkl'.format(install_hash))
+
+    @staticmethod
+    def _get_structure_source_hash():
+        # hash of the modules that build the structure, so that changes to
+        # them in development installs invalidate the cache
+        mf6_path = os.path.dirname(os.path.dirname(os.path.realpath(
+            __file__)))
+        md5 = hashlib.md5()
+        for fpth in (os.path.realpath(__file__),
+                     os.path.join(mf6_path, 'mfbase.py')):
+            with open(fpth, 'rb') as f:
+                md5.update(f.read())
+        return md5.hexdigest()
 
+    @staticmethod
+    def __structure_cache_stamp():
+        # the cache is only valid for the flopy and python versions, the
+        # structure modules and the package class files that it was built
+        # from
+        from ...version import __version__
+        file_stats = []
+        for package_file_path in sorted(
+                PackageContainer.get_package_file_paths()):
+            stat = os.stat(package_file_path)
+            file_stats.append((os.path.basename(package_file_path),
+                               stat.st_size, stat.st_mtime_ns))
+        return __version__, sys.version_info[:2], \
+            MFStructure._get_structure_source_hash(), file_stats
+
+    def __load_structure_cache(self):
+        cache_file = self.get_structure_cache_file()
+        if cache_file is None or not os.path.isfile(cache_file):
+            return False
+        # the structure is a large graph of small objects, garbage
+        # collection while it is unpickled only slows loading down
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(cache_file, 'rb') as fd:
+                if pickle.load(fd) != self.__structure_cache_stamp():
+                    return False
+                sim_struct, dimension_dict = pickle.load(fd)
+        except Exception:
+            # unreadable or outdated cache, rebuild the structure
+            return False
+        finally:
+            if gc_enabled:
+                gc.enable()
+        self.sim_struct = sim_struct
+        self.dimension_dict = dimension_dict
         return True
 
+    def __save_structure_cache(self):
+        cache_file = self.get_structure_cache_file()
+        if cache_file is None:
+            return
+        cache_dir = os.path.dirname(cache_file)
+        temp_file = None
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            # write to a temporary file first so that other processes never
+            # read a partially written cache
+            fd, temp_file = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(self.__structure_cache_stamp(), f,
+                            pickle.HIGHEST_PROTOCOL)
+                pickle.dump((self.sim_struct, self.dimension_dict), f,
+                            pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+        except Exception:
+            # the cache is optional, failing to write it is not an error
+            if temp_file is not None and os.path.isfile(temp_file):
+                os.remove(temp_file)
+
     def __load_flopy(self):
         current_variable = None
         var_info = {}
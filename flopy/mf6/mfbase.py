@@ -39,6 +39,21 @@ class FlopyException(Exception):
                            "FlopyException: {} ({})".format(error, location))
 
 
+class MFWriteException(FlopyException):
+    """
+    Exception raised when more than one file fails to be written
+    concurrently.  errors is a list of (file path, exception) tuples for the
+    files that failed, in the order the files were queued.
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        error = '{} files could not be written:\n{}'.format(
+            len(errors), '\n'.join('  {}: {}'.format(file_path, ex)
+                                   for file_path, ex in errors))
+        super(MFWriteException, self).__init__(error)
+
+
 class StructException(Exception):
     """
     Exception related to the package file structure
@@ -167,6 +182,66 @@ class ExtFileAction(Enum):
     copy_relative_paths = 3
 
 
+class MFFileWriter(object):
+    """
+    Writes package files, either one at a time as they are added, or
+    concurrently on a thread pool.
+
+    Parameters
+    ----------
+    max_workers : int
+        maximum number of threads used to write files.  when None each
+        package is written as soon as it is added, otherwise packages are
+        queued and written when flush is called
+
+    Methods
+    -------
+    add : (package : MFPackage, ext_file_action : ExtFileAction)
+        writes the package, or queues it to be written
+    flush : ()
+        creates the folders of all queued packages and then writes the
+        packages concurrently.  if writing one package
+        fails its exception is raised after the other packages have been
+        written, if more than one package fails a MFWriteException listing
+        all of the errors is raised
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        self._queue = []
+
+    def add(self, package, ext_file_action=None):
+        kwargs = {}
+        if ext_file_action is not None:
+            kwargs['ext_file_action'] = ext_file_action
+        if self.max_workers is None:
+            package.write(**kwargs)
+        else:
+            self._queue.append((package, kwargs))
+
+    def flush(self):
+        queue, self._queue = self._queue, []
+        if not queue:
+            return
+        for package, kwargs in queue:
+            package_folder = os.path.split(package.get_file_path())[0]
+            if package_folder and not os.path.isdir(package_folder):
+                os.makedirs(package_folder)
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(package.write, **kwargs)
+                       for package, kwargs in queue]
+        errors = []
+        for (package, kwargs), future in zip(queue, futures):
+            ex = future.exception()
+            if ex is not None:
+                errors.append((package.get_file_path(), ex))
+        if len(errors) == 1:
+            raise errors[0][1]
+        elif errors:
+            raise MFWriteException(errors)
+
+
 class MFFilePath(object):
     def __init__(self, file_path, model_name):
         self.file_path = file_path
@@ -442,7 +517,9 @@ class PackageContainer(object):
     package_factory : (package_type : string, model_type : string) :
       MFPackage subclass
         Static method that returns the appropriate package type object based
-        on the package_type and model_type strings
+        on the package_type and model_type strings.  Classes are looked up
+        in the registry generated by createpackages.py and their modules are
+        imported on first use
     get_package : (name : string) : MFPackage or [MfPackage]
         finds a package by package name, package key, package type, or partial
         package name. returns either a single package, a list of packages,
@@ -462,6 +539,59 @@ class PackageContainer(object):
 
     @staticmethod
     def package_factory(package_type, model_type):
+        registry = PackageContainer.get_registry()
+        if registry is None:
+            return PackageContainer._scan_package_factory(package_type,
+                                                          model_type)
+        package_registry = registry.package_registry
+        if package_type is None:
+            # return classes sorted by module name so the structure is built
+            # in a fixed order (simulation and model level mvr and gnc
+            # packages share a file type).  don't return packages "group"
+            # classes
+            return [PackageContainer.get_registry_class(module, class_name)
+                    for abbr, (module, class_name) in sorted(
+                        package_registry.items(), key=lambda x: x[1])
+                    if len(abbr) <= 8 or abbr[-8:] != 'packages']
+        for abbr in ('{}{}'.format(model_type, package_type),
+                     'utl{}'.format(package_type)):
+            if abbr in package_registry:
+                return PackageContainer.get_registry_class(
+                    *package_registry[abbr])
+        return None
+
+    @staticmethod
+    def model_factory(model_type):
+        registry = PackageContainer.get_registry()
+        if registry is None:
+            return PackageContainer._scan_model_factory(model_type)
+        if model_type in registry.model_registry:
+            return PackageContainer.get_registry_class(
+                *registry.model_registry[model_type])
+        return None
+
+    @staticmethod
+    def get_registry():
+        """
+        Returns the registry module generated by createpackages.py that maps
+        package abbreviations and model types to their modules and classes,
+        or None if the registry is not available.
+        """
+        try:
+            from .modflow import mfregistry
+        except ImportError:
+            return None
+        return mfregistry
+
+    @staticmethod
+    def get_registry_class(module_name, class_name):
+        # modules are only imported when one of their classes is requested
+        module = importlib.import_module('flopy.mf6.modflow.{}'.format(
+            module_name))
+        return getattr(module, class_name)
+
+    @staticmethod
+    def _scan_package_factory(package_type, model_type):
         package_abbr = '{}{}'.format(model_type, package_type)
         package_utl_abbr = 'utl{}'.format(package_type)
         package_list = []
@@ -491,7 +621,7 @@ class PackageContainer(object):
             return None
 
     @staticmethod
-    def model_factory(model_type):
+    def _scan_model_factory(model_type):
         package_file_paths = PackageContainer.get_package_file_paths()
         for package_file_path in package_file_paths:
             module = PackageContainer.get_module(package_file_path)
@@ -6,7 +6,7 @@ import os, sys, inspect, warnings
 import numpy as np
 from .mfbase import PackageContainer, ExtFileAction, PackageContainerType, \
                     MFDataException, ReadAsArraysException, FlopyException, \
-                    VerbosityLevel
+                    VerbosityLevel, MFFileWriter
 from .mfpackage import MFPackage
 from .coordinates import modeldimensions
 from ..utils import datautil
@@ -580,7 +580,8 @@ class MFModel(PackageContainer, ModelInterface):
 
         return instance
 
-    def write(self, ext_file_action=ExtFileAction.copy_relative_paths):
+    def write(self, ext_file_action=ExtFileAction.copy_relative_paths,
+              max_workers=None):
         """
         write model to model files
 
@@ -590,6 +591,11 @@ class MFModel(PackageContainer, ModelInterface):
             defines what to do with external files when the simulation path has
             changed.  defaults to copy_relative_paths which copies only files
             with relative paths, leaving files defined by absolute paths fixed.
+        max_workers : int
+            maximum number of threads used to write the model's files
+            concurrently.  the files written are the same as when they are
+            written one at a time.  defaults to None, which writes one file at
+            a time.
 
         Returns
         -------
@@ -597,20 +603,24 @@ class MFModel(PackageContainer, ModelInterface):
         Examples
         --------
         """
+        writer = MFFileWriter(max_workers)
+        self._write_files(writer, ext_file_action)
+        writer.flush()
 
+    def _write_files(self, writer, ext_file_action):
         # write name file
         if self.simulation_data.verbosity_level.value >= \
                 VerbosityLevel.normal.value:
             print('    writing model name file...')
 
-        self.name_file.write(ext_file_action=ext_file_action)
+        writer.add(self.name_file, ext_file_action)
 
         # write packages
         for pp in self.packagelist:
             if self.simulation_data.verbosity_level.value >= \
                     VerbosityLevel.normal.value:
                 print('    writing package {}...'.format(pp._get_pname()))
-            pp.write(ext_file_action=ext_file_action)
+            writer.add(pp, ext_file_action)
 
     def get_grid_type(self):
         """
@@ -1649,7 +1649,13 @@ class MFPackage(PackageContainer, PackageInterface):
         package_file_path = self.get_file_path()
         package_folder = os.path.split(package_file_path)[0]
         if package_folder and not os.path.isdir(package_folder):
-            os.makedirs(os.path.split(package_file_path)[0])
+            try:
+                os.makedirs(package_folder)
+            except OSError:
+                # the folder may have been created by another package
+                # written at the same time
+                if not os.path.isdir(package_folder):
+                    raise
 
         # open file
         fd = open(package_file_path, 'w')
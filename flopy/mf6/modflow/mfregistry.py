@@ -0,0 +1,51 @@
+# DO NOT MODIFY THIS FILE DIRECTLY.  THIS FILE MUST BE CREATED BY
+# mf6/utils/createpackages.py
+"""
+mfregistry module.  Maps package abbreviations and model types to the
+modules and classes in the modflow folder that implement them.
+"""
+
+package_registry = {
+    "nam": ("mfnam", "ModflowNam"),
+    "tdis": ("mftdis", "ModflowTdis"),
+    "gwfgwf": ("mfgwfgwf", "ModflowGwfgwf"),
+    "ims": ("mfims", "ModflowIms"),
+    "mvr": ("mfmvr", "ModflowMvr"),
+    "gnc": ("mfgnc", "ModflowGnc"),
+    "utlobs": ("mfutlobs", "ModflowUtlobs"),
+    "utlobspackages": ("mfutlobs", "UtlobsPackages"),
+    "utlts": ("mfutlts", "ModflowUtlts"),
+    "utltspackages": ("mfutlts", "UtltsPackages"),
+    "utltas": ("mfutltas", "ModflowUtltas"),
+    "utltaspackages": ("mfutltas", "UtltasPackages"),
+    "utltab": ("mfutllaktab", "ModflowUtllaktab"),
+    "gwfnam": ("mfgwfnam", "ModflowGwfnam"),
+    "gwfdis": ("mfgwfdis", "ModflowGwfdis"),
+    "gwfdisv": ("mfgwfdisv", "ModflowGwfdisv"),
+    "gwfdisu": ("mfgwfdisu", "ModflowGwfdisu"),
+    "gwfic": ("mfgwfic", "ModflowGwfic"),
+    "gwfnpf": ("mfgwfnpf", "ModflowGwfnpf"),
+    "gwfsto": ("mfgwfsto", "ModflowGwfsto"),
+    "gwfhfb": ("mfgwfhfb", "ModflowGwfhfb"),
+    "gwfchd": ("mfgwfchd", "ModflowGwfchd"),
+    "gwfwel": ("mfgwfwel", "ModflowGwfwel"),
+    "gwfdrn": ("mfgwfdrn", "ModflowGwfdrn"),
+    "gwfriv": ("mfgwfriv", "ModflowGwfriv"),
+    "gwfghb": ("mfgwfghb", "ModflowGwfghb"),
+    "gwfrch": ("mfgwfrch", "ModflowGwfrch"),
+    "gwfrcha": ("mfgwfrcha", "ModflowGwfrcha"),
+    "gwfevt": ("mfgwfevt", "ModflowGwfevt"),
+    "gwfevta": ("mfgwfevta", "ModflowGwfevta"),
+    "gwfmaw": ("mfgwfmaw", "ModflowGwfmaw"),
+    "gwfsfr": ("mfgwfsfr", "ModflowGwfsfr"),
+    "gwflak": ("mfgwflak", "ModflowGwflak"),
+    "gwfuzf": ("mfgwfuzf", "ModflowGwfuzf"),
+    "gwfmvr": ("mfgwfmvr", "ModflowGwfmvr"),
+    "gwfgnc": ("mfgwfgnc", "ModflowGwfgnc"),
+    "gwfoc": ("mfgwfoc", "ModflowGwfoc"),
+    "gwfcsub": ("mfgwfcsub", "ModflowGwfcsub"),
+}
+
+model_registry = {
+    "gwf": ("mfgwf", "ModflowGwf"),
+}
@@ -8,7 +8,7 @@ import os.path
 from ...mbase import run_model
 from ..mfbase import PackageContainer, MFFileMgmt, ExtFileAction, \
     PackageContainerType, MFDataException, FlopyException, \
-    VerbosityLevel
+    VerbosityLevel, MFFileWriter
 from ..mfpackage import MFPackage
 from ..data.mfstructure import DatumType
 from ..data import mfstructure
@@ -16,6 +16,7 @@ from ..utils import binaryfile_utils
 from ..utils import mfobservation
 from ..modflow import mfnam, mfims, mftdis, mfgwfgnc, mfgwfmvr
 from ..data.mfdatautil import MFComment
+from ..data.mffileaccess import MFExternalFileCache
 
 
 class SimulationDict(collections.OrderedDict):
@@ -221,6 +222,9 @@ class MFSimulationData(object):
         dictionary containing discretization information for each model
     mfdata : SimulationDict
         custom dictionary containing all model data for the simulation
+    external_file_cache : MFExternalFileCache
+        cache of arrays read from external files.  the memory budget of the
+        cache in bytes is set with external_file_cache.max_bytes.
 
     """
 
@@ -253,6 +257,9 @@ class MFSimulationData(object):
         # --- file path ---
         self.mfpath = MFFileMgmt(path)
 
+        # --- arrays read from external files ---
+        self.external_file_cache = MFExternalFileCache()
+
         # --- ease of use variables to make working with modflow input and
         # output data easier --- model dimension class for each model
         self.model_dimensions = collections.OrderedDict()
@@ -1017,7 +1024,7 @@ class MFSimulation(PackageContainer):
 
     def write_simulation(self,
                          ext_file_action=ExtFileAction.copy_relative_paths,
-                         silent=False):
+                         silent=False, max_workers=None):
         """Write the simulation to files.
 
         Parameters
@@ -1028,24 +1035,34 @@ class MFSimulation(PackageContainer):
                 paths fixed.
             silent : bool
                 writes out the simulation in silent mode (verbosity_level = 0)
+            max_workers : int
+                maximum number of threads used to write files concurrently.
+                the simulation level files are written first, then external
+                files are copied, then the remaining packages and the files
+                of all models are written.  the files written are the same as
+                when they are written one at a time.  errors are raised after
+                all files in a group have been written, as a MFWriteException
+                when more than one file fails.  defaults to None, which writes
+                one file at a time.
 
         """
         saved_verb_lvl = self.simulation_data.verbosity_level
         if silent:
             self.simulation_data.verbosity_level = VerbosityLevel.quiet
+        writer = MFFileWriter(max_workers)
 
         # write simulation name file
         if self.simulation_data.verbosity_level.value >= \
                 VerbosityLevel.normal.value:
             print('writing simulation...')
             print('  writing simulation name file...')
-        self.name_file.write(ext_file_action=ext_file_action)
+        writer.add(self.name_file, ext_file_action)
 
         # write TDIS file
         if self.simulation_data.verbosity_level.value >= \
                 VerbosityLevel.normal.value:
             print('  writing simulation tdis package...')
-        self._tdis_file.write(ext_file_action=ext_file_action)
+        writer.add(self._tdis_file, ext_file_action)
 
         # write ims files
         for ims_file in self._ims_files.values():
@@ -1053,11 +1070,11 @@ class MFSimulation(PackageContainer):
                     VerbosityLevel.normal.value:
                 print('  writing ims package {}...'.format(
                     ims_file._get_pname()))
-            ims_file.write(ext_file_action=ext_file_action)
+            writer.add(ims_file, ext_file_action)
 
         # write exchange files
         for exchange_file in self._exchange_files.values():
-            exchange_file.write()
+            writer.add(exchange_file)
             if hasattr(exchange_file, 'gnc_filerecord') and \
                     exchange_file.gnc_filerecord.has_data():
                 try:
@@ -1074,8 +1091,8 @@ class MFSimulation(PackageContainer):
                             VerbosityLevel.normal.value:
                         print('  writing gnc package {}...'.format(
                             self._ghost_node_files[gnc_file]._get_pname()))
-                    self._ghost_node_files[gnc_file].write(
-                        ext_file_action=ext_file_action)
+                    writer.add(self._ghost_node_files[gnc_file],
+                               ext_file_action)
                 else:
                     if self.simulation_data.verbosity_level.value >= \
                             VerbosityLevel.normal.value:
@@ -1099,14 +1116,15 @@ class MFSimulation(PackageContainer):
                             VerbosityLevel.normal.value:
                         print('  writing mvr package {}...'.format(
                             self._mover_files[mvr_file]._get_pname()))
-                    self._mover_files[mvr_file].write(
-                        ext_file_action=ext_file_action)
+                    writer.add(self._mover_files[mvr_file],
+                               ext_file_action)
                 else:
                     if self.simulation_data.verbosity_level.value >= \
                             VerbosityLevel.normal.value:
                         print('WARNING: Mover file {} not loaded prior to '
                               'writing. File will not be '
                               'written.'.format(mvr_file))
+        writer.flush()
 
         if ext_file_action == ExtFileAction.copy_relative_paths:
             # move external files with relative paths
@@ -1127,7 +1145,7 @@ class MFSimulation(PackageContainer):
             if self.simulation_data.verbosity_level.value >= \
                     VerbosityLevel.normal.value:
                 print('  writing package {}...'.format(pp._get_pname()))
-            pp.write(ext_file_action=ext_file_action)
+            writer.add(pp, ext_file_action)
 
         # FIX: model working folder should be model name file folder
 
@@ -1136,7 +1154,8 @@ class MFSimulation(PackageContainer):
             if self.simulation_data.verbosity_level.value >= \
                     VerbosityLevel.normal.value:
                 print('  writing model {}...'.format(model.name))
-            model.write(ext_file_action=ext_file_action)
+            model._write_files(writer, ext_file_action)
+        writer.flush()
 
         self.simulation_data.mfpath.set_last_accessed_path()
 
@@ -301,6 +301,21 @@ def build_model_init_vars(param_list):
     return '\n'.join(init_var_list)
 
 
+def build_registry_string(package_registry, model_registry):
+    registry_string = '# DO NOT MODIFY THIS FILE DIRECTLY.  THIS FILE ' \
+                      'MUST BE CREATED BY\n# mf6/utils/createpackages.py\n' \
+                      '"""\nmfregistry module.  Maps package abbreviations ' \
+                      'and model types to the\nmodules and classes in the ' \
+                      'modflow folder that implement them.\n"""\n'
+    for name, registry in (('package_registry', package_registry),
+                           ('model_registry', model_registry)):
+        entries = ['    "{}": ("{}", "{}"),'.format(key, module, class_name)
+                   for key, module, class_name in registry]
+        registry_string = '{}\n{} = {{\n{}\n}}\n'.format(
+            registry_string, name, '\n'.join(entries))
+    return registry_string
+
+
 def create_packages():
     indent = '    '
     init_string_def = '    def __init__(self'
@@ -338,6 +353,8 @@ def create_packages():
                      'w')
     init_file.write('# imports\n')
     init_file.write('from .mfsimulation import MFSimulation\n')
+    package_registry = []
+    model_registry = []
 
     nam_import_string = 'from .. import mfmodel\nfrom ..data.mfdatautil ' \
                         'import ListTemplateGenerator, ArrayTemplateGenerator'
@@ -502,6 +519,8 @@ def create_packages():
         pb_file = open(os.path.join(util_path, '..', 'modflow',
                                     'mf{}.py'.format(package_name)), 'w')
         pb_file.write(package_string)
+        package_registry.append((package_abbr, 'mf{}'.format(package_name),
+                                 'Modflow{}'.format(package_name.title())))
 
         if package[2] == 'utl' and package_abbr != 'utltab':
             set_param_list.append('filename=filename')
@@ -566,6 +585,10 @@ def create_packages():
                                                          params_appn[:-2],
                                                          append_pkg,)
             pb_file.write(packages_str)
+            package_registry.append(
+                ('utl{}packages'.format(package_short_name),
+                 'mf{}'.format(package_name),
+                 'Utl{}Packages'.format(package_short_name)))
         pb_file.close()
 
         init_file.write('from .mf{} import '
@@ -623,8 +646,18 @@ def create_packages():
             init_file.write('from .mf{} import '
                             'Modflow{}\n'.format(model_name,
                                                  model_name.capitalize()))
+            model_registry.append((model_name, 'mf{}'.format(model_name),
+                                   'Modflow{}'.format(
+                                       model_name.capitalize())))
     init_file.close()
 
+    # write registry used by PackageContainer to look up package classes
+    registry_file = open(os.path.join(util_path, '..', 'modflow',
+                                      'mfregistry.py'), 'w')
+    registry_file.write(build_registry_string(package_registry,
+                                              model_registry))
+    registry_file.close()
+
 
 if __name__ == '__main__':
     create_packages()
@@ -599,7 +599,8 @@ class Modflow(BaseModel):
 
     @staticmethod
     def load(f, version='mf2005', exe_name='mf2005.exe', verbose=False,
-             model_ws='.', load_only=None, forgive=False, check=True):
+             model_ws='.', load_only=None, forgive=False, check=True,
+             parallel=False, max_workers=None, lazy=False):
         """
         Load an existing MODFLOW model.
 
@@ -627,6 +628,25 @@ class Modflow(BaseModel):
             useful for debugging. Default False.
         check : boolean, optional
             Check model input for common errors. Default True.
+        parallel : bool, optional
+            Parse the packages that follow BAS6 in the name file
+            concurrently on a thread pool. The changes that the packages
+            make to the model are recorded and made in name file order,
+            so the model is the same as the model loaded sequentially.
+            Packages that read a DATA file are loaded again in name file
+            order after the packages before them. The NWT, UPW and SMS
+            packages, which can reset the model version, are loaded in
+            name file order. Default False.
+        max_workers : int, optional
+            Maximum number of threads used to load packages. Setting
+            max_workers also sets parallel to True. Default None, which
+            uses the ThreadPoolExecutor default.
+        lazy : bool, optional
+            Only locate the stress period data of the packages that support
+            lazy loading (WEL, DRN, DRT, GHB, RIV, CHD, RCH and EVT), and
+            read the data of a stress period when it is used. Stress periods
+            that are not used are copied from the original files when the
+            model is written. Default False.
 
         Returns
         -------
@@ -765,74 +785,152 @@ class Modflow(BaseModel):
             ml.mfpar.set_mult(ml, ext_unit_dict)
             assert ml.pop_key_list.pop() == ext_pkg_d.get('MULT')
 
+        def load_item(item, ext_unit_dict=ext_unit_dict):
+            package_load_args = getfullargspec(item.package.load)[0]
+            kwargs = {}
+            if "check" in package_load_args:
+                kwargs['check'] = False
+            if lazy and "lazy" in package_load_args:
+                kwargs['lazy'] = True
+            item.package.load(item.filehandle, ml,
+                              ext_unit_dict=ext_unit_dict, **kwargs)
+
+        def parse_item(item, units, reads):
+            # load a package with the changes to the model deferred, and
+            # return the changes and the exception raised by the load.
+            # DATA files can be shared by packages and are read in name
+            # file order, so None is returned if the package reads one.
+            changes = []
+            error = None
+            with ml._defer_changes(changes):
+                try:
+                    load_item(item, units)
+                except Exception as e:
+                    error = e
+            if reads:
+                return None
+            return changes, error
+
+        # when loading in parallel, the packages after BAS6 are parsed on a
+        # thread pool and the changes that each package makes to the model
+        # are made on this thread in ext_unit_dict order
+        if max_workers is not None:
+            parallel = True
+        keys = list(ext_unit_dict.keys())
+        first = len(keys)
+        if parallel:
+            first = 0
+            if bas_key is not None and 'BAS6' in load_only:
+                # packages read the BAS6 free format flag while they are
+                # loaded, so BAS6 and the packages before it are loaded
+                # on this thread
+                first = keys.index(bas_key) + 1
+        pool = None
+        futures = {}
+        positions = {}
+
+        def submit_packages():
+            from concurrent.futures import ThreadPoolExecutor
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+            for key in keys[first:]:
+                item = ext_unit_dict[key]
+                if item.package is None or item.filehandle is None or \
+                        item.filetype not in load_only:
+                    continue
+                # the NWT, UPW and SMS loaders reset the model version that
+                # their packages check, so they are loaded in name file order
+                if item.filetype in ('NWT', 'UPW', 'SMS'):
+                    continue
+                reads = []
+                units = ext_unit_dict.copy()
+                for unit, namdata in units.items():
+                    if namdata.package is None and \
+                            "data" in namdata.filetype.lower():
+                        units[unit] = _DataUnit(namdata, reads)
+                positions[key] = item.filehandle.tell()
+                futures[key] = pool.submit(parse_item, item, units, reads)
+            return pool
+
+        def load_package(key, item):
+            result = None
+            if key in futures:
+                result = futures.pop(key).result()
+            if result is None:
+                if key in positions:
+                    # the package read a DATA file, load it again
+                    item.filehandle.seek(positions[key])
+                load_item(item)
+            else:
+                changes, error = result
+                ml._apply_changes(changes)
+                if error is not None:
+                    raise error
+
         # try loading packages in ext_unit_dict
-        for key, item in ext_unit_dict.items():
-            if item.package is not None:
-                if item.filetype in load_only:
-                    package_load_args = getfullargspec(item.package.load)[0]
-                    if forgive:
-                        try:
-                            if "check" in package_load_args:
-                                item.package.load(item.filehandle, ml,
-                                                  ext_unit_dict=ext_unit_dict,
-                                                  check=False)
-                            else:
-                                item.package.load(item.filehandle, ml,
-                                                  ext_unit_dict=ext_unit_dict)
+        try:
+            for i, (key, item) in enumerate(ext_unit_dict.items()):
+                if i == first:
+                    pool = submit_packages()
+                if item.package is not None:
+                    if item.filetype in load_only:
+                        if forgive:
+                            try:
+                                load_package(key, item)
+                                files_successfully_loaded.append(
+                                    item.filename)
+                                if ml.verbose:
+                                    print('   {:4s} package load...success'
+                                          .format(item.filetype))
+                            except Exception as e:
+                                ml.load_fail = True
+                                if ml.verbose:
+                                    msg = 3 * ' ' + \
+                                          '{:4s} '.format(item.filetype) + \
+                                          'package load...failed\n' + \
+                                          3 * ' ' + '{!s}'.format(e)
+                                    print(msg)
+                                files_not_loaded.append(item.filename)
+                        else:
+                            load_package(key, item)
                             files_successfully_loaded.append(item.filename)
-                            if ml.verbose:
-                                print('   {:4s} package load...success'
-                                      .format(item.filetype))
-                        except Exception as e:
-                            ml.load_fail = True
                             if ml.verbose:
                                 msg = 3 * ' ' + \
                                       '{:4s} '.format(item.filetype) + \
-                                      'package load...failed\n' + \
-                                      3 * ' ' + '{!s}'.format(e)
+                                      'package load...success'
                                 print(msg)
-                            files_not_loaded.append(item.filename)
                     else:
-                        if "check" in package_load_args:
-                            item.package.load(item.filehandle, ml,
-                                              ext_unit_dict=ext_unit_dict,
-                                              check=False)
-                        else:
-                            item.package.load(item.filehandle, ml,
-                                              ext_unit_dict=ext_unit_dict)
-                        files_successfully_loaded.append(item.filename)
                         if ml.verbose:
                             msg = 3 * ' ' + '{:4s} '.format(item.filetype) + \
-                                  'package load...success'
+                                  'package load...skipped'
                             print(msg)
-                else:
+                        files_not_loaded.append(item.filename)
+                elif "data" not in item.filetype.lower():
+                    files_not_loaded.append(item.filename)
                     if ml.verbose:
                         msg = 3 * ' ' + '{:4s} '.format(item.filetype) + \
-                              'package load...skipped'
+                                  'package load...skipped'
                         print(msg)
-                    files_not_loaded.append(item.filename)
-            elif "data" not in item.filetype.lower():
-                files_not_loaded.append(item.filename)
-                if ml.verbose:
-                    msg = 3 * ' ' + '{:4s} '.format(item.filetype) + \
-                              'package load...skipped'
-                    print(msg)
-            elif "data" in item.filetype.lower():
-                if ml.verbose:
-                    msg = 3 * ' ' + '{:s} '.format(item.filetype) + \
-                          'file load...skipped\n' + 6 * ' ' + \
-                          '{}'.format(os.path.basename(item.filename))
-                    print(msg)
-                if key not in ml.pop_key_list:
-                    # do not add unit number (key) if it already exists
-                    if key not in ml.external_units:
-                        ml.external_fnames.append(item.filename)
-                        ml.external_units.append(key)
-                        ml.external_binflag.append("binary"
-                                                   in item.filetype.lower())
-                        ml.external_output.append(False)
-            else:
-                raise KeyError('unhandled case: {}, {}'.format(key, item))
+                elif "data" in item.filetype.lower():
+                    if ml.verbose:
+                        msg = 3 * ' ' + '{:s} '.format(item.filetype) + \
+                              'file load...skipped\n' + 6 * ' ' + \
+                              '{}'.format(os.path.basename(item.filename))
+                        print(msg)
+                    if key not in ml.pop_key_list:
+                        # do not add unit number (key) if it already exists
+                        if key not in ml.external_units:
+                            ml.external_fnames.append(item.filename)
+                            ml.external_units.append(key)
+                            ml.external_binflag.append(
+                                "binary" in item.filetype.lower())
+                            ml.external_output.append(False)
+                else:
+                    raise KeyError('unhandled case: {}, {}'.format(key, item))
+        finally:
+            if pool is not None:
+                for future in futures.values():
+                    future.cancel()
+                pool.shutdown(wait=True)
 
         # pop binary output keys and any external file units that are now
         # internal
@@ -869,3 +967,29 @@ class Modflow(BaseModel):
 
         # return model object
         return ml
+
+
+class _DataUnit(mfreadnam.NamData):
+    """
+    Name file entry of a DATA file for packages that are loaded on a
+    thread pool. The file handle is not available, reading it appends
+    the file name to reads and raises an IOError.
+
+    Parameters
+    ----------
+    namdata : NamData object
+        Name file entry of the DATA file.
+    reads : list
+        List that the file name is appended to when the file is read.
+
+    """
+
+    def __init__(self, namdata, reads):
+        self.__dict__.update(namdata.__dict__)
+        self._reads = reads
+
+    @property
+    def filehandle(self):
+        self._reads.append(self.filename)
+        raise IOError('DATA file {} cannot be read on a thread '
+                      'pool'.format(self.filename))
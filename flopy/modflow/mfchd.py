@@ -158,6 +158,9 @@ class ModflowChd(Package):
         None
 
         """
+        # lists that are read lazily from the file have to be read
+        # before the file is overwritten
+        self._load_lazy_data([self.fn_path])
         f_chd = open(self.fn_path, 'w')
         f_chd.write('{0:s}\n'.format(self.heading))
         f_chd.write(' {0:9d}'.format(self.stress_period_data.mxact))
@@ -197,7 +200,7 @@ class ModflowChd(Package):
         return ['shead', 'ehead']
 
     @staticmethod
-    def load(f, model, nper=None, ext_unit_dict=None):
+    def load(f, model, nper=None, ext_unit_dict=None, lazy=False):
         """
         Load an existing package.
 
@@ -217,6 +220,9 @@ class ModflowChd(Package):
             handle.  In this case ext_unit_dict is required, which can be
             constructed using the function
             :class:`flopy.utils.mfreadnam.parsenamefile`.
+        lazy : boolean
+            Locate the stress period lists in the file and only read them
+            when the stress period data are used. (default False)
 
         Returns
         -------
@@ -236,7 +242,8 @@ class ModflowChd(Package):
             sys.stdout.write('loading chd package file...\n')
 
         return Package.load(f, model, ModflowChd, nper=nper,
-                            ext_unit_dict=ext_unit_dict)
+                            ext_unit_dict=ext_unit_dict,
+                            lazy=lazy)
 
     @staticmethod
     def ftype():
@@ -211,6 +211,9 @@ class ModflowDrn(Package):
         if check:  # allows turning off package checks when writing files at model level
             self.check(f='{}.chk'.format(self.name[0]),
                        verbose=self.parent.verbose, level=1)
+        # lists that are read lazily from the file have to be read
+        # before the file is overwritten
+        self._load_lazy_data([self.fn_path])
         f_drn = open(self.fn_path, 'w')
         f_drn.write('{0}\n'.format(self.heading))
         # f_drn.write('%10i%10i\n' % (self.mxactd, self.idrncb))
@@ -246,7 +249,8 @@ class ModflowDrn(Package):
         return ['cond']
 
     @staticmethod
-    def load(f, model, nper=None, ext_unit_dict=None, check=True):
+    def load(f, model, nper=None, ext_unit_dict=None, check=True,
+             lazy=False):
         """
         Load an existing package.
 
@@ -265,6 +269,9 @@ class ModflowDrn(Package):
             :class:`flopy.utils.mfreadnam.parsenamefile`.
         check : boolean
             Check package data for common errors. (default True)
+        lazy : boolean
+            Locate the stress period lists in the file and only read them
+            when the stress period data are used. (default False)
 
         Returns
         -------
@@ -284,7 +291,8 @@ class ModflowDrn(Package):
             sys.stdout.write('loading drn package file...\n')
 
         return Package.load(f, model, ModflowDrn, nper=nper, check=check,
-                            ext_unit_dict=ext_unit_dict)
+                            ext_unit_dict=ext_unit_dict,
+                            lazy=lazy)
 
     @staticmethod
     def ftype():
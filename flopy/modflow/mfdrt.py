@@ -206,6 +206,9 @@ class ModflowDrt(Package):
         if check:  # allows turning off package checks when writing files at model level
             self.check(f='{}.chk'.format(self.name[0]),
                        verbose=self.parent.verbose, level=1)
+        # lists that are read lazily from the file have to be read
+        # before the file is overwritten
+        self._load_lazy_data([self.fn_path])
         f_drn = open(self.fn_path, 'w')
         f_drn.write('{0}\n'.format(self.heading))
         # f_drn.write('%10i%10i\n' % (self.mxactd, self.idrncb))
@@ -233,7 +236,8 @@ class ModflowDrt(Package):
         return create_empty_recarray(ncells, dtype, default_value=-1.0E+10)
 
     @staticmethod
-    def load(f, model, nper=None, ext_unit_dict=None, check=True):
+    def load(f, model, nper=None, ext_unit_dict=None, check=True,
+             lazy=False):
         """
         Load an existing package.
 
@@ -252,6 +256,9 @@ class ModflowDrt(Package):
             :class:`flopy.utils.mfreadnam.parsenamefile`.
         check : boolean
             Check package data for common errors. (default True)
+        lazy : boolean
+            Locate the stress period lists in the file and only read them
+            when the stress period data are used. (default False)
 
         Returns
         -------
@@ -271,7 +278,8 @@ class ModflowDrt(Package):
             sys.stdout.write('loading drt package file...\n')
 
         return Package.load(f, model, ModflowDrt, nper=nper, check=check,
-                            ext_unit_dict=ext_unit_dict)
+                            ext_unit_dict=ext_unit_dict,
+                            lazy=lazy)
 
     @staticmethod
     def ftype():
@@ -170,26 +170,29 @@ class ModflowEvt(Package):
         f_evt.write('{0:s}\n'.format(self.heading))
         f_evt.write('{0:10d}{1:10d}\n'.format(self.nevtop, self.ipakcb))
         for n in range(nper):
-            insurf, surf = self.surf.get_kper_entry(n)
-            inevtr, evtr = self.evtr.get_kper_entry(n)
-            inexdp, exdp = self.exdp.get_kper_entry(n)
-            inievt, ievt = self.ievt.get_kper_entry(n)
+            insurf, surf = self.surf.get_kper_util2d(n)
+            inevtr, evtr = self.evtr.get_kper_util2d(n)
+            inexdp, exdp = self.exdp.get_kper_util2d(n)
+            inievt, ievt = self.ievt.get_kper_util2d(n)
             comment = 'Evapotranspiration  dataset 5 for stress period ' + \
                       str(n + 1)
             f_evt.write('{0:10d}{1:10d}{2:10d}{3:10d} # {4:s}\n'
                         .format(insurf, inevtr, inexdp, inievt, comment))
             if (insurf >= 0):
-                f_evt.write(surf)
+                surf.write_file_entry(f_evt)
             if (inevtr >= 0):
-                f_evt.write(evtr)
+                evtr.write_file_entry(f_evt)
             if (inexdp >= 0):
-                f_evt.write(exdp)
+                exdp.write_file_entry(f_evt)
             if self.nevtop == 2 and inievt >= 0:
-                f_evt.write(ievt)
+                ievt.write_file_entry(f_evt)
+            elif inievt >= 0:
+                # the entry also writes external ievt files when not used
+                ievt.get_file_entry()
         f_evt.close()
 
     @staticmethod
-    def load(f, model, nper=None, ext_unit_dict=None):
+    def load(f, model, nper=None, ext_unit_dict=None, lazy=False):
         """
         Load an existing package.
 
@@ -209,6 +212,10 @@ class ModflowEvt(Package):
             handle.  In this case ext_unit_dict is required, which can be
             constructed using the function
             :class:`flopy.utils.mfreadnam.parsenamefile`.
+        lazy : boolean
+            Keep the stress period arrays that are read with free format
+            OPEN/CLOSE records in their files and only read them when the
+            arrays are used. (default False)
 
         Returns
         -------
@@ -280,7 +287,7 @@ class ModflowEvt(Package):
                     print('   loading surf stress period {0:3d}...'.format(
                         iper + 1))
                 t = Util2d.load(f, model, (nrow, ncol), np.float32, 'surf',
-                                ext_unit_dict)
+                                ext_unit_dict, lazy=lazy)
                 current_surf = t
             surf[iper] = current_surf
 
@@ -290,7 +297,7 @@ class ModflowEvt(Package):
                         print('   loading evtr stress period {0:3d}...'.format(
                             iper + 1))
                     t = Util2d.load(f, model, (nrow, ncol), np.float32, 'evtr',
-                                    ext_unit_dict)
+                                    ext_unit_dict, lazy=lazy)
                 else:
                     parm_dict = {}
                     for ipar in range(inevtr):
@@ -320,7 +327,7 @@ class ModflowEvt(Package):
                     print('   loading exdp stress period {0:3d}...'.format(
                         iper + 1))
                 t = Util2d.load(f, model, (nrow, ncol), np.float32, 'exdp',
-                                ext_unit_dict)
+                                ext_unit_dict, lazy=lazy)
                 current_exdp = t
             exdp[iper] = current_exdp
             if nevtop == 2:
@@ -329,7 +336,7 @@ class ModflowEvt(Package):
                         print('   loading ievt stress period {0:3d}...'.format(
                             iper + 1))
                     t = Util2d.load(f, model, (nrow, ncol), np.int32, 'ievt',
-                                    ext_unit_dict)
+                                    ext_unit_dict, lazy=lazy)
                     current_ievt = t
                 ievt[iper] = current_ievt
 
@@ -191,6 +191,9 @@ class ModflowGhb(Package):
         if check:  # allows turning off package checks when writing files at model level
             self.check(f='{}.chk'.format(self.name[0]),
                        verbose=self.parent.verbose, level=1)
+        # lists that are read lazily from the file have to be read
+        # before the file is overwritten
+        self._load_lazy_data([self.fn_path])
         f_ghb = open(self.fn_path, 'w')
         f_ghb.write('{}\n'.format(self.heading))
         f_ghb.write(
@@ -231,7 +234,8 @@ class ModflowGhb(Package):
         return ['cond']
 
     @staticmethod
-    def load(f, model, nper=None, ext_unit_dict=None, check=True):
+    def load(f, model, nper=None, ext_unit_dict=None, check=True,
+             lazy=False):
         """
         Load an existing package.
 
@@ -253,6 +257,9 @@ class ModflowGhb(Package):
             :class:`flopy.utils.mfreadnam.parsenamefile`.
         check : boolean
             Check package data for common errors. (default True)
+        lazy : boolean
+            Locate the stress period lists in the file and only read them
+            when the stress period data are used. (default False)
 
         Returns
         -------
@@ -272,7 +279,8 @@ class ModflowGhb(Package):
             sys.stdout.write('loading ghb package file...\n')
 
         return Package.load(f, model, ModflowGhb, nper=nper, check=check,
-                            ext_unit_dict=ext_unit_dict)
+                            ext_unit_dict=ext_unit_dict,
+                            lazy=lazy)
 
     @staticmethod
     def ftype():
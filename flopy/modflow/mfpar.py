@@ -314,7 +314,7 @@ class ModflowPar(object):
                         if layer == (findlayer + 1):
                             foundlayer = True
                     if foundlayer:
-                        model.parameter_load = True
+                        model._set_parameter_load()
                         cluster_data = np.zeros(shape, dtype=dtype)
                         if mltarr.lower() == 'none':
                             mult = np.ones(shape, dtype=dtype)
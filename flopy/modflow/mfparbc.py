@@ -246,7 +246,7 @@ class ModflowParBc(object):
                 except:
                     pv = np.float(pdict['parval'])
             for [mltarr, zonarr, izones] in inst_data:
-                model.parameter_load = True
+                model._set_parameter_load()
                 # print mltarr, zonarr, izones
                 if mltarr.lower() == 'none':
                     mult = np.ones(shape, dtype=dtype)
@@ -299,9 +299,9 @@ class ModflowRch(Package):
                                self.irch.name)
 
         for kper in range(nper):
-            inrech, file_entry_rech = self.rech.get_kper_entry(kper)
+            inrech, u2d_rech = self.rech.get_kper_util2d(kper)
             if self.nrchop == 2:
-                inirch, file_entry_irch = irch.get_kper_entry(kper)
+                inirch, u2d_irch = irch.get_kper_util2d(kper)
             else:
                 inirch = -1
             f_rch.write('{0:10d}{1:10d} # {2:s}\n'.format(inrech,
@@ -309,14 +309,15 @@ class ModflowRch(Package):
                                                           "Stress period " + str(
                                                               kper + 1)))
             if (inrech >= 0):
-                f_rch.write(file_entry_rech)
+                u2d_rech.write_file_entry(f_rch)
             if self.nrchop == 2:
                 if inirch >= 0:
-                    f_rch.write(file_entry_irch)
+                    u2d_irch.write_file_entry(f_rch)
         f_rch.close()
 
     @staticmethod
-    def load(f, model, nper=None, ext_unit_dict=None, check=True):
+    def load(f, model, nper=None, ext_unit_dict=None, check=True,
+             lazy=False):
         """
         Load an existing package.
 
@@ -338,6 +339,10 @@ class ModflowRch(Package):
             :class:`flopy.utils.mfreadnam.parsenamefile`.
         check : boolean
             Check package data for common errors. (default True)
+        lazy : boolean
+            Keep the stress period arrays that are read with free format
+            OPEN/CLOSE records in their files and only read them when the
+            arrays are used. (default False)
 
         Returns
         -------
@@ -407,7 +412,7 @@ class ModflowRch(Package):
                               'period {0:3d}...'.format(iper + 1)
                         print(txt)
                     t = Util2d.load(f, model, (nrow, ncol), np.float32, 'rech',
-                                    ext_unit_dict)
+                                    ext_unit_dict, lazy=lazy)
                 else:
                     parm_dict = {}
                     for ipar in range(inrech):
@@ -280,6 +280,9 @@ class ModflowRiv(Package):
         if check:
             self.check(f='{}.chk'.format(self.name[0]),
                        verbose=self.parent.verbose, level=1)
+        # lists that are read lazily from the file have to be read
+        # before the file is overwritten
+        self._load_lazy_data([self.fn_path])
         f_riv = open(self.fn_path, 'w')
         f_riv.write('{0}\n'.format(self.heading))
         line = '{0:10d}{1:10d}'.format(self.stress_period_data.mxact,
@@ -298,7 +301,8 @@ class ModflowRiv(Package):
             raise Exception("mfriv error adding record to list: " + str(e))
 
     @staticmethod
-    def load(f, model, nper=None, ext_unit_dict=None, check=True):
+    def load(f, model, nper=None, ext_unit_dict=None, check=True,
+             lazy=False):
         """
         Load an existing package.
 
@@ -320,6 +324,9 @@ class ModflowRiv(Package):
             :class:`flopy.utils.mfreadnam.parsenamefile`.
         check : boolean
             Check package data for common errors. (default True)
+        lazy : boolean
+            Locate the stress period lists in the file and only read them
+            when the stress period data are used. (default False)
 
         Returns
         -------
@@ -339,7 +346,8 @@ class ModflowRiv(Package):
             sys.stdout.write('loading riv package file...\n')
 
         return Package.load(f, model, ModflowRiv, nper=nper, check=check,
-                            ext_unit_dict=ext_unit_dict)
+                            ext_unit_dict=ext_unit_dict,
+                            lazy=lazy)
 
     @staticmethod
     def ftype():
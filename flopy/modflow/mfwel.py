@@ -258,12 +258,16 @@ class ModflowWel(Package):
         None
 
         """
+        # lists that are read lazily from the file have to be read before
+        # the file is overwritten
         if f is not None:
             if isinstance(f, str):
+                self._load_lazy_data([f])
                 f_wel = open(f, "w")
             else:
                 f_wel = f
         else:
+            self._load_lazy_data([self.fn_path])
             f_wel = open(self.fn_path, 'w')
 
         f_wel.write('%s\n' % self.heading)
@@ -336,7 +340,8 @@ class ModflowWel(Package):
         return ['flux']
 
     @staticmethod
-    def load(f, model, nper=None, ext_unit_dict=None, check=True):
+    def load(f, model, nper=None, ext_unit_dict=None, check=True,
+             lazy=False):
         """
         Load an existing package.
 
@@ -356,6 +361,9 @@ class ModflowWel(Package):
             handle.  In this case ext_unit_dict is required, which can be
             constructed using the function
             :class:`flopy.utils.mfreadnam.parsenamefile`.
+        lazy : boolean
+            Locate the stress period lists in the file and only read them
+            when the stress period data are used. (default False)
 
         Returns
         -------
@@ -375,7 +383,8 @@ class ModflowWel(Package):
             sys.stdout.write('loading wel package file...\n')
 
         return Package.load(f, model, ModflowWel, nper=nper, check=check,
-                            ext_unit_dict=ext_unit_dict)
+                            ext_unit_dict=ext_unit_dict,
+                            lazy=lazy)
 
     @staticmethod
     def ftype():
@@ -15,7 +15,7 @@ import numpy as np
 from numpy.lib.recfunctions import stack_arrays
 
 from .modflow.mfparbc import ModflowParBc as mfparbc
-from .utils import Util2d, Util3d, Transient2d, MfList, check
+from .utils import Util2d, Util3d, Transient2d, MfList, MfListSource, check
 from .utils import OptionBlock
 from .utils.flopy_io import ulstrd
 
@@ -645,6 +645,25 @@ class Package(PackageInterface):
         if wa is not None:
             wb.open(wa)
 
+    def _load_lazy_data(self, filenames=None):
+        """
+        Read the lazily loaded stress period data of the package that are
+        stored in filenames, so that these files can be overwritten.
+
+        Parameters
+        ----------
+        filenames : list of str, optional
+            Files that are about to be written. Default is None, which uses
+            the files of the package.
+
+        """
+        if filenames is None:
+            filenames = [os.path.join(self.parent.model_ws, fn)
+                         for fn in self.file_name]
+        for value in self.__dict__.values():
+            if isinstance(value, MfList):
+                value.load_lazy_data(filenames)
+
     def write_file(self, check=False):
         """
         Every Package needs its own write_file function
@@ -673,6 +692,10 @@ class Package(PackageInterface):
             check = kwargs.pop('check')
         else:
             check = True
+        if 'lazy' in kwargs:
+            lazy = kwargs.pop('lazy')
+        else:
+            lazy = False
 
         # open the file if not already open
         openfile = not hasattr(f, 'read')
@@ -806,6 +829,11 @@ class Package(PackageInterface):
         if nper is None:
             nrow, ncol, nlay, nper = model.get_nrow_ncol_nlay_nper()
 
+        # lists are only located when loading lazily, and are read when the
+        # stress period is used. parameters are always loaded.
+        if nppak > 0:
+            lazy = False
+
         # read data for every stress period
         bnd_output = None
         stress_period_data = {}
@@ -831,17 +859,27 @@ class Package(PackageInterface):
                 current = pak_type.get_empty(itmp, aux_names=aux_names,
                                              structured=model.structured)
             elif itmp > 0:
-                current = pak_type.get_empty(itmp, aux_names=aux_names,
-                                             structured=model.structured)
-                current = ulstrd(f, itmp, current, model, sfac_columns,
-                                 ext_unit_dict)
-                if model.structured:
-                    current['k'] -= 1
-                    current['i'] -= 1
-                    current['j'] -= 1
+                source = None
+                if lazy:
+                    source = MfListSource.from_file(f, itmp, model,
+                                                    sfac_columns)
+                if source is not None:
+                    current = source
+                    bnd_output = source
                 else:
-                    current['node'] -= 1
-                bnd_output = np.recarray.copy(current)
+                    current = pak_type.get_empty(itmp, aux_names=aux_names,
+                                                 structured=model.structured)
+                    current = ulstrd(f, itmp, current, model, sfac_columns,
+                                     ext_unit_dict)
+                    if model.structured:
+                        current['k'] -= 1
+                        current['i'] -= 1
+                        current['j'] -= 1
+                    else:
+                        current['node'] -= 1
+                    bnd_output = np.recarray.copy(current)
+            elif isinstance(current, MfListSource):
+                bnd_output = current
             else:
                 bnd_output = np.recarray.copy(current)
 
@@ -22,7 +22,7 @@
     """
 from .mfreadnam import parsenamefile
 from .util_array import Util3d, Util2d, Transient2d, Transient3d, read1d
-from .util_list import MfList
+from .util_list import MfList, MfListSource
 from .binaryfile import BinaryHeader, HeadFile, UcnFile, CellBudgetFile, \
     HeadUFile
 from .formattedfile import FormattedHeadFile
@@ -9,6 +9,7 @@ important classes that can be accessed by the user.
 
 """
 from __future__ import print_function
+import os
 import numpy as np
 import warnings
 from collections import OrderedDict
@@ -257,6 +258,8 @@ class BinaryLayerFile(LayerFile):
     """
 
     def __init__(self, filename, precision, verbose, kwargs):
+        self.memmap = kwargs.pop('memmap', False)
+        self._mmdata = None
         super(BinaryLayerFile, self).__init__(filename, precision, verbose,
                                               kwargs)
         return
@@ -285,6 +288,12 @@ class BinaryLayerFile(LayerFile):
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
         self.file.seek(0, 0)
+
+        # files with a fixed record size can be indexed without walking
+        # through every header
+        if self._build_index_stride(header):
+            return
+
         ipos = 0
         while ipos < self.totalbytes:
             header = self._get_header()
@@ -313,6 +322,137 @@ class BinaryLayerFile(LayerFile):
         self.nlay = np.max(self.recordarray['ilay'])
         return
 
+    def _build_index_stride(self, header):
+        """
+        Build the recordarray and iposarray from a memory-mapped view of
+        the binary file.  This is only possible if every record in the file
+        has the same size (all layers share nrow and ncol) and the same
+        text identifier, in which case the position of every header can be
+        calculated from the record stride.
+
+        Parameters
+        ----------
+        header : numpy record
+            The first header in the file.
+
+        Returns
+        -------
+        success : bool
+            True if the index was built.  False if the file is irregular and
+            has to be indexed by walking through each record.
+
+        """
+        databytes = int(self.get_databytes(header))
+        nval = databytes // self.realtype(1).nbytes
+        if nval < 1 or databytes > self.totalbytes:
+            return False
+        record_dtype = np.dtype([('header', self.header_dtype),
+                                 ('data', self.realtype, (nval,))])
+        if self.totalbytes % record_dtype.itemsize != 0:
+            return False
+
+        mm = np.memmap(self.filename, dtype=record_dtype, mode='r')
+        headers = mm['header']
+        if not np.all(headers['nrow'] == header['nrow']) or \
+                not np.all(headers['ncol'] == header['ncol']):
+            return False
+        if not np.all(np.char.find(headers['text'],
+                                   self.text.upper()) >= 0):
+            return False
+
+        self.recordarray = np.array(headers, dtype=self.header_dtype)
+        self.iposarray = np.arange(headers.shape[0], dtype=np.int64) * \
+                         record_dtype.itemsize + self.header_dtype.itemsize
+
+        # times and kstpkper are added each time totim changes
+        totim = self.recordarray['totim']
+        newtime = np.ones(totim.shape, dtype=bool)
+        newtime[1:] = totim[1:] != totim[:-1]
+        self.times = list(totim[newtime])
+        self.kstpkper = list(zip(self.recordarray['kstp'][newtime],
+                                 self.recordarray['kper'][newtime]))
+        self.nlay = np.max(self.recordarray['ilay'])
+
+        # keep a zero-copy view of the data if requested
+        if self.memmap and nval == self.nrow * self.ncol:
+            self._mmdata = mm['data'].reshape(-1, self.nrow, self.ncol)
+        return True
+
+    def _get_data_array(self, totim=0):
+        """
+        Get the three dimensional data array for the
+        specified kstp and kper value or totim value.  If the file was
+        opened with memmap=True, a read-only view into the memory-mapped
+        file is returned when the layers for totim are stored in order.
+
+        """
+        if self._mmdata is None:
+            return super(BinaryLayerFile, self)._get_data_array(totim)
+
+        if totim >= 0.:
+            keyindices = np.where((self.recordarray['totim'] == totim))[0]
+            if len(keyindices) == 0:
+                msg = 'totim value ({}) not found in file...'.format(totim)
+                raise Exception(msg)
+        else:
+            raise Exception('Data not found...')
+
+        ilay = self.recordarray['ilay'][keyindices]
+        i0 = keyindices[0]
+        if np.array_equal(keyindices, np.arange(i0, i0 + self.nlay)) and \
+                np.array_equal(ilay, np.arange(1, self.nlay + 1)):
+            return self._mmdata[i0:i0 + self.nlay]
+
+        data = np.empty((self.nlay, self.nrow, self.ncol),
+                        dtype=self.realtype)
+        data[:, :, :] = np.nan
+        data[ilay - 1] = self._mmdata[keyindices]
+        return data
+
+    def get_alldata(self, mflay=None, nodata=-9999):
+        """
+        Get all of the data from the file.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+
+        nodata : float
+           The nodata value in the data array.  All array values that have the
+           nodata value will be assigned np.nan.  If None, values are not
+           replaced and, for files opened with memmap=True, a read-only
+           view into the memory-mapped file is returned.
+
+        Returns
+        ----------
+        data : numpy array
+            Array has size (ntimes, nlay, nrow, ncol) if mflay is None or it
+            has size (ntimes, nrow, ncol) if mlay is specified.
+
+        """
+        if self._mmdata is not None and nodata is None:
+            ntimes = len(self.times)
+            ilay = np.tile(np.arange(1, self.nlay + 1), ntimes)
+            if np.array_equal(self.recordarray['ilay'], ilay):
+                data = self._mmdata.reshape(ntimes, self.nlay,
+                                            self.nrow, self.ncol)
+                if mflay is not None:
+                    data = data[:, mflay, :, :]
+                return data
+        return super(BinaryLayerFile, self).get_alldata(mflay=mflay,
+                                                        nodata=nodata)
+
+    def close(self):
+        """
+        Close the file handle and release the memory-mapped data.
+
+        """
+        self._mmdata = None
+        super(BinaryLayerFile, self).close()
+        return
+
     def get_databytes(self, header):
         """
 
@@ -369,6 +509,14 @@ class BinaryLayerFile(LayerFile):
         The layer, row, and column values must be zero-based, and must be
         within the following ranges: 0 <= k < nlay; 0 <= i < nrow; 0 <= j < ncol
 
+        The requested cells are grouped by layer so that each layer record
+        is only visited once.  If the file was opened with memmap=True, all
+        of the values for a layer are gathered from the memory-mapped file
+        in a single operation.  Otherwise the records are streamed from the
+        file one at a time and only the span of values between the first and
+        last requested cell in the layer is read, so files larger than the
+        available memory can be processed.
+
         Examples
         --------
 
@@ -379,24 +527,36 @@ class BinaryLayerFile(LayerFile):
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
 
-        istat = 1
-        for k, i, j in kijlist:
-            ioffset = (i * self.ncol + j) * self.realtype(1).nbytes
-            for irec, header in enumerate(self.recordarray):
-                ilay = header[
-                           'ilay'] - 1  # change ilay from header to zero-based
-                if ilay != k:
-                    continue
-                ipos = np.long(self.iposarray[irec])
-
-                # Calculate offset necessary to reach intended cell
-                self.file.seek(ipos + np.long(ioffset), 0)
-
-                # Find the time index and then put value into result in the
-                # correct location.
-                itim = np.where(result[:, 0] == header['totim'])[0]
-                result[itim, istat] = binaryread(self.file, self.realtype)
-            istat += 1
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        nodes = kij[:, 1] * self.ncol + kij[:, 2]
+
+        # find the time index (row in result) for each record
+        times = result[:, 0]
+        isort = np.argsort(times, kind='mergesort')
+        itims = isort[np.searchsorted(times, self.recordarray['totim'],
+                                      sorter=isort)]
+
+        # change ilay from header to zero-based
+        ilays = self.recordarray['ilay'] - 1
+        nbytes = self.realtype(1).nbytes
+        for k in np.unique(kij[:, 0]):
+            istat = np.where(kij[:, 0] == k)[0]
+            irecs = np.where(ilays == k)[0]
+            knodes = nodes[istat]
+            if self._mmdata is not None:
+                data = self._mmdata.reshape(self._mmdata.shape[0], -1)
+                result[itims[irecs, None], istat[None, :] + 1] = \
+                    data[irecs[:, None], knodes[None, :]]
+                continue
+
+            # read the span of values containing the requested cells
+            n0 = knodes.min()
+            nval = knodes.max() - n0 + 1
+            for irec in irecs:
+                ipos = np.int64(self.iposarray[irec])
+                self.file.seek(ipos + n0 * nbytes, 0)
+                data = binaryread(self.file, self.realtype, shape=(nval,))
+                result[itims[irec], istat + 1] = data[knodes - n0]
         return result
 
 
@@ -414,6 +574,11 @@ class HeadFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    memmap : bool
+        Memory-map the file so that get_data() and get_alldata() return
+        read-only views into the file instead of copies.  Views are only
+        returned if all records in the file have the same size.  Default
+        is False.
 
     Attributes
     ----------
@@ -448,6 +613,9 @@ class HeadFile(BinaryLayerFile):
     >>> ddnobj.list_records()
     >>> rec = ddnobj.get_data(totim=100.)
 
+    >>> hdobj = bf.HeadFile('model.hds', memmap=True)
+    >>> heads = hdobj.get_alldata(nodata=None)
+
 
     """
 
@@ -481,6 +649,11 @@ class UcnFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    memmap : bool
+        Memory-map the file so that get_data() and get_alldata() return
+        read-only views into the file instead of copies.  Views are only
+        returned if all records in the file have the same size.  Default
+        is False.
 
     Attributes
     ----------
@@ -541,6 +714,12 @@ class CellBudgetFile(object):
         'single' or 'double'.  Default is 'single'.
     verbose : bool
         Write information to the screen.  Default is False.
+    cache_index : bool
+        Save the record index to a '<filename>.cbcidx' file next to the
+        cell budget file and reuse it the next time the file is opened.
+        The cached index is rebuilt automatically if the size or
+        modification time of the cell budget file changes.  Default is
+        False.
 
     Attributes
     ----------
@@ -562,6 +741,8 @@ class CellBudgetFile(object):
     >>> cbb.list_records()
     >>> rec = cbb.get_data(kstpkper=(0,0), text='RIVER LEAKAGE')
 
+    >>> cbb = bf.CellBudgetFile('mymodel.cbb', cache_index=True)
+
     """
 
     def __init__(self, filename, precision='single', verbose=False, **kwargs):
@@ -608,6 +789,7 @@ class CellBudgetFile(object):
 
         self.dis = None
         self.sr = None
+        self.cache_index = kwargs.pop('cache_index', False)
         if 'model' in kwargs.keys():
             self.model = kwargs.pop('model')
             self.sr = self.model.sr
@@ -679,27 +861,121 @@ class CellBudgetFile(object):
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
         self.file.seek(0, 0)
-        self.recorddict = OrderedDict()
+
+        # read the index from the cache file or scan the budget file
+        if not self._load_index_cache():
+            self._scan_index()
+            if self.cache_index:
+                self._save_index_cache()
+
+        # set times for records without totim
+        totim = self.recordarray['totim']
+        izero = np.where(totim == 0)[0]
+        if izero.shape[0] > 0:
+            kk = np.column_stack((self.recordarray['kstp'][izero],
+                                  self.recordarray['kper'][izero]))
+            kk, inverse = np.unique(kk, axis=0, return_inverse=True)
+            kktotim = np.array([self._totim_from_kstpkper((kstp - 1,
+                                                           kper - 1))
+                                for kstp, kper in kk])
+            totim[izero] = kktotim[inverse.ravel()]
+
+        # unique times, kstpkper, text and package names in the order
+        # they appear in the file
+        itimes = np.where(totim >= 0)[0]
+        itimes = itimes[self._first_unique(totim[itimes])]
+        self.times = list(totim[itimes])
+        kstp = self.recordarray['kstp']
+        kper = self.recordarray['kper']
+        ikk = self._first_unique(np.column_stack((kstp, kper)))
+        self.kstpkper = list(zip(kstp[ikk], kper[ikk]))
+        itext = self._first_unique(self.recordarray['text'])
+        self.textlist = list(self.recordarray['text'][itext])
+        self.imethlist = list(self.recordarray['imeth'][itext])
+        ipaknam = self._first_unique(self.recordarray['paknam'])
+        self.paknamlist = list(self.recordarray['paknam'][ipaknam])
+
+        # store record and byte position mapping
+        self.nrecords = self.recordarray.shape[0]
+        self.recorddict = OrderedDict(zip(self.recordarray.tolist(),
+                                          self.iposarray.tolist()))
+        self.nper = self.recordarray["kper"].max()
+
+        # map kstpkper, totim and text to record numbers
+        self._kstpkperindex = self._build_record_index(
+            np.column_stack((kstp, kper)))
+        self._totimindex = self._build_record_index(totim)
+        self._textindex = self._build_record_index(self.recordarray['text'])
+        self._text16 = {}
+        self._paknam16 = {}
+        return
+
+    @staticmethod
+    def _build_record_index(keys):
+        """
+        Build a dictionary that maps each unique value (or row, for
+        two-dimensional arrays) in keys to an array of the zero-based record
+        numbers with that value.
+
+        """
+        if keys.ndim > 1:
+            ukeys, inverse = np.unique(keys, axis=0, return_inverse=True)
+            ukeys = [tuple(key) for key in ukeys.tolist()]
+        else:
+            ukeys, inverse = np.unique(keys, return_inverse=True)
+            ukeys = ukeys.tolist()
+        inverse = inverse.ravel()
+        irecs = np.argsort(inverse, kind='mergesort')
+        isplit = np.cumsum(np.bincount(inverse))[:-1]
+        return dict(zip(ukeys, np.split(irecs, isplit)))
+
+    def _select_indices(self, index, key, text16=None, paknam16=None):
+        """
+        Get the record numbers for key from a record index, optionally
+        limited to records with the text16 and paknam16 names.
+
+        """
+        select_indices = index.get(key, np.array([], dtype=np.int64))
+        if text16 is not None:
+            select_indices = select_indices[
+                self.recordarray['text'][select_indices] == text16]
+        if paknam16 is not None:
+            select_indices = select_indices[
+                self.recordarray['paknam'][select_indices] == paknam16]
+        return select_indices
+
+    def _totim_key(self, totim):
+        """
+        Convert totim to the precision of the totim values in the budget
+        file so it can be used to look up records in the totim index.
+
+        """
+        return float(self.recordarray.dtype['totim'].type(totim))
+
+    @staticmethod
+    def _first_unique(a):
+        """
+        Return the indices of the first occurrence of each unique value
+        (or row, for two-dimensional arrays) in a, in the order they
+        appear in a.
+
+        """
+        if a.ndim > 1:
+            _, idx = np.unique(a, axis=0, return_index=True)
+        else:
+            _, idx = np.unique(a, return_index=True)
+        return np.sort(idx)
+
+    def _scan_index(self):
+        """
+        Build the recordarray, iposarray and iposheader by reading through
+        every header in the binary file.
+
+        """
         ipos = 0
         while ipos < self.totalbytes:
             self.iposheader.append(ipos)
             header = self._get_header()
-            self.nrecords += 1
-            totim = header['totim']
-            if totim == 0:
-                totim = self._totim_from_kstpkper(
-                    (header["kstp"] - 1, header["kper"] - 1))
-                header["totim"] = totim
-            if totim >= 0 and totim not in self.times:
-                self.times.append(totim)
-            kstpkper = (header['kstp'], header['kper'])
-            if kstpkper not in self.kstpkper:
-                self.kstpkper.append(kstpkper)
-            if header['text'] not in self.textlist:
-                self.textlist.append(header['text'])
-                self.imethlist.append(header['imeth'])
-            if header['paknam'] not in self.paknamlist:
-                self.paknamlist.append(header['paknam'])
             ipos = self.file.tell()
 
             if self.verbose:
@@ -716,9 +992,6 @@ class CellBudgetFile(object):
                         int(header['imeth']) != 7:
                     print('')
 
-            # store record and byte position mapping
-            self.recorddict[
-                tuple(header)] = ipos  # store the position right after header2
             self.recordarray.append(header)
             self.iposarray.append(
                 ipos)  # store the position right after header2
@@ -731,7 +1004,68 @@ class CellBudgetFile(object):
         self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
         self.iposheader = np.array(self.iposheader, dtype=np.int64)
         self.iposarray = np.array(self.iposarray, dtype=np.int64)
-        self.nper = self.recordarray["kper"].max()
+        return
+
+    def _get_index_cache_key(self):
+        """
+        Return the size and modification time of the binary file, which
+        are used to determine if the index cache file is current.
+
+        """
+        fstat = os.stat(self.filename)
+        return np.array([fstat.st_size, fstat.st_mtime_ns], dtype=np.int64)
+
+    def _load_index_cache(self):
+        """
+        Load the recordarray, iposarray and iposheader from the index cache
+        file.
+
+        Returns
+        -------
+        success : bool
+            False if index caching is not enabled or if the index cache file
+            does not exist or is out of date.
+
+        """
+        if not self.cache_index:
+            return False
+        fpth = '{}.cbcidx'.format(self.filename)
+        if not os.path.isfile(fpth):
+            return False
+        try:
+            with np.load(fpth, allow_pickle=False) as cache:
+                key = cache['key']
+                recordarray = cache['recordarray']
+                iposarray = cache['iposarray']
+                iposheader = cache['iposheader']
+        except Exception:
+            return False
+        if not np.array_equal(key, self._get_index_cache_key()) or \
+                recordarray.dtype != self.header_dtype:
+            return False
+        if self.verbose:
+            print('loading record index from {}'.format(fpth))
+        self.recordarray = recordarray
+        self.iposarray = iposarray
+        self.iposheader = iposheader
+        return True
+
+    def _save_index_cache(self):
+        """
+        Save the recordarray, iposarray and iposheader to the index cache
+        file.
+
+        """
+        fpth = '{}.cbcidx'.format(self.filename)
+        try:
+            with open(fpth, 'wb') as f:
+                np.savez(f, key=self._get_index_cache_key(),
+                         recordarray=self.recordarray,
+                         iposarray=self.iposarray,
+                         iposheader=self.iposheader)
+        except (IOError, OSError) as e:
+            msg = 'Could not write record index to {}: {}'.format(fpth, e)
+            warnings.warn(msg)
         return
 
     def _skip_record(self, header):
@@ -825,10 +1159,13 @@ class CellBudgetFile(object):
                 ttext = text.decode()
             else:
                 ttext = text
-            for t in self.textlist:
-                if ttext.upper() in t.decode():
-                    text16 = t
-                    break
+            text16 = self._text16.get(ttext.upper())
+            if text16 is None:
+                for t in self.textlist:
+                    if ttext.upper() in t.decode():
+                        text16 = t
+                        self._text16[ttext.upper()] = t
+                        break
             if text16 is None:
                 errmsg = 'The specified text string is not in the budget file.'
                 raise Exception(errmsg)
@@ -846,10 +1183,13 @@ class CellBudgetFile(object):
                 tpaknam = paknam.decode()
             else:
                 tpaknam = paknam
-            for t in self._unique_package_names():
-                if tpaknam.upper() in t.decode():
-                    paknam16 = t
-                    break
+            paknam16 = self._paknam16.get(tpaknam.upper())
+            if paknam16 is None:
+                for t in self._unique_package_names():
+                    if tpaknam.upper() in t.decode():
+                        paknam16 = t
+                        self._paknam16[tpaknam.upper()] = t
+                        break
             if paknam16 is None:
                 errmsg = 'The specified package name string is not ' + \
                          'in the budget file.'
@@ -985,9 +1325,7 @@ class CellBudgetFile(object):
         # check and make sure that text is in file
         if text is not None:
             text16 = self._find_text(text)
-            select_indices = np.where((self.recordarray['text'] == text16))
-            if isinstance(select_indices, tuple):
-                select_indices = select_indices[0]
+            select_indices = self._textindex[text16]
         else:
             select_indices = None
         return select_indices
@@ -1082,46 +1420,16 @@ class CellBudgetFile(object):
         if kstpkper is not None:
             kstp1 = kstpkper[0] + 1
             kper1 = kstpkper[1] + 1
-            if text is None and paknam is None:
-                select_indices = np.where(
-                    (self.recordarray['kstp'] == kstp1) &
-                    (self.recordarray['kper'] == kper1))
-            else:
-                if paknam is None and text is not None:
-                    select_indices = np.where(
-                        (self.recordarray['kstp'] == kstp1) &
-                        (self.recordarray['kper'] == kper1) &
-                        (self.recordarray['text'] == text16))
-                elif text is None and paknam is not None:
-                    select_indices = np.where(
-                        (self.recordarray['kstp'] == kstp1) &
-                        (self.recordarray['kper'] == kper1) &
-                        (self.recordarray['paknam'] == paknam16))
-                else:
-                    select_indices = np.where(
-                        (self.recordarray['kstp'] == kstp1) &
-                        (self.recordarray['kper'] == kper1) &
-                        (self.recordarray['text'] == text16) &
-                        (self.recordarray['paknam'] == paknam16))
+            select_indices = self._select_indices(self._kstpkperindex,
+                                                  (kstp1, kper1),
+                                                  text16=text16,
+                                                  paknam16=paknam16)
 
         elif totim is not None:
-            if text is None and paknam is None:
-                select_indices = np.where(
-                    (self.recordarray['totim'] == totim))
-            else:
-                if paknam is None and text is not None:
-                    select_indices = np.where(
-                        (self.recordarray['totim'] == totim) &
-                        (self.recordarray['text'] == text16))
-                elif text is None and paknam is not None:
-                    select_indices = np.where(
-                        (self.recordarray['totim'] == totim) &
-                        (self.recordarray['paknam'] == paknam16))
-                else:
-                    select_indices = np.where(
-                        (self.recordarray['totim'] == totim) &
-                        (self.recordarray['text'] == text16) &
-                        (self.recordarray['paknam'] == paknam16))
+            select_indices = self._select_indices(self._totimindex,
+                                                  self._totim_key(totim),
+                                                  text16=text16,
+                                                  paknam16=paknam16)
 
         # allow for idx to be a list or a scalar
         elif idx is not None:
@@ -1132,7 +1440,7 @@ class CellBudgetFile(object):
 
         # case where only text is entered
         elif text is not None:
-            select_indices = np.where((self.recordarray['text'] == text16))
+            select_indices = self._textindex[text16]
 
         else:
             raise TypeError(
@@ -1522,7 +1830,8 @@ class CellBudgetFile(object):
         residual = np.zeros((nlay, nrow, ncol), dtype=np.float)
         if scaled:
             inflow = np.zeros((nlay, nrow, ncol), dtype=np.float)
-        select_indices = np.where((self.recordarray['totim'] == totim))[0]
+        select_indices = self._select_indices(self._totimindex,
+                                              self._totim_key(totim))
 
         for i in select_indices:
             text = self.recordarray[i]['text'].decode()
@@ -352,6 +352,187 @@ class Point:
         ax.set_ylim(ymin - 1, ymax + 1)
 
 
+class PolygonIndex:
+    def __init__(self, xvertices, yvertices, rtol=1e-9):
+        """
+        Packed bounding box index of a collection of polygons (e.g. the
+        cells of a vertex grid) for finding the polygons that contain
+        many points at once.
+
+        Parameters
+        ----------
+        xvertices : list of array-like
+            x-coordinates of the vertices of each polygon
+        yvertices : list of array-like
+            y-coordinates of the vertices of each polygon
+        rtol : float
+            points within rtol times the largest side of the extent of the
+            polygons from a polygon edge are on the edge (default is 1e-9),
+            so that points on an edge stay on it after a coordinate
+            transformation
+
+        Notes
+        -----
+        The polygon bounding boxes are binned on a regular grid with about
+        one bin per polygon, and the polygon numbers in each bin are stored
+        in a single packed array.  Points are located in their bin and only
+        tested against the polygons whose bounding boxes cover the bin.
+
+        """
+        npoly = len(xvertices)
+        nverts = np.array([len(xv) for xv in xvertices], dtype=int)
+        self.npolygons = npoly
+
+        # pad the rings with their first vertex so that every ring is
+        # closed and has the same number of vertices
+        nv = nverts.max() + 1 if npoly > 0 else 1
+        self._xv = np.empty((npoly, nv), dtype=float)
+        self._yv = np.empty((npoly, nv), dtype=float)
+        for ip, (xv, yv) in enumerate(zip(xvertices, yvertices)):
+            n = nverts[ip]
+            self._xv[ip, :n] = xv
+            self._yv[ip, :n] = yv
+            self._xv[ip, n:] = self._xv[ip, 0]
+            self._yv[ip, n:] = self._yv[ip, 0]
+
+        self.xmin = self._xv.min(axis=1)
+        self.xmax = self._xv.max(axis=1)
+        self.ymin = self._yv.min(axis=1)
+        self.ymax = self._yv.max(axis=1)
+        if npoly > 0:
+            self.extent = (self.xmin.min(), self.xmax.max(),
+                           self.ymin.min(), self.ymax.max())
+        else:
+            self.extent = (0., 0., 0., 0.)
+        self.tolerance = rtol * max(self.extent[1] - self.extent[0],
+                                    self.extent[3] - self.extent[2])
+
+        # regular grid of bins covering the extent
+        x0, x1, y0, y1 = self.extent
+        nbin = max(int(np.sqrt(npoly)), 1)
+        self._nbx = nbin if x1 > x0 else 1
+        self._nby = nbin if y1 > y0 else 1
+        self._dx = (x1 - x0) / self._nbx if x1 > x0 else 1.
+        self._dy = (y1 - y0) / self._nby if y1 > y0 else 1.
+
+        # pack the polygon numbers of each bin, in ascending order
+        ix0, iy0 = self._get_bins(self.xmin, self.ymin)
+        ix1, iy1 = self._get_bins(self.xmax, self.ymax)
+        nx = ix1 - ix0 + 1
+        ny = iy1 - iy0 + 1
+        count = nx * ny
+        poly = np.repeat(np.arange(npoly), count)
+        offset = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count,
+                                                    count)
+        bins = (np.repeat(iy0, count) + offset // np.repeat(nx, count)) * \
+            self._nbx + np.repeat(ix0, count) + offset % np.repeat(nx, count)
+        order = np.argsort(bins, kind='mergesort')
+        self._bin_polygons = poly[order]
+        self._bin_start = np.zeros(self._nbx * self._nby + 1, dtype=int)
+        self._bin_start[1:] = np.cumsum(
+            np.bincount(bins, minlength=self._nbx * self._nby))
+
+    def _get_bins(self, x, y):
+        x0, x1, y0, y1 = self.extent
+        ix = np.clip(((x - x0) / self._dx).astype(int), 0, self._nbx - 1)
+        iy = np.clip(((y - y0) / self._dy).astype(int), 0, self._nby - 1)
+        return ix, iy
+
+    def query(self, x, y, chunksize=100000):
+        """
+        Find the polygon that contains each point.
+
+        Parameters
+        ----------
+        x : array-like
+            x-coordinates of the points
+        y : array-like
+            y-coordinates of the points
+        chunksize : int
+            number of points tested at a time, limits the memory used for
+            the point and candidate polygon pairs (default is 100000)
+
+        Returns
+        -------
+        polygons : numpy.ndarray
+            polygon number of each point, -1 for points that are not in any
+            polygon.  points on the boundary of a polygon, within the
+            tolerance of the index, are in the polygon, a point on an edge
+            shared by several polygons is in the polygon with the lowest
+            number.
+
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if x.shape != y.shape:
+            raise ValueError('x and y must have the same number of points')
+        polygons = np.full(x.shape, -1, dtype=int)
+        for i0 in range(0, len(x), chunksize):
+            i1 = min(i0 + chunksize, len(x))
+            polygons[i0:i1] = self._query_chunk(x[i0:i1], y[i0:i1])
+        return polygons
+
+    def _query_chunk(self, x, y):
+        polygons = np.full(x.shape, -1, dtype=int)
+        x0, x1, y0, y1 = self.extent
+        tol = self.tolerance
+        inside = (x >= x0 - tol) & (x <= x1 + tol) & \
+                 (y >= y0 - tol) & (y <= y1 + tol)
+        points = np.flatnonzero(inside)
+        if len(points) == 0 or self.npolygons == 0:
+            return polygons
+
+        # candidate point and polygon pairs from the bins
+        ix, iy = self._get_bins(x[points], y[points])
+        bins = iy * self._nbx + ix
+        start = self._bin_start[bins]
+        count = self._bin_start[bins + 1] - start
+        point = np.repeat(points, count)
+        offset = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count,
+                                                    count)
+        poly = self._bin_polygons[np.repeat(start, count) + offset]
+
+        # bounding box test
+        px = x[point]
+        py = y[point]
+        keep = (px >= self.xmin[poly] - tol) & \
+               (px <= self.xmax[poly] + tol) & \
+               (py >= self.ymin[poly] - tol) & (py <= self.ymax[poly] + tol)
+        point, poly, px, py = point[keep], poly[keep], px[keep], py[keep]
+
+        # ray casting test, points within the tolerance of an edge are
+        # inside
+        contains = np.zeros(len(point), dtype=bool)
+        on_edge = np.zeros(len(point), dtype=bool)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for iv in range(self._xv.shape[1] - 1):
+                xa = self._xv[poly, iv]
+                ya = self._yv[poly, iv]
+                xb = self._xv[poly, iv + 1]
+                yb = self._yv[poly, iv + 1]
+                crosses = ((ya > py) != (yb > py)) & \
+                    (px < (xb - xa) * (py - ya) / (yb - ya) + xa)
+                contains ^= crosses
+                dx = xb - xa
+                dy = yb - ya
+                length2 = dx * dx + dy * dy
+                t = np.where(length2 > 0.,
+                             ((px - xa) * dx + (py - ya) * dy) / length2, 0.)
+                t = np.clip(t, 0., 1.)
+                on_edge |= (px - xa - t * dx) ** 2 + \
+                    (py - ya - t * dy) ** 2 <= tol * tol
+        contains |= on_edge
+
+        # pairs are sorted by point and polygon number, keep the first
+        # polygon that contains each point
+        point = point[contains]
+        poly = poly[contains]
+        first = np.ones(len(point), dtype=bool)
+        first[1:] = point[1:] != point[:-1]
+        polygons[point[first]] = poly[first]
+        return polygons
+
+
 def rotate(x, y, xoff, yoff, angrot_radians):
     """
     Given x and y array-like values calculate the rotation about an
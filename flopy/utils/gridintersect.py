@@ -1,6 +1,6 @@
 import numpy as np
 
-from .geometry import transform
+from .geometry import transform, PolygonIndex
 
 try:
     import shapely
@@ -29,6 +29,9 @@ class GridIntersect:
        bounding box of the shape covers nearly the entire grid, the query
        won't be able to limit the search space much resulting in slower
        performance.
+     - To find the cells of many points (e.g. particle endpoints or well
+       locations) use intersect_points, which takes arrays of coordinates
+       and does not build shapely geometries.
 
     """
 
@@ -190,6 +193,95 @@ class GridIntersect:
         shapelist.sort(key=sort_key)
         return shapelist
 
+    def intersect_points(self, x, y):
+        """
+        Find the grid cells of many points at once.
+
+        Points on the boundary of a cell are in the cell, a point on an edge
+        shared by several cells is in the cell with the lowest cellid, as
+        for intersect_point.
+
+        Parameters
+        ----------
+        x : array-like
+            x-coordinates of the points
+        y : array-like
+            y-coordinates of the points
+
+        Returns
+        -------
+        cellids : tuple of numpy.ndarray or numpy.ndarray
+            for structured grids a tuple with the row and column of each
+            point, for vertex grids the cell number of each point.  points
+            outside of the grid have a cellid of -1.
+
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if x.shape != y.shape:
+            raise ValueError('x and y must have the same number of points')
+        if self.mfgrid.grid_type == "structured":
+            return self._intersect_points_structured(x, y)
+        elif self.mfgrid.grid_type == "vertex":
+            return self._intersect_points_vertex(x, y)
+        raise NotImplementedError()
+
+    def _intersect_points_structured(self, x, y):
+        """
+        internal method, find the row and column of many points in a
+        structured grid
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            x-coordinates of the points
+        y : numpy.ndarray
+            y-coordinates of the points
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            row and column of each point, -1 outside of the grid
+
+        """
+        # if grid is rotated or offset transform points to local coords
+        if (self.mfgrid.angrot != 0. or self.mfgrid.xoffset != 0.
+                or self.mfgrid.yoffset != 0.):
+            x, y = transform(x, y, self.mfgrid.xoffset,
+                             self.mfgrid.yoffset,
+                             self.mfgrid.angrot_radians, inverse=True)
+        Xe, Ye = self.mfgrid.xyedges
+        jpos = ModflowGridIndices.find_positions_in_array(Xe, x)
+        ipos = ModflowGridIndices.find_positions_in_array(Ye, y)
+        outside = (ipos < 0) | (jpos < 0)
+        ipos[outside] = -1
+        jpos[outside] = -1
+        return ipos, jpos
+
+    def _intersect_points_vertex(self, x, y):
+        """
+        internal method, find the cell number of many points in a vertex
+        grid with a packed bounding box index of the cells, which is built
+        the first time it is needed
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            x-coordinates of the points
+        y : numpy.ndarray
+            y-coordinates of the points
+
+        Returns
+        -------
+        numpy.ndarray
+            cell number of each point, -1 outside of the grid
+
+        """
+        if getattr(self, '_polygon_index', None) is None:
+            self._polygon_index = PolygonIndex(self.mfgrid.xvertices,
+                                               self.mfgrid.yvertices)
+        return self._polygon_index.query(x, y)
+
     def _intersect_point_shapely(self, shp, sort_by_cellid=True):
         """
         intersect grid with Point or MultiPoint
@@ -199,7 +291,9 @@ class GridIntersect:
         shp : Point or MultiPoint
             shapely Point or MultiPoint to intersect with grid. Note,
             it is generally faster to loop over a MultiPoint and intersect
-            per point than to intersect a MultiPoint directly.
+            per point than to intersect a MultiPoint directly, and much
+            faster to pass the coordinates of many points to
+            intersect_points.
         sort_by_cellid : bool, optional
             flag whether to sort cells by id, used to ensure node
             with lowest id is returned, by default True
@@ -1262,6 +1356,32 @@ class ModflowGridIndices:
 
         return jpos
 
+    @staticmethod
+    def find_positions_in_array(arr, x):
+        """
+        Vectorized version of find_position_in_array.  If arr has the
+        coordinates of the cell edges, return the index of the cell
+        containing each x, the lowest index for x on a shared edge and -1
+        for x outside of arr.
+
+        Parameters
+        ----------
+        arr : A one dimensional array (such as Xe) that contains
+            coordinates of the cell edges, increasing or decreasing.
+
+        x : numpy.ndarray
+            The positions to find in arr.
+        """
+        arr = np.asarray(arr, dtype=float)
+        x = np.asarray(x, dtype=float)
+        if arr[-1] < arr[0]:
+            arr = -arr
+            x = -x
+        # cell j contains x when arr[j] <= x <= arr[j + 1]
+        pos = np.searchsorted(arr[1:], x, side='left')
+        pos[(x < arr[0]) | (x > arr[-1]) | np.isnan(x)] = -1
+        return pos
+
     @staticmethod
     def kij_from_nodenumber(nodenumber, nlay, nrow, ncol):
         """
@@ -6,6 +6,7 @@ recarrays, which can then be easily plotted.
 """
 
 import collections
+import mmap
 import os
 import re
 from datetime import timedelta
@@ -34,11 +35,17 @@ class ListBudget(object):
     through derived classes: MfListBudget (MODFLOW), SwtListBudget (SEAWAT)
     and SwrListBudget (MODFLOW with the SWR process)
 
+    The list file is memory mapped and read in a single forward pass that
+    extracts each budget table together with the time summary that follows
+    it.  Budget entries appended to the list file after it was loaded (for
+    example while the model is still running) can be read with refresh().
+
     Examples
     --------
     >>> mf_list = MfListBudget("my_model.list")
     >>> incremental, cumulative = mf_list.get_budget()
     >>> df_in, df_out = mf_list.get_dataframes(start_datetime="10-21-2015")
+    >>> nnew = mf_list.refresh()
 
     """
 
@@ -48,7 +55,7 @@ class ListBudget(object):
         assert os.path.exists(file_name), "file_name {0} not found".format(
             file_name)
         self.file_name = file_name
-        self.f = open(file_name, 'r', encoding='ascii', errors='replace')
+        self._mm = None
 
         self.tssp_lines = 0
 
@@ -64,6 +71,11 @@ class ListBudget(object):
         self.entries = []
         self.null_entries = []
 
+        # byte offset following the last complete budget entry and the
+        # number of records read up to that offset, used by refresh()
+        self._offset = 0
+        self._ncomplete = 0
+
         self.time_line_idx = 20
         if timeunit.upper() == 'SECONDS':
             self.timeunit = 'S'
@@ -91,9 +103,6 @@ class ListBudget(object):
         if len(self.idx_map) > 0:
             self._isvalid = True
 
-        # Close the open file
-        self.f.close()
-
         # return
         return
 
@@ -117,6 +126,49 @@ class ListBudget(object):
         """
         return self._isvalid
 
+    def refresh(self):
+        """
+        Read budget entries that were appended to the list file since it
+        was loaded or last refreshed.  Only the part of the file following
+        the last complete budget entry is parsed.  A trailing entry that
+        was only partially written is replaced when it is read again.
+
+        Returns
+        -------
+        out : int
+            Number of budget entries added.
+
+        Examples
+        --------
+        >>> mf_list = MfListBudget('my_model.list')
+        >>> nnew = mf_list.refresh()
+        >>> incremental, cumulative = mf_list.get_budget()
+
+        """
+        nold = len(self.idx_map)
+
+        # drop entries that were incomplete when last read
+        ncomplete = self._ncomplete
+        if nold > ncomplete:
+            self.idx_map = self.idx_map[:ncomplete]
+            self.inc = self.inc[:ncomplete]
+            self.cum = self.cum[:ncomplete]
+
+        # start over if the file was replaced by a shorter file
+        if os.path.getsize(self.file_name) < self._offset:
+            self.idx_map = []
+            self.entries = []
+            self.null_entries = []
+            self._offset = 0
+            self._ncomplete = 0
+            for attr in ('inc', 'cum'):
+                if hasattr(self, attr):
+                    delattr(self, attr)
+
+        self._load()
+        self._isvalid = len(self.idx_map) > 0
+        return len(self.idx_map) - nold
+
     def get_record_names(self):
         """
         Get a list of water budget record names in the file.
@@ -273,23 +325,24 @@ class ListBudget(object):
         if not self._isvalid:
             return None
 
-        # reopen the file
-        self.f = open(self.file_name, 'r', encoding='ascii', errors='replace')
         units = units.lower()
         if not units == 'seconds' and not units == 'minutes' and not units == 'hours':
             raise (
                 '"units" input variable must be "minutes", "hours", or "seconds": {0} was specified'.format(
                     units))
+        # reopen the file
+        self._open()
         try:
             seekpoint = self._seek_to_string('Elapsed run time:')
         except:
             print('Elapsed run time not included in list file. Returning NaN')
+            self._close()
             return np.nan
 
-        self.f.seek(seekpoint)
-        line = self.f.readline()
+        self._mm.seek(seekpoint)
+        line = self._readline()
 
-        self.f.close()
+        self._close()
         # yank out the floating point values from the Elapsed run time string
         times = list(map(float, re.findall(r'[+-]?[0-9.]+', line)))
         # pad an array with zeros and times with [days, hours, minutes, seconds]
@@ -524,10 +577,10 @@ class ListBudget(object):
         """
 
         # Ensure list file exists
-        if not os.path.isfile(self.f.name):
+        if not os.path.isfile(self.file_name):
             raise FileNotFoundError(errno.ENOENT,
                                     os.strerror(errno.ENOENT),
-                                    self.f.name)
+                                    self.file_name)
 
         # Eval based on model list type
         if isinstance(self, MfListBudget):
@@ -535,7 +588,7 @@ class ListBudget(object):
             # to list file
             sCheck = 'WELLS WITH REDUCED PUMPING WILL BE REPORTED ' +\
                      'TO THE MAIN LISTING FILE'
-            assert open(self.f.name).read().find(sCheck) > 0,\
+            assert open(self.file_name).read().find(sCheck) > 0,\
                 'Pumping reductions not written to list file. ' +\
                 'Try removing "noprint" keyword from well file.'
 
@@ -556,7 +609,7 @@ class ListBudget(object):
             sCheck = 'WELL REDUCTION INFO WILL BE WRITTEN TO UNIT:'
             bLstUnit = False
             bRdcdPpg = False
-            for l in open(self.f.name):
+            for l in open(self.file_name):
                 # Assumes LST unit always first
                 if 'UNIT' in l and not bLstUnit:
                     iLstUnit = int(l.strip().split()[-1])
@@ -590,7 +643,7 @@ class ListBudget(object):
             raise NotImplementedError(msg)
 
         # Iterate through list file to read in reduced ppg info
-        f = open(self.f.name)
+        f = open(self.file_name)
         lsData = []
         while True:
             l = f.readline()
@@ -619,36 +672,92 @@ class ListBudget(object):
         return(np.rec.fromrecords([tuple(x) for x in lsData],
                                   dtype=dtype))
 
-    def _build_index(self, maxentries):
-        self.idx_map = self._get_index(maxentries)
+    def _open(self):
+        """
+        Open a read-only memory map of the list file.
+
+        """
+        self._close()
+        with open(self.file_name, 'rb') as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be memory mapped
+                self._mm = None
+        return
+
+    def _close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
         return
 
-    def _get_index(self, maxentries):
-        # --parse through the file looking for matches and parsing ts and sp
-        idxs = []
-        l_count = 1
+    def _readline(self):
+        return self._mm.readline().decode('ascii', errors='replace')
+
+    def _read_entries(self, maxentries=None):
+        """
+        Read the budget tables and time summaries in the list file in a
+        single forward pass, starting after the last complete entry.
+
+        Parameters
+        ----------
+        maxentries : int
+            Maximum number of entries to read.  (default is None)
+
+        Returns
+        -------
+        records : list
+            (ts, sp, seekpoint, incdict, cumdict, totim, end) for each
+            budget entry, where end is the byte offset following the
+            entry or None if the entry is incomplete.
+
+        """
+        records = []
+        mm = self._mm
+        if mm is None:
+            return records
+        budgetkey = self.budgetkey.encode('ascii')
+        pos = self._offset
         while True:
-            seekpoint = self.f.tell()
-            line = self.f.readline()
-            if line == '':
+            idx = mm.find(budgetkey, pos)
+            if idx < 0:
                 break
-            if self.budgetkey in line:
-                for l in range(self.tssp_lines):
-                    line = self.f.readline()
-                try:
-                    ts, sp = self._get_ts_sp(line)
-                except:
-                    print('unable to cast ts,sp on line number', l_count,
-                          ' line: ', line)
-                    break
-                # print('info found for timestep stress period',ts,sp)
-
-                idxs.append([ts, sp, seekpoint])
+            seekpoint = mm.rfind(b'\n', 0, idx) + 1
+            mm.seek(seekpoint)
+            line = self._readline()
+            for l in range(self.tssp_lines):
+                line = self._readline()
+            try:
+                ts, sp = self._get_ts_sp(line)
+            except:
+                print('unable to cast ts,sp on line number',
+                      mm[:seekpoint].count(b'\n') + 1, ' line: ', line)
+                break
+            pos = mm.tell()
 
-                if maxentries and len(idxs) >= maxentries:
-                    break
+            try:
+                tinc, tcum = self._get_sp(ts, sp, seekpoint)
+            except:
+                if len(self.entries) > 0:
+                    raise
+                raise Exception('unable to read budget information from '
+                                'first entry in list file')
+            if len(self.entries) < 1:
+                self._set_entries(tinc)
+
+            # the time summary follows the budget table
+            tspoint = self._seek_to_string('TIME SUMMARY AT END')
+            tslen, sptim, totim = self._get_totim(ts, sp, tspoint)
+            end = mm.tell()
+            if np.isnan(totim) or mm[end - 1:end] != b'\n':
+                end = None
+            records.append((ts, sp, seekpoint, tinc, tcum, totim, end))
+
+            if maxentries and len(records) >= maxentries:
+                break
 
-        return idxs
+        return records
 
     def _seek_to_string(self, s):
         """
@@ -664,14 +773,10 @@ class ListBudget(object):
             Next location of the string
 
         """
-        while True:
-            seekpoint = self.f.tell()
-            line = self.f.readline()
-            if line == '':
-                break
-            if s in line:
-                break
-        return seekpoint
+        idx = self._mm.find(s.encode('ascii'), self._mm.tell())
+        if idx < 0:
+            return len(self._mm)
+        return self._mm.rfind(b'\n', 0, idx) + 1
 
     def _get_ts_sp(self, line):
         """
@@ -698,50 +803,24 @@ class ListBudget(object):
 
         return ts, sp
 
-    def _set_entries(self):
-        if len(self.idx_map) < 1:
-            return None, None
+    def _set_entries(self, incdict):
         if len(self.entries) > 0:
             raise Exception('entries already set:' + str(self.entries))
-        if not self.idx_map:
-            raise Exception('must call build_index before call set_entries')
-        try:
-            incdict, cumdict = self._get_sp(self.idx_map[0][0],
-                                            self.idx_map[0][1],
-                                            self.idx_map[0][2])
-        except:
-            raise Exception('unable to read budget information from first '
-                            'entry in list file')
         self.entries = incdict.keys()
         null_entries = collections.OrderedDict()
-        incdict = collections.OrderedDict()
-        cumdict = collections.OrderedDict()
         for entry in self.entries:
-            incdict[entry] = []
-            cumdict[entry] = []
             null_entries[entry] = np.NaN
         self.null_entries = [null_entries, null_entries]
-        return incdict, cumdict
+        return
 
     def _load(self, maxentries=None):
-        self._build_index(maxentries)
-        incdict, cumdict = self._set_entries()
-        if incdict is None and cumdict is None:
+        self._open()
+        try:
+            records = self._read_entries(maxentries)
+        finally:
+            self._close()
+        if len(records) < 1:
             return
-        totim = []
-        for ts, sp, seekpoint in self.idx_map:
-            tinc, tcum = self._get_sp(ts, sp, seekpoint)
-            for entry in self.entries:
-                incdict[entry].append(tinc[entry])
-                cumdict[entry].append(tcum[entry])
-
-            # Get the time for this record
-            seekpoint = self._seek_to_string('TIME SUMMARY AT END')
-            tslen, sptim, tt = self._get_totim(ts, sp, seekpoint)
-            totim.append(tt)
-
-        # get kstp and kper
-        idx_array = np.array(self.idx_map)
 
         # build dtype for recarray
         dtype_tups = [('totim', np.float32), ("time_step", np.int32),
@@ -751,32 +830,46 @@ class ListBudget(object):
         dtype = np.dtype(dtype_tups)
 
         # create recarray
-        nentries = len(incdict[entry])
-        self.inc = np.recarray(shape=(nentries,), dtype=dtype)
-        self.cum = np.recarray(shape=(nentries,), dtype=dtype)
+        nentries = len(records)
+        inc = np.recarray(shape=(nentries,), dtype=dtype)
+        cum = np.recarray(shape=(nentries,), dtype=dtype)
 
         # fill each column of the recarray
         for entry in self.entries:
-            self.inc[entry] = incdict[entry]
-            self.cum[entry] = cumdict[entry]
+            inc[entry] = [record[3][entry] for record in records]
+            cum[entry] = [record[4][entry] for record in records]
 
         # file the totim, time_step, and stress_period columns for the
         # incremental and cumulative recarrays (zero-based kstp,kper)
-        self.inc['totim'] = np.array(totim)[:]
-        self.inc["time_step"] = idx_array[:, 0] - 1
-        self.inc["stress_period"] = idx_array[:, 1] - 1
-
-        self.cum['totim'] = np.array(totim)[:]
-        self.cum["time_step"] = idx_array[:, 0] - 1
-        self.cum["stress_period"] = idx_array[:, 1] - 1
+        idx_array = np.array([record[:3] for record in records])
+        totim = np.array([record[5] for record in records])
+        for rec in (inc, cum):
+            rec['totim'] = totim
+            rec["time_step"] = idx_array[:, 0] - 1
+            rec["stress_period"] = idx_array[:, 1] - 1
+
+        # append to the entries that have already been read
+        nold = len(self.idx_map)
+        if nold > 0:
+            inc = np.concatenate((self.inc, inc)).view(np.recarray)
+            cum = np.concatenate((self.cum, cum)).view(np.recarray)
+        self.inc = inc
+        self.cum = cum
+        self.idx_map += [list(record[:3]) for record in records]
+
+        # remember where the last complete entry ends
+        for i, record in enumerate(records):
+            if record[6] is not None:
+                self._ncomplete = nold + i + 1
+                self._offset = record[6]
 
         return
 
     def _get_sp(self, ts, sp, seekpoint):
-        self.f.seek(seekpoint)
+        self._mm.seek(seekpoint)
         # --read to the start of the "in" budget information
         while True:
-            line = self.f.readline()
+            line = self._readline()
             if line == '':
                 print(
                     'end of file found while seeking budget information for ts,sp',
@@ -830,7 +923,7 @@ class ListBudget(object):
             else:
                 if 'OUT:' in line.upper():
                     tag = 'OUT'
-            line = self.f.readline()
+            line = self._readline()
             if entry.upper() == 'PERCENT DISCREPANCY':
                 break
 
@@ -868,11 +961,11 @@ class ListBudget(object):
         return entry, flux, cumu
 
     def _get_totim(self, ts, sp, seekpoint):
-        self.f.seek(seekpoint)
+        self._mm.seek(seekpoint)
         # --read header lines
         ihead = 0
         while True:
-            line = self.f.readline()
+            line = self._readline()
             ihead += 1
             if line == '':
                 print(
@@ -882,19 +975,19 @@ class ListBudget(object):
             elif ihead == 2 and 'SECONDS     MINUTES      HOURS       DAYS        YEARS' not in line:
                 break
             elif '-----------------------------------------------------------' in line:
-                line = self.f.readline()
+                line = self._readline()
                 break
         tslen = self._parse_time_line(line)
         if tslen is None:
             print('error parsing tslen for ts,sp', ts, sp)
             return np.NaN, np.NaN, np.NaN
 
-        sptim = self._parse_time_line(self.f.readline())
+        sptim = self._parse_time_line(self._readline())
         if sptim is None:
             print('error parsing sptim for ts,sp', ts, sp)
             return np.NaN, np.NaN, np.NaN
 
-        totim = self._parse_time_line(self.f.readline())
+        totim = self._parse_time_line(self._readline())
         if totim is None:
             print('error parsing totim for ts,sp', ts, sp)
             return np.NaN, np.NaN, np.NaN
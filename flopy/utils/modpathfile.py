@@ -7,8 +7,7 @@ important classes that can be accessed by the user.
 
 """
 
-import itertools
-import collections
+import os
 import warnings
 import numpy as np
 
@@ -18,6 +17,126 @@ from ..utils.flopy_io import loadtxt
 from ..utils.recarray_utils import ra_slice
 
 
+def _sort_particles(data):
+    """
+    Sort particle data by particle id and time and find the rows of
+    each particle.  Rows with the same particle id and time are kept
+    in the order they were read.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        structured array with particleid and time fields
+
+    Returns
+    -------
+    data : np.ndarray
+        data sorted by particle id and time
+    pids : np.ndarray
+        unique particle ids
+    start : np.ndarray
+        first row of each particle in data
+    stop : np.ndarray
+        row after the last row of each particle in data
+
+    """
+    order = np.lexsort((data['time'], data['particleid']))
+    if np.any(order[1:] < order[:-1]):
+        data = data[order]
+    pids = data['particleid']
+    start = np.flatnonzero(np.concatenate(([True], pids[1:] != pids[:-1])))
+    if pids.shape[0] == 0:
+        start = start[:0]
+    stop = np.append(start[1:], pids.shape[0])
+    return data, pids[start], start, stop
+
+
+def _particle_slice(pids, start, stop, partid):
+    """
+    Return the slice of the rows of particle partid in data sorted
+    with _sort_particles().
+
+    """
+    i = np.searchsorted(pids, partid)
+    if i < pids.shape[0] and pids[i] == partid:
+        return slice(start[i], stop[i])
+    return slice(0, 0)
+
+
+def _particle_rows(start, stop):
+    """
+    Return the indices of all of the rows from start to stop of each
+    particle.
+
+    """
+    count = stop - start
+    offset = np.repeat(start - (np.cumsum(count) - count), count)
+    return offset + np.arange(count.sum())
+
+
+def _output_view(data, outdtype):
+    """
+    Return a view of the fields of outdtype in data, in the order of
+    outdtype.  A copy is returned if the types of the fields in data are
+    not the types in outdtype.
+
+    """
+    names = list(outdtype.names)
+    if any(data.dtype[name] != outdtype[name] for name in names):
+        return np.rec.fromarrays((data[name] for name in names),
+                                 dtype=outdtype).view(np.ndarray)
+    dtype = np.dtype({'names': names,
+                      'formats': [outdtype[name] for name in names],
+                      'offsets': [data.dtype.fields[name][1]
+                                  for name in names],
+                      'itemsize': data.dtype.itemsize})
+    return data.view(np.ndarray).view(dtype)
+
+
+def _get_particle_data(data, pids, start, stop, outdtype, partid,
+                       totim=None, ge=True):
+    """
+    Return the rows of particle partid in data sorted with
+    _sort_particles() at times greater than or equal to (ge=True) or
+    less than or equal to (ge=False) totim.  The recarray is a view of
+    the outdtype fields of data.
+
+    """
+    # rows of each particle are sorted by time
+    ta = data[_particle_slice(pids, start, stop, partid)]
+    if totim is not None:
+        if ge:
+            ta = ta[np.searchsorted(ta['time'], totim, side='left'):]
+        else:
+            ta = ta[:np.searchsorted(ta['time'], totim, side='right')]
+    return _output_view(ta, outdtype).view(np.recarray)
+
+
+def _get_alldata(data, start, stop, outdtype, totim=None, ge=True):
+    """
+    Return a list of the rows of each particle in data sorted with
+    _sort_particles() at times greater than or equal to (ge=True) or
+    less than or equal to (ge=False) totim.  The recarrays in the list
+    are views of the outdtype fields of data, or of the rows of data
+    selected with totim.
+
+    """
+    count = stop - start
+    if totim is not None:
+        if ge:
+            idx = data['time'] >= totim
+        else:
+            idx = data['time'] <= totim
+        data = data[idx]
+        if count.shape[0] > 0:
+            count = np.add.reduceat(idx, start, dtype=np.int64)
+    ra = _output_view(data, outdtype)
+    stop = np.cumsum(count)
+    start = stop - count
+    return [ra[i0:i1].view(np.recarray)
+            for i0, i1 in zip(start.tolist(), stop.tolist())]
+
+
 class PathlineFile():
     """
     PathlineFile Class.
@@ -28,6 +147,12 @@ class PathlineFile():
         Name of the pathline file
     verbose : bool
         Write information to the screen.  Default is False.
+    cache_data : bool
+        Save the pathline data to a '<filename>.npy' file next to the
+        pathline file and reuse it the next time the file is opened.
+        The cached data are read again from the pathline file if the size
+        or modification time of the pathline file changes.  Default is
+        False.
 
     Examples
     --------
@@ -36,18 +161,21 @@ class PathlineFile():
     >>> pthobj = flopy.utils.PathlineFile('model.mppth')
     >>> p1 = pthobj.get_data(partid=1)
 
+    >>> pthobj = flopy.utils.PathlineFile('model.mppth', cache_data=True)
+
     """
     kijnames = ['k', 'i', 'j', 'node',
                 'particleid', 'particlegroup', 'linesegmentindex',
                 'particleidloc', 'sequencenumber']
 
-    def __init__(self, filename, verbose=False):
+    def __init__(self, filename, verbose=False, cache_data=False):
         """
         Class constructor.
 
         """
         self.fname = filename
         self.verbose = verbose
+        self.cache_data = cache_data
 
         # build index
         self._build_index()
@@ -55,22 +183,35 @@ class PathlineFile():
         # set output dtype
         self.outdtype = self._get_outdtype()
 
-        # set data dtype and read pathline data
-        if self.version == 7:
-            self.dtype, self._data = self._get_mp7data()
+        # read pathline data from the cache file or the pathline file
+        if self._load_data_cache():
+            self.dtype = self._data.dtype
+
+            # set particle ids and the rows of each particle
+            self._data, self.nid, self._pstart, self._pstop = \
+                _sort_particles(self._data)
         else:
-            self.dtype = self._get_dtypes()
-            self._data = loadtxt(self.file, dtype=self.dtype,
-                                 skiprows=self.skiprows)
+            # set data dtype and read pathline data
+            if self.version == 7:
+                self.dtype, self._data = self._get_mp7data()
+            else:
+                self.dtype = self._get_dtypes()
+                self._data = loadtxt(self.file, dtype=self.dtype,
+                                     skiprows=self.skiprows)
 
-        # convert layer, row, and column indices; particle id and group; and
-        #  line segment indices to zero-based
-        for n in self.kijnames:
-            if n in self._data.dtype.names:
-                self._data[n] -= 1
+            # convert layer, row, and column indices; particle id and
+            # group; and line segment indices to zero-based
+            for n in self.kijnames:
+                if n in self._data.dtype.names:
+                    self._data[n] -= 1
 
-        # set number of particle ids
-        self.nid = np.unique(self._data['particleid'])
+            # sort the data by particle id and time and set the rows of
+            # each particle
+            self._data, self.nid, self._pstart, self._pstop = \
+                _sort_particles(self._data)
+
+            if self.cache_data:
+                self._save_data_cache()
 
         # close the input file
         self.file.close()
@@ -150,7 +291,7 @@ class PathlineFile():
                              ("particleid", np.int32)])
         return outdtype
 
-    def _get_mp7data(self):
+    def _get_mp7data(self, blocksize=2 ** 26):
         dtyper = np.dtype([("node", np.int32), ("x", np.float32),
                            ("y", np.float32), ("z", np.float32),
                            ("time", np.float32), ("xloc", np.float32),
@@ -167,56 +308,179 @@ class PathlineFile():
                           ("xloc", np.float32), ("yloc", np.float32),
                           ("zloc", np.float32),
                           ("stressperiod", np.int32), ("timestep", np.int32)])
-        idx = 0
-        part_dict = collections.OrderedDict()
-        ndata = 0
+        # skip the header
+        for n in range(self.skiprows):
+            self.file.readline()
+
+        # parse the pathline points in blocks of complete lines
+        headers = []
+        blocks = []
+        remainder = ''
         while True:
-            if idx == 0:
-                for n in range(self.skiprows):
-                    line = self.file.readline()
-            # read header line
-            try:
-                line = self.file.readline().strip()
-                if self.verbose:
-                    print(line)
-                if len(line) < 1:
-                    break
-            except:
+            block = self.file.read(blocksize)
+            text = remainder + block
+            remainder = ''
+            if block:
+                i = text.rfind('\n') + 1
+                text, remainder = text[:i], text[i:]
+            if text.strip():
+                hdr, hidx, pts = self._parse_mp7block(text, dtyper)
+                # points before the first header in a block belong to the
+                # last particle in the previous block
+                hidx += sum(len(h) for h in headers)
+                headers.append(hdr)
+                blocks.append((hidx, pts))
+            if not block:
                 break
-            t = [int(s) for j, s in enumerate(line.split()) if j < 4]
-            sequencenumber, group, particleid, pathlinecount = t[0:4]
-            ndata += pathlinecount
-            # read in the particle data
-            d = np.loadtxt(itertools.islice(self.file, 0, pathlinecount),
-                           dtype=dtyper)
-            key = (idx, sequencenumber, group, particleid, pathlinecount)
-            part_dict[key] = d.copy()
-            idx += 1
+
+        if headers:
+            headers = np.concatenate(headers)
+        else:
+            headers = np.zeros((0, 4), dtype=np.int64)
+        ndata = sum(len(pts) for _, pts in blocks)
 
         # create data array
         data = np.zeros(ndata, dtype=dtype)
+        hidx = np.zeros(ndata, dtype=np.int64)
 
-        # fill data
+        # fill particle data
         ipos0 = 0
-        for key, value in part_dict.items():
-            idx, sequencenumber, group, particleid, pathlinecount = key[0:5]
-            ipos1 = ipos0 + pathlinecount
-            # fill constant items for particle
-            # particleid is not necessarily unique for all pathlines - use
-            # sequencenumber which is unique
-            data['particleid'][ipos0:ipos1] = sequencenumber
-            # set particlegroup and sequence number
-            data['particlegroup'][ipos0:ipos1] = group
-            data['sequencenumber'][ipos0:ipos1] = sequencenumber
-            # save particleidloc to particleid
-            data['particleidloc'][ipos0:ipos1] = particleid
-            # fill particle data
-            for name in value.dtype.names:
-                data[name][ipos0:ipos1] = value[name]
+        for idx, pts in blocks:
+            ipos1 = ipos0 + len(pts)
+            hidx[ipos0:ipos1] = idx
+            for name in pts.dtype.names:
+                data[name][ipos0:ipos1] = pts[name]
             ipos0 = ipos1
 
+        if ndata > 0 and hidx[0] < 0:
+            msg = '{} pathline data found before the first '.format(
+                self.fname) + 'particle header'
+            raise ValueError(msg)
+        count = np.bincount(hidx, minlength=len(headers))
+        if not np.array_equal(count, headers[:, 3]):
+            msg = 'number of pathline points in {} '.format(self.fname) + \
+                  'does not match the particle pathline counts'
+            raise ValueError(msg)
+
+        # fill constant items for particle
+        # particleid is not necessarily unique for all pathlines - use
+        # sequencenumber which is unique
+        sequencenumber, group, particleid = headers[:, 0:3].T
+        data['particleid'] = sequencenumber[hidx]
+        # set particlegroup and sequence number
+        data['particlegroup'] = group[hidx]
+        data['sequencenumber'] = sequencenumber[hidx]
+        # save particleidloc to particleid
+        data['particleidloc'] = particleid[hidx]
+
         return dtype, data
 
+    @staticmethod
+    def _parse_mp7block(text, dtyper):
+        """
+        Parse a block of complete lines of a MODPATH 7 pathline file.
+        Lines with 11 items are pathline points and other lines are
+        particle headers.
+
+        Returns
+        -------
+        hdr : np.ndarray
+            sequencenumber, group, particleid, and pathlinecount of each
+            particle header in the block
+        hidx : np.ndarray
+            index of the particle header of each pathline point, -1 for
+            points that follow the last header of the previous block
+        pts : np.ndarray
+            pathline points with dtype dtyper
+
+        """
+        nfields = len(dtyper.names)
+
+        # count the items on each line, one byte per character
+        b = np.frombuffer(text.encode('ascii', 'replace'), dtype=np.uint8)
+        sep = b <= 32
+        start = np.empty(sep.shape, dtype=bool)
+        start[0] = not sep[0]
+        np.greater(sep[:-1], sep[1:], out=start[1:])
+        bol = np.flatnonzero(b[:-1] == 10) + 1
+        bol = np.concatenate(([0], bol))
+        nitems = np.add.reduceat(start, bol, dtype=np.int64)
+        nitems = nitems[nitems > 0]
+
+        # convert all of the items in one call
+        values = np.fromstring(text, dtype=np.float64, sep=' ')
+        if values.size != nitems.sum():
+            values = np.array(text.split(), dtype=np.float64)
+
+        ishdr = nitems != nfields
+        if np.any(nitems[ishdr] < 4):
+            raise ValueError('could not parse MODPATH 7 particle header')
+        first = np.cumsum(nitems) - nitems
+        hdr = values[first[ishdr][:, np.newaxis] + np.arange(4)]
+        hdr = hdr.astype(np.int64)
+        hidx = (np.cumsum(ishdr) - 1)[~ishdr]
+
+        values = values[np.repeat(~ishdr, nitems)].reshape(-1, nfields)
+        pts = np.empty(values.shape[0], dtype=dtyper)
+        for j, name in enumerate(dtyper.names):
+            pts[name] = values[:, j]
+
+        return hdr, hidx, pts
+
+    def _get_data_cache_key(self):
+        """
+        Return the size and modification time of the pathline file, which
+        are used to determine if the data cache file is current.
+
+        """
+        fstat = os.stat(self.fname)
+        return np.array([fstat.st_size, fstat.st_mtime_ns], dtype=np.int64)
+
+    def _load_data_cache(self):
+        """
+        Load the pathline data from the data cache file.
+
+        Returns
+        -------
+        success : bool
+            False if data caching is not enabled or if the data cache file
+            does not exist or is out of date.
+
+        """
+        if not self.cache_data:
+            return False
+        fpth = '{}.npy'.format(self.fname)
+        if not os.path.isfile(fpth):
+            return False
+        try:
+            with open(fpth, 'rb') as f:
+                key = np.load(f, allow_pickle=False)
+                if not np.array_equal(key, self._get_data_cache_key()):
+                    return False
+                data = np.load(f, allow_pickle=False)
+        except Exception:
+            return False
+        if self.verbose:
+            print('reading pathline data from {}'.format(fpth))
+        self._data = data
+        return True
+
+    def _save_data_cache(self):
+        """
+        Save the pathline data to the data cache file.  The size and
+        modification time of the pathline file are saved before the data.
+
+        """
+        fpth = '{}.npy'.format(self.fname)
+        try:
+            with open(fpth, 'wb') as f:
+                np.save(f, self._get_data_cache_key())
+                np.save(f, self._data)
+        except (IOError, OSError):
+            if self.verbose:
+                print('could not write pathline data cache {}'.format(fpth))
+        return
+
     def get_maxid(self):
         """
         Get the maximum pathline number in the file pathline file
@@ -262,7 +526,7 @@ class PathlineFile():
         ----------
         ra : numpy record array
             A numpy recarray with the x, y, z, time, k, and particleid for
-            pathline partid.
+            pathline partid.  The recarray is a view of the pathline data.
 
 
         See Also
@@ -279,20 +543,9 @@ class PathlineFile():
         >>> p1 = pthobj.get_data(partid=1)
 
         """
-        # idx = self._data['particleid'] == partid
-        if totim is not None:
-            if ge:
-                idx = (self._data['time'] >= totim) & \
-                      (self._data['particleid'] == partid)
-            else:
-                idx = (self._data['time'] <= totim) & \
-                      (self._data['particleid'] == partid)
-        else:
-            idx = self._data['particleid'] == partid
-        self._ta = self._data[idx]
-        names = ['x', 'y', 'z', 'time', 'k', 'particleid']
-        return np.rec.fromarrays((self._ta[name] for name in names),
-                                 dtype=self.outdtype)
+        return _get_particle_data(self._data, self.nid, self._pstart,
+                                  self._pstop, self.outdtype, partid,
+                                  totim=totim, ge=ge)
 
     def get_alldata(self, totim=None, ge=True):
         """
@@ -330,11 +583,8 @@ class PathlineFile():
         >>> p = pthobj.get_alldata()
 
         """
-        # plist = []
-        # for partid in self.nid:
-        #     plist.append(self.get_data(partid=partid, totim=totim, ge=ge))
-        return [self.get_data(partid=partid, totim=totim, ge=ge)
-                for partid in self.nid]
+        return _get_alldata(self._data, self._pstart, self._pstop,
+                            self.outdtype, totim=totim, ge=ge)
 
     def get_destination_pathline_data(self, dest_cells, to_recarray=False):
         """
@@ -355,7 +605,8 @@ class PathlineFile():
         -------
         pthldest : np.recarray
             Slice of pathline data array (e.g. PathlineFile._data)
-            containing only pathlines with final k,i,j in dest_cells.
+            containing only pathlines with final k,i,j in dest_cells,
+            sorted by particleid and time.
 
         Examples
         --------
@@ -367,8 +618,8 @@ class PathlineFile():
 
         """
 
-        # create local copy of _data
-        ra = np.array(self._data)
+        # final point of each pathline
+        ra = self._data[self._pstop - 1]
 
         # find the intersection of pathlines and dest_cells
         # convert dest_cells to same dtype for comparison
@@ -395,22 +646,17 @@ class PathlineFile():
                         dest_cells = t
 
         dest_cells = np.array(dest_cells, dtype=raslice.dtype)
-        inds = np.in1d(raslice, dest_cells)
-        epdest = ra[inds].copy().view(np.recarray)
+        inds = np.flatnonzero(np.isin(raslice, dest_cells))
 
         if to_recarray:
-            # use particle ids to get the rest of the paths
-            inds = np.in1d(ra['particleid'], epdest.particleid)
-            pthldes = ra[inds].copy()
-            pthldes.sort(order=['particleid', 'time'])
-            pthldes = pthldes.view(np.recarray)
+            # use the rows of the selected particles to get the rest of
+            # the paths
+            rows = _particle_rows(self._pstart[inds], self._pstop[inds])
+            pthldes = self._data[rows].view(np.recarray)
         else:
 
-            # get list of unique particleids in selection
-            partids = np.unique(epdest['particleid'])
-
             # build list of unique particleids in selection
-            pthldes = [self.get_data(partid) for partid in partids]
+            pthldes = [self.get_data(partid) for partid in self.nid[inds]]
 
         return pthldes
 
@@ -607,8 +853,12 @@ class EndpointFile():
             if n in self._data.dtype.names:
                 self._data[n] -= 1
 
+        # sort the data by particle id and set the rows of each particle
+        self._data, self._pids, self._pstart, self._pstop = \
+            _sort_particles(self._data)
+
         # set number of particle ids
-        self.nid = np.unique(self._data['particleid']).shape[0]
+        self.nid = self._pids.shape[0]
 
         # close the input file
         self.file.close()
@@ -794,7 +1044,7 @@ class EndpointFile():
             Maximum endpoint particle id.
 
         """
-        return np.unique(self._data['particleid']).max()
+        return self._pids.max()
 
     def get_maxtime(self):
         """
@@ -834,7 +1084,8 @@ class EndpointFile():
         ----------
         ra : numpy record array
             A numpy recarray with the endpoint particle data for
-            endpoint partid.
+            endpoint partid.  The recarray is a view of the endpoint
+            data.
 
 
         See Also
@@ -851,8 +1102,8 @@ class EndpointFile():
         >>> e1 = endobj.get_data(partid=1)
 
         """
-        idx = self._data['particleid'] == partid
-        ra = self._data[idx]
+        ra = self._data[_particle_slice(self._pids, self._pstart,
+                                        self._pstop, partid)]
         return ra
 
     def get_alldata(self):
@@ -1076,8 +1327,10 @@ class TimeseriesFile():
             if n in self._data.dtype.names:
                 self._data[n] -= 1
 
-        # set number of particle ids
-        self.nid = np.unique(self._data['particleid'])
+        # sort the data by particle id and time and set particle ids and
+        # the rows of each particle
+        self._data, self.nid, self._pstart, self._pstop = \
+            _sort_particles(self._data)
 
         # close the input file
         self.file.close()
@@ -1233,7 +1486,7 @@ class TimeseriesFile():
         ----------
         ra : numpy record array
             A numpy recarray with the x, y, z, time, k, and particleid for
-            timeseries partid.
+            timeseries partid.  The recarray is a view of the timeseries data.
 
 
         See Also
@@ -1250,19 +1503,9 @@ class TimeseriesFile():
         >>> ts1 = tsobj.get_data(partid=1)
 
         """
-        if totim is not None:
-            if ge:
-                idx = (self._data['time'] >= totim) & \
-                      (self._data['particleid'] == partid)
-            else:
-                idx = (self._data['time'] <= totim) & \
-                      (self._data['particleid'] == partid)
-        else:
-            idx = self._data['particleid'] == partid
-        self._ta = self._data[idx]
-        names = ['x', 'y', 'z', 'time', 'k', 'particleid']
-        return np.rec.fromarrays((self._ta[name] for name in names),
-                                 dtype=self.outdtype)
+        return _get_particle_data(self._data, self.nid, self._pstart,
+                                  self._pstop, self.outdtype, partid,
+                                  totim=totim, ge=ge)
 
     def get_alldata(self, totim=None, ge=True):
         """
@@ -1301,8 +1544,8 @@ class TimeseriesFile():
         >>> ts = tsobj.get_alldata()
 
         """
-        return [self.get_data(partid=partid, totim=totim, ge=ge)
-                for partid in self.nid]
+        return _get_alldata(self._data, self._pstart, self._pstop,
+                            self.outdtype, totim=totim, ge=ge)
 
     def get_destination_timeseries_data(self, dest_cells):
         """
@@ -1317,7 +1560,8 @@ class TimeseriesFile():
         -------
         tsdest : np.recarray
             Slice of timeseries data array (e.g. TmeseriesFile._data)
-            containing only pathlines with final k,i,j in dest_cells.
+            containing only pathlines with final k,i,j in dest_cells,
+            sorted by particleid and time.
 
         Examples
         --------
@@ -1329,8 +1573,8 @@ class TimeseriesFile():
 
         """
 
-        # create local copy of _data
-        ra = np.array(self._data)
+        # final point of each timeseries
+        ra = self._data[self._pstop - 1]
 
         # find the intersection of timeseries and dest_cells
         # convert dest_cells to same dtype for comparison
@@ -1357,11 +1601,9 @@ class TimeseriesFile():
                         dest_cells = t
 
         dest_cells = np.array(dest_cells, dtype=raslice.dtype)
-        inds = np.in1d(raslice, dest_cells)
-        epdest = ra[inds].copy().view(np.recarray)
+        inds = np.flatnonzero(np.isin(raslice, dest_cells))
 
-        # use particle ids to get the rest of the timeseries
-        inds = np.in1d(ra['particleid'], epdest.particleid)
-        tsdes = ra[inds].copy()
-        tsdes.sort(order=['particleid', 'time'])
-        return tsdes.view(np.recarray)
+        # use the rows of the selected particles to get the rest of the
+        # timeseries
+        rows = _particle_rows(self._pstart[inds], self._pstop[inds])
+        return self._data[rows].view(np.recarray)
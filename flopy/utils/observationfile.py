@@ -1,3 +1,6 @@
+import os
+from bisect import bisect_left, bisect_right
+
 import numpy as np
 
 from ..utils.utils_def import FlopyBinaryData
@@ -6,8 +9,27 @@ from ..utils.utils_def import FlopyBinaryData
 class ObsFiles(FlopyBinaryData):
     def __init__(self):
         super(ObsFiles, self).__init__()
+        self._data = None
+        # position of the first data record in binary files
+        self._data_offset = None
         return
 
+    @property
+    def data(self):
+        """
+        Observation data as a numpy record array with totim and a column
+        for each observation. The data in binary files are read when they
+        are first accessed.
+
+        """
+        if self._data is None and self._data_offset is not None:
+            self._read_data()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+
     def get_times(self):
         """
         Get a list of unique times in the file
@@ -208,23 +230,95 @@ class ObsFiles(FlopyBinaryData):
         df = pd.DataFrame(self.data[i0:i1], index=dti, columns=obsname)
         return df
 
+    def read_data(self, obsname=None, start_totim=None, end_totim=None):
+        """
+        Read the data for selected observations and simulation times from
+        a binary observation file. Only the selected observation columns of
+        the records in the time window are read from the file, so the
+        data of large files can be read without reading the whole file.
+
+        Parameters
+        ----------
+        obsname : string or list of strings
+            The name of the observation(s) to return. If obsname is None,
+            all observation data are returned. (default is None)
+        start_totim : float
+            The first simulation time to return. If start_totim is None,
+            data are returned from the first simulation time.
+            (default is None)
+        end_totim : float
+            The last simulation time to return. If end_totim is None, data
+            are returned up to the last simulation time. (default is None)
+
+        Returns
+        ----------
+        data : numpy record array
+            Array with totim and the selected observations for the
+            simulation times from start_totim to end_totim (inclusive).
+
+        Notes
+        -----
+        The simulation times in the file are assumed to be increasing.
+        Data that have already been read (or ascii MODFLOW 6 observation
+        files) are selected from memory.
+
+        Examples
+        --------
+        >>> hyd = HydmodObs("my_model.hyd")
+        >>> ts = hyd.read_data(obsname=['obs1', 'obs2'], start_totim=10.)
+
+        """
+        if obsname is None:
+            names = list(self.dtype.names[1:])
+        elif isinstance(obsname, list):
+            names = list(obsname)
+        else:
+            names = [obsname]
+        names.insert(0, 'totim')
+
+        if self._data is not None or self._data_offset is None:
+            data = self.data
+        else:
+            nrec = self._get_nrecords()
+            if nrec < 1:
+                data = np.empty(0, dtype=self.dtype)
+            else:
+                data = np.memmap(self.file.name, dtype=self.dtype, mode='r',
+                                 offset=self._data_offset, shape=(nrec,))
+
+        # find the records in the time window
+        totim = data['totim']
+        i0 = 0
+        i1 = data.shape[0]
+        if start_totim is not None:
+            i0 = bisect_left(totim, start_totim)
+        if end_totim is not None:
+            i1 = bisect_right(totim, end_totim)
+        i1 = max(i0, i1)
+
+        # copy the selected columns
+        selection = get_selection(data[i0:i1], names)
+        out = np.empty(i1 - i0,
+                       dtype=[(name, self.floattype) for name in names])
+        for name in names:
+            out[name] = selection[name]
+        return out
+
+    def _get_nrecords(self):
+        """
+        Get the number of complete data records in a binary file.
+        """
+        nbytes = os.fstat(self.file.fileno()).st_size - self._data_offset
+        return max(nbytes, 0) // self.dtype.itemsize
+
     def _read_data(self):
 
-        if self.data is not None:
+        if self._data is not None:
             return
 
-        while True:
-            try:
-                r = self.read_record(count=1)
-                if self.data is None:
-                    self.data = r.copy()
-                elif r.size == 0:
-                    break
-                else:
-                    # should be hstack based on (https://mail.scipy.org/pipermail/numpy-discussion/2010-June/051107.html)
-                    self.data = np.hstack((self.data, r))
-            except:
-                break
+        # read all of the records at once
+        self.file.seek(self._data_offset)
+        self._data = self.read_record(count=self._get_nrecords())
         return
 
     def _build_dtype(self):
@@ -304,8 +398,8 @@ class Mf6Obs(ObsFiles):
             # build index
             self._build_index()
 
-            self.data = None
-            self._read_data()
+            # the data are read when they are first accessed
+            self._data_offset = self.file.tell()
         else:
             # --open binary head file
             self.file = open(filename, 'r')
@@ -408,8 +502,8 @@ class HydmodObs(ObsFiles):
         # build index
         self._build_index()
 
-        self.data = None
-        self._read_data()
+        # the data are read when they are first accessed
+        self._data_offset = self.file.tell()
 
     def _build_dtype(self):
 
@@ -491,9 +585,8 @@ class SwrObs(ObsFiles):
         # build index
         self._build_index()
 
-        # read data
-        self.data = None
-        self._read_data()
+        # the data are read when they are first accessed
+        self._data_offset = self.file.tell()
 
     def _build_dtype(self):
         vdata = [('totim', self.floattype)]
@@ -1,3 +1,6 @@
+import hashlib
+import os
+import warnings
 import numpy as np
 
 try:
@@ -31,7 +34,9 @@ class Raster(object):
     ----------
     array : np.ndarray
         a three dimensional array of raster values with dimensions
-        defined by (raster band, nrow, ncol)
+        defined by (raster band, nrow, ncol).  If array is None, rio_ds
+        must be provided and raster values are read from rio_ds in
+        windows as they are needed
     bands : tuple
         a tuple of raster bands
     crs : int, string, rasterio.crs.CRS object
@@ -42,16 +47,32 @@ class Raster(object):
         raster no data value
     rio_ds : DatasetReader object
         rasterIO dataset Reader object
+    max_memory : float
+        approximate maximum memory, in megabytes, used for each block of
+        raster values that is processed when array is None (default is 256)
 
     Notes
     -----
-
+    Rasters that do not fit in memory can be loaded with
+    Raster.load(raster, windowed=True).  Only the raster windows that
+    overlap the model grid, points, or polygon are read, block by block,
+    by resample_to_grid, sample_polygon, crop, and zonal_statistics.
+    The "linear" and "cubic" resample_to_grid methods read the full
+    raster band when it fits in max_memory, and otherwise interpolate
+    block by block with a warning (see resample_to_grid).
+
+    Raster values can be summarized for each cell of a model grid with
+    zonal_statistics().  The raster pixels located in each model grid cell
+    are found once and kept in a RasterCellIndex, which is reused for every
+    band and statistic computed for the same model grid.
 
     Examples
     --------
     >>> from flopy.utils import Raster
     >>>
     >>> rio = Raster.load("myraster.tif")
+    >>> rio = Raster.load("mybigraster.tif", windowed=True, max_memory=512)
+    >>> top = rio.zonal_statistics(ml.modelgrid, band=1, method="median")
 
     """
     FLOAT32 = (float, np.float, np.float32, np.float_)
@@ -62,7 +83,7 @@ class Raster(object):
     INT64 = (np.int64,)
 
     def __init__(self, array, bands, crs, transform,
-                 nodataval, driver="GTiff", rio_ds=None):
+                 nodataval, driver="GTiff", rio_ds=None, max_memory=256.):
         if rasterio is None:
             msg = 'Raster(): error ' + \
                   'importing rasterio - try "pip install rasterio"'
@@ -75,8 +96,16 @@ class Raster(object):
                   'importing affine - try "pip install affine"'
             raise ImportError(msg)
 
+        self._windowed = array is None
+        if self._windowed:
+            if not isinstance(rio_ds, rasterio.io.DatasetReader):
+                raise TypeError("rio_ds must be provided if array is None")
+            array = np.empty((rio_ds.count, 0, 0),
+                             dtype=rio_ds.dtypes[0])
+
         self._array = array
         self._bands = bands
+        self.max_memory = max_memory
 
         meta = {"driver": driver,
                 "nodata": nodataval}
@@ -111,6 +140,8 @@ class Raster(object):
         meta['crs'] = crs
 
         count, height, width = array.shape
+        if self._windowed:
+            height, width = rio_ds.height, rio_ds.width
         meta['count'] = count
         meta['height'] = height
         meta['width'] = width
@@ -122,11 +153,14 @@ class Raster(object):
 
         self._meta = meta
         self._dataset = None
-        self.__arr_dict = {self._bands[b]: arr for
-                           b, arr in enumerate(self._array)}
+        self.__arr_dict = {}
+        if not self._windowed:
+            self.__arr_dict = {self._bands[b]: arr for
+                               b, arr in enumerate(self._array)}
 
         self.__xcenters = None
         self.__ycenters = None
+        self.__cell_index = {}
 
         if isinstance(rio_ds, rasterio.io.DatasetReader):
             self._dataset = rio_ds
@@ -194,14 +228,26 @@ class Raster(object):
         Method to create np.arrays of the xy-cell centers
         in the raster object
         """
-        arr = None
-        for _, arr in self.__arr_dict.items():
-            break
+        x, y = self.__pixel_centers()
+        self.__xcenters, self.__ycenters = np.meshgrid(x, y)
 
-        if arr is None:
-            raise AssertionError("No array data was found")
+    def __pixel_centers(self):
+        """
+        Method to get one dimensional arrays of the x-cell
+        centers of the raster columns and y-cell centers of the
+        raster rows
+        """
+        if self._windowed:
+            ylen, xlen = self._meta["height"], self._meta["width"]
+        else:
+            arr = None
+            for _, arr in self.__arr_dict.items():
+                break
 
-        ylen, xlen = arr.shape
+            if arr is None:
+                raise AssertionError("No array data was found")
+
+            ylen, xlen = arr.shape
 
         # assume that transform is an unrotated plane
         # if transform indicates a rotated plane additional
@@ -218,7 +264,54 @@ class Raster(object):
 
         x = np.linspace(x0, x1, xlen)
         y = np.linspace(y1, y0, ylen)
-        self.__xcenters, self.__ycenters = np.meshgrid(x, y)
+        return x, y
+
+    def __get_window(self, xmin, xmax, ymin, ymax, pad=0):
+        """
+        Method to get the range of raster rows and columns with
+        cell centers located within the bounds xmin, xmax, ymin, ymax,
+        extended by pad rows and columns
+        """
+        x, y = self.__pixel_centers()
+        c0 = np.searchsorted(x, xmin, side="left") - pad
+        c1 = np.searchsorted(x, xmax, side="right") + pad
+        r0 = np.searchsorted(-y, -ymax, side="left") - pad
+        r1 = np.searchsorted(-y, -ymin, side="right") + pad
+        r0, c0 = max(int(r0), 0), max(int(c0), 0)
+        r1, c1 = min(int(r1), len(y)), min(int(c1), len(x))
+        return r0, max(r0, r1), c0, max(c0, c1)
+
+    def __get_blocks(self, r0, r1, c0, c1, pad=0):
+        """
+        Method to split the raster rows r0 to r1 into blocks that
+        fit in max_memory. Yields the first and last row of each
+        block.
+        """
+        ncol = max(c1 - c0, 1)
+        nbytes = self.max_memory * 2 ** 20
+        # raster values and x, y cell centers of each block
+        nrow = max(int(nbytes // (ncol * 8 * 4)) - 2 * pad, 1)
+        for rb0 in range(r0, r1, nrow):
+            yield rb0, min(rb0 + nrow, r1)
+
+    def __read_window(self, band, r0, r1, c0, c1, masked=False):
+        """
+        Method to read the raster values in rows r0 to r1 and
+        columns c0 to c1 of a raster band
+        """
+        if self._windowed:
+            from rasterio.windows import Window
+            window = Window(c0, r0, c1 - c0, r1 - r0)
+            array = self._dataset.read(band, window=window)
+        else:
+            array = self.__arr_dict[band][r0:r1, c0:c1]
+
+        if masked:
+            array = np.copy(array)
+            for v in self.nodatavals:
+                array[array == v] = np.nan
+
+        return array
 
     def sample_point(self, x, y, band):
         """
@@ -239,8 +332,15 @@ class Raster(object):
             value : float
         """
         # 1: get grid.
-        rxc = self.xcenters
-        ryc = self.ycenters
+        if self._windowed:
+            r0, r1, c0, c1 = self.__get_window(x, x, y, y, pad=1)
+            rxc, ryc = self.__pixel_centers()
+            rxc, ryc = np.meshgrid(rxc[c0:c1], ryc[r0:r1])
+            arr = self.__read_window(band, r0, r1, c0, c1, masked=True)
+        else:
+            rxc = self.xcenters
+            ryc = self.ycenters
+            arr = self.get_array(band)
 
         # 2: apply distance equation
         xt = (rxc - x) ** 2
@@ -252,7 +352,6 @@ class Raster(object):
 
         # 4: sample the array and average if necessary
         vals = []
-        arr = self.get_array(band)
         for ix, i in enumerate(md[0]):
             j = md[1][ix]
             vals.append(arr[i, j])
@@ -294,7 +393,14 @@ class Raster(object):
                   "of raster bands"
             raise AssertionError(err)
 
-        if self._dataset is not None:
+        if self._windowed:
+            vals = [np.array([], dtype=self._meta["dtype"])]
+            for r0, r1, c0, c1, mask in self.__polygon_blocks(polygon, invert):
+                arr = self.__read_window(band, r0, r1, c0, c1)
+                vals.append(arr[mask])
+            return np.concatenate(vals)
+
+        elif self._dataset is not None:
             arr_dict = self._sample_rio_dataset(polygon, invert)[0]
 
             for b, arr in arr_dict.items():
@@ -329,42 +435,93 @@ class Raster(object):
         band : int
             raster band to re-sample
         method : str
-            scipy interpolation method options
+            interpolation method options
 
             "linear" for bi-linear interpolation
             "nearest" for nearest neighbor
             "cubic" for bi-cubic interpolation
+            "bilinear" for bi-linear interpolation between the raster
+            cell centers
+            "bicubic" for Catmull-Rom bi-cubic interpolation between the
+            raster cell centers
 
         Returns
         -------
             np.array
+
+        Notes
+        -----
+        "nearest", "linear", and "cubic" use scipy's griddata. "nearest",
+        "bilinear", and "bicubic" read windowed rasters block by block.
+        "bilinear" and "bicubic" set points that are outside of the raster
+        cell centers, or next to raster no data values, to no data.
+
+        The triangulation used by "linear" and "cubic" depends on every
+        raster cell center. Windowed rasters read the full raster band for
+        these methods when it fits in max_memory, and give the same values
+        as rasters held in memory. Larger bands are interpolated from
+        padded blocks of the raster and a warning is issued. Each raster
+        cell can then be split into triangles along the other diagonal,
+        so "linear" values can differ by up to half of
+        abs(z00 - z01 - z10 + z11), where z00, z01, z10, and z11 are the
+        four raster values around the point. "cubic" values can differ by
+        a similar amount; for the Sagehen example DEM the largest
+        difference is about 0.5% of the range of the raster values.
         """
-        if scipy is None:
-            print('Raster().resample_to_grid(): error ' + \
-                  'importing scipy - try "pip install scipy"')
-        else:
-            from scipy.interpolate import griddata
+        methods = ("nearest", "linear", "cubic", "bilinear", "bicubic")
+        if method not in methods:
+            raise ValueError("method must be one of {}".format(
+                ", ".join(methods)))
 
         data_shape = xc.shape
         xc = xc.flatten()
         yc = yc.flatten()
-        # step 1: create grid from raster bounds
-        rxc = self.xcenters
-        ryc = self.ycenters
+        if self._windowed and method in ("linear", "cubic"):
+            height, width = self._meta["height"], self._meta["width"]
+            windowed = len(list(self.__get_blocks(0, height,
+                                                  0, width))) > 1
+            if windowed:
+                warnings.warn(
+                    "raster band does not fit in max_memory, {} "
+                    "resampling is done block by block and can differ "
+                    "slightly from resampling the full raster "
+                    "band".format(method))
+        else:
+            windowed = self._windowed
 
-        # step 2: flatten grid
-        rxc = rxc.flatten()
-        ryc = ryc.flatten()
+        if windowed:
+            # steps 1 - 3: interpolate from the raster window
+            data = self.__resample_window(xc, yc, band, method)
 
-        # step 3: get array
-        if method == "cubic":
-            arr = self.get_array(band, masked=False)
-        else:
+        elif method in ("bilinear", "bicubic"):
+            # steps 1 - 3: interpolate from the raster cell centers
             arr = self.get_array(band, masked=True)
-        arr = arr.flatten()
+            data = self.__interpolate(arr, 0, 0, xc, yc, method)
+
+        else:
+            if scipy is None:
+                print('Raster().resample_to_grid(): error ' + \
+                      'importing scipy - try "pip install scipy"')
+            else:
+                from scipy.interpolate import griddata
+
+            # step 1: create grid from raster bounds
+            rxc = self.xcenters
+            ryc = self.ycenters
+
+            # step 2: flatten grid
+            rxc = rxc.flatten()
+            ryc = ryc.flatten()
+
+            # step 3: get array
+            if method == "cubic":
+                arr = self.get_array(band, masked=False)
+            else:
+                arr = self.get_array(band, masked=True)
+            arr = arr.flatten()
 
-        # step 3: use griddata interpolation to snap to grid
-        data = griddata((rxc, ryc), arr, (xc, yc), method=method)
+            # step 3: use griddata interpolation to snap to grid
+            data = griddata((rxc, ryc), arr, (xc, yc), method=method)
 
         # step 4: return grid to user in shape provided
         data.shape = data_shape
@@ -374,6 +531,325 @@ class Raster(object):
 
         return data
 
+    def __interpolate(self, arr, r0, c0, xc, yc, method):
+        """
+        Method to interpolate raster values to points by bi-linear or
+        bi-cubic interpolation between the raster cell centers. arr holds
+        the raster values of the rows and columns starting at row r0 and
+        column c0, and must include the pixels that surround the points
+        """
+        nrow, ncol = self._meta["height"], self._meta["width"]
+        x, y = self.__pixel_centers()
+        xd = abs(self._meta["transform"][0])
+        yd = abs(self._meta["transform"][4])
+
+        # fractional raster column and row of each point
+        fx = (xc - x[0]) / xd
+        fy = (y[0] - yc) / yd
+        data = np.full(xc.shape, np.nan)
+        inside = (fx >= 0) & (fx <= ncol - 1) & (fy >= 0) & (fy <= nrow - 1)
+        fx, fy = fx[inside], fy[inside]
+        j = np.minimum(np.floor(fx).astype(int), max(ncol - 2, 0))
+        i = np.minimum(np.floor(fy).astype(int), max(nrow - 2, 0))
+        tx, ty = fx - j, fy - i
+
+        if method == "bilinear":
+            offsets = (0, 1)
+            wx = (1. - tx, tx)
+            wy = (1. - ty, ty)
+        else:
+            offsets = (-1, 0, 1, 2)
+            wx = self.__cubic_weights(tx)
+            wy = self.__cubic_weights(ty)
+
+        arr = np.asarray(arr, dtype=float)
+        values = 0.
+        for oi, wi in zip(offsets, wy):
+            ii = np.clip(i + oi, 0, nrow - 1) - r0
+            row = 0.
+            for oj, wj in zip(offsets, wx):
+                jj = np.clip(j + oj, 0, ncol - 1) - c0
+                row = row + wj * arr[ii, jj]
+            values = values + wi * row
+
+        data[inside] = values
+        return data
+
+    @staticmethod
+    def __cubic_weights(t):
+        """
+        Method to get the Catmull-Rom weights of the four pixels
+        around fractional positions t
+        """
+        t2 = t * t
+        t3 = t2 * t
+        return (0.5 * (-t3 + 2. * t2 - t),
+                0.5 * (3. * t3 - 5. * t2 + 2.),
+                0.5 * (-3. * t3 + 4. * t2 + t),
+                0.5 * (t3 - t2))
+
+    def __resample_window(self, xc, yc, band, method):
+        """
+        Method to interpolate raster values to points by reading
+        the raster window that overlaps the points block by block.
+        Blocks are padded with the neighboring raster rows so points
+        near the edge of a block are interpolated from the same pixels
+        as they would be from the full raster.
+        """
+        data = np.full(xc.shape, np.nan)
+        if xc.size == 0:
+            return data
+
+        pad = 2
+        x, y = self.__pixel_centers()
+        r0, r1, c0, c1 = self.__get_window(np.min(xc), np.max(xc),
+                                           np.min(yc), np.max(yc), pad=pad)
+        if r0 == r1 or c0 == c1:
+            return data
+
+        # raster row containing each point
+        yd = abs(self._meta["transform"][4])
+        rows = np.floor((y[0] - yc) / yd + 0.5).astype(int)
+        rows = np.clip(rows, r0, r1 - 1)
+
+        for rb0, rb1 in self.__get_blocks(r0, r1, c0, c1, pad=pad):
+            idx = np.flatnonzero((rows >= rb0) & (rows < rb1))
+            if idx.size == 0:
+                continue
+
+            w0, w1 = max(rb0 - pad, r0), min(rb1 + pad, r1)
+            arr = self.__read_window(band, w0, w1, c0, c1,
+                                     masked=method != "cubic")
+            if method in ("bilinear", "bicubic"):
+                data[idx] = self.__interpolate(arr, w0, c0, xc[idx],
+                                               yc[idx], method)
+            else:
+                from scipy.interpolate import griddata
+                rxc, ryc = np.meshgrid(x[c0:c1], y[w0:w1])
+                data[idx] = griddata((rxc.ravel(), ryc.ravel()), arr.ravel(),
+                                     (xc[idx], yc[idx]), method=method)
+
+        return data
+
+    def __polygon_blocks(self, polygon, invert=False):
+        """
+        Method to split the raster window that overlaps a polygon
+        into blocks that fit in max_memory. Yields the first and last
+        row and column of each block and the intersection mask of
+        the block.
+        """
+        polygon = self.__polygon_vertices(polygon)
+        if invert:
+            r0, r1 = 0, self._meta["height"]
+            c0, c1 = 0, self._meta["width"]
+        else:
+            verts = np.array([pt[:2] for pt in polygon], dtype=float)
+            r0, r1, c0, c1 = self.__get_window(np.min(verts[:, 0]),
+                                               np.max(verts[:, 0]),
+                                               np.min(verts[:, 1]),
+                                               np.max(verts[:, 1]))
+
+        x, y = self.__pixel_centers()
+        for rb0, rb1 in self.__get_blocks(r0, r1, c0, c1):
+            xc, yc = np.meshgrid(x[c0:c1], y[rb0:rb1])
+            mask = self._point_in_polygon(xc, yc, list(polygon))
+            if invert:
+                mask = np.invert(mask)
+            yield rb0, rb1, c0, c1, mask
+
+    def __read_pixels(self, band, pixels):
+        """
+        Method to read the values of flattened raster pixel
+        numbers block by block
+        """
+        vals = np.zeros(pixels.shape, dtype=self._meta["dtype"])
+        if pixels.size == 0:
+            return vals
+
+        rows, cols = np.divmod(pixels, self._meta["width"])
+        r0, r1 = int(np.min(rows)), int(np.max(rows)) + 1
+        c0, c1 = int(np.min(cols)), int(np.max(cols)) + 1
+        for rb0, rb1 in self.__get_blocks(r0, r1, c0, c1):
+            idx = np.flatnonzero((rows >= rb0) & (rows < rb1))
+            if idx.size == 0:
+                continue
+            arr = self.__read_window(band, rb0, rb1, c0, c1)
+            vals[idx] = arr[rows[idx] - rb0, cols[idx] - c0]
+
+        return vals
+
+    def get_cell_index(self, modelgrid, fname=None):
+        """
+        Method to get the index of the raster pixels whose centers are
+        located in each cell of a model grid.  The index is built the first
+        time it is requested for a model grid and is reused until the raster
+        or model grid geometry changes.
+
+        Parameters
+        ----------
+        modelgrid : flopy.discretization.Grid object
+            StructuredGrid, VertexGrid, or UnstructuredGrid
+        fname : str
+            optional index cache file name.  The index is loaded from fname
+            if the file was saved for the same raster and model grid
+            geometry, otherwise the index is built and saved to fname.
+
+        Returns
+        -------
+            RasterCellIndex object
+
+        """
+        key = self.__get_cell_index_key(modelgrid)
+        index = self.__cell_index.get(key)
+
+        if index is None and fname is not None and os.path.isfile(fname):
+            try:
+                index = RasterCellIndex.load(fname)
+            except Exception:
+                index = None
+            if index is not None and index.key != key:
+                index = None
+
+        if index is None:
+            index = self.__build_cell_index(modelgrid, key)
+            if fname is not None:
+                index.save(fname)
+
+        self.__cell_index[key] = index
+        return index
+
+    def zonal_statistics(self, modelgrid, band, method="mean"):
+        """
+        Method to summarize the raster values located in each
+        cell of a model grid. Unlike resample_to_grid, no
+        interpolation is done; the statistic is calculated from the
+        raster pixels whose centers are located in each cell.
+
+        Parameters
+        ----------
+        modelgrid : flopy.discretization.Grid object
+            StructuredGrid, VertexGrid, or UnstructuredGrid
+        band : int
+            raster band to summarize
+        method : str
+            statistic calculated for each cell
+
+            "mean" for the mean of the pixel values
+            "median" for the median of the pixel values
+            "min" for the minimum pixel value
+            "max" for the maximum pixel value
+            "mode" for the most common pixel value
+            "count" for the number of pixels
+
+        Returns
+        -------
+            np.array with the shape of the model grid cell centers.
+            Cells without pixel values are set to the raster nodata
+            value (zero for "count").
+
+        """
+        if band not in self.bands:
+            err = "Band number is not recognized, use self.bands for a list " \
+                  "of raster bands"
+            raise AssertionError(err)
+
+        index = self.get_cell_index(modelgrid)
+        if self._windowed:
+            arr = self.__read_pixels(band, index.pixels)
+        else:
+            arr = self.get_array(band, masked=False)
+
+        nodata = self.nodatavals[0]
+        if nodata is None:
+            nodata = np.nan
+        exclude = [v for v in self.nodatavals if v is not None]
+
+        return index.get_statistic(arr, method, nodata=nodata,
+                                   exclude=exclude)
+
+    def __get_cell_index_key(self, modelgrid):
+        """
+        Method to create a hash of the raster and model grid
+        geometry that identifies a cell index
+        """
+        xc = np.ascontiguousarray(modelgrid.xcellcenters, dtype=np.float64)
+        yc = np.ascontiguousarray(modelgrid.ycellcenters, dtype=np.float64)
+        x, y = self.__pixel_centers()
+        raster = tuple(self._meta["transform"])[:6] + (len(y), len(x))
+        grid = (modelgrid.grid_type,) + xc.shape + tuple(modelgrid.extent)
+
+        md5 = hashlib.md5()
+        md5.update(repr((raster, grid)).encode())
+        md5.update(xc.tobytes())
+        md5.update(yc.tobytes())
+        return md5.hexdigest()
+
+    def __build_cell_index(self, modelgrid, key):
+        """
+        Method to find the model grid cell that contains each
+        raster pixel center. Cells that do not contain a pixel
+        center are assigned the pixel that contains the cell center.
+        """
+        x, y = self.__pixel_centers()
+        nrow, ncol = len(y), len(x)
+
+        # step 1: limit the search to pixels within the model grid extent
+        xmin, xmax, ymin, ymax = modelgrid.extent
+        r0, r1, c0, c1 = self.__get_window(xmin, xmax, ymin, ymax)
+
+        # step 2: find the cell that contains each pixel center
+        cells = [np.zeros(0, dtype=int)]
+        pixels = [np.zeros(0, dtype=int)]
+        for rb0, rb1 in self.__get_blocks(r0, r1, c0, c1):
+            xp, yp = np.meshgrid(x[c0:c1], y[rb0:rb1])
+            pix = np.arange(rb0, rb1)[:, np.newaxis] * ncol + \
+                np.arange(c0, c1)
+            cell = self.__intersect_grid(modelgrid, xp.ravel(), yp.ravel())
+            idx = cell >= 0
+            cells.append(cell[idx])
+            pixels.append(pix.ravel()[idx])
+        cells = np.concatenate(cells)
+        pixels = np.concatenate(pixels)
+
+        # step 3: use the pixel containing the cell center for cells
+        # that are smaller than a pixel
+        shape = modelgrid.xcellcenters.shape
+        count = np.bincount(cells, minlength=int(np.prod(shape)))
+        empty = np.flatnonzero(count == 0)
+        if empty.size > 0:
+            xc = np.ravel(modelgrid.xcellcenters)[empty]
+            yc = np.ravel(modelgrid.ycellcenters)[empty]
+            xd = abs(self._meta["transform"][0])
+            yd = abs(self._meta["transform"][4])
+            j = np.floor((xc - x[0]) / xd + 0.5).astype(int)
+            i = np.floor((y[0] - yc) / yd + 0.5).astype(int)
+            idx = (j >= 0) & (j < ncol) & (i >= 0) & (i < nrow)
+            cells = np.concatenate((cells, empty[idx]))
+            pixels = np.concatenate((pixels, i[idx] * ncol + j[idx]))
+
+        return RasterCellIndex(cells, pixels, shape, key=key)
+
+    @staticmethod
+    def __intersect_grid(modelgrid, x, y):
+        """
+        Method to get the flattened number of the model grid cell
+        that contains each point, -1 for points outside of the grid
+        """
+        if modelgrid.grid_type == "structured":
+            # get the cell edges and points in local coordinates
+            x, y = modelgrid.get_local_coords(x, y)
+            xe, ye = modelgrid.xyedges
+            col = np.searchsorted(xe, x, side="left") - 1
+            row = np.searchsorted(-ye, -y, side="left") - 1
+            ncol = len(xe) - 1
+            nrow = len(ye) - 1
+            cells = row * ncol + col
+            cells[(col < 0) | (col >= ncol) | (row < 0) | (row >= nrow)] = -1
+        else:
+            cells = modelgrid.intersect(x, y, forgive=True)
+            cells = np.where(np.isnan(cells), -1, cells).astype(int)
+        return cells
+
     def crop(self, polygon, invert=False):
         """
         Method to crop a new raster object
@@ -395,7 +871,10 @@ class Raster(object):
             area inside the shapes will be masked out
 
         """
-        if self._dataset is not None:
+        if self._windowed:
+            self.__crop_window(polygon, invert)
+
+        elif self._dataset is not None:
             arr_dict, rstr_crp_meta = self._sample_rio_dataset(polygon, invert)
             self.__arr_dict = arr_dict
             self._meta = rstr_crp_meta
@@ -456,13 +935,7 @@ class Raster(object):
             ymai = np.max(yind)
 
             crp_mask = mask[ymii:ymai + 1, xmii:xmai + 1]
-            nodata = self._meta["nodata"]
-            if not isinstance(nodata, float) and not isinstance(nodata, int):
-                try:
-                    nodata = nodata[0]
-                except (IndexError, TypeError):
-                    nodata = -1.0e+38
-                    self._meta["nodata"] = nodata
+            nodata = self.__crop_nodata()
 
             arr_dict = {}
             for band, arr in self.__arr_dict.items():
@@ -487,6 +960,76 @@ class Raster(object):
             self.__xcenters = None
             self.__ycenters = None
 
+    def __crop_window(self, polygon, invert):
+        """
+        Method to crop the raster by reading only the raster
+        windows that overlap the polygon, block by block
+        """
+        from affine import Affine
+
+        # step 1: find the bounding rows and columns of the intersection
+        rows, cols = [], []
+        for r0, r1, c0, c1, mask in self.__polygon_blocks(polygon, invert):
+            i = np.flatnonzero(mask.any(axis=1))
+            j = np.flatnonzero(mask.any(axis=0))
+            if i.size > 0:
+                rows += [r0 + i[0], r0 + i[-1] + 1]
+                cols += [c0 + j[0], c0 + j[-1] + 1]
+
+        if not rows:
+            raise AssertionError("polygon does not intersect the raster")
+
+        ymii, ymai = min(rows), max(rows)
+        xmii, xmai = min(cols), max(cols)
+        nodata = self.__crop_nodata()
+
+        # step 2: read the cropped window and mask pixels outside polygon
+        arr_dict = {band: np.zeros((ymai - ymii, xmai - xmii),
+                                   dtype=self._meta["dtype"])
+                    for band in self.bands}
+        for r0, r1, c0, c1, mask in self.__polygon_blocks(polygon, invert):
+            i0, i1 = max(r0, ymii), min(r1, ymai)
+            if i0 >= i1:
+                continue
+            crp_mask = mask[i0 - r0:i1 - r0, xmii - c0:xmai - c0]
+            for band, arr in arr_dict.items():
+                t = self.__read_window(band, i0, i1, xmii, xmai)
+                t[~crp_mask] = nodata
+                arr[i0 - ymii:i1 - ymii] = t
+
+        # step 3: update metadata including a new Affine
+        x, y = self.__pixel_centers()
+        xd = abs(self._meta["transform"][0])
+        yd = abs(self._meta["transform"][4])
+        xmin = x[xmii] - xd / 2.
+        ymax = y[ymii] + yd / 2.
+
+        self._meta["height"] = ymai - ymii
+        self._meta["width"] = xmai - xmii
+        transform = self._meta['transform']
+        self._meta["transform"] = Affine(transform[0], transform[1], xmin,
+                                         transform[3], transform[4], ymax)
+
+        self.__arr_dict = arr_dict
+        self._windowed = False
+        self._dataset = None
+        self.__xcenters = None
+        self.__ycenters = None
+
+    def __crop_nodata(self):
+        """
+        Method to get the nodata value assigned to cropped
+        raster pixels
+        """
+        nodata = self._meta["nodata"]
+        if not isinstance(nodata, float) and not isinstance(nodata, int):
+            try:
+                nodata = nodata[0]
+            except (IndexError, TypeError):
+                nodata = -1.0e+38
+                self._meta["nodata"] = nodata
+        return nodata
+
     def _sample_rio_dataset(self, polygon, invert):
         """
         Internal method to sample a rasterIO dataset using
@@ -572,6 +1115,26 @@ class Raster(object):
         -------
             mask : np.ndarray (dtype = bool)
 
+        """
+        # step 1: check the data type in shapes
+        polygon = self.__polygon_vertices(polygon)
+
+        # step 2: create a grid of centoids
+        xc = self.xcenters
+        yc = self.ycenters
+
+        # step 3: do intersection
+        mask = self._point_in_polygon(xc, yc, polygon)
+        if invert:
+            mask = np.invert(mask)
+
+        return mask
+
+    @staticmethod
+    def __polygon_vertices(polygon):
+        """
+        Method to get the vertices of a polygon as a
+        list of [(x0, y0), ..., (xn, yn)]
         """
         if shapely is None:
             msg = 'Raster()._intersection(): error ' + \
@@ -580,7 +1143,6 @@ class Raster(object):
         else:
             from shapely import geometry
 
-        # step 1: check the data type in shapes
         if isinstance(polygon, geometry.Polygon):
             polygon = list(polygon.exterior.coords)
 
@@ -601,16 +1163,7 @@ class Raster(object):
             # this is a list of coordinates
             pass
 
-        # step 2: create a grid of centoids
-        xc = self.xcenters
-        yc = self.ycenters
-
-        # step 3: do intersection
-        mask = self._point_in_polygon(xc, yc, polygon)
-        if invert:
-            mask = np.invert(mask)
-
-        return mask
+        return polygon
 
     @staticmethod
     def _point_in_polygon(xc, yc, polygon):
@@ -715,11 +1268,20 @@ class Raster(object):
             name += ".tif"
 
         with rasterio.open(name, "w", **self._meta) as foo:
-            for band, arr in self.__arr_dict.items():
-                foo.write(arr, band)
+            if self._windowed:
+                from rasterio.windows import Window
+                height, width = self._meta["height"], self._meta["width"]
+                for band in self.bands:
+                    for r0, r1 in self.__get_blocks(0, height, 0, width):
+                        arr = self.__read_window(band, r0, r1, 0, width)
+                        window = Window(0, r0, width, r1 - r0)
+                        foo.write(arr, band, window=window)
+            else:
+                for band, arr in self.__arr_dict.items():
+                    foo.write(arr, band)
 
     @staticmethod
-    def load(raster):
+    def load(raster, windowed=False, max_memory=256.):
         """
         Static method to load a raster file
         into the raster object
@@ -727,6 +1289,13 @@ class Raster(object):
         Parameters
         ----------
         raster : str
+        windowed : bool
+            flag to keep the raster file open and read raster values
+            in windows as they are needed instead of reading all of
+            the raster bands into memory
+        max_memory : float
+            approximate maximum memory, in megabytes, used for each
+            block of raster values that is read when windowed is True
 
         Returns
         -------
@@ -739,10 +1308,15 @@ class Raster(object):
             raise ImportError(msg)
 
         dataset = rasterio.open(raster)
-        array = dataset.read()
         bands = dataset.indexes
         meta = dataset.meta
 
+        if windowed:
+            return Raster(None, bands, meta["crs"], meta['transform'],
+                          meta['nodata'], meta['driver'], rio_ds=dataset,
+                          max_memory=max_memory)
+
+        array = dataset.read()
         return Raster(array, bands, meta["crs"], meta['transform'],
                       meta['nodata'], meta['driver'])
 
@@ -850,3 +1424,154 @@ class Raster(object):
             ax = show_hist(data, ax=ax, **kwargs)
 
         return ax
+
+
+class RasterCellIndex(object):
+    """
+    Index of the raster pixels whose centers are located in each
+    cell of a model grid, used to calculate statistics of raster
+    values for each cell.  Built by Raster.get_cell_index().
+
+    Parameters
+    ----------
+    cells : np.ndarray
+        flattened model grid cell number of each indexed pixel
+    pixels : np.ndarray
+        flattened raster pixel number of each indexed pixel
+    shape : tuple
+        shape of the model grid cell arrays
+    key : str
+        hash of the raster and model grid geometry used to build the index
+
+    """
+    methods = ("mean", "median", "min", "max", "mode", "count")
+
+    def __init__(self, cells, pixels, shape, key=None):
+        cells = np.asarray(cells, dtype=np.int64)
+        pixels = np.asarray(pixels, dtype=np.int64)
+        order = np.argsort(cells, kind="mergesort")
+        self.cells = cells[order]
+        self.pixels = pixels[order]
+        self.shape = tuple(int(i) for i in shape)
+        self.ncells = int(np.prod(self.shape))
+        self.key = key
+        self.count = np.bincount(self.cells, minlength=self.ncells)
+
+    def get_statistic(self, array, method="mean", nodata=np.nan, exclude=()):
+        """
+        Method to calculate a statistic of the raster values
+        located in each model grid cell
+
+        Parameters
+        ----------
+        array : np.ndarray
+            two dimensional array of raster band values, or one
+            dimensional array of the values of the indexed pixels
+        method : str
+            "mean", "median", "min", "max", "mode", or "count"
+        nodata : float
+            value assigned to cells without raster values
+        exclude : iterable
+            raster values that are not used in the statistic, in
+            addition to NaN
+
+        Returns
+        -------
+            np.array with the shape of the model grid cell arrays
+
+        """
+        if method not in self.methods:
+            raise ValueError("method must be one of: {}".format(
+                ", ".join(self.methods)))
+
+        if np.ndim(array) == 1 and np.size(array) == self.pixels.size:
+            vals = np.asarray(array)
+        else:
+            vals = np.ravel(array)[self.pixels]
+        valid = np.ones(vals.shape, dtype=bool)
+        for v in exclude:
+            valid &= vals != v
+        if vals.dtype.kind == "f":
+            valid &= ~np.isnan(vals)
+        cells = self.cells[valid]
+        vals = vals[valid].astype(np.float64)
+
+        count = np.bincount(cells, minlength=self.ncells)
+        if method == "count":
+            return count.reshape(self.shape)
+
+        data = np.full(self.ncells, nodata, dtype=np.float64)
+        idx = count > 0
+        start = (np.cumsum(count) - count)[idx]
+        n = count[idx]
+        if vals.size == 0:
+            pass
+        elif method == "mean":
+            total = np.bincount(cells, weights=vals, minlength=self.ncells)
+            data[idx] = total[idx] / n
+        elif method == "min":
+            data[idx] = np.minimum.reduceat(vals, start)
+        elif method == "max":
+            data[idx] = np.maximum.reduceat(vals, start)
+        elif method == "median":
+            vals = vals[np.lexsort((vals, cells))]
+            data[idx] = 0.5 * (vals[start + (n - 1) // 2] +
+                               vals[start + n // 2])
+        elif method == "mode":
+            order = np.lexsort((vals, cells))
+            vals = vals[order]
+            cells = cells[order]
+
+            # runs of equal values in each cell, the longest run
+            # (the smallest value for ties) is the mode
+            run = np.ones(vals.shape, dtype=bool)
+            run[1:] = (cells[1:] != cells[:-1]) | (vals[1:] != vals[:-1])
+            run = np.flatnonzero(run)
+            nrun = np.diff(np.append(run, vals.size))
+            rcell = cells[run]
+            first = np.ones(run.shape, dtype=bool)
+            first[1:] = rcell[1:] != rcell[:-1]
+            maxrun = np.maximum.reduceat(nrun, np.flatnonzero(first))
+            best = np.flatnonzero(nrun == maxrun[np.cumsum(first) - 1])
+            first = np.ones(best.shape, dtype=bool)
+            first[1:] = rcell[best[1:]] != rcell[best[:-1]]
+            best = best[first]
+            data[rcell[best]] = vals[run[best]]
+
+        return data.reshape(self.shape)
+
+    def save(self, fname):
+        """
+        Method to save the index to a numpy .npz file
+
+        Parameters
+        ----------
+        fname : str
+            index file name
+
+        """
+        key = "" if self.key is None else self.key
+        with open(fname, "wb") as f:
+            np.savez(f, cells=self.cells, pixels=self.pixels,
+                     shape=np.array(self.shape, dtype=np.int64),
+                     key=np.array(key))
+
+    @staticmethod
+    def load(fname):
+        """
+        Static method to load an index saved with save()
+
+        Parameters
+        ----------
+        fname : str
+            index file name
+
+        Returns
+        -------
+            RasterCellIndex object
+
+        """
+        with np.load(fname, allow_pickle=False) as f:
+            key = str(f["key"])
+            return RasterCellIndex(f["cells"], f["pixels"], tuple(f["shape"]),
+                                   key=key if key else None)
@@ -11,6 +11,8 @@ from __future__ import division, print_function
 import os
 import shutil
 import copy
+import re
+import string
 import numpy as np
 from warnings import warn
 from ..utils.binaryfile import BinaryHeader
@@ -1496,12 +1498,23 @@ class Transient2d(DataInterface):
         Get the file entry info for a given kper
         returns (itmp,file entry string from Util2d)
         """
+        itmp, u2d = self.get_kper_util2d(kper)
+        if u2d is None:
+            return (itmp, '')
+        return (itmp, u2d.get_file_entry())
+
+    def get_kper_util2d(self, kper):
+        """
+        Get the Util2d that is written for a given kper, so the file entry
+        can be written with Util2d.write_file_entry
+        returns (itmp,Util2d or None if itmp is -1)
+        """
         if kper in self.transient_2ds:
-            return (1, self.transient_2ds[kper].get_file_entry())
+            return (1, self.transient_2ds[kper])
         elif kper < min(self.transient_2ds.keys()):
-            return (1, self.get_zero_2d(kper).get_file_entry())
+            return (1, self.get_zero_2d(kper))
         else:
-            return (-1, '')
+            return (-1, None)
 
     def build_transient_sequence(self):
         """
@@ -2136,6 +2149,28 @@ class Util2d(DataInterface):
             return self._get_fixed_cr(locat)
 
     def get_file_entry(self, how=None):
+        return ''.join(self._file_entry_blocks(how=how))
+
+    def write_file_entry(self, f, how=None):
+        """
+        Write the file entry of the array to an open file. Internal arrays
+        are formatted and written in blocks of rows instead of as a single
+        string.
+
+        Parameters
+        ----------
+        f : file handle
+            File the entry is written to.
+        how : str, optional
+            One of "constant", "internal", "external", or "openclose".
+            Default is None, which uses how of the array.
+
+        """
+        for block in self._file_entry_blocks(how=how):
+            f.write(block)
+
+    def _file_entry_blocks(self, how=None):
+        # generate the file entry in blocks, see get_file_entry
 
         if how is not None:
             how = how.lower()
@@ -2165,8 +2200,9 @@ class Util2d(DataInterface):
         if how == "internal":
             assert not self.format.binary, "Util2d error: 'how' is internal, but" + \
                                            "format is binary"
-            cr = self.get_internal_cr()
-            return cr + self.string
+            yield self.get_internal_cr()
+            for block in self._string_blocks():
+                yield block
 
         elif how == "external" or how == "openclose":
             if how == "openclose":
@@ -2184,7 +2220,8 @@ class Util2d(DataInterface):
                                    self._array,
                                    fortran_format=self.format.fortran)
 
-            elif self.__value != self.python_file_path:
+            elif os.path.abspath(self.__value) != \
+                    os.path.abspath(self.python_file_path):
                 if os.path.exists(self.python_file_path):
                     # if the file already exists, remove it
                     if self._model.verbose:
@@ -2205,9 +2242,9 @@ class Util2d(DataInterface):
                                                             self.python_file_path,
                                                             str(e)))
             if how == "external":
-                return self.get_external_cr()
+                yield self.get_external_cr()
             else:
-                return self.get_openclose_cr()
+                yield self.get_openclose_cr()
 
         elif how == "constant":
             if self.vtype not in [np.int32, np.float32]:
@@ -2218,7 +2255,7 @@ class Util2d(DataInterface):
                 value = u[0]
             else:
                 value = self.__value
-            return self.get_constant_cr(value)
+            yield self.get_constant_cr(value)
 
         else:
             raise Exception("Util2d.get_file_entry() error: " + \
@@ -2239,6 +2276,11 @@ class Util2d(DataInterface):
                                      python_format=self.format.py)
         return a_string
 
+    def _string_blocks(self):
+        # the string representation in blocks of rows, see string
+        return self._array2string_blocks(self.shape, self._array,
+                                         python_format=self.format.py)
+
     @property
     def array(self):
         """
@@ -2384,9 +2426,183 @@ class Util2d(DataInterface):
         if openfile:
             file_in = open(file_in, 'r')
         npl, fmt, width, decimal = ArrayFormat.decode_fortran_descriptor(fmtin)
+        try:
+            data, lines = None, []
+            if npl != 'free':
+                data, lines = Util2d._load_txt_fixed(file_in, num_items,
+                                                     dtype, npl, width)
+            elif num_items >= 1000:
+                # small arrays are parsed faster item by item
+                data, lines = Util2d._load_txt_free(file_in, num_items,
+                                                    dtype)
+            if data is None:
+                # parse the lines that have already been read (and any
+                # additional lines that are needed) item by item
+                data = Util2d._load_txt_items(file_in, lines, num_items,
+                                              dtype, npl, width)
+        finally:
+            if openfile:
+                file_in.close()
+        if data.size != num_items:
+            raise ValueError('Util2d.load_txt(): expected array size {0},'
+                             ' but found size {1}'.format(num_items,
+                                                          data.size))
+        return data.reshape(shape)
+
+    @staticmethod
+    def _load_txt_free(file_in, num_items, dtype, itemsize=8):
+        """Read a free format array in blocks and parse all of the items
+        at once with np.fromstring.
+
+        The first block is num_items * itemsize characters long and each
+        block after it is twice as long.
+
+        Returns
+        -------
+        data : ndarray or None
+            1-D array of num_items values, or None if the items could not
+            be parsed in bulk. If None, the position of file_in is not
+            changed.
+        lines : list of str
+            Always empty, lines are not retained
+        """
+        if num_items < 1:
+            return None, []
+        try:
+            pos = file_in.tell()
+        except (AttributeError, IOError, ValueError):
+            return None, []
+        blocksize = num_items * itemsize
+        blocks = []
+        offset = 0
+        nitems = 0
+        prevsep = True
+        ilast = -1
+        while True:
+            blockpos, blockoffset = file_in.tell(), offset
+            block = file_in.read(blocksize)
+            if not isinstance(block, str):
+                file_in.seek(pos)
+                return None, []
+            eof = len(block) < blocksize
+            blocks.append(block)
+            if len(block) > 0:
+                # locate the start of each item, one byte per character
+                b = np.frombuffer(block.encode('ascii', 'replace'),
+                                  dtype=np.uint8)
+                # whitespace, control characters, and commas separate items
+                sep = (b <= 32) | (b == 44)
+                start = np.empty(sep.shape, dtype=bool)
+                start[0] = prevsep and not sep[0]
+                np.greater(sep[:-1], sep[1:], out=start[1:])
+                prevsep = sep[-1]
+                nstart = np.count_nonzero(start)
+                if nitems + nstart >= num_items:
+                    start = np.flatnonzero(start)
+                    ilast = offset + start[num_items - nitems - 1]
+                nitems += nstart
+            offset += len(block)
+            if ilast >= 0:
+                # stop at the end of the line with the last item
+                if not eof and '\n' not in block[ilast - blockoffset:]:
+                    blocks.append(file_in.readline())
+                break
+            if eof:
+                file_in.seek(pos)
+                return None, []
+            blocksize *= 2
+        text = ''.join(blocks)
+        nread = len(text)
+        nchar = text.find('\n', ilast) + 1
+        if nchar == 0:
+            nchar = nread
+        text = text[:nchar]
+        if '*' in text:
+            # repeat counts are expanded by the item by item parser
+            file_in.seek(pos)
+            return None, []
+        if ',' in text:
+            text = text.replace(',', ' ')
+        # items on the line after the last item are also parsed
+        tail = text[ilast:].split()
+        nitems = num_items + len(tail) - 1
+        try:
+            data = np.fromstring(text, dtype=dtype, sep=' ')
+            # np.fromstring stops at the first item it cannot parse, which
+            # changes the number of items unless it is the last one, so the
+            # items on the last line are converted like the item by item
+            # parser converts them
+            if data.size == nitems:
+                data[num_items - 1:] = np.fromiter(tail, dtype=dtype,
+                                                   count=len(tail))
+        except (ValueError, UnicodeError):
+            file_in.seek(pos)
+            return None, []
+        if data.size != nitems:
+            file_in.seek(pos)
+            return None, []
+        if nchar < nread:
+            # move to the start of the line after the array
+            file_in.seek(blockpos)
+            file_in.read(nchar - blockoffset)
+        return data[:num_items], []
+
+    @staticmethod
+    def _load_txt_fixed(file_in, num_items, dtype, npl, width):
+        """Read the lines of a fixed width array and split them into
+        fields by viewing the lines as an (nlines, npl, width) character
+        buffer.
+
+        Returns
+        -------
+        data : ndarray or None
+            1-D array of num_items values, or None if the items could not
+            be parsed in bulk
+        lines : list of str
+            The lines that were read from file_in
+        """
+        linewidth = npl * width
+        lines = []
+        fields = []
+        nitems = 0
+        while nitems < num_items:
+            line = file_in.readline()
+            if len(line) == 0:
+                raise ValueError('Util2d.load_txt(): no data found')
+            lines.append(line)
+            field = line[:linewidth].rstrip()
+            # number of fields, assuming there are no blank fields before
+            # the last item on the line
+            nitems += -(-len(field) // width)
+            fields.append(field.ljust(linewidth))
+        try:
+            buf = ''.join(fields).encode('ascii')
+        except UnicodeEncodeError:
+            return None, lines
+        fields = np.frombuffer(buf, dtype='S{}'.format(width))
+        chars = np.frombuffer(buf, dtype=np.uint8).reshape(-1, width)
+        blank = np.all((chars == 32) | (chars == 9), axis=1)
+        if blank.sum() != fields.size - nitems:
+            # blank fields between items, use the item by item parser
+            return None, lines
+        try:
+            data = fields[~blank].astype(dtype)
+        except ValueError:
+            return None, lines
+        return data[:num_items], lines
+
+    @staticmethod
+    def _load_txt_items(file_in, lines, num_items, dtype, npl, width):
+        """Parse a formatted array item by item, starting with lines that
+        have already been read from file_in.
+        """
         items = []
+        lines = list(lines)
         while len(items) < num_items:
-            line = file_in.readline()
+            if len(lines) > 0:
+                line = lines.pop(0)
+            else:
+                line = file_in.readline()
             if len(line) == 0:
                 raise ValueError('Util2d.load_txt(): no data found')
             if npl == 'free':
@@ -2412,28 +2628,33 @@ class Util2d(DataInterface):
                             items.append(item)
                     except IndexError:
                         break
-        if openfile:
-            file_in.close()
-        data = np.fromiter(items, dtype=dtype, count=num_items)
-        if data.size != num_items:
-            raise ValueError('Util2d.load_txt(): expected array size {0},'
-                             ' but found size {1}'.format(num_items,
-                                                          data.size))
-        return data.reshape(shape)
+        return np.fromiter(items, dtype=dtype, count=num_items)
 
     @staticmethod
     def write_txt(shape, file_out, data, fortran_format="(FREE)",
                   python_format=None):
+        """
+        Write an array to a file name or file handle. The array is
+        formatted and written in blocks of rows.
+        """
         if fortran_format.upper() == '(FREE)' and python_format is None:
             np.savetxt(file_out, np.atleast_2d(data),
                        ArrayFormat.get_default_numpy_fmt(data.dtype),
                        delimiter='')
             return
         if not hasattr(file_out, "write"):
-            file_out = open(file_out, 'w')
-        file_out.write(
-            Util2d.array2string(shape, data, fortran_format=fortran_format,
-                                python_format=python_format))
+            with open(file_out, 'w') as f:
+                Util2d.write_txt(shape, f, data,
+                                 fortran_format=fortran_format,
+                                 python_format=python_format)
+            return
+        for block in Util2d._array2string_blocks(
+                shape, data, fortran_format=fortran_format,
+                python_format=python_format):
+            file_out.write(block)
+
+    # approximate number of array values formatted at once by the writers
+    _chunksize = 65536
 
     @staticmethod
     def array2string(shape, data, fortran_format="(FREE)",
@@ -2446,6 +2667,17 @@ class Util2d(DataInterface):
         this routine now supports fixed format arrays where the numbers
         may touch.
         """
+        return ''.join(Util2d._array2string_blocks(
+            shape, data, fortran_format=fortran_format,
+            python_format=python_format))
+
+    @staticmethod
+    def _array2string_blocks(shape, data, fortran_format="(FREE)",
+                             python_format=None):
+        """
+        Generate the string representation of array2string in blocks of
+        rows, so arrays can be written without building the whole string.
+        """
         if len(shape) == 2:
             nrow, ncol = shape
         else:
@@ -2475,22 +2707,92 @@ class Util2d(DataInterface):
             linereturnflag = False
         else:
             linereturnflag = True
-        # write the array to a string
-        s = ""
-        for i in range(nrow):
-            icol = 0
+
+        # format for a row, with a replacement field for each value
+        item_fmt, percent = Util2d._get_item_format(output_fmt,
+                                                    data.dtype.kind)
+        row_fmt = None
+        if item_fmt is not None:
+            row_fmt = ''
             for j in range(ncol):
-                try:
-                    s = s + output_fmt.format(data[i, j])
-                except Exception as e:
-                    raise Exception("error writing array value" + \
-                                    "{0} at r,c [{1},{2}]\n{3}".format(
-                                        data[i, j], i, j, str(e)))
+                row_fmt += item_fmt
                 if (j + 1) % column_length == 0.0 and (j != 0 or ncol == 1):
-                    s += '\n'
+                    row_fmt += '\n'
             if linereturnflag:
-                s += '\n'
-        return s
+                row_fmt += '\n'
+
+        # write the array in blocks of rows
+        nblock = max(1, Util2d._chunksize // max(ncol, 1))
+        for i0 in range(0, nrow, nblock):
+            i1 = min(i0 + nblock, nrow)
+            if row_fmt is not None:
+                try:
+                    values = data[i0:i1, :ncol].ravel().tolist()
+                    if percent:
+                        yield (row_fmt * (i1 - i0)) % tuple(values)
+                    else:
+                        yield (row_fmt * (i1 - i0)).format(*values)
+                    continue
+                except Exception:
+                    # format each value to report the value that failed
+                    pass
+            s = []
+            for i in range(i0, i1):
+                for j in range(ncol):
+                    try:
+                        s.append(output_fmt.format(data[i, j]))
+                    except Exception as e:
+                        raise Exception("error writing array value" + \
+                                        "{0} at r,c [{1},{2}]\n{3}".format(
+                                            data[i, j], i, j, str(e)))
+                    if (j + 1) % column_length == 0.0 and \
+                            (j != 0 or ncol == 1):
+                        s.append('\n')
+                if linereturnflag:
+                    s.append('\n')
+            yield ''.join(s)
+
+    @staticmethod
+    def _get_item_format(output_fmt, kind):
+        """
+        Convert a format with a single replacement field, such as
+        '{0:15.6E}', to a format that can be repeated for each value of a
+        row. Simple numeric formats are converted to printf-style formats,
+        which are faster. Returns (None, False) for other formats.
+        """
+        try:
+            parsed = list(string.Formatter().parse(output_fmt))
+        except ValueError:
+            return None, False
+        fields = [(spec, conversion) for literal, field, spec, conversion
+                  in parsed if field is not None]
+        if len(fields) != 1:
+            return None, False
+        spec, conversion = fields[0]
+        # the values are formatted as python scalars, which is only the
+        # same as formatting numpy scalars if a format spec is given
+        if conversion or not spec or '{' in spec:
+            return None, False
+        if any(item[1] not in (None, '', '0') for item in parsed):
+            return None, False
+        match = re.match(r'^(\d*(\.\d+)?)([eEfFgGd])$', spec)
+        percent = False
+        if match is not None:
+            if match.group(3) == 'd':
+                percent = kind in 'iub' and match.group(2) is None
+            else:
+                percent = kind == 'f'
+        fmt = ''
+        for literal, field, _, _ in parsed:
+            if percent:
+                fmt += literal.replace('%', '%%')
+                if field is not None:
+                    fmt += '%' + spec
+            else:
+                fmt += literal.replace('{', '{{').replace('}', '}}')
+                if field is not None:
+                    fmt += '{:' + spec + '}'
+        return fmt, percent
 
     @staticmethod
     def load_bin(shape, file_in, dtype, bintype=None):
@@ -2633,13 +2935,15 @@ class Util2d(DataInterface):
 
     @staticmethod
     def load(f_handle, model, shape, dtype, name, ext_unit_dict=None,
-             array_free_format=None, array_format="modflow"):
+             array_free_format=None, array_format="modflow", lazy=False):
         """
         functionality to load Util2d instance from an existing
         model input file.
         external and internal record types must be fully loaded
         if you are using fixed format record types,make sure
         ext_unit_dict has been initialized from the NAM file
+        if lazy is True, free format open/close arrays are not read, the
+        Util2d refers to the file and reads it when the array is used
         """
         if shape == (0, 0):
             raise IndexError('No information on model grid dimensions. '
@@ -2681,6 +2985,13 @@ class Util2d(DataInterface):
             # load_txt(shape, file_in, dtype, fmtin):
             assert os.path.exists(fname), "Util2d.load() error: open/close " + \
                                           "file " + str(fname) + " not found"
+            fmtin = cr_dict['fmtin'].lower().replace('(', '').replace(')', '')
+            if lazy and fmtin.strip() == 'free':
+                u2d = Util2d(model, shape, dtype, fname, name=name,
+                             iprn=cr_dict['iprn'], fmtin="(FREE)",
+                             cnstnt=cr_dict['cnstnt'],
+                             array_free_format=array_free_format)
+                return u2d
             if str('binary') not in str(cr_dict['fmtin'].lower()):
                 f = open(fname, 'r')
                 data = Util2d.load_txt(shape=shape,
@@ -2726,7 +3037,7 @@ class Util2d(DataInterface):
                          array_free_format=array_free_format)
             # track this unit number so we can remove it from the external
             # file list later
-            model.pop_key_list.append(cr_dict['nunit'])
+            model.add_pop_key_list(cr_dict['nunit'])
         elif cr_dict['type'] == 'block':
             data = Util2d.load_block(shape, f_handle, dtype)
             u2d = Util2d(model, shape, dtype, data, name=name,
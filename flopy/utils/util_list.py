@@ -11,6 +11,7 @@ from __future__ import division, print_function
 
 import os
 import warnings
+from itertools import chain, islice
 import numpy as np
 from ..datbase import DataInterface, DataListInterface, DataType
 
@@ -46,17 +47,25 @@ class MfList(DataInterface, DataListInterface):
         write the transient sequence to the model input file f
     check_kij() : None
         checks for boundaries outside of model domain - issues warnings only
+    load_lazy_data(filenames) : None
+        read the stress period lists that are loaded lazily
 
     See Also
     --------
 
     Notes
     -----
+    Stress periods can be set with MfListSource objects, which refer to a
+    list in a model input file. The list is read the first time the stress
+    period is accessed, and is copied to the new file by write_transient
+    if it has not been accessed.
 
     Examples
     --------
 
     """
+    # number of rows that are formatted at once when lists are written
+    _chunksize = 65536
 
     def __init__(self, package, data=None, dtype=None, model=None,
                  list_free_format=None, binary=False):
@@ -208,6 +217,7 @@ class MfList(DataInterface, DataListInterface):
 
     @property
     def data(self):
+        self.load_lazy_data()
         return self.__data
 
     @property
@@ -233,6 +243,8 @@ class MfList(DataInterface, DataListInterface):
             return self.__fromfile(self.__data[kper]).shape[0]
         if self.__vtype[kper] == np.recarray:
             return self.__data[kper].shape[0]
+        if self.__vtype[kper] == MfListSource:
+            return self.__data[kper].nlist
         # If not any of the above, it must be an int
         return self.__data[kper]
 
@@ -243,19 +255,24 @@ class MfList(DataInterface, DataListInterface):
             mxact = max(mxact, self.get_itmp(kper))
         return mxact
 
+    @property
+    def free_format(self):
+        """Returns True if the lists are written in free format"""
+        if self.list_free_format is not None:
+            return self.list_free_format
+        use_free = True
+        if self.package.parent.has_package('bas6'):
+            use_free = self.package.parent.bas6.ifrefm
+        # mt3d list data is fixed format
+        if 'mt3d' in self.package.parent.version.lower():
+            use_free = False
+        return use_free
+
     @property
     def fmt_string(self):
         """Returns a C-style fmt string for numpy savetxt that corresponds to
         the dtype"""
-        if self.list_free_format is not None:
-            use_free = self.list_free_format
-        else:
-            use_free = True
-            if self.package.parent.has_package('bas6'):
-                use_free = self.package.parent.bas6.ifrefm
-            # mt3d list data is fixed format
-            if 'mt3d' in self.package.parent.version.lower():
-                use_free = False
+        use_free = self.free_format
         fmts = []
         for field in self.dtype.descr:
             vtype = field[1][1].lower()
@@ -332,6 +349,8 @@ class MfList(DataInterface, DataListInterface):
 
                 if isinstance(d, np.recarray):
                     self.__cast_recarray(kper, d)
+                elif isinstance(d, MfListSource):
+                    self.__cast_source(kper, d)
                 elif isinstance(d, np.ndarray):
                     self.__cast_ndarray(kper, d)
                 elif isinstance(d, int):
@@ -405,6 +424,38 @@ class MfList(DataInterface, DataListInterface):
                             str(e))
         self.__vtype[kper] = np.recarray
 
+    def __cast_source(self, kper, d):
+        d.bind(self)
+        self.__data[kper] = d
+        self.__vtype[kper] = MfListSource
+
+    def __load_source(self, kper):
+        # read a lazily loaded list and replace the source with the recarray
+        d = self.__data[kper].load(self)
+        self.__data[kper] = d
+        self.__vtype[kper] = np.recarray
+        return d
+
+    def load_lazy_data(self, filenames=None):
+        """
+        Read the stress period lists that are loaded lazily.
+
+        Parameters
+        ----------
+        filenames : list of str, optional
+            Only read the lists that are in these files. Default is None,
+            which reads all of the lazily loaded lists.
+
+        """
+        if filenames is not None:
+            filenames = [os.path.abspath(fn) for fn in filenames]
+        for kper, vtype in list(self.__vtype.items()):
+            if vtype != MfListSource:
+                continue
+            if filenames is None or \
+                    self.__data[kper].filename in filenames:
+                self.__load_source(kper)
+
     def get_dataframe(self, squeeze=True):
         """
         Cast recarrays for stress periods into single
@@ -513,6 +564,10 @@ class MfList(DataInterface, DataListInterface):
                 # Extend the recarray
                 self.__data[kper] = np.append(
                     self.__data[kper], self.get_empty(1))
+            elif self.vtype[kper] == MfListSource:
+                # If lazily loaded, read the list and extend it
+                self.__data[kper] = np.append(
+                    self.__load_source(kper), self.get_empty(1))
         else:
             self.__data[kper] = self.get_empty(1)
             self.__vtype[kper] = np.recarray
@@ -537,26 +592,34 @@ class MfList(DataInterface, DataListInterface):
             raise Exception(
                 "MfList error: _getitem__() passed invalid kper index:"
                 + str(kper))
-        if kper not in list(self.data.keys()):
+        if kper not in list(self.__data.keys()):
             if kper == 0:
                 return self.get_empty()
             else:
-                return self.data[self.__find_last_kper(kper)]
+                return self.__get_last(kper)
         if self.vtype[kper] == int:
-            if self.data[kper] == 0:
+            if self.__data[kper] == 0:
                 return self.get_empty()
             else:
-                return self.data[self.__find_last_kper(kper)]
+                return self.__get_last(kper)
         if self.vtype[kper] == str:
-            return self.__fromfile(self.data[kper])
+            return self.__fromfile(self.__data[kper])
         if self.vtype[kper] == np.recarray:
-            return self.data[kper]
+            return self.__data[kper]
+        if self.vtype[kper] == MfListSource:
+            return self.__load_source(kper)
+
+    def __get_last(self, kper):
+        last = self.__find_last_kper(kper)
+        if self.__vtype[last] == MfListSource:
+            return self.__load_source(last)
+        return self.__data[last]
 
     def __setitem__(self, kper, data):
         if kper in list(self.__data.keys()):
             if self._model.verbose:
                 print('removing existing data for kper={}'.format(kper))
-            self.data.pop(kper)
+            self.__data.pop(kper)
         # If data is a list, then all we can do is try to cast it to
         # an ndarray, then cast again to a recarray
         if isinstance(data, list):
@@ -593,7 +656,7 @@ class MfList(DataInterface, DataListInterface):
         return d
 
     def get_filenames(self):
-        kpers = list(self.data.keys())
+        kpers = list(self.__data.keys())
         kpers.sort()
         filenames = []
         first = kpers[0]
@@ -631,7 +694,13 @@ class MfList(DataInterface, DataListInterface):
         nr, nc, nl, nper = self._model.get_nrow_ncol_nlay_nper()
         assert hasattr(f, "read"), "MfList.write() error: " + \
                                    "f argument must be a file handle"
-        kpers = list(self.data.keys())
+        # lists that are read lazily from the file that is written have to
+        # be read before anything is written; this raises an IOError if the
+        # file was already truncated when it was opened
+        name = getattr(f, 'name', None)
+        if isinstance(name, str):
+            self.load_lazy_data([name])
+        kpers = list(self.__data.keys())
         kpers.sort()
         first = kpers[0]
         if single_per is None:
@@ -649,6 +718,8 @@ class MfList(DataInterface, DataListInterface):
             elif kper in kpers:
                 kper_data = self.__data[kper]
                 kper_vtype = self.__vtype[kper]
+                if kper_vtype == MfListSource:
+                    itmp = kper_data.nlist
                 if (kper_vtype == str):
                     if (not self._model.array_free_format):
                         kper_data = self.__fromfile(kper_data)
@@ -674,6 +745,9 @@ class MfList(DataInterface, DataListInterface):
             if self.__binary:
                 isExternal = True
             if isExternal:
+                if kper_vtype == MfListSource:
+                    kper_data = kper_data.load(self)
+                    kper_vtype = np.recarray
                 if kper_vtype == np.recarray:
                     py_filepath = ''
                     if self._model.model_ws is not None:
@@ -692,6 +766,12 @@ class MfList(DataInterface, DataListInterface):
                     kper_vtype = str
                     kper_data = model_filepath
 
+            # the lines of the source can only be copied if the list is
+            # still written the way the source file was read
+            if kper_vtype == MfListSource and not kper_data.matches(self):
+                kper_data = kper_data.load(self)
+                kper_vtype = np.recarray
+
             if kper_vtype == np.recarray:
                 name = f.name
                 if self.__binary or not numpy114:
@@ -708,6 +788,9 @@ class MfList(DataInterface, DataListInterface):
                 if self.__binary:
                     f.write(' (BINARY)')
                 f.write('\n')
+            elif kper_vtype == MfListSource:
+                # copy the list that has not been read from the source file
+                kper_data.write(f)
 
     def __tofile(self, f, data):
         # Write the recarray (data) to the file (or file handle) f
@@ -728,8 +811,42 @@ class MfList(DataInterface, DataListInterface):
             dtype2 = np.dtype(dtype2)
             d = np.array(d, dtype=dtype2)
             d.tofile(f)
-        else:
+        elif isinstance(f, str):
+            with open(f, 'w') as fh:
+                self.__savetxt(fh, d)
+        elif 'b' in getattr(f, 'mode', ''):
             np.savetxt(f, d, fmt=self.fmt_string, delimiter='')
+        else:
+            self.__savetxt(f, d)
+
+    def __savetxt(self, f, d):
+        # Write the recarray d to the text file handle f in blocks of rows.
+        # The text is the same as np.savetxt(f, d, fmt=self.fmt_string),
+        # but each block is formatted with a single string operation.
+        fmt_string = self.fmt_string
+        row_fmt = fmt_string + '\n'
+        names = d.dtype.names
+        fmts = ['%' + fmt for fmt in fmt_string.split('%')[1:]]
+        # floats written with %s use the numpy string representation,
+        # which is not the same as the representation of python floats
+        as_str = [fmt.strip()[-1] == 's' and d.dtype[name].kind == 'f'
+                  for name, fmt in zip(names, fmts)]
+        for i0 in range(0, d.shape[0], self._chunksize):
+            block = d[i0:i0 + self._chunksize]
+            values = np.empty((block.shape[0], len(names)), dtype=object)
+            for j, name in enumerate(names):
+                if as_str[j]:
+                    values[:, j] = block[name].astype(str)
+                else:
+                    values[:, j] = block[name].tolist()
+            try:
+                text = (row_fmt * block.shape[0]) % \
+                       tuple(values.ravel().tolist())
+            except (TypeError, ValueError):
+                # fall back to numpy, which also reports formatting errors
+                np.savetxt(f, block, fmt=fmt_string, delimiter='')
+                continue
+            f.write(text)
 
     def check_kij(self):
         names = self.dtype.names
@@ -770,12 +887,12 @@ class MfList(DataInterface, DataListInterface):
                     warnings.warn(warn_str)
 
     def __find_last_kper(self, kper):
-        kpers = list(self.data.keys())
+        kpers = list(self.__data.keys())
         kpers.sort()
         last = 0
         for kkper in kpers[::-1]:
             # if this entry is valid
-            if self.vtype[kkper] != int or self.data[kkper] != -1:
+            if self.vtype[kkper] != int or self.__data[kkper] != -1:
                 last = kkper
                 if kkper <= kper:
                     break
@@ -1016,8 +1133,8 @@ class MfList(DataInterface, DataListInterface):
                 arrays[name] = arr.copy()
 
         # if this kper is not found
-        if kper not in self.data.keys():
-            kpers = list(self.data.keys())
+        if kper not in self.__data.keys():
+            kpers = list(self.__data.keys())
             kpers.sort()
             # if this kper is before the first entry,
             # (maybe) mask and return
@@ -1030,7 +1147,10 @@ class MfList(DataInterface, DataListInterface):
             else:
                 kper = self.__find_last_kper(kper)
 
-        sarr = self.data[kper]
+        if self.__vtype[kper] == MfListSource:
+            sarr = self.__load_source(kper)
+        else:
+            sarr = self.__data[kper]
 
         if np.isscalar(sarr):
             # if there are no entries for this kper
@@ -1177,3 +1297,223 @@ class MfList(DataInterface, DataListInterface):
                 spd[n] = v
             sp_data[kper] = spd
         return sp_data
+
+
+class MfListSource(object):
+    """
+    Reference to the list of a stress period in a MODFLOW input file. The
+    list is only read when the stress period data are used.
+
+    Parameters
+    ----------
+    filename : str
+        File that contains the list.
+    offset : int
+        Position of the start of the list in the file, as returned by tell()
+        on a file opened in text mode.
+    nlist : int
+        Number of rows in the list.
+    sfac_columns : list of str, optional
+        Names of the columns that are scaled by SFAC. (default is None)
+    free_format : bool, optional
+        True if the list was read in free format. (default is True)
+
+    Notes
+    -----
+    The size and modification time of the file are stored when the
+    MfListSource is created. An IOError is raised if the file is changed
+    before the list is read.
+
+    The dtype and the package options of the MfList the source is added to
+    are stored as well. The lines of the list are only copied by write if
+    the free format flag, the dtype and the options of the MfList are still
+    the same, otherwise the list is read and formatted by the MfList.
+
+    """
+
+    def __init__(self, filename, offset, nlist, sfac_columns=None,
+                 free_format=True):
+        self.filename = os.path.abspath(filename)
+        self.offset = offset
+        self.nlist = nlist
+        if sfac_columns is None:
+            sfac_columns = []
+        self.sfac_columns = list(sfac_columns)
+        self.free_format = free_format
+        self.dtype = None
+        self.options = None
+        self._stat = self._get_stat()
+
+    @staticmethod
+    def _get_options(mflist):
+        # text of the package options, which can be a list or an OptionBlock
+        return str(getattr(mflist.package, 'options', None))
+
+    def bind(self, mflist):
+        """
+        Store the dtype and the package options of the MfList the source is
+        added to, if they were not stored before.
+
+        Parameters
+        ----------
+        mflist : MfList
+            The MfList the stress period belongs to.
+
+        """
+        if self.dtype is None:
+            self.dtype = mflist.dtype
+            self.options = self._get_options(mflist)
+
+    def matches(self, mflist):
+        """
+        Check if the lines of the list can be copied to the file of a MfList.
+
+        Parameters
+        ----------
+        mflist : MfList
+            The MfList the stress period belongs to.
+
+        Returns
+        -------
+        matches : bool
+            True if the free format flag, the dtype and the package options
+            of mflist are the same as when the list was loaded.
+
+        """
+        return mflist.free_format == self.free_format and \
+            mflist.dtype == self.dtype and \
+            self._get_options(mflist) == self.options
+
+    def _get_stat(self):
+        stat = os.stat(self.filename)
+        return stat.st_size, stat.st_mtime
+
+    def check(self):
+        """
+        Check that the file has not been changed since the MfListSource was
+        created.
+
+        """
+        if not os.path.isfile(self.filename) or \
+                self._get_stat() != self._stat:
+            raise IOError('MfListSource: {} '.format(self.filename) +
+                          'was changed after the stress period list was '
+                          'located, the list can no longer be read')
+
+    @classmethod
+    def from_file(cls, f, nlist, model, sfac_columns=None):
+        """
+        Locate the list that starts at the current position of a file and
+        move the file past the list without reading the values.
+
+        Parameters
+        ----------
+        f : file handle
+            File opened in text mode.
+        nlist : int
+            Number of rows in the list.
+        model : model object
+            The model the list is loaded for.
+        sfac_columns : list of str, optional
+            Names of the columns that are scaled by SFAC.
+
+        Returns
+        -------
+        source : MfListSource or None
+            None if the list cannot be loaded lazily, for example lists on
+            EXTERNAL units or binary lists. f is not moved in this case.
+
+        """
+        try:
+            pos = f.tell()
+            filename = f.name
+        except (AttributeError, IOError, OSError):
+            return None
+        if not isinstance(filename, str) or not os.path.isfile(filename):
+            return None
+
+        line = f.readline()
+        key = line.strip().lower()
+        if key.startswith('external') or key == '':
+            f.seek(pos)
+            return None
+        if key.startswith('open/close'):
+            if '(binary)' in key:
+                f.seek(pos)
+                return None
+            fname = line.strip().split()[1]
+            if '/' in fname:
+                raw = fname.split('/')
+            elif '\\' in fname:
+                raw = fname.split('\\')
+            else:
+                raw = [fname]
+            oc_filename = os.path.join(model.model_ws, *raw)
+            if not os.path.isfile(oc_filename):
+                f.seek(pos)
+                return None
+            return cls(oc_filename, 0, nlist, sfac_columns,
+                       model.free_format_input)
+
+        # skip the rest of an internal list
+        nskip = nlist - 1
+        if key.startswith('sfac'):
+            nskip += 1
+        for i in range(nskip):
+            if f.readline() == '':
+                f.seek(pos)
+                return None
+        return cls(filename, pos, nlist, sfac_columns,
+                   model.free_format_input)
+
+    def load(self, mflist):
+        """
+        Read the list.
+
+        Parameters
+        ----------
+        mflist : MfList
+            The MfList the stress period belongs to.
+
+        Returns
+        -------
+        ra : np.recarray
+            The list with zero-based cell indices.
+
+        """
+        from .flopy_io import ulstrd
+        self.check()
+        model = mflist.model
+        ra = mflist.get_empty(self.nlist).view(np.recarray)
+        with open(self.filename, 'r') as f:
+            f.seek(self.offset)
+            ra = ulstrd(f, self.nlist, ra, model, self.sfac_columns, None)
+        if model.structured:
+            ra['k'] -= 1
+            ra['i'] -= 1
+            ra['j'] -= 1
+        else:
+            ra['node'] -= 1
+        return ra
+
+    def write(self, f):
+        """
+        Copy the lines of the list to a file.
+
+        Parameters
+        ----------
+        f : file handle
+            File opened in text mode.
+
+        """
+        self.check()
+        with open(self.filename, 'r') as src:
+            src.seek(self.offset)
+            line = src.readline()
+            n = self.nlist - 1
+            if line.strip().lower().startswith('sfac'):
+                n += 1
+            for line in chain([line], islice(src, n)):
+                f.write(line)
+            if not line.endswith('\n'):
+                f.write('\n')
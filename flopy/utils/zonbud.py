@@ -1,8 +1,8 @@
 import os
+import sys
 import copy
 import numpy as np
 from .binaryfile import CellBudgetFile
-from itertools import groupby
 from collections import OrderedDict
 from ..utils.utils_def import totim_to_datetime
 
@@ -29,6 +29,12 @@ class ZoneBudget(object):
         When using this option in conjunction with a list of zones, the
         zone(s) passed may either be all strings (aliases), all integers,
         or mixed.
+    max_workers : int
+        Number of worker processes used to compute the budgets for the
+        time steps. The cell budget file is always read once in record
+        order; when max_workers is greater than 1 the budget for each time
+        step is computed in a process pool. (default is None, which
+        computes the budgets in the current process).
 
     Returns
     -------
@@ -79,6 +85,7 @@ class ZoneBudget(object):
             self.sr = self.dis.parent.sr
         if 'sr' in kwargs.keys():
             self.sr = kwargs.pop('sr')
+        max_workers = kwargs.pop('max_workers', None)
         if len(kwargs.keys()) > 0:
             args = ','.join(kwargs.keys())
             raise Exception('LayerFile error: unrecognized kwargs: ' + args)
@@ -158,6 +165,8 @@ class ZoneBudget(object):
                     seen.append(z)
 
         self._iflow_recnames = self._get_internal_flow_record_names()
+        self._iflow_names = dict(zip(self._iflow_recnames['zone'].tolist(),
+                                     self._iflow_recnames['name'].tolist()))
 
         # All record names in the cell-by-cell budget binary file
         self.record_names = [n.strip() for n in
@@ -186,36 +195,178 @@ class ZoneBudget(object):
 
         # Initialize budget recordarray
         array_list = []
+        time_keys = []
         if self.kstpkper is not None:
             for kk in self.kstpkper:
                 recordarray = self._initialize_budget_recordarray(kstpkper=kk,
                                                                   totim=None)
                 array_list.append(recordarray)
+                time_keys.append(tuple(kk))
         elif self.totim is not None:
             for t in self.totim:
                 recordarray = self._initialize_budget_recordarray(
                     kstpkper=None, totim=t)
                 array_list.append(recordarray)
+                time_keys.append(t)
         self._budget = np.concatenate(array_list, axis=0)
 
+        # Map each time and record name to its row in the budget
+        # recordarray so fluxes can be accumulated without searching
+        self._budget_rows = {}
+        offsets = []
+        offset = 0
+        for key, recordarray in zip(time_keys, array_list):
+            if key not in self._budget_rows:
+                self._budget_rows[key] = self._get_recordarray_rows(
+                    recordarray, offset)
+            offsets.append(offset)
+            offset += len(recordarray)
+
         # Update budget record array
         if self.kstpkper is not None:
-            for kk in self.kstpkper:
-                if verbose:
-                    s = 'Computing the budget for' \
-                        ' time step {} in stress period {}'.format(kk[0] + 1,
-                                                                   kk[1] + 1)
-                    print(s)
-                self._compute_budget(kstpkper=kk)
-        elif self.totim is not None:
-            for t in self.totim:
+            times = [(kk, None) for kk in self.kstpkper]
+            record_indices = self._group_record_indices(kstpkper=self.kstpkper)
+        else:
+            times = [(None, t) for t in self.totim]
+            record_indices = self._group_record_indices(totim=self.totim)
+
+        # Compute the budgets in the order the time steps are stored in
+        # the cell budget file so that the file is read in a single pass
+        order = sorted(range(len(times)),
+                       key=lambda n: (min(record_indices[n])
+                                      if len(record_indices[n]) > 0 else -1,
+                                      n))
+        if max_workers is not None and max_workers > 1:
+            self._compute_budgets_parallel(times, record_indices, order,
+                                           offsets, max_workers, verbose)
+        else:
+            for n in order:
+                kk, t = times[n]
                 if verbose:
-                    s = 'Computing the budget for time {}'.format(t)
-                    print(s)
-                self._compute_budget(totim=t)
+                    print(self._get_compute_message(kk, t))
+                records = self._read_budget_records(record_indices[n])
+                self._compute_budget(kstpkper=kk, totim=t, records=records)
+
+        return
+
+    @staticmethod
+    def _get_compute_message(kstpkper=None, totim=None):
+        if kstpkper is not None:
+            s = 'Computing the budget for' \
+                ' time step {} in stress period {}'.format(kstpkper[0] + 1,
+                                                           kstpkper[1] + 1)
+        else:
+            s = 'Computing the budget for time {}'.format(totim)
+        return s
+
+    @staticmethod
+    def _get_recordarray_rows(recordarray, offset=0):
+        """
+        Get the row index of each record name in a budget recordarray.
+
+        Parameters
+        ----------
+        recordarray : np.recarray
+            Budget recordarray for a single time.
+        offset : int
+            Row of the first record (default is 0).
+
+        Returns
+        -------
+        rows : dict
+            Dictionary of record name, row index pairs.
+
+        """
+        rows = {}
+        for i, name in enumerate(recordarray['name']):
+            rows.setdefault(name, offset + i)
+        return rows
+
+    def _compute_budgets_parallel(self, times, record_indices, order,
+                                  offsets, max_workers, verbose=False):
+        """
+        Compute the budget for each time step in a process pool. The
+        cell budget file is read once in record order by this process and
+        the records for each time step are passed to the workers, which
+        share a read-only copy of the zone arrays.
+
+        Parameters
+        ----------
+        times : list of tuples
+            (kstpkper, totim) for each time step.
+        record_indices : list of lists of ints
+            Cell budget file record numbers for each time step.
+        order : list of ints
+            Order in which the time steps are computed.
+        offsets : list of ints
+            Row of the first record of each time step in the budget
+            recordarray.
+        max_workers : int
+            Number of worker processes.
+        verbose : bool
+            Print progress (default is False).
+
+        Returns
+        -------
+        None
+
+        """
+        from concurrent.futures import ProcessPoolExecutor, wait, \
+            FIRST_COMPLETED
+
+        # Limit the number of time steps held in memory at once
+        max_pending = 2 * max_workers
+        pending = {}
+
+        def merge(futures):
+            for future in futures:
+                n = pending.pop(future)
+                budget = future.result()
+                self._budget[offsets[n]:offsets[n] + len(budget)] = budget
+
+        worker = self._get_worker_copy()
+        if sys.version_info >= (3, 7):
+            # send the zone arrays to each worker process once
+            pool_kwargs = {'initializer': _init_zonebudget_worker,
+                           'initargs': (worker,)}
+            worker = None
+        else:
+            pool_kwargs = {}
 
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 **pool_kwargs) as pool:
+            for n in order:
+                kk, t = times[n]
+                if verbose:
+                    print(self._get_compute_message(kk, t))
+                records = self._read_budget_records(record_indices[n])
+                future = pool.submit(_compute_zonebudget_worker, kk, t,
+                                     records, worker)
+                pending[future] = n
+                if len(pending) >= max_pending:
+                    done, _ = wait(list(pending.keys()),
+                                   return_when=FIRST_COMPLETED)
+                    merge(done)
+            merge(list(pending.keys()))
         return
 
+    def _get_worker_copy(self):
+        """
+        Get a copy of the ZoneBudget object without the cell budget file,
+        model, and budget recordarray that can be sent to worker processes.
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        ignore_attrs = ['cbc', 'model', 'dis', 'sr', '_budget',
+                        '_budget_rows']
+        for k, v in self.__dict__.items():
+            if k not in ignore_attrs:
+                setattr(result, k, v)
+        result.cbc = None
+        result._budget = None
+        result._budget_rows = {}
+        return result
+
     def get_model_shape(self):
         """
 
@@ -462,7 +613,7 @@ class ZoneBudget(object):
         result.cbc = self.cbc
         return result
 
-    def _compute_budget(self, kstpkper=None, totim=None):
+    def _compute_budget(self, kstpkper=None, totim=None, records=None):
         """
         Creates a budget for the specified zone array. This function only supports the
         use of a single time step/stress period or time.
@@ -473,12 +624,20 @@ class ZoneBudget(object):
             Tuple of kstp and kper to compute budget for (default is None).
         totim : float
             Totim to compute budget for (default is None).
+        records : dict
+            Dictionary of record name, data pairs for the time step. If
+            None, the records are read from the cell budget file
+            (default is None).
 
         Returns
         -------
         None
 
         """
+        if records is None:
+            records = self._read_budget_records(
+                self._get_record_indices(kstpkper, totim))
+
         # Initialize an array to track where the constant head cells
         # are located.
         ich = np.zeros(self.cbc_shape, self.int_type)
@@ -492,37 +651,130 @@ class ZoneBudget(object):
             C-----HEAD CELLS ARE AND THEN USE FACE FLOWS TO DETERMINE THE AMOUNT OF
             C-----FLOW.  STORE CONSTANT-HEAD LOCATIONS IN ICH ARRAY.
             """
-            chd = self.cbc.get_data(text='CONSTANT HEAD', full3D=True,
-                                    kstpkper=kstpkper, totim=totim)[0]
-            ich[np.ma.where(chd != 0.)] = 1
+            chd = records.get('CONSTANT HEAD')
+            if chd is not None:
+                ich[np.ma.where(chd != 0.)] = 1
         if 'FLOW RIGHT FACE' in self.record_names:
-            self._accumulate_flow_frf('FLOW RIGHT FACE', ich, kstpkper, totim)
+            self._accumulate_flow_frf('FLOW RIGHT FACE', ich, kstpkper, totim,
+                                      records.get('FLOW RIGHT FACE'))
         if 'FLOW FRONT FACE' in self.record_names:
-            self._accumulate_flow_fff('FLOW FRONT FACE', ich, kstpkper, totim)
+            self._accumulate_flow_fff('FLOW FRONT FACE', ich, kstpkper, totim,
+                                      records.get('FLOW FRONT FACE'))
         if 'FLOW LOWER FACE' in self.record_names:
-            self._accumulate_flow_flf('FLOW LOWER FACE', ich, kstpkper, totim)
+            self._accumulate_flow_flf('FLOW LOWER FACE', ich, kstpkper, totim,
+                                      records.get('FLOW LOWER FACE'))
         if 'SWIADDTOCH' in self.record_names:
-            swichd = self.cbc.get_data(text='SWIADDTOCH', full3D=True,
-                                       kstpkper=kstpkper, totim=totim)[0]
-            swiich[swichd != 0] = 1
+            swichd = records.get('SWIADDTOCH')
+            if swichd is not None:
+                swiich[swichd != 0] = 1
         if 'SWIADDTOFRF' in self.record_names:
-            self._accumulate_flow_frf('SWIADDTOFRF', swiich, kstpkper, totim)
+            self._accumulate_flow_frf('SWIADDTOFRF', swiich, kstpkper, totim,
+                                      records.get('SWIADDTOFRF'))
         if 'SWIADDTOFFF' in self.record_names:
-            self._accumulate_flow_fff('SWIADDTOFFF', swiich, kstpkper, totim)
+            self._accumulate_flow_fff('SWIADDTOFFF', swiich, kstpkper, totim,
+                                      records.get('SWIADDTOFFF'))
         if 'SWIADDTOFLF' in self.record_names:
-            self._accumulate_flow_flf('SWIADDTOFLF', swiich, kstpkper, totim)
+            self._accumulate_flow_flf('SWIADDTOFLF', swiich, kstpkper, totim,
+                                      records.get('SWIADDTOFLF'))
 
         # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
         # ACCUMULATE THE FLOW BY ZONE
         # iterate over remaining items in the list
         for recname in self.ssst_record_names:
-            self._accumulate_flow_ssst(recname, kstpkper, totim)
+            self._accumulate_flow_ssst(recname, kstpkper, totim,
+                                       records.get(recname))
 
         # Compute mass balance terms
         self._compute_mass_balance(kstpkper, totim)
 
         return
 
+    def _get_record_indices(self, kstpkper=None, totim=None):
+        """
+        Get the cell budget file record numbers for a time.
+
+        Parameters
+        ----------
+        kstpkper : tuple
+            Tuple of kstp and kper (default is None).
+        totim : float
+            Simulation time (default is None).
+
+        Returns
+        -------
+        idx : list of ints
+            Record numbers in file order.
+
+        """
+        return self._group_record_indices(
+            [kstpkper] if kstpkper is not None else None,
+            [totim] if totim is not None else None)[0]
+
+    def _group_record_indices(self, kstpkper=None, totim=None):
+        """
+        Group the cell budget file record numbers by time step using a
+        single pass through the record headers.
+
+        Parameters
+        ----------
+        kstpkper : list of tuples
+            Time steps and stress periods to group records for
+            (default is None).
+        totim : list of floats
+            Simulation times to group records for (default is None).
+
+        Returns
+        -------
+        idx : list of lists of ints
+            Record numbers in file order for each kstpkper or totim.
+
+        """
+        recordarray = self.cbc.recordarray
+        if kstpkper is not None:
+            # budget file kstp and kper are one based
+            keys = [(kk[0] + 1, kk[1] + 1) for kk in kstpkper]
+            recordkeys = zip(recordarray['kstp'].tolist(),
+                             recordarray['kper'].tolist())
+        else:
+            # compare times at the precision of the budget file
+            totimtype = recordarray.dtype['totim'].type
+            keys = [float(totimtype(t)) for t in totim]
+            recordkeys = recordarray['totim'].tolist()
+        groups = dict((key, []) for key in keys)
+        for i, key in enumerate(recordkeys):
+            if key in groups:
+                groups[key].append(i)
+        return [groups[key] for key in keys]
+
+    def _read_budget_records(self, idx):
+        """
+        Read cell budget file records in file order.
+
+        Parameters
+        ----------
+        idx : list of ints
+            Record numbers to read.
+
+        Returns
+        -------
+        records : dict
+            Dictionary of stripped record name, data pairs. Only the first
+            record with a name is kept. Constant head records are returned
+            as full three-dimensional arrays.
+
+        """
+        records = {}
+        for i in sorted(idx):
+            recname = self.cbc.recordarray['text'][i]
+            if isinstance(recname, bytes):
+                recname = recname.decode()
+            recname = recname.strip()
+            if recname in records:
+                continue
+            full3D = recname in ('CONSTANT HEAD', 'SWIADDTOCH')
+            records[recname] = self.cbc.get_record(i, full3D=full3D)
+        return records
+
     def _get_internal_flow_record_names(self):
         """
         Get internal flow record names
@@ -708,14 +960,9 @@ class ZoneBudget(object):
         idx = np.logical_not(np.array([item in tz for item in [0] * len(tz)]))
         fzi = fz[idx]
         tzi = tz[idx]
-        rownames = np.array(list(['FROM_' +
-                                  self._iflow_recnames[
-                                      self._iflow_recnames['zone'] == z][
-                                      'name'][0]
-                                  for z in fzi]))
-        colnames = np.array(list(
-            [self._iflow_recnames[self._iflow_recnames['zone'] == z]['name'][0]
-             for z in tzi]))
+        rownames = np.array(['FROM_' + self._iflow_names[z]
+                             for z in fzi.tolist()])
+        colnames = np.array([self._iflow_names[z] for z in tzi.tolist()])
         fluxes = f[idx]
         self._update_budget_recordarray(rownames, colnames, fluxes, kstpkper,
                                         totim)
@@ -724,14 +971,9 @@ class ZoneBudget(object):
         idx = np.logical_not(np.array([item in fz for item in [0] * len(fz)]))
         fzi = fz[idx]
         tzi = tz[idx]
-        rownames = np.array(list(['TO_' +
-                                  self._iflow_recnames[
-                                      self._iflow_recnames['zone'] == z][
-                                      'name'][0]
-                                  for z in tzi]))
-        colnames = np.array(list(
-            [self._iflow_recnames[self._iflow_recnames['zone'] == z]['name'][0]
-             for z in fzi]))
+        rownames = np.array(['TO_' + self._iflow_names[z]
+                             for z in tzi.tolist()])
+        colnames = np.array([self._iflow_names[z] for z in fzi.tolist()])
         fluxes = f[idx]
         self._update_budget_recordarray(rownames, colnames, fluxes, kstpkper,
                                         totim)
@@ -777,26 +1019,55 @@ class ZoneBudget(object):
 
         """
         try:
-
-            if kstpkper is not None:
-                for rn, cn, flux in list(zip(rownames, colnames, fluxes)):
-                    rowidx = np.where(
-                        (self._budget['time_step'] == kstpkper[0]) &
-                        (self._budget['stress_period'] == kstpkper[1]) &
-                        (self._budget['name'] == rn))
-                    self._budget[cn][rowidx] += flux
-            elif totim is not None:
-                for rn, cn, flux in list(zip(rownames, colnames, fluxes)):
-                    rowidx = np.where((self._budget['totim'] == totim) &
-                                      (self._budget['name'] == rn))
-                    self._budget[cn][rowidx] += flux
+            # only the leading entries are used if the lengths differ
+            n = min(len(rownames), len(colnames), len(fluxes))
+            rows = self._get_budget_rows(kstpkper, totim)
+            rowidx = np.array([rows.get(rn, -1) for rn in rownames[:n]],
+                              dtype=np.int64)
+            colnames = np.asarray(colnames)[:n]
+            fluxes = np.asarray(fluxes)[:n].astype(self.float_type)
+            valid = rowidx >= 0
+            rowidx, colnames, fluxes = rowidx[valid], colnames[valid], \
+                                       fluxes[valid]
+
+            # accumulate all of the fluxes for a column at once; repeated
+            # rows are summed by np.add.at
+            for cn in np.unique(colnames):
+                select = colnames == cn
+                np.add.at(self._budget[cn], rowidx[select], fluxes[select])
 
         except Exception as e:
             print(e)
             raise
         return
 
-    def _accumulate_flow_frf(self, recname, ich, kstpkper, totim):
+    def _get_budget_rows(self, kstpkper=None, totim=None):
+        """
+        Get the budget recordarray row index of each record name for the
+        specified time.
+
+        Parameters
+        ----------
+        kstpkper : tuple
+            Tuple of kstp and kper (default is None).
+        totim : float
+            Simulation time (default is None).
+
+        Returns
+        -------
+        rows : dict
+            Dictionary of record name, row index pairs.
+
+        """
+        if kstpkper is not None:
+            key = tuple(kstpkper)
+        elif totim is not None:
+            key = totim
+        else:
+            return {}
+        return self._budget_rows.get(key, {})
+
+    def _accumulate_flow_frf(self, recname, ich, kstpkper, totim, data):
         """
 
         Parameters
@@ -805,17 +1076,14 @@ class ZoneBudget(object):
         ich
         kstpkper
         totim
+        data
 
         Returns
         -------
 
         """
         try:
-            if self.ncol >= 2:
-                data = \
-                    self.cbc.get_data(text=recname, kstpkper=kstpkper,
-                                      totim=totim)[0]
-
+            if self.ncol >= 2 and data is not None:
                 # "FLOW RIGHT FACE"  COMPUTE FLOW BETWEEN ZONES ACROSS COLUMNS.
                 # COMPUTE FLOW ONLY BETWEEN A ZONE AND A HIGHER ZONE -- FLOW FROM
                 # ZONE 4 TO 3 IS THE NEGATIVE OF FLOW FROM 3 TO 4.
@@ -966,7 +1234,7 @@ class ZoneBudget(object):
             raise
         return
 
-    def _accumulate_flow_fff(self, recname, ich, kstpkper, totim):
+    def _accumulate_flow_fff(self, recname, ich, kstpkper, totim, data):
         """
 
         Parameters
@@ -975,17 +1243,14 @@ class ZoneBudget(object):
         ich
         kstpkper
         totim
+        data
 
         Returns
         -------
 
         """
         try:
-            if self.nrow >= 2:
-                data = \
-                    self.cbc.get_data(text=recname, kstpkper=kstpkper,
-                                      totim=totim)[0]
-
+            if self.nrow >= 2 and data is not None:
                 # "FLOW FRONT FACE"
                 # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I-1,K
                 k, i, j = np.where(
@@ -1101,7 +1366,7 @@ class ZoneBudget(object):
             raise
         return
 
-    def _accumulate_flow_flf(self, recname, ich, kstpkper, totim):
+    def _accumulate_flow_flf(self, recname, ich, kstpkper, totim, data):
         """
 
         Parameters
@@ -1110,17 +1375,14 @@ class ZoneBudget(object):
         ich
         kstpkper
         totim
+        data
 
         Returns
         -------
 
         """
         try:
-            if self.nlay >= 2:
-                data = \
-                    self.cbc.get_data(text=recname, kstpkper=kstpkper,
-                                      totim=totim)[0]
-
+            if self.nlay >= 2 and data is not None:
                 # "FLOW LOWER FACE"
                 # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I,K-1
                 k, i, j = np.where(
@@ -1236,21 +1498,17 @@ class ZoneBudget(object):
             raise
         return
 
-    def _accumulate_flow_ssst(self, recname, kstpkper, totim):
+    def _accumulate_flow_ssst(self, recname, kstpkper, totim, data):
 
         # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
         # ACCUMULATE THE FLOW BY ZONE
 
         imeth = self.imeth[recname]
 
-        data = self.cbc.get_data(text=recname, kstpkper=kstpkper,
-                                 totim=totim)
-        if len(data) == 0:
+        if data is None:
             # Empty data, can occur during the first time step of a transient model when
             # storage terms are zero and not in the cell-budget file.
             return
-        else:
-            data = data[0]
 
         if imeth == 2 or imeth == 5:
             # LIST
@@ -1258,12 +1516,10 @@ class ZoneBudget(object):
                               self.float_type)
             qout = np.ma.zeros((self.nlay * self.nrow * self.ncol),
                                self.float_type)
-            for [node, q] in zip(data['node'], data['q']):
-                idx = node - 1
-                if q > 0:
-                    qin.data[idx] += q
-                elif q < 0:
-                    qout.data[idx] += q
+            node = np.asarray(data['node']) - 1
+            q = np.asarray(data['q'])
+            np.add.at(qin.data, node[q > 0], q[q > 0])
+            np.add.at(qout.data, node[q < 0], q[q < 0])
             qin = np.ma.reshape(qin, (self.nlay, self.nrow, self.ncol))
             qout = np.ma.reshape(qout, (self.nlay, self.nrow, self.ncol))
         elif imeth == 0 or imeth == 1:
@@ -1276,8 +1532,8 @@ class ZoneBudget(object):
             # 1-LAYER ARRAY WITH LAYER INDICATOR ARRAY
             rlay, rdata = data[0], data[1]
             data = np.ma.zeros(self.cbc_shape, self.float_type)
-            for (r, c), l in np.ndenumerate(rlay):
-                data[l - 1, r, c] = rdata[r, c]
+            r, c = np.indices(rlay.shape)
+            data[np.asarray(rlay) - 1, r, c] = rdata
             qin = np.ma.zeros(self.cbc_shape, self.float_type)
             qout = np.ma.zeros(self.cbc_shape, self.float_type)
             qin[data > 0] = data[data > 0]
@@ -1296,38 +1552,24 @@ class ZoneBudget(object):
                 'Unrecognized "imeth" for {} record: {}'.format(recname,
                                                                 imeth))
 
+        # Sum the inflows and outflows for every zone in a single pass
+        zones = [z for z in self.allzones if z != 0]
+        izone = self.izone.ravel()
+        nzones = izone.max() + 1
+        zin = np.bincount(izone, weights=np.ma.filled(qin, 0.).ravel(),
+                          minlength=nzones)
+        zout = np.bincount(izone, weights=np.ma.filled(qout, 0.).ravel(),
+                           minlength=nzones)
+        tz = np.array([self._zonenamedict[z] for z in zones])
+
         # Inflows
-        fz = []
-        tz = []
-        f = []
-        for z in self.allzones:
-            if z != 0:
-                flux = qin[(self.izone == z)].sum()
-                if type(flux) == np.ma.core.MaskedConstant:
-                    flux = 0.
-                fz.append('FROM_' + '_'.join(recname.split()))
-                tz.append(self._zonenamedict[z])
-                f.append(flux)
-        fz = np.array(fz)
-        tz = np.array(tz)
-        f = np.array(f)
+        fz = np.array(['FROM_' + '_'.join(recname.split())] * len(zones))
+        f = zin[zones]
         self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
 
         # Outflows
-        fz = []
-        tz = []
-        f = []
-        for z in self.allzones:
-            if z != 0:
-                flux = qout[(self.izone == z)].sum()
-                if type(flux) == np.ma.core.MaskedConstant:
-                    flux = 0.
-                fz.append('TO_' + '_'.join(recname.split()))
-                tz.append(self._zonenamedict[z])
-                f.append(flux)
-        fz = np.array(fz)
-        tz = np.array(tz)
-        f = np.array(f)
+        fz = np.array(['TO_' + '_'.join(recname.split())] * len(zones))
+        f = zout[zones]
         self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
 
         return
@@ -1338,16 +1580,8 @@ class ZoneBudget(object):
         skipcols = ['time_step', 'stress_period', 'totim', 'name']
 
         # Compute inflows
-        recnames = self.get_record_names()
-        innames = [n for n in recnames if n.startswith('FROM_')]
-        outnames = [n for n in recnames if n.startswith('TO_')]
-        if kstpkper is not None:
-            rowidx = np.where((self._budget['time_step'] == kstpkper[0]) &
-                              (self._budget['stress_period'] == kstpkper[1]) &
-                              np.in1d(self._budget['name'], innames))
-        elif totim is not None:
-            rowidx = np.where((self._budget['totim'] == totim) &
-                              np.in1d(self._budget['name'], innames))
+        rows = self._get_budget_rows(kstpkper, totim)
+        rowidx = sorted(i for n, i in rows.items() if n.startswith('FROM_'))
         a = _numpyvoid2numeric(
             self._budget[list(self._zonenamedict.values())][rowidx])
         intot = np.array(a.sum(axis=0))
@@ -1357,13 +1591,7 @@ class ZoneBudget(object):
         self._update_budget_fromssst(fz, tz, intot, kstpkper, totim)
 
         # Compute outflows
-        if kstpkper is not None:
-            rowidx = np.where((self._budget['time_step'] == kstpkper[0]) &
-                              (self._budget['stress_period'] == kstpkper[1]) &
-                              np.in1d(self._budget['name'], outnames))
-        elif totim is not None:
-            rowidx = np.where((self._budget['totim'] == totim) &
-                              np.in1d(self._budget['name'], outnames))
+        rowidx = sorted(i for n, i in rows.items() if n.startswith('TO_'))
         a = _numpyvoid2numeric(
             self._budget[list(self._zonenamedict.values())][rowidx])
         outot = np.array(a.sum(axis=0))
@@ -1479,6 +1707,32 @@ class ZoneBudget(object):
         return newobj
 
 
+# ZoneBudget object shared by the time steps computed in a worker process
+_zonebudget_worker = None
+
+
+def _init_zonebudget_worker(zonebudget):
+    global _zonebudget_worker
+    _zonebudget_worker = zonebudget
+
+
+def _compute_zonebudget_worker(kstpkper, totim, records, zonebudget=None):
+    # Compute the budget recordarray for a single time step in a worker
+    # process
+    zb = zonebudget
+    if zb is None:
+        zb = _zonebudget_worker
+    budget = zb._initialize_budget_recordarray(kstpkper=kstpkper,
+                                               totim=totim)
+    key = tuple(kstpkper) if kstpkper is not None else totim
+    zb._budget = budget
+    zb._budget_rows = {key: zb._get_recordarray_rows(budget)}
+    zb._compute_budget(kstpkper=kstpkper, totim=totim, records=records)
+    zb._budget = None
+    zb._budget_rows = {}
+    return budget
+
+
 def _numpyvoid2numeric(a):
     # The budget record array has multiple dtypes and a slice returns
     # the flexible-type numpy.void which must be converted to a numeric
@@ -1690,21 +1944,50 @@ def read_zbarray(fname):
 
 
 def sum_flux_tuples(fromzones, tozones, fluxes):
-    tup = zip(fromzones, tozones, fluxes)
-    sorted_tups = sort_tuple(tup)
-
-    # Group the sorted tuples by (from zone, to zone)
-    # itertools.groupby() returns the index (from zone, to zone) and
-    # a list of the tuples with that index
-    from_zones = []
-    to_zones = []
-    fluxes = []
-    for (fz, tz), ftup in groupby(sorted_tups, lambda tup: tup[:2]):
-        f = np.sum([tup[-1] for tup in list(ftup)])
-        from_zones.append(fz)
-        to_zones.append(tz)
-        fluxes.append(f)
-    return np.array(from_zones), np.array(to_zones), np.array(fluxes)
+    """
+    Sum the fluxes for each unique (from zone, to zone) pair.
+
+    Parameters
+    ----------
+    fromzones : array-like of ints
+        Zone from which each flux is coming.
+    tozones : array-like of ints
+        Zone to which each flux is going.
+    fluxes : array-like of floats
+        Flux values.
+
+    Returns
+    -------
+    from_zones, to_zones, fluxes : tuple of ndarrays
+        Unique (from zone, to zone) pairs, sorted by from zone and then
+        to zone, and the sum of the fluxes for each pair.
+
+    """
+    fromzones = np.asarray(fromzones, dtype=np.int64).ravel()
+    tozones = np.asarray(tozones, dtype=np.int64).ravel()
+    fluxes = np.asarray(fluxes).ravel()
+    if fluxes.size == 0:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64), \
+               np.array([], dtype=fluxes.dtype)
+
+    # Encode each (from zone, to zone) pair as a single integer, with the
+    # zones offset by the smallest zone so that negative zones get unique
+    # keys, and group the fluxes of each pair with a stable sort
+    zmin = min(fromzones.min(), tozones.min())
+    fromzones = fromzones - zmin
+    tozones = tozones - zmin
+    nzones = max(fromzones.max(), tozones.max()) + 1
+    keys = fromzones * nzones + tozones
+    order = np.argsort(keys, kind='mergesort')
+    keys = keys[order]
+    start = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    ukeys = keys[start]
+
+    # Sum the fluxes of each pair in the flux dtype, in the order they
+    # were given
+    groups = np.split(fluxes[order], start[1:])
+    f = np.array([np.sum(group) for group in groups], dtype=fluxes.dtype)
+    return ukeys // nzones + zmin, ukeys % nzones + zmin, f
 
 
 def sort_tuple(tup, n=2):